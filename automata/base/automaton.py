@@ -86,6 +86,39 @@ def __post_init__(self) -> None:
         if global_config.should_validate_automata:
             self.validate()
 
+    @classmethod
+    def _from_trusted(cls, **kwargs: Any) -> Self:
+        """
+        Create an automaton from attributes that are already immutable and
+        known to be valid, skipping freeze_value and validation.
+        """
+        automaton = cls.__new__(cls)
+        for attr_name, attr_value in kwargs.items():
+            object.__setattr__(automaton, attr_name, attr_value)
+        return automaton
+
+    @classmethod
+    def _from_derived(cls, **kwargs: Any) -> Self:
+        """
+        Create an automaton from attributes computed by an operation on valid
+        automata. Such attributes are valid by construction, so validation is
+        skipped; they are still frozen unless mutable automata are allowed.
+        """
+        if not global_config.allow_mutable_automata:
+            kwargs = {
+                attr_name: cls._freeze_derived_value(attr_name, attr_value)
+                for attr_name, attr_value in kwargs.items()
+            }
+        return cls._from_trusted(**kwargs)
+
+    @staticmethod
+    def _freeze_derived_value(attr_name: str, attr_value: Any) -> Any:
+        """
+        Freeze an attribute passed to _from_derived. Subclasses may override
+        this to take advantage of the known shape of their attributes.
+        """
+        return freeze_value(attr_value)
+
     @abc.abstractmethod
     def validate(self) -> None:
         """
@@ -0,0 +1,320 @@
+"""
+Opt-in memoization of automaton operations. Since automata are immutable,
+the result of an operation on the same operands can be shared safely, so
+while a cache is active, repeated operations return the cached result instead
+of recomputing it.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Literal, NamedTuple, Optional, TypeVar
+
+from typing_extensions import ParamSpec
+
+KeyModeT = Literal["identity", "language"]
+
+ParamT = ParamSpec("ParamT")
+ResultT = TypeVar("ResultT")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics describing the use of an operation cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+# The default of lookups telling a missing result from a cached None
+_MISSING = object()
+
+
+class _IdentityKey:
+    """
+    A cache key component comparing its value by identity. The key holds a
+    reference to the value, so its id cannot be reused while the key exists.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _IdentityKey) and other.value is self.value
+
+
+class OperationCache:
+    """
+    A size-bounded, least-recently-used cache of automaton operation results.
+
+    Parameters
+    ----------
+    maxsize : Optional[int], default: 128
+        The maximum number of results to keep, or None for no limit.
+    key : Literal["identity", "language"], default: "identity"
+        How DFA operands are matched. With "identity", a result is reused
+        only for the very same operand objects. With "language", a result is
+        reused for any DFA operands accepting the same languages (as
+        determined by `DFA.language_hash` and equality), in which case the
+        cached result accepts the right language but may have state names
+        derived from different operands. Other operands, such as NFAs, are
+        always matched by identity.
+    """
+
+    __slots__ = ("maxsize", "key", "hits", "misses", "evictions", "_results")
+
+    def __init__(
+        self, maxsize: Optional[int] = 128, key: KeyModeT = "identity"
+    ) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        if key not in ("identity", "language"):
+            raise ValueError(f"invalid key mode {key!r}")
+        self.maxsize = maxsize
+        self.key = key
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results: OrderedDict[Any, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _make_key_component(self, value: Any) -> Any:
+        """Return the part of a cache key identifying one argument."""
+        if isinstance(value, (str, int, float, bool, type(None), frozenset)):
+            return value
+        if self.key == "language" and hasattr(value, "language_hash"):
+            # Compute the language hash now, so that hashing the key later
+            # does not run any (cached) operations
+            value.language_hash()
+            return (type(value), value)
+        return _IdentityKey(value)
+
+    def make_key(self, operation: str, arguments: inspect.BoundArguments) -> Any:
+        """
+        Return the cache key for an operation called with the given
+        arguments.
+
+        Parameters
+        ----------
+        operation : str
+            The qualified name of the operation.
+        arguments : inspect.BoundArguments
+            The arguments of the call, with defaults applied.
+
+        Returns
+        ------
+        Any
+            A hashable key for the call.
+        """
+        return (
+            operation,
+            tuple(
+                (name, self._make_key_component(value))
+                for name, value in arguments.arguments.items()
+            ),
+        )
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Return the cached result for key, or default if it is not cached. The
+        lookup counts as a hit or a miss.
+
+        Parameters
+        ----------
+        key : Any
+            The key of the result.
+        default : Any, default: None
+            The value to return if no result is cached for key.
+
+        Returns
+        ------
+        Any
+            The cached result, or default.
+        """
+        try:
+            result = self._results[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._results.move_to_end(key)
+        return result
+
+    def setdefault(self, key: Any, result: ResultT) -> ResultT:
+        """
+        Cache a result computed after a miss, unless a result for key has been
+        cached in the meantime, in which case that result is kept. Neither
+        case counts as a hit or a miss.
+
+        Parameters
+        ----------
+        key : Any
+            The key of the result.
+        result : ResultT
+            The newly computed result.
+
+        Returns
+        ------
+        ResultT
+            The result cached for key, or result if nothing is cached.
+        """
+        try:
+            cached_result = self._results[key]
+        except KeyError:
+            pass
+        else:
+            self._results.move_to_end(key)
+            return cached_result
+
+        if self.maxsize != 0:
+            self._results[key] = result
+            if self.maxsize is not None and len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def get_or_compute(self, key: Any, compute: Callable[[], ResultT]) -> ResultT:
+        """
+        Return the cached result for key, computing and caching it if needed.
+
+        Parameters
+        ----------
+        key : Any
+            The key of the result.
+        compute : Callable[[], ResultT]
+            The function computing the result on a miss.
+
+        Returns
+        ------
+        ResultT
+            The cached or newly computed result.
+        """
+        result = self.get(key, _MISSING)
+        if result is _MISSING:
+            result = self.setdefault(key, compute())
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return statistics describing the use of this cache.
+
+        Returns
+        ------
+        CacheInfo
+            The hits, misses, evictions, maximum size and current size of
+            this cache.
+        """
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._results)
+        )
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the statistics."""
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+_active_cache: ContextVar[Optional[OperationCache]] = ContextVar(
+    "automata_operation_cache", default=None
+)
+
+
+def get_active_cache() -> Optional[OperationCache]:
+    """
+    Return the operation cache active in the current context, if any.
+
+    Returns
+    ------
+    Optional[OperationCache]
+        The active cache, or None if operations are not being cached.
+    """
+    return _active_cache.get()
+
+
+@contextmanager
+def operation_cache(
+    maxsize: Optional[int] = 128,
+    key: KeyModeT = "identity",
+    *,
+    cache: Optional[OperationCache] = None,
+) -> Iterator[OperationCache]:
+    """
+    Cache the results of automaton operations within a block. Supported
+    operations are DFA union, intersection, difference, complement, minify
+    and from_nfa, and NFA union, intersection, concatenate, kleene_star,
+    option, reverse, eliminate_lambda, reduce, shuffle_product,
+    right_quotient and left_quotient, including their operator forms.
+
+    Parameters
+    ----------
+    maxsize : Optional[int], default: 128
+        The maximum number of results to keep, or None for no limit. Ignored
+        if cache is given.
+    key : Literal["identity", "language"], default: "identity"
+        How DFA operands are matched; see `OperationCache`. Ignored if cache
+        is given.
+    cache : Optional[OperationCache], default: None
+        An existing cache to use, for example to share results across several
+        blocks.
+
+    Yields
+    ------
+    OperationCache
+        The active cache, whose statistics can be inspected with
+        `OperationCache.cache_info`.
+    """
+    if cache is None:
+        cache = OperationCache(maxsize, key)
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+
+
+def cached_operation(
+    operation: Callable[ParamT, ResultT],
+) -> Callable[ParamT, ResultT]:
+    """
+    Decorate an automaton operation so that its results are cached while an
+    operation cache is active. When no cache is active, the only overhead is
+    a single context variable lookup.
+    """
+    signature = inspect.signature(operation)
+    operation_name = operation.__qualname__
+
+    @functools.wraps(operation)
+    def wrapper(*args: ParamT.args, **kwargs: ParamT.kwargs) -> ResultT:
+        cache = _active_cache.get()
+        if cache is None:
+            return operation(*args, **kwargs)
+
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+
+        # Operations used to build the key (such as minifying operands to
+        # compute their language hashes) must not themselves be cached
+        token = _active_cache.set(None)
+        try:
+            key = cache.make_key(operation_name, arguments)
+        finally:
+            _active_cache.reset(token)
+
+        return cache.get_or_compute(key, lambda: operation(*args, **kwargs))
+
+    return wrapper
@@ -4,3 +4,7 @@
 # When set to True, it disables the freeze_value step
 #   -> You must guarantee that your code does not modify the automata
 allow_mutable_automata: bool = False
+# NFAs with at most this many states are simulated with bitsets of states
+#   -> Bitsets take memory quadratic in the number of states, so larger NFAs
+#      are simulated with sets of states instead
+max_bitset_nfa_states: int = 20000
@@ -1,6 +1,7 @@
 """Exception classes shared by all automata."""
 
 from dataclasses import dataclass
+from typing import Dict, Union
 
 
 class AutomatonException(Exception):
@@ -93,3 +94,40 @@ class DiagramException(AutomatonException):
     """The diagram cannot be produced"""
 
     pass
+
+
+class SerializationError(AutomatonException):
+    """The automaton cannot be saved to or loaded from the given file"""
+
+    pass
+
+
+class ResourceLimitError(AutomatonException):
+    """
+    An operation exceeded a resource limit, ran past its deadline or was
+    cancelled before completing.
+
+    Attributes
+    ----------
+    limit : str
+        The limit that was exceeded: "max_states", "max_steps",
+        "max_configurations", "timeout" or "cancelled".
+    phase : str
+        The name of the operation that was interrupted.
+    stats : Dict[str, Union[int, float]]
+        The progress made by the operation before it was interrupted, such as
+        the number of states constructed and the elapsed time in seconds.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        limit: str,
+        phase: str,
+        stats: Dict[str, Union[int, float]],
+    ) -> None:
+        super().__init__(message)
+        self.limit = limit
+        self.phase = phase
+        self.stats = stats
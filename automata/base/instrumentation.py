@@ -0,0 +1,157 @@
+"""
+Opt-in instrumentation of automaton algorithms. While a stats collector is
+active, algorithms such as DFA construction and minification record counters,
+maxima and per-phase timings in it, and report progress on long-running
+constructions. When no collector is active, each algorithm only performs a
+single context variable lookup.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Callable, Dict, Iterator, Optional
+
+# Called with the name of a phase and the number of items processed so far
+ProgressCallbackT = Callable[[str, int], None]
+
+
+class StatsCollector:
+    """
+    A collector of statistics reported by automaton algorithms.
+
+    Parameters
+    ----------
+    progress_callback : Optional[Callable[[str, int], None]], default: None
+        A function called periodically during long-running constructions,
+        with the name of the phase and the number of items (such as states)
+        processed so far.
+    progress_interval : int, default: 10000
+        The number of items processed between calls to progress_callback.
+
+    Attributes
+    ----------
+    counters : Dict[str, int]
+        Running totals, such as the number of states expanded.
+    maxima : Dict[str, int]
+        Largest values observed, such as the peak size of a work queue.
+    timings : Dict[str, float]
+        Total time in seconds spent in each phase.
+    """
+
+    __slots__ = (
+        "counters",
+        "maxima",
+        "timings",
+        "progress_callback",
+        "progress_interval",
+    )
+
+    def __init__(
+        self,
+        progress_callback: Optional[ProgressCallbackT] = None,
+        progress_interval: int = 10000,
+    ) -> None:
+        if progress_interval <= 0:
+            raise ValueError("progress_interval must be positive")
+        self.counters: Dict[str, int] = {}
+        self.maxima: Dict[str, int] = {}
+        self.timings: Dict[str, float] = {}
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add amount to the counter with the given name."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_max(self, name: str, value: int) -> None:
+        """Record value if it is the largest seen for the given name."""
+        if value > self.maxima.get(name, value - 1):
+            self.maxima[name] = value
+
+    def record_time(self, phase: str, start_time: float) -> None:
+        """
+        Add the time elapsed since start_time, as returned by
+        `time.perf_counter`, to the timing of the given phase.
+        """
+        self.timings[phase] = self.timings.get(phase, 0.0) + (
+            perf_counter() - start_time
+        )
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block as part of the given phase."""
+        start_time = perf_counter()
+        try:
+            yield
+        finally:
+            self.record_time(phase, start_time)
+
+    def report_progress(self, phase: str, count: int) -> None:
+        """Report that count items of the given phase have been processed."""
+        if self.progress_callback is not None:
+            self.progress_callback(phase, count)
+
+    def clear(self) -> None:
+        """Reset all recorded statistics."""
+        self.counters.clear()
+        self.maxima.clear()
+        self.timings.clear()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(counters={self.counters!r}, "
+            f"maxima={self.maxima!r}, timings={self.timings!r})"
+        )
+
+
+_active_collector: ContextVar[Optional[StatsCollector]] = ContextVar(
+    "automata_stats_collector", default=None
+)
+
+
+def get_stats_collector() -> Optional[StatsCollector]:
+    """
+    Return the stats collector active in the current context, if any.
+
+    Returns
+    ------
+    Optional[StatsCollector]
+        The active collector, or None if statistics are not being collected.
+    """
+    return _active_collector.get()
+
+
+@contextmanager
+def collect_stats(
+    collector: Optional[StatsCollector] = None,
+    *,
+    progress_callback: Optional[ProgressCallbackT] = None,
+    progress_interval: int = 10000,
+) -> Iterator[StatsCollector]:
+    """
+    Collect statistics from automaton algorithms run within a block.
+
+    Parameters
+    ----------
+    collector : Optional[StatsCollector], default: None
+        An existing collector to add statistics to. If None, a new collector
+        is created with the given progress_callback and progress_interval.
+    progress_callback : Optional[Callable[[str, int], None]], default: None
+        A function called periodically during long-running constructions.
+    progress_interval : int, default: 10000
+        The number of items processed between calls to progress_callback.
+
+    Yields
+    ------
+    StatsCollector
+        The active collector.
+    """
+    if collector is None:
+        collector = StatsCollector(progress_callback, progress_interval)
+    token = _active_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _active_collector.reset(token)
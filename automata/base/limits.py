@@ -0,0 +1,265 @@
+"""
+Opt-in resource limits for automaton algorithms. Constructions such as the
+subset construction, product constructions and NPDA/NTM simulation can blow up
+exponentially on some inputs. While resource limits are active, these
+algorithms cooperatively check the number of states, steps and configurations
+they have produced, as well as a deadline and a cancellation token, and raise
+a `ResourceLimitError` as soon as a limit is exceeded. When no limits are
+active, each algorithm only performs a single context variable lookup.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Iterator, Optional, Union
+
+import automata.base.exceptions as exceptions
+
+
+class CancellationToken:
+    """
+    A flag used to cancel an operation running under resource limits,
+    possibly from another thread.
+    """
+
+    __slots__ = ("cancelled",)
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Request cancellation of the operations checking this token."""
+        self.cancelled = True
+
+
+class ResourceLimits:
+    """
+    Limits on the resources used by automaton algorithms.
+
+    Parameters
+    ----------
+    max_states : Optional[int], default: None
+        The maximum number of states an automaton construction may produce.
+    max_steps : Optional[int], default: None
+        The maximum number of steps an NPDA or NTM simulation may take.
+    max_configurations : Optional[int], default: None
+        The maximum number of configurations an NPDA or NTM simulation may
+        track at once.
+    timeout : Optional[float], default: None
+        The number of seconds, counted from the creation of these limits,
+        after which operations are interrupted.
+    cancellation_token : Optional[CancellationToken], default: None
+        A token that interrupts operations once cancelled.
+    """
+
+    __slots__ = (
+        "max_states",
+        "max_steps",
+        "max_configurations",
+        "deadline",
+        "cancellation_token",
+        "start_time",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_states: Optional[int] = None,
+        max_steps: Optional[int] = None,
+        max_configurations: Optional[int] = None,
+        timeout: Optional[float] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> None:
+        for name, value in (
+            ("max_states", max_states),
+            ("max_steps", max_steps),
+            ("max_configurations", max_configurations),
+            ("timeout", timeout),
+        ):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be non-negative")
+
+        self.max_states = max_states
+        self.max_steps = max_steps
+        self.max_configurations = max_configurations
+        self.cancellation_token = cancellation_token
+        self.start_time = perf_counter()
+        self.deadline = None if timeout is None else self.start_time + timeout
+
+    def check(
+        self,
+        phase: str,
+        *,
+        states: Optional[int] = None,
+        steps: Optional[int] = None,
+        configurations: Optional[int] = None,
+    ) -> None:
+        """
+        Check the progress of an operation against these limits.
+
+        Parameters
+        ----------
+        phase : str
+            The name of the operation being checked.
+        states : Optional[int], default: None
+            The number of states constructed so far.
+        steps : Optional[int], default: None
+            The number of simulation steps taken so far.
+        configurations : Optional[int], default: None
+            The number of configurations currently tracked.
+
+        Raises
+        ------
+        ResourceLimitError
+            If a limit has been exceeded, the deadline has passed or the
+            operation has been cancelled.
+        """
+        if (
+            states is not None
+            and self.max_states is not None
+            and states > self.max_states
+        ):
+            self._raise(
+                "max_states",
+                f"{phase} exceeded the limit of {self.max_states} states",
+                phase,
+                states,
+                steps,
+                configurations,
+            )
+        if steps is not None and self.max_steps is not None and steps > self.max_steps:
+            self._raise(
+                "max_steps",
+                f"{phase} exceeded the limit of {self.max_steps} steps",
+                phase,
+                states,
+                steps,
+                configurations,
+            )
+        if (
+            configurations is not None
+            and self.max_configurations is not None
+            and configurations > self.max_configurations
+        ):
+            self._raise(
+                "max_configurations",
+                f"{phase} exceeded the limit of "
+                f"{self.max_configurations} configurations",
+                phase,
+                states,
+                steps,
+                configurations,
+            )
+        if self.cancellation_token is not None and self.cancellation_token.cancelled:
+            self._raise(
+                "cancelled",
+                f"{phase} was cancelled",
+                phase,
+                states,
+                steps,
+                configurations,
+            )
+        if self.deadline is not None and perf_counter() > self.deadline:
+            self._raise(
+                "timeout",
+                f"{phase} did not finish before the deadline",
+                phase,
+                states,
+                steps,
+                configurations,
+            )
+
+    def _raise(
+        self,
+        limit: str,
+        message: str,
+        phase: str,
+        states: Optional[int],
+        steps: Optional[int],
+        configurations: Optional[int],
+    ) -> None:
+        """Raise a ResourceLimitError with the progress of the operation."""
+        stats: Dict[str, Union[int, float]] = {
+            name: value
+            for name, value in (
+                ("states", states),
+                ("steps", steps),
+                ("configurations", configurations),
+            )
+            if value is not None
+        }
+        stats["elapsed"] = perf_counter() - self.start_time
+        raise exceptions.ResourceLimitError(
+            message, limit=limit, phase=phase, stats=stats
+        )
+
+
+_active_limits: ContextVar[Optional[ResourceLimits]] = ContextVar(
+    "automata_resource_limits", default=None
+)
+
+
+def get_resource_limits() -> Optional[ResourceLimits]:
+    """
+    Return the resource limits active in the current context, if any.
+
+    Returns
+    ------
+    Optional[ResourceLimits]
+        The active limits, or None if resource use is unlimited.
+    """
+    return _active_limits.get()
+
+
+@contextmanager
+def resource_limits(
+    limits: Optional[ResourceLimits] = None,
+    *,
+    max_states: Optional[int] = None,
+    max_steps: Optional[int] = None,
+    max_configurations: Optional[int] = None,
+    timeout: Optional[float] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> Iterator[ResourceLimits]:
+    """
+    Limit the resources used by automaton algorithms run within a block.
+    Limits replace, rather than add to, any limits active outside the block.
+
+    Parameters
+    ----------
+    limits : Optional[ResourceLimits], default: None
+        Existing limits to apply. If None, new limits are created from the
+        remaining arguments, with the timeout counted from the start of the
+        block.
+    max_states : Optional[int], default: None
+        The maximum number of states an automaton construction may produce.
+    max_steps : Optional[int], default: None
+        The maximum number of steps an NPDA or NTM simulation may take.
+    max_configurations : Optional[int], default: None
+        The maximum number of configurations an NPDA or NTM simulation may
+        track at once.
+    timeout : Optional[float], default: None
+        The number of seconds after which operations are interrupted.
+    cancellation_token : Optional[CancellationToken], default: None
+        A token that interrupts operations once cancelled.
+
+    Yields
+    ------
+    ResourceLimits
+        The active limits.
+    """
+    if limits is None:
+        limits = ResourceLimits(
+            max_states=max_states,
+            max_steps=max_steps,
+            max_configurations=max_configurations,
+            timeout=timeout,
+            cancellation_token=cancellation_token,
+        )
+    token = _active_limits.set(limits)
+    try:
+        yield limits
+    finally:
+        _active_limits.reset(token)
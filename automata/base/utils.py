@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 import os
 import pathlib
 import random
@@ -227,6 +228,27 @@ def pairwise(iterable: Iterable[T], final_none: bool = False) -> Iterable[Tuple[
     return zip(a, b)
 
 
+def sample_poisson(mean: float, rng: random.Random) -> int:
+    """
+    Sample a Poisson-distributed count with the given mean. Small means are
+    sampled exactly by inversion, and large means with a normal approximation
+    so that sampling takes constant time.
+    """
+    if mean <= 0:
+        return 0
+    if mean > 30:
+        return max(0, round(rng.gauss(mean, math.sqrt(mean))))
+
+    threshold = rng.random()
+    probability = cumulative = math.exp(-mean)
+    count = 0
+    while threshold > cumulative and probability > 0:
+        count += 1
+        probability *= mean / count
+        cumulative += probability
+    return count
+
+
 def get_reachable_nodes(
     G: nx.DiGraph,
     sources: Iterable[Any],
@@ -252,3 +274,59 @@ def get_reachable_nodes(
             work_deque.append(neighbor)
 
     return seen
+
+
+def get_strongly_connected_components(
+    nodes: Iterable[T], get_successors: Callable[[T], Iterable[T]]
+) -> List[List[T]]:
+    """
+    Return the strongly connected components of the graph with the given
+    nodes and edges, in reverse topological order: every edge leaving a
+    component leads to a component that comes before it. Uses an iterative
+    version of Tarjan's algorithm, so deep graphs do not hit the recursion
+    limit.
+    """
+    index: Dict[T, int] = {}
+    lowlink: Dict[T, int] = {}
+    stack: List[T] = []
+    on_stack: Set[T] = set()
+    components: List[List[T]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(get_successors(root)))]
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(get_successors(successor))))
+                    break
+                if successor in on_stack and index[successor] < lowlink[node]:
+                    lowlink[node] = index[successor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
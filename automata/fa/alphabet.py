@@ -0,0 +1,255 @@
+"""Classes and methods for compressing the alphabets of finite automata."""
+
+from __future__ import annotations
+
+import array
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import automata.base.exceptions as exceptions
+import automata.fa.fa as fa
+from automata.base.utils import PartitionRefinement
+
+if TYPE_CHECKING:
+    import automata.fa.dfa as dfa
+
+
+class SymbolClasses:
+    """
+    A partition of the input symbols of an automaton into equivalence classes.
+    Two symbols are equivalent if every state has the same transitions on
+    both of them, so an automaton only needs to store one transition per
+    class instead of one transition per symbol.
+
+    Classes are numbered from zero in order of their smallest symbol.
+
+    Parameters
+    ----------
+    classes : Iterable[AbstractSet[str]]
+        The disjoint, non-empty sets of equivalent symbols.
+    """
+
+    __slots__ = ("classes", "class_of")
+
+    classes: Tuple[FrozenSet[str], ...]
+    class_of: Dict[str, int]
+
+    def __init__(self, classes: Iterable[AbstractSet[str]]) -> None:
+        """Initialize the symbol classes and the symbol lookup table."""
+        self.classes = tuple(
+            sorted((frozenset(symbols) for symbols in classes if symbols), key=min)
+        )
+        self.class_of = {}
+        for class_index, symbols in enumerate(self.classes):
+            for symbol in symbols:
+                if symbol in self.class_of:
+                    raise ValueError(f"symbol {symbol} is in more than one class")
+                self.class_of[symbol] = class_index
+
+    @classmethod
+    def from_transitions(
+        cls,
+        input_symbols: AbstractSet[str],
+        transitions: Iterable[Tuple[fa.FAStateT, fa.FAStateT, str]],
+    ) -> SymbolClasses:
+        """
+        Compute the coarsest symbol classes respecting the given transitions.
+
+        Parameters
+        ----------
+        input_symbols : AbstractSet[str]
+            The symbols to partition.
+        transitions : Iterable[Tuple[FAStateT, FAStateT, str]]
+            The transitions of the automaton, as given by `iter_transitions`.
+            Lambda transitions are ignored.
+
+        Returns
+        ------
+        SymbolClasses
+            The symbol classes, where two symbols are in the same class
+            if and only if they label exactly the same transitions.
+        """
+        edge_symbols: DefaultDict[Tuple[fa.FAStateT, fa.FAStateT], Set[str]] = (
+            defaultdict(set)
+        )
+        for start_state, end_state, symbol in transitions:
+            if symbol != "":
+                edge_symbols[start_state, end_state].add(symbol)
+
+        partition = PartitionRefinement(input_symbols)
+        for symbols in edge_symbols.values():
+            partition.refine(symbols)
+
+        return cls(partition.get_sets())
+
+    def __len__(self) -> int:
+        """Return the number of symbol classes."""
+        return len(self.classes)
+
+    def __iter__(self) -> Iterator[FrozenSet[str]]:
+        """Iterate over the symbol classes in order."""
+        return iter(self.classes)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the symbol classes."""
+        return f"{self.__class__.__qualname__}({list(map(set, self.classes))!r})"
+
+    def representatives(self) -> Tuple[str, ...]:
+        """
+        Return the smallest symbol of each class, in class order.
+
+        Returns
+        ------
+        Tuple[str, ...]
+            A symbol from each class.
+        """
+        return tuple(min(symbols) for symbols in self.classes)
+
+    def classify(self, input_str: str) -> Optional[array.array]:
+        """
+        Translate the input string into its sequence of class indices.
+
+        Parameters
+        ----------
+        input_str : str
+            The string to translate.
+
+        Returns
+        ------
+        Optional[array.array]
+            The class index of each symbol in the string, or None if the
+            string contains a symbol not in any class.
+        """
+        class_of = self.class_of
+        class_indices = array.array("i")
+        for symbol in input_str:
+            class_index = class_of.get(symbol)
+            if class_index is None:
+                return None
+            class_indices.append(class_index)
+        return class_indices
+
+
+class CompressedDFA:
+    """
+    A read-only, memory-compact representation of a DFA for fast matching.
+
+    States are numbered from zero (the initial state), and the transitions
+    are stored in a flat integer table with one row per state and one column
+    per symbol class, where -1 marks a missing transition.
+
+    Instances are created using `DFA.compress`.
+    """
+
+    __slots__ = (
+        "symbol_classes",
+        "states",
+        "final_states",
+        "table",
+    )
+
+    symbol_classes: SymbolClasses
+    states: Tuple[fa.FAStateT, ...]
+    final_states: bytearray
+    table: array.array
+
+    def __init__(self, target_dfa: dfa.DFA) -> None:
+        """Build the compressed transition table of the given DFA."""
+        symbol_classes = target_dfa.symbol_classes()
+        representatives = symbol_classes.representatives()
+
+        states = [target_dfa.initial_state]
+        states.extend(
+            state for state in target_dfa.states if state != target_dfa.initial_state
+        )
+        state_index = {state: i for i, state in enumerate(states)}
+
+        table = array.array("i", [-1]) * (len(states) * len(representatives))
+        for i, state in enumerate(states):
+            paths = target_dfa.transitions[state]
+            row = i * len(representatives)
+            for class_index, symbol in enumerate(representatives):
+                end_state = paths.get(symbol)
+                if end_state is not None:
+                    table[row + class_index] = state_index[end_state]
+
+        self.symbol_classes = symbol_classes
+        self.states = tuple(states)
+        self.final_states = bytearray(
+            state in target_dfa.final_states for state in states
+        )
+        self.table = table
+
+    def _read_input(self, input_str: str) -> int:
+        """Return the index of the state reached on the input, or -1."""
+        class_of = self.symbol_classes.class_of
+        class_count = len(self.symbol_classes)
+        table = self.table
+
+        current_state = 0
+        for symbol in input_str:
+            class_index = class_of.get(symbol)
+            if class_index is None:
+                return -1
+            current_state = table[current_state * class_count + class_index]
+            if current_state < 0:
+                return -1
+        return current_state
+
+    def accepts_input(self, input_str: str) -> bool:
+        """
+        Return True if the compressed DFA accepts the given input.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to check.
+
+        Returns
+        ------
+        bool
+            Whether the DFA accepts the input.
+        """
+        current_state = self._read_input(input_str)
+        return current_state >= 0 and bool(self.final_states[current_state])
+
+    def read_input(self, input_str: str) -> fa.FAStateT:
+        """
+        Check if the given string is accepted by the compressed DFA.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to read.
+
+        Returns
+        ------
+        FAStateT
+            The final state the DFA stopped on, if the input is accepted.
+
+        Raises
+        ------
+        RejectionException
+            Raised if the DFA does not accept the input.
+        """
+        current_state = self._read_input(input_str)
+        if current_state < 0:
+            raise exceptions.RejectionException(
+                "the DFA has no transition for the input"
+            )
+        if not self.final_states[current_state]:
+            raise exceptions.RejectionException(
+                f"the DFA stopped on a non-final state ({self.states[current_state]})"
+            )
+        return self.states[current_state]
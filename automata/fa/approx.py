@@ -0,0 +1,276 @@
+"""Classes and methods for bit-parallel approximate string matching."""
+
+from __future__ import annotations
+
+from typing import AbstractSet, Dict, Generator, List, Optional, Tuple
+
+import automata.base.exceptions as exceptions
+
+
+class ApproximateMatcher:
+    """
+    The `ApproximateMatcher` class recognizes the same language as the
+    Levenshtein NFA built by `NFA.edit_distance`, but simulates it with
+    bit-parallel operations on Python integers instead of sets of states.
+
+    Each row of the Levenshtein NFA (all states with the same number of
+    errors) is stored as a single integer, so reading a symbol takes a
+    constant number of integer operations per allowed error (Wu-Manber). When
+    all error types are enabled and any symbol may be inserted or substituted,
+    Myers' bit-vector algorithm is used instead, which reads a symbol in a
+    constant number of integer operations regardless of the edit distance.
+
+    Parameters
+    ----------
+    pattern : str
+        The reference string to match other strings against.
+    max_edit_distance : int
+        The maximum edit distance from the pattern of strings to match.
+    input_symbols : Optional[AbstractSet[str]], default: None
+        The symbols which may be inserted or substituted, as with the
+        `input_symbols` of `NFA.edit_distance`. If None, any symbol may be.
+    insertion : bool, default: True
+        Whether to recognize insertion edits relative to the pattern.
+    deletion : bool, default: True
+        Whether to recognize deletion edits relative to the pattern.
+    substitution : bool, default: True
+        Whether to recognize substitution edits relative to the pattern.
+    """
+
+    __slots__ = (
+        "pattern",
+        "max_edit_distance",
+        "input_symbols",
+        "insertion",
+        "deletion",
+        "substitution",
+        "_symbol_masks",
+        "_use_myers",
+    )
+
+    pattern: str
+    max_edit_distance: int
+    input_symbols: Optional[AbstractSet[str]]
+    insertion: bool
+    deletion: bool
+    substitution: bool
+    _symbol_masks: Dict[str, int]
+    _use_myers: bool
+
+    def __init__(
+        self,
+        pattern: str,
+        max_edit_distance: int,
+        *,
+        input_symbols: Optional[AbstractSet[str]] = None,
+        insertion: bool = True,
+        deletion: bool = True,
+        substitution: bool = True,
+    ) -> None:
+        """Initialize a matcher for the given pattern and edit distance."""
+        if max_edit_distance < 0:
+            raise ValueError("max_edit_distance must be greater than zero")
+        if not (insertion or deletion or substitution):
+            raise ValueError(
+                "At least one of insertion, deletion, or substitution must be enabled."
+            )
+        if input_symbols is not None:
+            input_symbols = frozenset(input_symbols)
+            for symbol in pattern:
+                if symbol not in input_symbols:
+                    raise exceptions.InvalidSymbolError(
+                        f"pattern symbol {symbol} is not a valid input symbol"
+                    )
+
+        self.pattern = pattern
+        self.max_edit_distance = max_edit_distance
+        self.input_symbols = input_symbols
+        self.insertion = insertion
+        self.deletion = deletion
+        self.substitution = substitution
+
+        # Bit i of the mask for a symbol is set if the pattern has that
+        # symbol at position i
+        self._symbol_masks = {}
+        for i, symbol in enumerate(pattern):
+            self._symbol_masks[symbol] = self._symbol_masks.get(symbol, 0) | (1 << i)
+
+        self._use_myers = (
+            insertion
+            and deletion
+            and substitution
+            and input_symbols is None
+            and len(pattern) > 0
+        )
+
+    def distance(self, text: str) -> Optional[int]:
+        """
+        Return the edit distance between the text and the pattern, using only
+        the enabled error types.
+
+        Parameters
+        ----------
+        text : str
+            The string to compare to the pattern.
+
+        Returns
+        ------
+        Optional[int]
+            The edit distance between the text and the pattern, or None if it
+            exceeds max_edit_distance.
+        """
+        if self._use_myers:
+            score = self._myers_distances(text, search=False)[-1]
+            return score if score <= self.max_edit_distance else None
+
+        rows = self._get_initial_rows()
+        for symbol in text:
+            rows = self._step(rows, symbol)
+            if not any(rows):
+                return None
+
+        return self._get_match_distance(rows)
+
+    def fullmatch(self, text: str) -> bool:
+        """
+        Return True if the text is within the edit distance of the pattern.
+        This is equivalent to `accepts_input` on the corresponding
+        `NFA.edit_distance` automaton.
+
+        Parameters
+        ----------
+        text : str
+            The string to compare to the pattern.
+
+        Returns
+        ------
+        bool
+            True if the text is within max_edit_distance of the pattern.
+        """
+        return self.distance(text) is not None
+
+    def search(self, text: str) -> Generator[Tuple[int, int], None, None]:
+        """
+        Generates every position in the text at which a substring within the
+        edit distance of the pattern ends.
+
+        Parameters
+        ----------
+        text : str
+            The string to search through.
+
+        Returns
+        ------
+        Generator[Tuple[int, int], None, None]
+            A generator of pairs (end, distance), in increasing order of end,
+            where text[start:end] is within distance of the pattern for some
+            start, and distance is the smallest such edit distance.
+        """
+        if self._use_myers:
+            for end, score in enumerate(self._myers_distances(text, search=True)):
+                if score <= self.max_edit_distance:
+                    yield end, score
+            return
+
+        rows = self._get_initial_rows()
+        match_distance = self._get_match_distance(rows)
+        if match_distance is not None:
+            yield 0, match_distance
+
+        for end, symbol in enumerate(text, start=1):
+            rows = self._step(rows, symbol)
+            # A new match may start after every symbol read
+            rows[0] |= 1
+            self._add_deletions(rows)
+
+            match_distance = self._get_match_distance(rows)
+            if match_distance is not None:
+                yield end, match_distance
+
+    def _get_initial_rows(self) -> List[int]:
+        """Return the active states of each row before reading any input."""
+        rows = [0] * (self.max_edit_distance + 1)
+        rows[0] = 1
+        self._add_deletions(rows)
+        return rows
+
+    def _add_deletions(self, rows: List[int]) -> None:
+        """Follow the deletion (lambda) transitions between consecutive rows."""
+        if not self.deletion:
+            return
+
+        pattern_mask = (1 << len(self.pattern)) - 1
+        for errors in range(1, len(rows)):
+            rows[errors] |= (rows[errors - 1] & pattern_mask) << 1
+
+    def _step(self, rows: List[int], symbol: str) -> List[int]:
+        """Return the active states of each row after reading the symbol."""
+        symbol_mask = self._symbol_masks.get(symbol, 0)
+        pattern_mask = (1 << len(self.pattern)) - 1
+        can_edit = self.input_symbols is None or symbol in self.input_symbols
+
+        next_rows = [(rows[0] & symbol_mask) << 1]
+        for errors in range(1, len(rows)):
+            next_row = (rows[errors] & symbol_mask) << 1
+            if can_edit:
+                if self.insertion:
+                    next_row |= rows[errors - 1]
+                if self.substitution:
+                    next_row |= (rows[errors - 1] & pattern_mask) << 1
+            next_rows.append(next_row)
+
+        self._add_deletions(next_rows)
+        return next_rows
+
+    def _get_match_distance(self, rows: List[int]) -> Optional[int]:
+        """Return the fewest errors of an active final state, if any."""
+        final_bit = 1 << len(self.pattern)
+        for errors, row in enumerate(rows):
+            if row & final_bit:
+                return errors
+        return None
+
+    def _myers_distances(self, text: str, *, search: bool) -> List[int]:
+        """
+        Compute the last row of the edit distance table between the pattern
+        and each prefix of the text using Myers' bit-vector algorithm. If
+        search is True, the match may start anywhere in the text.
+        """
+        pattern_length = len(self.pattern)
+        pattern_mask = (1 << pattern_length) - 1
+        high_bit = 1 << (pattern_length - 1)
+
+        positive_vector = pattern_mask
+        negative_vector = 0
+        score = pattern_length
+        scores = [score]
+
+        for symbol in text:
+            symbol_mask = self._symbol_masks.get(symbol, 0)
+            x_vertical = symbol_mask | negative_vector
+            x_horizontal = (
+                ((symbol_mask & positive_vector) + positive_vector) ^ positive_vector
+            ) | symbol_mask
+            positive_horizontal = negative_vector | (
+                ~(x_horizontal | positive_vector) & pattern_mask
+            )
+            negative_horizontal = positive_vector & x_horizontal
+
+            if positive_horizontal & high_bit:
+                score += 1
+            elif negative_horizontal & high_bit:
+                score -= 1
+
+            positive_horizontal = (positive_horizontal << 1) & pattern_mask
+            negative_horizontal = (negative_horizontal << 1) & pattern_mask
+            if not search:
+                # The first row of the table grows with the length of the text
+                positive_horizontal |= 1
+
+            positive_vector = negative_horizontal | (
+                ~(x_vertical | positive_horizontal) & pattern_mask
+            )
+            negative_vector = positive_horizontal & x_vertical
+            scores.append(score)
+
+        return scores
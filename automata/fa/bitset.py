@@ -0,0 +1,410 @@
+"""Classes and methods for simulating NFAs with bitsets of states."""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import automata.base.exceptions as exceptions
+import automata.fa.fa as fa
+from automata.base.utils import get_strongly_connected_components
+
+if TYPE_CHECKING:
+    import automata.fa.nfa as nfa
+
+# The successors of each byte of a bitset, indexed by the value of the byte.
+# Entries are computed when first needed.
+ChunkTableT = List[Optional[int]]
+# The nonempty successors of a set of states on each class of symbols with the
+# same successors, by the index of the class
+PathsT = Tuple[Tuple[int, int], ...]
+
+# The positions of the bits set in each byte
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+
+
+def iter_bits(mask: int) -> Generator[int, None, None]:
+    """Yield the indices of the bits set in the given bitset, in order."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+class MaskImage:
+    """
+    The image of bitsets of states under a relation, given by the bitset
+    image of each state. Sparse bitsets are read a state at a time. Other
+    bitsets are read a byte at a time, and the image of each byte is cached
+    in a table filled in as it is used.
+
+    Parameters
+    ----------
+    rows : List[int]
+        The image of each state, as a bitset.
+    """
+
+    __slots__ = ("rows", "_tables", "_byte_count")
+
+    rows: List[int]
+    _tables: List[Optional[ChunkTableT]]
+    _byte_count: int
+
+    def __init__(self, rows: List[int]) -> None:
+        self.rows = rows
+        self._byte_count = (len(rows) + 7) // 8
+        self._tables = [None] * self._byte_count
+
+    def __call__(self, mask: int) -> int:
+        """Return the union of the images of the states in the bitset."""
+        rows = self.rows
+        image = 0
+        if mask.bit_count() * 4 < self._byte_count:
+            while mask:
+                low_bit = mask & -mask
+                image |= rows[low_bit.bit_length() - 1]
+                mask ^= low_bit
+            return image
+
+        tables = self._tables
+        for chunk_index, byte in enumerate(mask.to_bytes(self._byte_count, "little")):
+            if not byte:
+                continue
+            table = tables[chunk_index]
+            if table is None:
+                table = [None] * 256
+                tables[chunk_index] = table
+            chunk_image = table[byte]
+            if chunk_image is None:
+                chunk_image = 0
+                offset = chunk_index * 8
+                for bit in _BYTE_BITS[byte]:
+                    chunk_image |= rows[offset + bit]
+                table[byte] = chunk_image
+            image |= chunk_image
+        return image
+
+
+class BitsetNFA:
+    """
+    The `BitsetNFA` class simulates an NFA with sets of states represented as
+    Python integers, where bit i is set if the NFA is in the state with index
+    i. The lambda closures and the successors of every state on every symbol
+    are precomputed, so that reading a symbol only ORs together successor
+    masks.
+
+    Sets of several states are read a byte at a time: for each byte of the
+    bitset, the union of the successors of its (up to eight) states is looked
+    up in a table, which is filled in as the NFA is simulated. Symbols with
+    the same successors share their tables. Sparse sets of states are read a
+    state at a time instead. The successors of a set of states on every
+    symbol at once, as needed for the subset construction, are computed the
+    same way.
+
+    The initial state has index 0.
+
+    Instances are created using `NFA.to_bitset`.
+    """
+
+    __slots__ = (
+        "states",
+        "state_index",
+        "initial_mask",
+        "final_mask",
+        "successors",
+        "_images",
+        "_class_symbols",
+        "_state_paths",
+        "_chunk_paths",
+        "_byte_count",
+    )
+
+    states: Tuple[fa.FAStateT, ...]
+    state_index: Dict[fa.FAStateT, int]
+    initial_mask: int
+    final_mask: int
+    successors: Dict[str, List[int]]
+    _images: Dict[str, MaskImage]
+    _class_symbols: Tuple[Tuple[str, ...], ...]
+    _state_paths: List[PathsT]
+    _chunk_paths: List[Optional[List[Optional[PathsT]]]]
+    _byte_count: int
+
+    def __init__(self, target_nfa: nfa.NFA) -> None:
+        """Precompute the successor masks of the given NFA."""
+        states = [target_nfa.initial_state]
+        states.extend(
+            state for state in target_nfa.states if state != target_nfa.initial_state
+        )
+        state_index = {state: i for i, state in enumerate(states)}
+
+        # The lambda closures are computed as bitsets directly, one strongly
+        # connected component of the lambda transitions at a time, in reverse
+        # topological order
+        lambda_successors = {
+            state: end_states
+            for state, paths in target_nfa.transitions.items()
+            if (end_states := paths.get(""))
+        }
+        closure_masks: Dict[fa.FAStateT, int] = {}
+        for component in get_strongly_connected_components(
+            states, lambda state: lambda_successors.get(state, ())
+        ):
+            mask = 0
+            for state in component:
+                mask |= 1 << state_index[state]
+                for end_state in lambda_successors.get(state, ()):
+                    mask |= closure_masks.get(end_state, 0)
+            for state in component:
+                closure_masks[state] = mask
+
+        successors: Dict[str, List[int]] = {}
+        for state, paths in target_nfa.transitions.items():
+            i = state_index[state]
+            for symbol, end_states in paths.items():
+                if not symbol or not end_states:
+                    continue
+                symbol_successors = successors.get(symbol)
+                if symbol_successors is None:
+                    symbol_successors = successors[symbol] = [0] * len(states)
+                mask = 0
+                for end_state in end_states:
+                    mask |= closure_masks[end_state]
+                symbol_successors[i] = mask
+
+        # Share the successors and tables of symbols with the same successors
+        byte_count = (len(states) + 7) // 8
+        shared_images: Dict[Tuple[int, ...], MaskImage] = {}
+        images = {}
+        class_symbols: Dict[Tuple[int, ...], List[str]] = {}
+        for symbol, symbol_successors in successors.items():
+            key = tuple(symbol_successors)
+            image = shared_images.get(key)
+            if image is None:
+                image = shared_images[key] = MaskImage(symbol_successors)
+            successors[symbol] = image.rows
+            images[symbol] = image
+            class_symbols.setdefault(key, []).append(symbol)
+
+        # Index the successors of each state by class of symbols, so that the
+        # subset construction does not handle each symbol separately
+        state_paths: List[List[Tuple[int, int]]] = [[] for _ in states]
+        for class_index, key in enumerate(class_symbols):
+            for i, mask in enumerate(key):
+                if mask:
+                    state_paths[i].append((class_index, mask))
+
+        self.states = tuple(states)
+        self.state_index = state_index
+        self.initial_mask = closure_masks[target_nfa.initial_state]
+        self.final_mask = self.to_mask(target_nfa.final_states)
+        self.successors = successors
+        self._images = images
+        self._class_symbols = tuple(map(tuple, class_symbols.values()))
+        self._state_paths = [tuple(paths) for paths in state_paths]
+        self._chunk_paths = [None] * byte_count
+        self._byte_count = byte_count
+
+    def to_mask(self, states: AbstractSet[fa.FAStateT]) -> int:
+        """
+        Return the bitset representing the given states.
+
+        Parameters
+        ----------
+        states : AbstractSet[FAStateT]
+            A set of states of the NFA.
+
+        Returns
+        ------
+        int
+            The bitset with the bits of the given states set.
+        """
+        state_index = self.state_index
+        return sum(1 << state_index[state] for state in states)
+
+    def to_states(self, mask: int) -> FrozenSet[fa.FAStateT]:
+        """
+        Return the states in the given bitset.
+
+        Parameters
+        ----------
+        mask : int
+            A bitset of states.
+
+        Returns
+        ------
+        FrozenSet[FAStateT]
+            The states whose bits are set in the bitset.
+        """
+        states = self.states
+        result = []
+        for chunk_index, byte in enumerate(mask.to_bytes(self._byte_count, "little")):
+            if byte:
+                offset = chunk_index * 8
+                result.extend([states[offset + bit] for bit in _BYTE_BITS[byte]])
+        return frozenset(result)
+
+    def step(self, mask: int, symbol: str) -> int:
+        """
+        Return the bitset of states reached by reading a symbol.
+
+        Parameters
+        ----------
+        mask : int
+            The bitset of current states, which must be closed under lambda
+            transitions.
+        symbol : str
+            The symbol to read.
+
+        Returns
+        ------
+        int
+            The bitset of next states, closed under lambda transitions.
+        """
+        image = self._images.get(symbol)
+        if image is None:
+            return 0
+        return image(mask)
+
+    def successor_masks(self, mask: int) -> Dict[str, int]:
+        """
+        Return the bitsets of states reached by reading each symbol, which is
+        one step of the subset construction.
+
+        Parameters
+        ----------
+        mask : int
+            The bitset of current states, which must be closed under lambda
+            transitions.
+
+        Returns
+        ------
+        Dict[str, int]
+            The bitset of next states on each symbol, closed under lambda
+            transitions. Symbols with no next states are omitted.
+        """
+        class_masks: Dict[int, int] = {}
+        get_mask = class_masks.get
+        state_paths = self._state_paths
+
+        if mask.bit_count() * 4 < self._byte_count:
+            while mask:
+                low_bit = mask & -mask
+                bit_paths = state_paths[low_bit.bit_length() - 1]
+                for class_index, successor_mask in bit_paths:
+                    class_masks[class_index] = get_mask(class_index, 0) | successor_mask
+                mask ^= low_bit
+        else:
+            chunk_paths = self._chunk_paths
+            for chunk_index, byte in enumerate(
+                mask.to_bytes(self._byte_count, "little")
+            ):
+                if not byte:
+                    continue
+                table = chunk_paths[chunk_index]
+                if table is None:
+                    table = [None] * 256
+                    chunk_paths[chunk_index] = table
+                paths = table[byte]
+                if paths is None:
+                    merged_paths: Dict[int, int] = {}
+                    offset = chunk_index * 8
+                    for bit in _BYTE_BITS[byte]:
+                        for class_index, successor_mask in state_paths[offset + bit]:
+                            merged_paths[class_index] = (
+                                merged_paths.get(class_index, 0) | successor_mask
+                            )
+                    paths = tuple(merged_paths.items())
+                    table[byte] = paths
+                for class_index, successor_mask in paths:
+                    class_masks[class_index] = get_mask(class_index, 0) | successor_mask
+
+        next_masks: Dict[str, int] = {}
+        class_symbols = self._class_symbols
+        for class_index, successor_mask in class_masks.items():
+            next_masks.update(dict.fromkeys(class_symbols[class_index], successor_mask))
+        return next_masks
+
+    def read_input_stepwise(self, input_str: str) -> Generator[int, None, None]:
+        """
+        Return a generator that yields the bitset of current states at each
+        step while reading input. Unlike `NFA.read_input_stepwise`, no
+        exception is raised if the input is rejected.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to read.
+
+        Yields
+        ------
+        Generator[int, None, None]
+            The bitset of current states after each step of reading input.
+        """
+        mask = self.initial_mask
+        yield mask
+        step = self.step
+        for symbol in input_str:
+            mask = step(mask, symbol)
+            yield mask
+
+    def accepts_input(self, input_str: str) -> bool:
+        """
+        Return True if the NFA accepts the given input.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to check.
+
+        Returns
+        ------
+        bool
+            Whether the NFA accepts the input.
+        """
+        step = self.step
+        mask = self.initial_mask
+        for symbol in input_str:
+            mask = step(mask, symbol)
+            if not mask:
+                return False
+        return bool(mask & self.final_mask)
+
+    def read_input(self, input_str: str) -> FrozenSet[fa.FAStateT]:
+        """
+        Check if the given string is accepted by the NFA.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to read.
+
+        Returns
+        ------
+        FrozenSet[FAStateT]
+            The states the NFA stopped on, if the input is accepted.
+
+        Raises
+        ------
+        RejectionException
+            Raised if the NFA does not accept the input.
+        """
+        for mask in self.read_input_stepwise(input_str):
+            pass
+        if not mask & self.final_mask:
+            raise exceptions.RejectionException(
+                "the NFA stopped on all non-final states ({})".format(
+                    ", ".join(str(state) for state in self.to_states(mask))
+                )
+            )
+        return self.to_states(mask)
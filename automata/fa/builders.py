@@ -0,0 +1,308 @@
+"""
+Classes for building finite automata incrementally. Builders accumulate
+states and transitions in plain mutable structures, then freeze them once
+and hand them to the automaton directly, avoiding the recursive copy and
+validation performed by the automaton constructors.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+)
+
+from frozendict import frozendict
+
+import automata.base.config as global_config
+import automata.base.exceptions as exceptions
+import automata.fa.dfa as dfa
+import automata.fa.nfa as nfa
+from automata.fa.fa import FAStateT
+
+# Marks a builder whose initial state has not been set, since None is a
+# valid state name
+_NO_INITIAL_STATE: Any = object()
+
+
+class _FABuilder:
+    """The states and symbols shared by all finite automaton builders."""
+
+    __slots__ = ("_states", "_input_symbols", "_initial_state", "_final_states")
+
+    def __init__(self, input_symbols: Iterable[str] = ()) -> None:
+        self._states: Set[FAStateT] = set()
+        self._input_symbols: Set[str] = set(input_symbols)
+        self._initial_state: FAStateT = _NO_INITIAL_STATE
+        self._final_states: Set[FAStateT] = set()
+
+    @property
+    def states(self) -> AbstractSet[FAStateT]:
+        """The states added to this builder so far."""
+        return self._states
+
+    def add_state(
+        self, state: FAStateT, *, initial: bool = False, final: bool = False
+    ) -> None:
+        """
+        Add a state to the automaton being built. Adding a state that already
+        exists has no effect, other than marking it initial or final.
+
+        Parameters
+        ----------
+        state : FAStateT
+            The state to add.
+        initial : bool, default: False
+            Whether to make the state the initial state.
+        final : bool, default: False
+            Whether to make the state a final state.
+        """
+        self._states.add(state)
+        if initial:
+            self._initial_state = state
+        if final:
+            self._final_states.add(state)
+
+    def add_input_symbol(self, symbol: str) -> None:
+        """
+        Add an input symbol to the automaton being built, even if no
+        transition uses it.
+
+        Parameters
+        ----------
+        symbol : str
+            The input symbol to add.
+        """
+        self._input_symbols.add(symbol)
+
+    def set_initial(self, state: FAStateT) -> None:
+        """
+        Set the initial state of the automaton being built, adding the state
+        if necessary.
+
+        Parameters
+        ----------
+        state : FAStateT
+            The new initial state.
+        """
+        self.add_state(state, initial=True)
+
+    def set_final(self, state: FAStateT, final: bool = True) -> None:
+        """
+        Mark whether a state of the automaton being built is final, adding
+        the state if necessary.
+
+        Parameters
+        ----------
+        state : FAStateT
+            The state to mark.
+        final : bool, default: True
+            Whether the state should be final.
+        """
+        self._states.add(state)
+        if final:
+            self._final_states.add(state)
+        else:
+            self._final_states.discard(state)
+
+    def _get_initial_state(self) -> FAStateT:
+        """Return the initial state, raising an error if it has not been set."""
+        if self._initial_state is _NO_INITIAL_STATE:
+            raise exceptions.MissingStateError("no initial state has been set")
+        return self._initial_state
+
+    @staticmethod
+    def _should_validate(validate: Optional[bool]) -> bool:
+        """Return whether a built automaton should be validated."""
+        if validate is None:
+            return global_config.should_validate_automata
+        return validate
+
+
+class DFABuilder(_FABuilder):
+    """
+    A mutable builder for DFAs.
+
+    Parameters
+    ----------
+    input_symbols : Iterable[str], default: ()
+        Input symbols to include in the DFA in addition to those used by
+        transitions.
+    allow_partial : bool, default: False
+        Whether the built DFA may have missing transitions.
+    """
+
+    __slots__ = ("_transitions", "_allow_partial")
+
+    def __init__(
+        self,
+        input_symbols: Iterable[str] = (),
+        *,
+        allow_partial: bool = False,
+    ) -> None:
+        super().__init__(input_symbols)
+        self._transitions: Dict[FAStateT, Dict[str, FAStateT]] = {}
+        self._allow_partial = allow_partial
+
+    def add_transition(
+        self, start_state: FAStateT, symbol: str, end_state: FAStateT
+    ) -> None:
+        """
+        Add a transition to the DFA being built, replacing any existing
+        transition from start_state on symbol. Both states and the symbol are
+        added if necessary.
+
+        Parameters
+        ----------
+        start_state : FAStateT
+            The state the transition leaves.
+        symbol : str
+            The input symbol the transition reads.
+        end_state : FAStateT
+            The state the transition enters.
+        """
+        self._states.add(start_state)
+        self._states.add(end_state)
+        self._input_symbols.add(symbol)
+        self._transitions.setdefault(start_state, {})[symbol] = end_state
+
+    def build(self, *, validate: Optional[bool] = None) -> dfa.DFA:
+        """
+        Build a DFA from the states and transitions added so far. The builder
+        can continue to be used afterwards without affecting the built DFA.
+
+        Parameters
+        ----------
+        validate : Optional[bool], default: None
+            Whether to validate the built DFA. Defaults to the global
+            should_validate_automata setting.
+
+        Returns
+        ------
+        DFA
+            The built DFA.
+
+        Raises
+        ------
+        MissingStateError
+            If no initial state has been set.
+        """
+        empty_paths: frozendict = frozendict()
+        transitions = frozendict(
+            {
+                state: (
+                    frozendict(self._transitions[state])
+                    if state in self._transitions
+                    else empty_paths
+                )
+                for state in self._states
+            }
+        )
+
+        new_dfa = dfa.DFA._from_trusted(
+            states=frozenset(self._states),
+            input_symbols=frozenset(self._input_symbols),
+            transitions=transitions,
+            initial_state=self._get_initial_state(),
+            final_states=frozenset(self._final_states),
+            allow_partial=self._allow_partial,
+        )
+        if self._should_validate(validate):
+            new_dfa.validate()
+        return new_dfa
+
+
+class NFABuilder(_FABuilder):
+    """
+    A mutable builder for NFAs.
+
+    Parameters
+    ----------
+    input_symbols : Iterable[str], default: ()
+        Input symbols to include in the NFA in addition to those used by
+        transitions.
+    """
+
+    __slots__ = ("_transitions",)
+
+    def __init__(self, input_symbols: Iterable[str] = ()) -> None:
+        super().__init__(input_symbols)
+        self._transitions: Dict[FAStateT, Dict[str, Set[FAStateT]]] = {}
+
+    def add_transition(
+        self, start_state: FAStateT, symbol: str, end_state: FAStateT
+    ) -> None:
+        """
+        Add a transition to the NFA being built. Both states and the symbol
+        are added if necessary; an empty symbol adds a lambda transition.
+
+        Parameters
+        ----------
+        start_state : FAStateT
+            The state the transition leaves.
+        symbol : str
+            The input symbol the transition reads, or "" for a lambda
+            transition.
+        end_state : FAStateT
+            The state the transition enters.
+        """
+        self._states.add(start_state)
+        self._states.add(end_state)
+        if symbol:
+            self._input_symbols.add(symbol)
+        self._transitions.setdefault(start_state, {}).setdefault(symbol, set()).add(
+            end_state
+        )
+
+    def build(self, *, validate: Optional[bool] = None) -> nfa.NFA:
+        """
+        Build an NFA from the states and transitions added so far. The builder
+        can continue to be used afterwards without affecting the built NFA.
+
+        Parameters
+        ----------
+        validate : Optional[bool], default: None
+            Whether to validate the built NFA. Defaults to the global
+            should_validate_automata setting.
+
+        Returns
+        ------
+        NFA
+            The built NFA.
+
+        Raises
+        ------
+        MissingStateError
+            If no initial state has been set.
+        """
+        empty_paths: frozendict = frozendict()
+        transitions = frozendict(
+            {
+                state: (
+                    frozendict(
+                        {
+                            symbol: frozenset(end_states)
+                            for symbol, end_states in self._transitions[state].items()
+                        }
+                    )
+                    if state in self._transitions
+                    else empty_paths
+                )
+                for state in self._states
+            }
+        )
+
+        new_nfa = nfa.NFA._from_trusted(
+            states=frozenset(self._states),
+            input_symbols=frozenset(self._input_symbols),
+            transitions=transitions,
+            initial_state=self._get_initial_state(),
+            final_states=frozenset(self._final_states),
+        )
+        if self._should_validate(validate):
+            new_nfa.validate()
+        return new_nfa
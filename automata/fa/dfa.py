@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import array
+import os
 from collections import defaultdict, deque
 from itertools import chain, count
 from random import Random
+from time import perf_counter
 from typing import (
     AbstractSet,
     Any,
@@ -22,16 +24,25 @@
     Set,
     Tuple,
     Type,
+    Union,
     cast,
 )
 
 import networkx as nx
 from cached_method import cached_method
+from frozendict import frozendict
 from typing_extensions import Self, TypeAlias
 
+import automata.base.config as global_config
 import automata.base.exceptions as exceptions
+import automata.fa.alphabet as alphabet
 import automata.fa.fa as fa
+import automata.fa.generators as generators
 import automata.fa.nfa as nfa
+import automata.fa.serialization as serialization
+from automata.base.cache import cached_operation
+from automata.base.instrumentation import get_stats_collector
+from automata.base.limits import get_resource_limits
 from automata.base.utils import (
     PartitionRefinement,
     _missing_animation_imports,
@@ -39,6 +50,9 @@
     get_renaming_function,
     pairwise,
 )
+from automata.regex.derivatives import TermFactory
+from automata.regex.parser import get_regex_input_symbols
+from automata.regex.syntax import parse_regex_ast
 
 if not _missing_animation_imports:
     from automata.fa.animation import _DFAAnimation
@@ -48,6 +62,11 @@
 DFAPathT = Mapping[DFASymbolT, DFAStateT]
 DFATransitionsT = Mapping[DFAStateT, DFAPathT]
 
+# The sorted input symbols, transition table (one row per state and one column
+# per symbol, with -1 for missing transitions) and final state flags of a
+# canonical DFA
+CanonicalTablesT = Tuple[Tuple[str, ...], array.array, bytes]
+
 ExpandStateReturnType = Iterator[Tuple[DFASymbolT, DFAStateT]]
 ExpandStateFn = Callable[[DFAStateT], ExpandStateReturnType]
 IsFinalStateFn = Callable[[DFAStateT], bool]
@@ -96,6 +115,7 @@ class DFA(fa.FA):
         "allow_partial",
         "_count_cache",
         "_word_cache",
+        "_canonical_tables",
         # These two entries are to allow for caching methods
         "__dict__",
         "__weakref__",
@@ -127,13 +147,39 @@ def __init__(
 
         self.clear_cache()
 
+    @classmethod
+    def _from_trusted(cls, **kwargs: Any) -> Self:
+        new_dfa = super()._from_trusted(**kwargs)
+        new_dfa.clear_cache()
+        return new_dfa
+
+    @staticmethod
+    def _freeze_derived_value(attr_name: str, attr_value: Any) -> Any:
+        """
+        Freeze an attribute of a derived DFA, relying on the transitions being
+        a mapping of mappings whose values are already immutable states.
+        """
+        if isinstance(attr_value, set):
+            return frozenset(attr_value)
+        if attr_name == "transitions" and not isinstance(attr_value, frozendict):
+            return frozendict(
+                {
+                    state: (
+                        paths if isinstance(paths, frozendict) else frozendict(paths)
+                    )
+                    for state, paths in attr_value.items()
+                }
+            )
+        return attr_value
+
     def clear_cache(self) -> None:
         """
-        Resets the word and count caches.
+        Resets the word, count and canonical form caches.
         Can be called if too much memory is being used.
         """
         object.__setattr__(self, "_word_cache", [])
         object.__setattr__(self, "_count_cache", [])
+        object.__setattr__(self, "_canonical_tables", None)
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -147,6 +193,15 @@ def __eq__(self, other: Any) -> bool:
         if not isinstance(other, DFA) or self.input_symbols != other.input_symbols:
             return NotImplemented
 
+        # Canonical forms are equal exactly when the languages are, so compare
+        # them directly if both have already been computed. Mutable automata
+        # never cache them, since they may have changed since.
+        if not global_config.allow_mutable_automata:
+            canonical_tables = getattr(self, "_canonical_tables", None)
+            other_canonical_tables = getattr(other, "_canonical_tables", None)
+            if canonical_tables is not None and other_canonical_tables is not None:
+                return canonical_tables == other_canonical_tables
+
         operand_dfas = (self, other)
         initial_state_a = (self.initial_state, 0)
         initial_state_b = (other.initial_state, 1)
@@ -186,6 +241,13 @@ def transition(state_pair: DFAStatePairT, symbol: str) -> DFAStatePairT:
 
         return True
 
+    def __hash__(self) -> int:
+        """
+        Return a hash of the language accepted by this DFA, so that equal DFAs
+        have equal hashes. See `language_hash`.
+        """
+        return self.language_hash()
+
     def __le__(self, other: DFA) -> bool:
         """Return True if this DFA is a subset of (or equal to) another DFA."""
         if isinstance(other, DFA):
@@ -302,7 +364,7 @@ def to_partial(self, *, retain_names: bool = False, minify: bool = True) -> Self
                 retain_names=retain_names,
             )
 
-        return self.__class__(
+        return self.__class__._from_derived(
             states=new_states,
             input_symbols=self.input_symbols,
             transitions={
@@ -389,7 +451,7 @@ def _to_complete(
         }
         transitions[trap_state] = default_to_trap
 
-        return cls(
+        return cls._from_derived(
             states=frozenset(transitions.keys()),
             input_symbols=input_symbols,
             transitions=transitions,
@@ -555,6 +617,101 @@ def _get_digraph(self) -> nx.DiGraph:
 
         return graph
 
+    @cached_method
+    def _get_coaccessible_states(self) -> Set[DFAStateT]:
+        """Return the set of states from which a final state can be reached"""
+        return get_reachable_nodes(
+            self._get_digraph(), self.final_states, reversed=True
+        )
+
+    @cached_method
+    def symbol_classes(self) -> alphabet.SymbolClasses:
+        """
+        Partition the input symbols of this DFA into equivalence classes,
+        where two symbols are equivalent if every state transitions to the
+        same state on both of them. This partition is cached for the lifetime
+        of the instance.
+
+        Returns
+        ------
+        SymbolClasses
+            The coarsest partition of the input symbols respecting the
+            transitions of this DFA.
+        """
+        return alphabet.SymbolClasses.from_transitions(
+            self.input_symbols, self.iter_transitions()
+        )
+
+    def compress(self) -> alphabet.CompressedDFA:
+        """
+        Create a read-only, compact representation of this DFA for fast
+        matching. Transitions are stored in a flat integer table indexed by
+        state and symbol class, so DFAs over large alphabets whose states treat
+        most symbols alike take far less memory.
+
+        Returns
+        ------
+        CompressedDFA
+            A compressed DFA accepting the same language as this DFA.
+        """
+        return alphabet.CompressedDFA(self)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Save this DFA to a file in a compact binary format, which can be
+        loaded again with `DFA.load`. States must be strings, integers,
+        booleans, None, or tuples and frozensets of these.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The path of the file to write.
+
+        Raises
+        ------
+        SerializationError
+            If a state of this DFA cannot be saved.
+        """
+        serialization.save_dfa(self, path)
+
+    @classmethod
+    def load(
+        cls: Type[Self],
+        path: Union[str, os.PathLike],
+        *,
+        mmap: bool = True,
+        trusted: bool = False,
+    ) -> Self:
+        """
+        Load a DFA saved with `DFA.save`. The transition table is used
+        directly from the file, and state names are decoded lazily, so
+        loading takes constant time when trusted is True.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The path of the file to read.
+        mmap : bool, default: True
+            Whether to memory-map the file instead of reading it into
+            memory. Memory-mapped tables are shared between processes
+            loading the same file.
+        trusted : bool, default: False
+            Whether to skip validating the loaded DFA. Only set this for
+            files written by `DFA.save` that have not been modified.
+
+        Returns
+        ------
+        Self
+            The loaded DFA, whose states and transitions are read-only views.
+
+        Raises
+        ------
+        SerializationError
+            If the file is not a valid DFA file.
+        """
+        return serialization.load_dfa(cls, path, mmap=mmap, trusted=trusted)
+
+    @cached_operation
     def minify(self, retain_names: bool = False) -> Self:
         """
         Create a minimal DFA which accepts the same inputs as this DFA.
@@ -604,6 +761,109 @@ def minify(self, retain_names: bool = False) -> Self:
             retain_names=retain_names,
         )
 
+    def _get_canonical_tables(self) -> CanonicalTablesT:
+        """
+        Return the tables of the canonical form of this DFA, computing them on
+        the first call. The tables are cached for the lifetime of the instance,
+        unless mutable automata are allowed.
+        """
+        cache_tables = not global_config.allow_mutable_automata
+        canonical_tables = getattr(self, "_canonical_tables", None)
+        if cache_tables and canonical_tables is not None:
+            return canonical_tables
+
+        minimal_dfa = self.minify()
+        live_states = get_reachable_nodes(
+            minimal_dfa._get_digraph(), minimal_dfa.final_states, reversed=True
+        )
+        symbols = tuple(sorted(minimal_dfa.input_symbols))
+
+        # Number the live states in breadth-first order, visiting the
+        # successors of each state in symbol order
+        state_indices = {minimal_dfa.initial_state: 0}
+        queue = deque([minimal_dfa.initial_state])
+        table = array.array("i")
+        final_flags = bytearray()
+        while queue:
+            state = queue.popleft()
+            paths = minimal_dfa.transitions[state]
+            final_flags.append(state in minimal_dfa.final_states)
+            for symbol in symbols:
+                if symbol not in paths or paths[symbol] not in live_states:
+                    table.append(-1)
+                    continue
+                end_state = paths[symbol]
+                end_index = state_indices.get(end_state)
+                if end_index is None:
+                    end_index = len(state_indices)
+                    state_indices[end_state] = end_index
+                    queue.append(end_state)
+                table.append(end_index)
+
+        canonical_tables = (symbols, table, bytes(final_flags))
+        if cache_tables:
+            object.__setattr__(self, "_canonical_tables", canonical_tables)
+        return canonical_tables
+
+    def canonical(self) -> Self:
+        """
+        Create the canonical form of this DFA: the minimal partial DFA
+        accepting the same language, without dead states (other than the
+        initial state, if the language is empty), whose states are the
+        integers 0 to n-1 numbered in breadth-first order from the initial
+        state over the sorted input symbols.
+
+        Two DFAs accept the same language exactly when their canonical forms
+        are identical, so canonical forms can be compared structurally.
+
+        Returns
+        ------
+        Self
+            The canonical form of this DFA.
+        """
+        symbols, table, final_flags = self._get_canonical_tables()
+        state_count = len(final_flags)
+        transitions = {
+            state: {
+                symbol: table[state * len(symbols) + column]
+                for column, symbol in enumerate(symbols)
+                if table[state * len(symbols) + column] >= 0
+            }
+            for state in range(state_count)
+        }
+
+        canonical_dfa = self.__class__._from_derived(
+            states=frozenset(range(state_count)),
+            input_symbols=self.input_symbols,
+            transitions=transitions,
+            initial_state=0,
+            final_states=frozenset(
+                state for state in range(state_count) if final_flags[state]
+            ),
+            allow_partial=-1 in table,
+        )
+        if not global_config.allow_mutable_automata:
+            object.__setattr__(
+                canonical_dfa, "_canonical_tables", (symbols, table, final_flags)
+            )
+        return canonical_dfa
+
+    def language_hash(self) -> int:
+        """
+        Return a hash of the language accepted by this DFA, computed from its
+        canonical form. DFAs with the same input symbols accepting the same
+        language have the same hash. The canonical form is computed on the
+        first call and cached, after which equality checks against other DFAs
+        whose canonical forms are cached compare the forms directly.
+
+        Returns
+        ------
+        int
+            The hash of the language accepted by this DFA.
+        """
+        symbols, table, final_flags = self._get_canonical_tables()
+        return hash((symbols, table.tobytes(), final_flags))
+
     @classmethod
     def _minify(
         cls: Type[Self],
@@ -620,6 +880,9 @@ def _minify(
         If the input DFA is partial, then the result is also a partial DFA
         """
 
+        stats = get_stats_collector()
+        start_time = perf_counter() if stats is not None else 0.0
+
         reachable_states = set(reachable_states)
 
         # Per input-symbol backmap (tgt -> origin states)
@@ -665,8 +928,13 @@ def _minify(
 
         origin_dicts = tuple(transition_back_map.values())
         processing = {final_states_id}
+        refinement_rounds = 0
 
         while processing:
+            if stats is not None:
+                stats.record_max("minify.splitter_queue", len(processing))
+            refinement_rounds += 1
+
             # Save a copy of the set, since it could get modified while executing
             active_state = tuple(eq_classes.get_set_by_id(processing.pop()))
             for origin_dict in origin_dicts:
@@ -691,6 +959,11 @@ def _minify(
                         else:
                             processing.add(YdiffX_id)
 
+        if stats is not None:
+            stats.increment("minify.states", len(reachable_states))
+            stats.increment("minify.refinement_rounds", refinement_rounds)
+            stats.record_time("minify", start_time)
+
         # now eq_classes are good to go, make them a list for ordering
         eq_class_name_pairs: List[Tuple[DFAStateT, Set[DFAStateT]]] = (
             [(frozenset(eq), eq) for eq in eq_classes.get_sets()]
@@ -734,7 +1007,7 @@ def _minify(
         allow_partial = any(
             len(lookup) != len(input_symbols) for lookup in new_transitions.values()
         )
-        return cls(
+        return cls._from_derived(
             states=new_states,
             input_symbols=new_input_symbols,
             transitions=new_transitions,
@@ -743,6 +1016,7 @@ def _minify(
             allow_partial=allow_partial,
         )
 
+    @cached_operation
     def union(
         self, other: DFA, *, retain_names: bool = False, minify: bool = True
     ) -> Self:
@@ -787,6 +1061,7 @@ def union_function(state_pair: Tuple[DFAStateT, DFAStateT]) -> bool:
             minify=minify,
         )
 
+    @cached_operation
     def intersection(
         self, other: DFA, *, retain_names: bool = False, minify: bool = True
     ) -> Self:
@@ -831,6 +1106,7 @@ def intersection_function(state_pair: Tuple[DFAStateT, DFAStateT]) -> bool:
             minify=minify,
         )
 
+    @cached_operation
     def difference(
         self, other: DFA, *, retain_names: bool = False, minify: bool = True
     ) -> Self:
@@ -922,6 +1198,7 @@ def symmetric_difference_function(
             minify=minify,
         )
 
+    @cached_operation
     def complement(self, *, retain_names: bool = False, minify: bool = True) -> Self:
         """
         Creates a DFA which accepts an input if and only if the old one does not.
@@ -964,7 +1241,7 @@ def complement(self, *, retain_names: bool = False, minify: bool = True) -> Self
                 retain_names=retain_names,
             )
 
-        return complete_dfa.__class__(
+        return complete_dfa.__class__._from_derived(
             states=complete_dfa.states,
             input_symbols=complete_dfa.input_symbols,
             transitions=complete_dfa.transitions,
@@ -1044,6 +1321,10 @@ def get_name_original(state: DFAStateT) -> DFAStateT:
         else:
             get_name = get_renaming_function(count(0))
 
+        stats = get_stats_collector()
+        start_time = perf_counter() if stats is not None else 0.0
+        limits = get_resource_limits()
+
         initial_state_name = get_name(initial_state)
 
         transitions: Dict[DFAStateT, Dict[str, DFAStateT]] = {initial_state_name: {}}
@@ -1058,11 +1339,23 @@ def get_name_original(state: DFAStateT) -> DFAStateT:
                 states.add(tgt_state_name)
                 transitions[tgt_state_name] = {}
 
+                if stats is not None and len(states) % stats.progress_interval == 0:
+                    stats.report_progress("expand_dfa", len(states))
+                if limits is not None:
+                    limits.check("expand_dfa", states=len(states))
+
             transitions[cur_state_name][chr] = tgt_state_name
 
             if final_state_fn(tgt_state):
                 final_states.add(tgt_state_name)
 
+        if stats is not None:
+            stats.increment("expand_dfa.states", len(states))
+            stats.increment(
+                "expand_dfa.edges", sum(len(paths) for paths in transitions.values())
+            )
+            stats.record_time("expand_dfa", start_time)
+
         if minify:
             # From the construction, the states/final states are reachable
             return cls._minify(
@@ -1082,7 +1375,7 @@ def get_name_original(state: DFAStateT) -> DFAStateT:
         is_partial = any(
             len(lookup) != len(input_symbols) for lookup in transitions.values()
         )
-        return cls(
+        return cls._from_derived(
             states=states,
             input_symbols=input_symbols,
             transitions=transitions,
@@ -1569,6 +1862,121 @@ def successors(
         ):
             yield "".join(char_stack)
 
+    def fuzzy_lookup(
+        self,
+        query: str,
+        max_edit_distance: int,
+        *,
+        insertion: bool = True,
+        deletion: bool = True,
+        substitution: bool = True,
+    ) -> Generator[str, None, None]:
+        """
+        Generates all words accepted by the DFA within the given edit distance
+        of the query string, in lexicographical order.
+
+        This walks the DFA and the Levenshtein NFA for the query (see
+        `NFA.edit_distance`) in lockstep, pruning a branch as soon as either
+        side can no longer reach an accepting state. Unlike intersecting with
+        `DFA.from_nfa(NFA.edit_distance(...))`, no product automaton is built,
+        so once the states that can reach an accepting state have been found
+        (a single pass per DFA, reused by later lookups), the cost of a lookup
+        only depends on the part of the DFA explored.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for close matches of.
+        max_edit_distance : int
+            The maximum edit distance from the query of words to generate.
+        insertion : bool, default: True
+            Whether to recognize insertion edits relative to the query.
+        deletion : bool, default: True
+            Whether to recognize deletion edits relative to the query.
+        substitution : bool, default: True
+            Whether to recognize substitution edits relative to the query.
+
+        Returns
+        ------
+        Generator[str, None, None]
+            A generator for all words accepted by self within the given edit
+            distance of the query.
+
+        Raises
+        ------
+        ValueError
+            Raised if the max_edit_distance is negative or all of the error flags
+            are set to False (at least one must be True).
+        """
+        levenshtein_nfa = nfa.NFA.edit_distance(
+            self.input_symbols | frozenset(query),
+            query,
+            max_edit_distance,
+            insertion=insertion,
+            deletion=deletion,
+            substitution=substitution,
+        )
+
+        coaccessible_states = self._get_coaccessible_states()
+        if self.initial_state not in coaccessible_states:
+            return
+
+        # The same Levenshtein state sets are reached along many different
+        # paths of the DFA, so memoize each step of the NFA
+        step_cache: Dict[Tuple[FrozenSet[Any], str], FrozenSet[Any]] = {}
+
+        def get_next_nfa_states(
+            nfa_states: FrozenSet[Any], symbol: str
+        ) -> FrozenSet[Any]:
+            key = (nfa_states, symbol)
+            next_nfa_states = step_cache.get(key)
+            if next_nfa_states is None:
+                next_nfa_states = levenshtein_nfa._get_next_current_states(
+                    nfa_states, symbol
+                )
+                step_cache[key] = next_nfa_states
+            return next_nfa_states
+
+        def is_match(dfa_state: DFAStateT, nfa_states: FrozenSet[Any]) -> bool:
+            return dfa_state in self.final_states and not nfa_states.isdisjoint(
+                levenshtein_nfa.final_states
+            )
+
+        sorted_symbols = sorted(self.input_symbols)
+        initial_nfa_states = levenshtein_nfa._get_lambda_closures()[
+            levenshtein_nfa.initial_state
+        ]
+
+        if is_match(self.initial_state, initial_nfa_states):
+            yield ""
+
+        # Iterative preorder traversal over the symbols in sorted order, which
+        # yields matching words in lexicographical order
+        prefix: List[str] = []
+        stack = [(self.initial_state, initial_nfa_states, iter(sorted_symbols))]
+
+        while stack:
+            dfa_state, nfa_states, symbols = stack[-1]
+            for symbol in symbols:
+                next_dfa_state = self._get_next_current_state(dfa_state, symbol)
+                if next_dfa_state not in coaccessible_states:
+                    continue
+
+                next_nfa_states = get_next_nfa_states(nfa_states, symbol)
+                if not next_nfa_states:
+                    continue
+
+                prefix.append(symbol)
+                if is_match(next_dfa_state, next_nfa_states):
+                    yield "".join(prefix)
+
+                stack.append((next_dfa_state, next_nfa_states, iter(sorted_symbols)))
+                break
+            else:
+                stack.pop()
+                if prefix:
+                    prefix.pop()
+
     def count_words_of_length(self, k: int) -> int:
         """
         Returns count of words of length k accepted by the DFA.
@@ -2317,6 +2725,10 @@ def nth_from_end(
         # read Finally we trim the label to n bits with a modulo operation.
         state_count = 2**n
 
+        limits = get_resource_limits()
+        if limits is not None:
+            limits.check("nth_from_end", states=state_count)
+
         return cls(
             states=frozenset(range(state_count)),
             input_symbols=input_symbols,
@@ -2336,6 +2748,92 @@ def nth_from_end(
             allow_partial=False,
         )
 
+    @classmethod
+    def random(
+        cls: Type[Self],
+        n_states: int,
+        input_symbols: AbstractSet[str],
+        *,
+        seed: Optional[int] = None,
+        accepting_ratio: float = 0.5,
+        partial: bool = False,
+        uniform: bool = True,
+    ) -> Self:
+        """
+        Generates a random DFA whose states are all reachable from the
+        initial state. The states are the integers 0 to n_states - 1,
+        numbered in breadth-first order from the initial state 0.
+
+        Parameters
+        ----------
+        n_states : int
+            The number of states, which must be positive.
+        input_symbols : AbstractSet[str]
+            The set of input symbols to construct the DFA over.
+        seed : Optional[int], default: None
+            The random seed to use, for reproducible DFAs.
+        accepting_ratio : float, default: 0.5
+            The probability of each state being a final state.
+        partial : bool, default: False
+            Whether to generate a partial DFA, in which transitions may be
+            missing.
+        uniform : bool, default: True
+            Whether to sample uniformly among all accessible DFAs with the
+            given number of states, which takes O(n^(3/2)) expected time.
+            If False, a linear-time sampler is used instead, which is better
+            suited to generating DFAs with hundreds of thousands of states or
+            more, but is biased towards particular shapes of DFAs.
+
+        Returns
+        ------
+        Self
+            A random DFA.
+        """
+        if n_states < 1:
+            raise ValueError("Number of states must be positive")
+        if n_states > 1 and not input_symbols:
+            raise ValueError("Input symbols must be nonempty if n_states > 1")
+        if not 0 <= accepting_ratio <= 1:
+            raise ValueError("Accepting ratio must be between 0 and 1")
+
+        with generators.paused_gc():
+            rng = Random(seed)
+            symbols = tuple(sorted(input_symbols))
+            symbol_count = len(symbols)
+            table = generators.random_dfa_table(
+                n_states, symbol_count, rng, partial=partial, uniform=uniform
+            )
+            final_flags = generators.random_final_flags(n_states, accepting_ratio, rng)
+
+            # Build the frozen transitions directly, rather than freezing them
+            # transition by transition
+            row_slices = (
+                table[state * symbol_count : (state + 1) * symbol_count]
+                for state in range(n_states)
+            )
+            if partial:
+                rows = (
+                    frozendict(
+                        (symbol, target)
+                        for symbol, target in zip(symbols, row)
+                        if target != generators.MISSING
+                    )
+                    for row in row_slices
+                )
+            else:
+                rows = (frozendict(zip(symbols, row)) for row in row_slices)
+
+            return cls._from_trusted(
+                states=frozenset(range(n_states)),
+                input_symbols=frozenset(symbols),
+                transitions=frozendict(zip(range(n_states), rows)),
+                initial_state=0,
+                final_states=frozenset(
+                    state for state, is_final in enumerate(final_flags) if is_final
+                ),
+                allow_partial=partial,
+            )
+
     @classmethod
     def from_finite_language(
         cls: Type[Self],
@@ -2456,7 +2954,7 @@ def compress(word: str, next_word: str) -> None:
                 allow_partial=as_partial,
             )
 
-        return cls._to_complete(
+        new_dfa = cls._to_complete(
             input_symbols=input_symbols,
             transitions=transitions,
             initial_state="",
@@ -2464,7 +2962,13 @@ def compress(word: str, next_word: str) -> None:
             trap_state=0,
         )
 
+        # The language is user input, so validate the result as the
+        # constructor would
+        new_dfa.__post_init__()
+        return new_dfa
+
     @classmethod
+    @cached_operation
     def from_nfa(
         cls: Type[Self],
         target_nfa: nfa.NFA,
@@ -2491,22 +2995,105 @@ def from_nfa(
             The DFA accepting the language of the input NFA.
         """
 
-        def subset_function(current_states: FrozenSet[DFAStateT]) -> bool:
-            return not current_states.isdisjoint(target_nfa.final_states)
+        stats = get_stats_collector()
+        start_time = perf_counter() if stats is not None else 0.0
 
-        initial_state = frozenset(
-            target_nfa._get_lambda_closures()[target_nfa.initial_state]
-        )
+        # Unless the states of the DFA must be named by sets of NFA states,
+        # those sets are represented as bitsets, so they are cheap to build
+        # and hash
+        if retain_names:
 
-        return cls._expand_dfa(
-            subset_function,
-            initial_state,
-            target_nfa._iterate_through_symbol_path_pairs,
-            target_nfa.input_symbols,
-            retain_names=retain_names,
+            def subset_function(current_states: FrozenSet[DFAStateT]) -> bool:
+                return not current_states.isdisjoint(target_nfa.final_states)
+
+            new_dfa = cls._expand_dfa(
+                subset_function,
+                frozenset(target_nfa._get_lambda_closures()[target_nfa.initial_state]),
+                target_nfa._iterate_through_symbol_path_pairs,
+                target_nfa.input_symbols,
+                retain_names=True,
+                minify=minify,
+            )
+        else:
+            bitset_nfa = target_nfa.to_bitset()
+            final_mask = bitset_nfa.final_mask
+
+            def is_final_mask(mask: int) -> bool:
+                return bool(mask & final_mask)
+
+            def expand_mask(mask: int) -> Iterator[Tuple[str, int]]:
+                return iter(bitset_nfa.successor_masks(mask).items())
+
+            new_dfa = cls._expand_dfa(
+                is_final_mask,
+                bitset_nfa.initial_mask,
+                expand_mask,
+                target_nfa.input_symbols,
+                minify=minify,
+            )
+
+        if stats is not None:
+            stats.increment("from_nfa.nfa_states", len(target_nfa.states))
+            stats.increment("from_nfa.dfa_states", len(new_dfa.states))
+            stats.record_time("from_nfa", start_time)
+
+        return new_dfa
+
+    @classmethod
+    def from_regex(
+        cls: Type[Self],
+        regex: str,
+        *,
+        input_symbols: Optional[AbstractSet[str]] = None,
+        minify: bool = True,
+    ) -> Self:
+        """
+        Initialize this DFA as one equivalent to the given regular expression,
+        without building an NFA first. The states of the DFA are the
+        derivatives of the regex, as defined by Brzozowski, so intersections
+        are handled like any other operator instead of through products of
+        automata. Derivatives are simplified as they are built, and the
+        derivative with respect to symbols that the regex does not
+        distinguish is only computed once. Note that this usually returns a
+        partial DFA. To only compute the derivatives needed to match some
+        inputs, use `LazyDerivativeDFA` instead.
+
+        Parameters
+        ----------
+        regex : str
+            The regex to construct an equivalent DFA for.
+        input_symbols : Optional[AbstractSet[str]], default: None
+            The set of input symbols to create the DFA over. If not
+            set, defaults to all non-reserved characters found in the regex.
+        minify : bool, default: True
+            Whether or not to minify the DFA of derivatives, which is usually
+            close to minimal already.
+
+        Returns
+        ------
+        Self
+            The DFA accepting the language of the input regex.
+        """
+        stats = get_stats_collector()
+        start_time = perf_counter() if stats is not None else 0.0
+
+        factory = TermFactory(get_regex_input_symbols(regex, input_symbols))
+        initial_term = factory.from_node(parse_regex_ast(regex))
+
+        new_dfa = cls._expand_dfa(
+            lambda term: term.nullable,
+            initial_term,
+            factory.iter_transitions,
+            factory.input_symbols,
             minify=minify,
         )
 
+        if stats is not None:
+            stats.increment("from_regex.terms", len(factory))
+            stats.record_time("from_regex", start_time)
+
+        return new_dfa
+
     def iter_transitions(
         self,
     ) -> Generator[Tuple[DFAStateT, DFAStateT, str], None, None]:
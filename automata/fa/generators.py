@@ -0,0 +1,244 @@
+"""
+Functions for sampling random transition tables for finite automata. Tables
+are built as flat arrays, so that automata with millions of states can be
+generated without creating a Python object per transition.
+"""
+
+from __future__ import annotations
+
+import array
+import gc
+import math
+from contextlib import contextmanager
+from itertools import accumulate
+from random import Random
+from typing import Dict, Iterator, List, Set
+
+from automata.base.utils import sample_poisson
+
+# Transition targets stored in a DFA table for missing transitions
+MISSING = -1
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector while building a large automaton.
+    Building millions of transition containers would otherwise trigger many
+    full collections, although none of the containers form cycles.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _expected_gap_total(state_count: int, weight_offset: int, z: float) -> float:
+    """
+    Approximate the expected total number of non-creating transitions in the
+    Boltzmann model with parameter z, by integrating over the states.
+    """
+    lower = (0.5 + weight_offset) * z
+    upper = (state_count + 0.5 + weight_offset) * z
+    return (math.log1p(-lower) - math.log1p(-upper)) / z - state_count
+
+
+def _solve_boltzmann_parameter(
+    state_count: int, symbol_count: int, weight_offset: int
+) -> float:
+    """
+    Find the Boltzmann parameter for which the expected total number of
+    non-creating transitions matches the number of transitions of an
+    accessible DFA. Any parameter gives exactly uniform samples; this one
+    makes rejection least likely.
+    """
+    target = (symbol_count - 1) * state_count + 1
+    low, high = 0.0, 1.0 / (state_count + 0.5 + weight_offset)
+    for _ in range(100):
+        z = (low + high) / 2
+        if _expected_gap_total(state_count, weight_offset, z) < target:
+            low = z
+        else:
+            high = z
+    return low
+
+
+def _uniform_creation_steps(
+    state_count: int, symbol_count: int, weight_offset: int, rng: Random
+) -> List[int]:
+    """
+    Sample the steps at which new states are discovered by a BFS over a
+    uniformly random accessible DFA, using the Boltzmann sampler of Bassino
+    and Nicaud.
+
+    Transitions are visited in order of their source state, then symbol. The
+    visit of a transition either discovers the next new state, or leads to
+    one of the d states discovered so far (or is missing, for partial DFAs,
+    in which case weight_offset is 1). A DFA is thus described by the number
+    g_d of non-discovering transitions visited while d states are known,
+    weighted by (d + weight_offset)^g_d. The counts are sampled as independent
+    geometric variables, rejecting samples in which a state is discovered
+    after its own transitions should have been visited, or in which the
+    counts do not add up to the number of transitions. Accepted samples are
+    exactly uniform, and the expected running time is O(n^(3/2)).
+    """
+    total_gaps = (symbol_count - 1) * state_count + 1
+    z = _solve_boltzmann_parameter(state_count, symbol_count, weight_offset)
+    log = math.log
+    random = rng.random
+    # Multiplying log(U) by 1 / log(q) for a uniform U in (0, 1] gives a
+    # geometric variable with parameter q
+    inverse_log_qs = [
+        1.0 / log((discovered + weight_offset) * z)
+        for discovered in range(1, state_count + 1)
+    ]
+
+    while True:
+        gaps = [int(log(1.0 - random()) * c) for c in inverse_log_qs]
+        if sum(gaps) != total_gaps:
+            continue
+
+        creation_steps = [
+            discovered - 1 + gap_total
+            for discovered, gap_total in enumerate(accumulate(gaps[:-1]), 1)
+        ]
+        # Each state must be the target of a transition from a state
+        # discovered before it
+        if all(
+            step < symbol_count * discovered
+            for discovered, step in enumerate(creation_steps, 1)
+        ):
+            return creation_steps
+
+
+def _fast_creation_steps(state_count: int, symbol_count: int, rng: Random) -> List[int]:
+    """
+    Choose the steps at which new states are discovered by spreading them
+    evenly over the transitions, as late as allowed. This takes linear time
+    but does not sample DFAs uniformly.
+    """
+    creation_steps = []
+    transition_count = state_count * symbol_count
+    discovered = 1
+    random = rng.random
+    for step in range(transition_count):
+        if discovered == state_count:
+            break
+        remaining_states = state_count - discovered
+        if (
+            step == symbol_count * discovered - 1
+            or random() * (transition_count - step) < remaining_states
+        ):
+            creation_steps.append(step)
+            discovered += 1
+    return creation_steps
+
+
+def random_dfa_table(
+    state_count: int,
+    symbol_count: int,
+    rng: Random,
+    *,
+    partial: bool = False,
+    uniform: bool = True,
+) -> array.array:
+    """
+    Sample the transition table of a random accessible DFA, with one row per
+    state and one column per symbol. State 0 is the initial state, and states
+    are numbered in BFS order. Missing transitions are marked with MISSING.
+
+    Parameters
+    ----------
+    state_count : int
+        The number of states, which must be positive.
+    symbol_count : int
+        The number of input symbols, which must be positive if there is more
+        than one state.
+    rng : Random
+        The random number generator to use.
+    partial : bool, default: False
+        Whether transitions may be missing.
+    uniform : bool, default: True
+        Whether to sample uniformly among all accessible DFAs with the given
+        number of states. Otherwise, a faster linear-time sampler is used.
+
+    Returns
+    ------
+    array.array
+        The transition table.
+    """
+    weight_offset = 1 if partial else 0
+    if symbol_count == 1 or state_count == 1:
+        # The BFS is forced to discover a new state at every step
+        creation_steps = list(range(state_count - 1))
+    elif uniform:
+        creation_steps = _uniform_creation_steps(
+            state_count, symbol_count, weight_offset, rng
+        )
+    else:
+        creation_steps = _fast_creation_steps(state_count, symbol_count, rng)
+
+    table = array.array("i", bytes(4 * state_count * symbol_count))
+    random = rng.random
+    discovered = 1
+    previous_step = -1
+    for creation_step in [*creation_steps, len(table)]:
+        choices = discovered + weight_offset
+        for step in range(previous_step + 1, creation_step):
+            target = int(random() * choices)
+            table[step] = target if target < discovered else MISSING
+        if creation_step < len(table):
+            table[creation_step] = discovered
+            discovered += 1
+        previous_step = creation_step
+    return table
+
+
+def random_final_flags(state_count: int, accepting_ratio: float, rng: Random) -> bytes:
+    """Return a byte per state, set with probability accepting_ratio."""
+    random = rng.random
+    return bytes(random() < accepting_ratio for _ in range(state_count))
+
+
+def random_nfa_transitions(
+    state_count: int,
+    symbol_count: int,
+    rng: Random,
+    *,
+    density: float,
+    lambda_density: float,
+) -> List[Dict[int, Set[int]]]:
+    """
+    Sample the transitions of a random accessible NFA. The transitions of
+    each state are given as a mapping from symbol indices (with -1 for
+    lambda transitions) to sets of target states.
+
+    Each state has transitions to a random spanning tree's children, plus on
+    average density additional transitions per symbol and lambda_density
+    additional lambda transitions, with uniformly random symbols and
+    targets.
+    """
+    transitions: List[Dict[int, Set[int]]] = [{} for _ in range(state_count)]
+    random = rng.random
+
+    for state in range(1, state_count):
+        paths = transitions[int(random() * state)]
+        symbol = int(random() * symbol_count)
+        if symbol in paths:
+            paths[symbol].add(state)
+        else:
+            paths[symbol] = {state}
+
+    for symbol in range(-1, symbol_count):
+        mean = state_count * (lambda_density if symbol == -1 else density)
+        for _ in range(sample_poisson(mean, rng)):
+            paths = transitions[int(random() * state_count)]
+            target = int(random() * state_count)
+            if symbol in paths:
+                paths[symbol].add(target)
+            else:
+                paths[symbol] = {target}
+    return transitions
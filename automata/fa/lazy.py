@@ -0,0 +1,460 @@
+"""Classes and methods for matching input with lazily constructed DFAs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, AbstractSet, Dict, FrozenSet, List, Optional
+
+import automata.base.exceptions as exceptions
+import automata.fa.fa as fa
+from automata.base.cache import CacheInfo
+from automata.base.instrumentation import get_stats_collector
+from automata.regex.derivatives import RegexTerm, TermFactory
+from automata.regex.parser import get_regex_input_symbols
+from automata.regex.syntax import RegexNode, parse_regex_ast
+
+if TYPE_CHECKING:
+    import automata.fa.bitset as bitset
+    import automata.fa.nfa as nfa
+
+# The target of cached transitions to the empty set of states
+_DEAD_STATE = -1
+
+
+class LazyDFA:
+    """
+    The `LazyDFA` class matches input against an NFA by building the
+    equivalent DFA on the fly, as in RE2. Each DFA state is a set of NFA
+    states, represented as a bitset (see `BitsetNFA`), and is only created
+    when some input reaches it. Transitions between DFA states are computed
+    by simulating the NFA the first time they are taken, and looked up in a
+    cache afterwards, so matching runs at close to DFA speed while only
+    storing the part of the DFA that the input actually uses.
+
+    Once the cache holds max_states DFA states, it is flushed, and DFA states
+    are created again as needed. This bounds memory use, even for NFAs whose
+    DFA is exponentially large.
+
+    Parameters
+    ----------
+    target_nfa : NFA
+        The NFA to match input against.
+    max_states : int, default: 10000
+        The maximum number of DFA states to cache. Each state stores a bitset
+        of NFA states and its transitions taken so far.
+
+    Attributes
+    ----------
+    hits : int
+        The number of transitions read from the cache.
+    misses : int
+        The number of transitions computed by simulating the NFA.
+    flushes : int
+        The number of times the cache was flushed.
+    evictions : int
+        The total number of DFA states discarded by flushes.
+    fallbacks : int
+        The number of inputs finished by simulating the NFA directly, because
+        the cache was flushed too often while reading them.
+    """
+
+    __slots__ = (
+        "max_states",
+        "hits",
+        "misses",
+        "flushes",
+        "evictions",
+        "fallbacks",
+        "_bitset_nfa",
+        "_state_ids",
+        "_masks",
+        "_transitions",
+    )
+
+    max_states: int
+    hits: int
+    misses: int
+    flushes: int
+    evictions: int
+    fallbacks: int
+    _bitset_nfa: bitset.BitsetNFA
+    _state_ids: Dict[int, int]
+    _masks: List[int]
+    _transitions: List[Dict[str, int]]
+
+    def __init__(self, target_nfa: nfa.NFA, *, max_states: int = 10000) -> None:
+        """Initialize an empty cache for the given NFA."""
+        if max_states < 1:
+            raise ValueError("max_states must be positive")
+
+        self.max_states = max_states
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+        self.evictions = 0
+        self.fallbacks = 0
+        self._bitset_nfa = target_nfa.to_bitset()
+        self._state_ids = {}
+        self._masks = []
+        self._transitions = []
+        self._add_state(self._bitset_nfa.initial_mask)
+
+    def _add_state(self, mask: int) -> int:
+        """Create the DFA state for the given set of NFA states."""
+        state = len(self._masks)
+        self._state_ids[mask] = state
+        self._masks.append(mask)
+        self._transitions.append({})
+        return state
+
+    def _flush(self) -> None:
+        """
+        Discard all DFA states except the initial state. The lists are
+        cleared in place, so references held by callers remain valid.
+        """
+        self.flushes += 1
+        self.evictions += len(self._masks) - 1
+        self._state_ids.clear()
+        del self._masks[:]
+        del self._transitions[:]
+        self._add_state(self._bitset_nfa.initial_mask)
+
+    def _compute_transition(self, state: int, symbol: str) -> int:
+        """
+        Compute and cache the transition from the given DFA state on the
+        given symbol, flushing the cache if it is full. Since a flush
+        renumbers the DFA states, the state passed in must not be used
+        afterwards; the returned state remains valid.
+        """
+        self.misses += 1
+        mask = self._masks[state]
+        next_mask = self._bitset_nfa.step(mask, symbol)
+        if not next_mask:
+            self._transitions[state][symbol] = _DEAD_STATE
+            return _DEAD_STATE
+
+        next_state = self._state_ids.get(next_mask)
+        if next_state is None:
+            if len(self._masks) >= self.max_states:
+                self._flush()
+                flushed_state = self._state_ids.get(mask)
+                state = (
+                    self._add_state(mask) if flushed_state is None else flushed_state
+                )
+                next_state = self._state_ids.get(next_mask)
+            if next_state is None:
+                next_state = self._add_state(next_mask)
+
+        self._transitions[state][symbol] = next_state
+        return next_state
+
+    def _read_input(self, input_str: str) -> int:
+        """
+        Return the bitset of NFA states reached on the input.
+
+        As in RE2, if the cache is flushed twice while reading fewer than
+        ten symbols per cached state, caching does not pay off for this
+        input, so the rest of it is read by simulating the NFA directly.
+        """
+        transitions = self._transitions
+        state = 0
+        hits = 0
+        last_flush_index = None
+        for index, symbol in enumerate(input_str):
+            next_state = transitions[state].get(symbol)
+            if next_state is None:
+                flushes = self.flushes
+                next_state = self._compute_transition(state, symbol)
+                if self.flushes != flushes:
+                    if (
+                        last_flush_index is not None
+                        and index - last_flush_index < 10 * self.max_states
+                    ):
+                        self.hits += hits
+                        return self._read_with_nfa(
+                            self._masks[next_state], input_str[index + 1 :]
+                        )
+                    last_flush_index = index
+            else:
+                hits += 1
+            if next_state == _DEAD_STATE:
+                self.hits += hits
+                return 0
+            state = next_state
+
+        self.hits += hits
+        return self._masks[state]
+
+    def _read_with_nfa(self, mask: int, input_str: str) -> int:
+        """Return the bitset of NFA states reached on the input from mask."""
+        self.fallbacks += 1
+        step = self._bitset_nfa.step
+        for symbol in input_str:
+            mask = step(mask, symbol)
+            if not mask:
+                break
+        return mask
+
+    def accepts_input(self, input_str: str) -> bool:
+        """
+        Return True if the NFA accepts the given input.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to check.
+
+        Returns
+        ------
+        bool
+            Whether the NFA accepts the input.
+        """
+        stats = get_stats_collector()
+        if stats is None:
+            return bool(self._read_input(input_str) & self._bitset_nfa.final_mask)
+
+        hits, misses, flushes = self.hits, self.misses, self.flushes
+        mask = self._read_input(input_str)
+        stats.increment("lazy_dfa.hits", self.hits - hits)
+        stats.increment("lazy_dfa.misses", self.misses - misses)
+        stats.increment("lazy_dfa.flushes", self.flushes - flushes)
+        stats.record_max("lazy_dfa.states", len(self._masks))
+        return bool(mask & self._bitset_nfa.final_mask)
+
+    def read_input(self, input_str: str) -> FrozenSet[fa.FAStateT]:
+        """
+        Check if the given string is accepted by the NFA.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to read.
+
+        Returns
+        ------
+        FrozenSet[FAStateT]
+            The NFA states reached on the input, if the input is accepted.
+
+        Raises
+        ------
+        RejectionException
+            Raised if the NFA does not accept the input.
+        """
+        mask = self._read_input(input_str)
+        states = self._bitset_nfa.to_states(mask)
+        if not mask & self._bitset_nfa.final_mask:
+            raise exceptions.RejectionException(
+                "the NFA stopped on all non-final states ({})".format(
+                    ", ".join(str(state) for state in states)
+                )
+            )
+        return states
+
+    def __len__(self) -> int:
+        """Return the number of DFA states currently cached."""
+        return len(self._masks)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return statistics describing the use of the cache.
+
+        Returns
+        ------
+        CacheInfo
+            The transition cache hits and misses, the number of DFA states
+            evicted by flushes, and the maximum and current numbers of DFA
+            states.
+        """
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.max_states, len(self._masks)
+        )
+
+    def clear(self) -> None:
+        """Discard all cached DFA states and reset the statistics."""
+        self._flush()
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+        self.evictions = 0
+        self.fallbacks = 0
+
+
+class LazyDerivativeDFA:
+    """
+    The `LazyDerivativeDFA` class matches input against a regex by building
+    the DFA of its derivatives (see `DFA.from_regex`) on the fly. Each DFA
+    state is a derivative of the regex, and the derivative of a state with
+    respect to a symbol is only computed the first time the symbol is read
+    in that state, then looked up in a cache afterwards. No NFA is built, and
+    intersections are derived directly.
+
+    Derivatives are built from each other, so they cannot be discarded while
+    reading an input. Instead, once more than max_states DFA states have been
+    cached, the cache is flushed before reading the next input.
+
+    Parameters
+    ----------
+    regex : str
+        The regex to match input against.
+    input_symbols : Optional[AbstractSet[str]], default: None
+        The alphabet of the regex. If not set, defaults to all non-reserved
+        characters found in the regex. Inputs containing other symbols are
+        rejected.
+    max_states : int, default: 10000
+        The number of cached DFA states above which the cache is flushed.
+
+    Attributes
+    ----------
+    input_symbols : FrozenSet[str]
+        The alphabet of the regex.
+    hits : int
+        The number of transitions read from the cache.
+    misses : int
+        The number of transitions computed by taking derivatives.
+    flushes : int
+        The number of times the cache was flushed.
+    evictions : int
+        The total number of DFA states discarded by flushes.
+    """
+
+    __slots__ = (
+        "input_symbols",
+        "max_states",
+        "hits",
+        "misses",
+        "flushes",
+        "evictions",
+        "_node",
+        "_factory",
+        "_initial_term",
+        "_transitions",
+    )
+
+    input_symbols: FrozenSet[str]
+    max_states: int
+    hits: int
+    misses: int
+    flushes: int
+    evictions: int
+    _node: RegexNode
+    _factory: TermFactory
+    _initial_term: RegexTerm
+    _transitions: Dict[RegexTerm, Dict[str, RegexTerm]]
+
+    def __init__(
+        self,
+        regex: str,
+        *,
+        input_symbols: Optional[AbstractSet[str]] = None,
+        max_states: int = 10000,
+    ) -> None:
+        """Parse the regex and initialize an empty cache."""
+        if max_states < 1:
+            raise ValueError("max_states must be positive")
+
+        self.input_symbols = get_regex_input_symbols(regex, input_symbols)
+        self.max_states = max_states
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+        self.evictions = 0
+        self._node = parse_regex_ast(regex)
+        self._reset()
+
+    def _reset(self) -> None:
+        """Discard all derivatives, and rebuild the term of the regex."""
+        self._factory = TermFactory(self.input_symbols)
+        self._initial_term = self._factory.from_node(self._node)
+        self._transitions = {}
+
+    def _flush(self) -> None:
+        """Discard all cached DFA states."""
+        self.flushes += 1
+        self.evictions += len(self._transitions)
+        self._reset()
+
+    def _read_input(self, input_str: str) -> RegexTerm:
+        """Return the derivative of the regex with respect to the input."""
+        if len(self._transitions) > self.max_states:
+            self._flush()
+
+        factory = self._factory
+        empty = factory.empty
+        transitions = self._transitions
+        term = self._initial_term
+        hits = 0
+        for symbol in input_str:
+            paths = transitions.get(term)
+            if paths is None:
+                paths = transitions[term] = {}
+            next_term = paths.get(symbol)
+            if next_term is None:
+                if symbol not in self.input_symbols:
+                    term = empty
+                    break
+                self.misses += 1
+                next_term = paths[symbol] = factory.derivative(term, symbol)
+            else:
+                hits += 1
+            term = next_term
+            if term is empty:
+                break
+
+        self.hits += hits
+        return term
+
+    def accepts_input(self, input_str: str) -> bool:
+        """
+        Return True if the regex matches the given input.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to check.
+
+        Returns
+        ------
+        bool
+            Whether the regex matches the input.
+        """
+        stats = get_stats_collector()
+        if stats is None:
+            return self._read_input(input_str).nullable
+
+        hits, misses, flushes = self.hits, self.misses, self.flushes
+        term = self._read_input(input_str)
+        stats.increment("lazy_dfa.hits", self.hits - hits)
+        stats.increment("lazy_dfa.misses", self.misses - misses)
+        stats.increment("lazy_dfa.flushes", self.flushes - flushes)
+        stats.record_max("lazy_dfa.states", len(self._transitions))
+        return term.nullable
+
+    def __len__(self) -> int:
+        """Return the number of DFA states with cached transitions."""
+        return len(self._transitions)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return statistics describing the use of the cache.
+
+        Returns
+        ------
+        CacheInfo
+            The transition cache hits and misses, the number of DFA states
+            evicted by flushes, and the maximum and current numbers of DFA
+            states.
+        """
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.max_states,
+            len(self._transitions),
+        )
+
+    def clear(self) -> None:
+        """Discard all cached DFA states and reset the statistics."""
+        self._reset()
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+        self.evictions = 0
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-import re
 from collections import deque
 from itertools import chain, count, product, repeat
+from random import Random
+from time import perf_counter
 from typing import (
     AbstractSet,
     Any,
+    Callable,
     Deque,
     Dict,
     FrozenSet,
     Generator,
     Iterable,
     List,
+    Literal,
     Mapping,
     Optional,
     Set,
@@ -26,21 +29,25 @@
 from frozendict import frozendict
 from typing_extensions import Self, TypeAlias
 
+import automata.base.config as global_config
 import automata.base.exceptions as exceptions
+import automata.fa.alphabet as alphabet
+import automata.fa.bitset as bitset
 import automata.fa.dfa as dfa
 import automata.fa.fa as fa
-from automata.base.utils import _missing_animation_imports, get_reachable_nodes
-from automata.regex.parser import (
-    DIGIT_CHARS,
-    NON_DIGIT_CHARS,
-    NON_WHITESPACE_CHARS,
-    NON_WORD_CHARS,
-    RESERVED_CHARACTERS,
-    WHITESPACE_CHARS,
-    WORD_CHARS,
-    _handle_escape_sequences,
-    parse_regex,
+import automata.fa.generators as generators
+import automata.fa.lazy as lazy
+import automata.fa.simulation as simulation
+from automata.base.cache import cached_operation
+from automata.base.instrumentation import get_stats_collector
+from automata.base.limits import get_resource_limits
+from automata.base.utils import (
+    _missing_animation_imports,
+    get_strongly_connected_components,
 )
+from automata.regex.derivatives import parse_regex_antimirov
+from automata.regex.glushkov import parse_regex_glushkov
+from automata.regex.parser import get_regex_input_symbols, parse_regex
 
 if not _missing_animation_imports:
     from automata.fa.animation import _NFAAnimation
@@ -49,6 +56,7 @@
 
 NFAPathT = Mapping[str, AbstractSet[NFAStateT]]
 NFATransitionsT = Mapping[NFAStateT, NFAPathT]
+RegexConstructionT = Literal["thompson", "glushkov", "antimirov"]
 InputPathListT = List[Tuple[NFAStateT, NFAStateT, str]]
 
 
@@ -116,6 +124,32 @@ def __init__(
             final_states=final_states,
         )
 
+    @staticmethod
+    def _freeze_derived_value(attr_name: str, attr_value: Any) -> Any:
+        """
+        Freeze an attribute of a derived NFA, relying on the transitions being
+        a mapping of mappings whose values are sets of immutable states.
+        """
+        if isinstance(attr_value, set):
+            return frozenset(attr_value)
+        if attr_name == "transitions" and not isinstance(attr_value, frozendict):
+            return frozendict(
+                {
+                    state: (
+                        paths
+                        if isinstance(paths, frozendict)
+                        else frozendict(
+                            {
+                                symbol: frozenset(end_states)
+                                for symbol, end_states in paths.items()
+                            }
+                        )
+                    )
+                    for state, paths in attr_value.items()
+                }
+            )
+        return attr_value
+
     @cached_method
     def _get_lambda_closures(self) -> Mapping[NFAStateT, FrozenSet[NFAStateT]]:
         """
@@ -127,26 +161,90 @@ def _get_lambda_closures(self) -> Mapping[NFAStateT, FrozenSet[NFAStateT]]:
         The lambda closure of a state q is the set containing q, along with
         every state that can be reached from q by following only lambda
         transitions.
+
+        The closures are computed once per strongly connected component of
+        the graph of lambda transitions, in reverse topological order, from
+        the closures of the components it has lambda transitions to. States
+        in the same component share their closure.
         """
-        lambda_graph = nx.DiGraph()
-        lambda_graph.add_nodes_from(self.states)
-        lambda_graph.add_edges_from(
-            (
-                (start_state, end_state)
-                for start_state, transition in self.transitions.items()
-                for char, end_states in transition.items()
-                if char == ""
-                for end_state in end_states
-            )
-        )
+        lambda_successors = {
+            state: end_states
+            for state, paths in self.transitions.items()
+            if (end_states := paths.get(""))
+        }
+        lambda_closures: Dict[NFAStateT, FrozenSet[NFAStateT]] = {}
 
-        return frozendict(
-            {
-                state: frozenset(get_reachable_nodes(lambda_graph, [state]))
-                for state in self.states
+        for component in get_strongly_connected_components(
+            self.states, lambda state: lambda_successors.get(state, ())
+        ):
+            # Every closure outside the component that it has lambda
+            # transitions to has already been computed
+            successor_closures = {
+                id(successor_closure): successor_closure
+                for state in component
+                for end_state in lambda_successors.get(state, ())
+                if (successor_closure := lambda_closures.get(end_state)) is not None
             }
+            closure = frozenset(component).union(*successor_closures.values())
+
+            for state in component:
+                lambda_closures[state] = closure
+
+        return frozendict(lambda_closures)
+
+    @cached_method
+    def symbol_classes(self) -> alphabet.SymbolClasses:
+        """
+        Partition the input symbols of this NFA into equivalence classes,
+        where two symbols are equivalent if every state transitions to the
+        same set of states on both of them. Lambda transitions are ignored.
+        This partition is cached for the lifetime of the instance.
+
+        Returns
+        ------
+        SymbolClasses
+            The coarsest partition of the input symbols respecting the
+            transitions of this NFA.
+        """
+        return alphabet.SymbolClasses.from_transitions(
+            self.input_symbols, self.iter_transitions()
         )
 
+    @cached_method
+    def to_bitset(self) -> bitset.BitsetNFA:
+        """
+        Create a representation of this NFA for fast simulation, in which sets
+        of states are integer bitsets and the successors of every state on
+        every symbol are precomputed, including lambda closures. This
+        representation is cached for the lifetime of the instance, and is used
+        by `read_input_stepwise` and `accepts_input` unless this NFA has more
+        than `automata.base.config.max_bitset_nfa_states` states.
+
+        Returns
+        ------
+        BitsetNFA
+            A bitset representation of this NFA.
+        """
+        return bitset.BitsetNFA(self)
+
+    def to_lazy_dfa(self, *, max_states: int = 10000) -> lazy.LazyDFA:
+        """
+        Create a matcher which builds the DFA equivalent to this NFA lazily,
+        only creating the DFA states that input actually reaches, and caching
+        at most max_states of them at a time.
+
+        Parameters
+        ----------
+        max_states : int, default: 10000
+            The maximum number of DFA states to cache.
+
+        Returns
+        ------
+        LazyDFA
+            A lazy DFA accepting the same language as this NFA.
+        """
+        return lazy.LazyDFA(self, max_states=max_states)
+
     def __add__(self, other: NFA) -> Self:
         """Return the concatenation of this NFA and another NFA."""
         if isinstance(other, NFA):
@@ -190,7 +288,7 @@ def from_dfa(cls: Type[Self], target_dfa: dfa.DFA) -> Self:
             for start_state, paths in target_dfa.transitions.items()
         }
 
-        return cls(
+        return cls._from_derived(
             states=target_dfa.states,
             input_symbols=target_dfa.input_symbols,
             transitions=nfa_transitions,
@@ -212,7 +310,11 @@ def _validate_transition_invalid_symbols(
 
     @classmethod
     def from_regex(
-        cls: Type[Self], regex: str, *, input_symbols: Optional[AbstractSet[str]] = None
+        cls: Type[Self],
+        regex: str,
+        *,
+        input_symbols: Optional[AbstractSet[str]] = None,
+        construction: RegexConstructionT = "thompson",
     ) -> Self:
         """
         Initialize this NFA as one equivalent to the given regular expression.
@@ -224,146 +326,36 @@ def from_regex(
         input_symbols : Optional[AbstractSet[str]], default: None
             The set of input symbols to create the NFA over. If not
             set, defaults to all non-reserved characters found in the regex.
+        construction : str, default: "thompson"
+            The construction used to build the NFA: "thompson", "glushkov" or
+            "antimirov". The Thompson construction builds the NFA from small
+            fragments joined by lambda transitions. The Glushkov construction
+            builds the position automaton of the regex instead, which has no
+            lambda transitions and one state per symbol position plus an
+            initial state (intersections and shuffles become products of
+            position automata). The Antimirov construction builds the partial
+            derivative automaton, which has no lambda transitions and is
+            usually smaller than the position automaton.
 
         Returns
         ------
         Self
             The NFA accepting the language of the input regex.
         """
-        # Dictionary mapping shorthand character class markers to their character sets
-        shorthand_classes = {
-            "\\s": WHITESPACE_CHARS,
-            "\\S": NON_WHITESPACE_CHARS,
-            "\\d": DIGIT_CHARS,
-            "\\D": NON_DIGIT_CHARS,
-            "\\w": WORD_CHARS,
-            "\\W": NON_WORD_CHARS,
-        }
-
-        # Create a set for additional symbols from shorthand classes
-        additional_symbols: Set[str] = set()
-
-        # Check for shorthand classes in the regex
-        for marker, char_set in shorthand_classes.items():
-            if marker in regex:
-                additional_symbols.update(char_set)
-
-        # Extract escaped sequences from the regex
-        escape_chars = set()
-        i = 0
-        while i < len(regex):
-            if regex[i] == "\\" and i + 1 < len(regex):
-                # Skip shorthand classes
-                if regex[i + 1] in "sSwWdD":
-                    i += 2
-                    continue
-
-                escaped_char = _handle_escape_sequences(regex[i + 1])
-                escape_chars.add(escaped_char)
-                i += 2
-            else:
-                i += 1
-
-        class_symbols = set()
-        range_pattern = re.compile(r"\[([^\]]*)\]")
-        for match in range_pattern.finditer(regex):
-            class_content = match.group(1)
-            pos = 0
-            # Dictionary for shorthand class handling in character classes
-            shorthand_map = {
-                "s": WHITESPACE_CHARS,
-                "S": NON_WHITESPACE_CHARS,
-                "d": DIGIT_CHARS,
-                "D": NON_DIGIT_CHARS,
-                "w": WORD_CHARS,
-                "W": NON_WORD_CHARS,
-            }
+        if construction not in ("thompson", "glushkov", "antimirov"):
+            raise ValueError(f"Unknown regex construction {construction!r}")
 
-            while pos < len(class_content):
-                if class_content[pos] == "\\" and pos + 1 < len(class_content):
-                    # Check for shorthand classes in character classes
-                    if class_content[pos + 1] in shorthand_map:
-                        additional_symbols.update(shorthand_map[class_content[pos + 1]])
-                        pos += 2
-                        continue
-
-                    # Handle escape sequence in character class
-                    escaped_char = _handle_escape_sequences(class_content[pos + 1])
-                    class_symbols.add(escaped_char)
-
-                    # Check if this is part of a range
-                    if (
-                        pos + 2 < len(class_content)
-                        and class_content[pos + 2] == "-"
-                        and pos + 3 < len(class_content)
-                    ):
-                        # Handle range with escaped start character
-                        start_char = escaped_char
-
-                        # Check if end character is also escaped
-                        if class_content[pos + 3] == "\\" and pos + 4 < len(
-                            class_content
-                        ):
-                            end_char = _handle_escape_sequences(class_content[pos + 4])
-                            pos += 5
-                        else:
-                            end_char = class_content[pos + 3]
-                            pos += 4
-
-                        # Add all characters in the range to input symbols
-                        for i in range(ord(start_char), ord(end_char) + 1):
-                            class_symbols.add(chr(i))
-                        continue
-
-                    pos += 2
-                elif pos + 2 < len(class_content) and class_content[pos + 1] == "-":
-                    # Handle normal range
-                    start_char = class_content[pos]
-
-                    if class_content[pos + 2] == "\\" and pos + 3 < len(class_content):
-                        end_char = _handle_escape_sequences(class_content[pos + 3])
-                        pos += 4
-                    else:
-                        end_char = class_content[pos + 2]
-                        pos += 3
-
-                    for i in range(ord(start_char), ord(end_char) + 1):
-                        class_symbols.add(chr(i))
-                else:
-                    if class_content[pos] != "^":  # Skip negation symbol
-                        class_symbols.add(class_content[pos])
-                    pos += 1
-
-        # Set up the final input symbols
-        if input_symbols is None:
-            # If no input_symbols provided, collect all non-reserved chars from regex
-            input_symbols_set = set()
-            for char in regex:
-                if char not in RESERVED_CHARACTERS:
-                    input_symbols_set.add(char)
-
-            # Include all character class symbols and escape sequences
-            input_symbols_set.update(class_symbols)
-            input_symbols_set.update(escape_chars)
-
-            # Add the shorthand characters
-            input_symbols_set.update(additional_symbols)
-
-            final_input_symbols = frozenset(input_symbols_set)
-        else:
-            # For user-provided input_symbols, we need to update
-            # with character class symbols and escape sequences
-            final_input_symbols = (
-                frozenset(input_symbols)
-                .union(class_symbols)
-                .union(escape_chars)
-                .union(additional_symbols)
-            )
+        final_input_symbols = get_regex_input_symbols(regex, input_symbols)
 
         # Build the NFA
-        nfa_builder = parse_regex(regex, final_input_symbols)
+        if construction == "glushkov":
+            nfa_builder = parse_regex_glushkov(regex, final_input_symbols)
+        elif construction == "antimirov":
+            nfa_builder = parse_regex_antimirov(regex, final_input_symbols)
+        else:
+            nfa_builder = parse_regex(regex, final_input_symbols)
 
-        return cls(
+        new_nfa = cls._from_derived(
             states=frozenset(nfa_builder._transitions.keys()),
             input_symbols=final_input_symbols,
             transitions=nfa_builder._transitions,
@@ -371,6 +363,14 @@ def from_regex(
             final_states=nfa_builder._final_states,
         )
 
+        # The regex is the only user input here, so only its symbols need to be
+        # checked against user-provided input symbols
+        if input_symbols is not None:
+            for start_state, paths in new_nfa.transitions.items():
+                new_nfa._validate_transition_invalid_symbols(start_state, paths)
+
+        return new_nfa
+
     def _validate_transition_end_states(
         self, start_state: NFAStateT, paths: NFAPathT
     ) -> None:
@@ -442,78 +442,69 @@ def _get_next_current_states(
 
         return frozenset(next_current_states)
 
-    @staticmethod
-    def _compute_reachable_states(
-        initial_state: NFAStateT, transitions: NFATransitionsT
-    ) -> Set[NFAStateT]:
-        """Compute the states which are reachable from the initial state."""
-
-        visited_set: Set[NFAStateT] = set()
-        queue: Deque[NFAStateT] = deque()
-
-        queue.append(initial_state)
-        visited_set.add(initial_state)
-
-        while queue:
-            state = queue.popleft()
-            state_dict = transitions.get(state)
-
-            if state_dict:
-                for next_state in chain.from_iterable(
-                    dest for dest in state_dict.values()
-                ):
-                    if next_state not in visited_set:
-                        visited_set.add(next_state)
-                        queue.append(next_state)
-
-        return visited_set
-
     def _eliminate_lambda(
         self,
     ) -> Tuple[AbstractSet[NFAStateT], NFATransitionsT, AbstractSet[NFAStateT]]:
-        """Internal helper function for eliminate lambda. Doesn't create final NFA."""
+        """
+        Internal helper function for eliminate lambda. Doesn't create final NFA.
 
-        # Create new transitions and final states for running this algorithm
-        new_transitions = {
-            state: {symbol: set(dest) for symbol, dest in paths.items()}
-            for state, paths in self.transitions.items()
-        }
-        new_final_states = set(self.final_states)
+        Each state reachable without lambda transitions gets the transitions
+        of every state in its lambda closure, and is final if its closure
+        contains a final state. States in the same strongly connected component
+        of lambda transitions share their closure, so their transitions are
+        only computed once and are shared.
+        """
+        transitions = self.transitions
+        final_states = self.final_states
         lambda_closures = self._get_lambda_closures()
+        # The new transitions and finality of each distinct closure
+        closure_paths: Dict[int, Tuple[Mapping[str, FrozenSet[NFAStateT]], bool]] = {}
 
-        for state in self.states:
-            lambda_enclosure = lambda_closures[state] - {state}
-            for input_symbol in self.input_symbols:
-                next_current_states = set(
-                    self._get_next_current_states(lambda_enclosure, input_symbol)
-                )
-
-                # Don't do anything if no new current states
-                if next_current_states:
-                    state_transition_dict = new_transitions.setdefault(state, {})
+        new_transitions: Dict[NFAStateT, Mapping[str, FrozenSet[NFAStateT]]] = {}
+        new_final_states = set()
+        reachable_states = {self.initial_state}
+        queue: Deque[NFAStateT] = deque(reachable_states)
 
-                    if input_symbol in state_transition_dict:
-                        state_transition_dict[input_symbol].update(next_current_states)
-                    else:
-                        state_transition_dict[input_symbol] = next_current_states
+        while queue:
+            state = queue.popleft()
+            closure = lambda_closures[state]
+            paths_and_finality = closure_paths.get(id(closure))
+
+            if paths_and_finality is None:
+                new_paths: Dict[str, Set[NFAStateT]] = {}
+                for closure_state in closure:
+                    for symbol, end_states in transitions.get(
+                        closure_state, {}
+                    ).items():
+                        if symbol and end_states:
+                            new_paths.setdefault(symbol, set()).update(end_states)
+
+                paths_and_finality = (
+                    frozendict(
+                        {
+                            symbol: frozenset(end_states)
+                            for symbol, end_states in new_paths.items()
+                        }
+                    ),
+                    not final_states.isdisjoint(closure),
+                )
+                closure_paths[id(closure)] = paths_and_finality
 
-            if not new_final_states.isdisjoint(lambda_enclosure):
+            paths, is_final = paths_and_finality
+            if paths or state in transitions:
+                new_transitions[state] = paths
+            if is_final:
                 new_final_states.add(state)
 
-            if state in new_transitions:
-                new_transitions[state].pop("", None)
+            for end_states in paths.values():
+                for end_state in end_states:
+                    if end_state not in reachable_states:
+                        reachable_states.add(end_state)
+                        queue.append(end_state)
 
-        # Remove unreachable states
-        reachable_states = self.__class__._compute_reachable_states(
-            self.initial_state, new_transitions
-        )
-        reachable_final_states = reachable_states & new_final_states
-
-        for state in self.states - reachable_states:
-            new_transitions.pop(state, None)
-
-        return reachable_states, new_transitions, reachable_final_states
+        return reachable_states, new_transitions, new_final_states
 
+    @cached_operation
     def eliminate_lambda(self) -> Self:
         """
         Returns an equivalent NFA with lambda transitions removed.
@@ -530,7 +521,7 @@ def eliminate_lambda(self) -> Self:
             reachable_final_states,
         ) = self._eliminate_lambda()
 
-        return self.__class__(
+        return self.__class__._from_derived(
             states=reachable_states,
             input_symbols=self.input_symbols,
             transitions=new_transitions,
@@ -538,6 +529,75 @@ def eliminate_lambda(self) -> Self:
             final_states=reachable_final_states,
         )
 
+    @cached_operation
+    def reduce(self) -> Self:
+        """
+        Returns an equivalent NFA without lambda transitions whose states are a
+        subset of the states of this NFA, computed without determinizing it.
+
+        States which simulate each other (forward, in that they accept the same
+        strings, or backward, in that they are reached by the same strings)
+        are merged, and transitions to a state that is strictly simulated by
+        another target of the same transition are removed, until the size of
+        the NFA stops decreasing. Unreachable states and states from which no
+        final state is reachable are removed as well. This takes polynomial
+        time, unlike `DFA.from_nfa(nfa).minify()`, although the result is not
+        necessarily minimal.
+
+        Returns
+        ------
+        Self
+            The equivalent reduced NFA.
+        """
+        stats = get_stats_collector()
+        start_time = perf_counter() if stats is not None else 0.0
+
+        (
+            reachable_states,
+            new_transitions,
+            reachable_final_states,
+        ) = self._eliminate_lambda()
+
+        states = [self.initial_state]
+        states.extend(
+            state for state in reachable_states if state != self.initial_state
+        )
+        state_index = {state: i for i, state in enumerate(states)}
+
+        def to_mask(states: AbstractSet[NFAStateT]) -> int:
+            return sum(1 << state_index[state] for state in states)
+
+        successors = [
+            {
+                symbol: to_mask(end_states)
+                for symbol, end_states in new_transitions.get(state, {}).items()
+            }
+            for state in states
+        ]
+        successors, original_states, final_mask = simulation.reduce_nfa(
+            successors, to_mask(reachable_final_states)
+        )
+
+        def to_states(mask: int) -> FrozenSet[NFAStateT]:
+            return frozenset(states[original_states[i]] for i in bitset.iter_bits(mask))
+
+        reduced_states = [states[i] for i in original_states]
+        if stats is not None:
+            stats.increment("reduce.nfa_states", len(self.states))
+            stats.increment("reduce.reduced_states", len(reduced_states))
+            stats.record_time("reduce", start_time)
+
+        return self.__class__._from_derived(
+            states=frozenset(reduced_states),
+            input_symbols=self.input_symbols,
+            transitions={
+                state: {symbol: to_states(mask) for symbol, mask in paths.items()}
+                for state, paths in zip(reduced_states, successors)
+            },
+            initial_state=self.initial_state,
+            final_states=to_states(final_mask),
+        )
+
     def _check_for_input_rejection(
         self, current_states: AbstractSet[NFAStateT]
     ) -> None:
@@ -572,14 +632,49 @@ def read_input_stepwise(
         RejectionException
             Raised if this NFA does not accept the input string.
         """
-        current_states = self._get_lambda_closures()[self.initial_state]
+        if len(self.states) > global_config.max_bitset_nfa_states:
+            current_states = self._get_lambda_closures()[self.initial_state]
 
-        yield current_states
-        for input_symbol in input_str:
-            current_states = self._get_next_current_states(current_states, input_symbol)
             yield current_states
+            for input_symbol in input_str:
+                current_states = self._get_next_current_states(
+                    current_states, input_symbol
+                )
+                yield current_states
 
-        self._check_for_input_rejection(current_states)
+            self._check_for_input_rejection(current_states)
+            return
+
+        bitset_nfa = self.to_bitset()
+        step = bitset_nfa.step
+        to_states = bitset_nfa.to_states
+
+        mask = bitset_nfa.initial_mask
+        yield to_states(mask)
+        for input_symbol in input_str:
+            mask = step(mask, input_symbol)
+            yield to_states(mask)
+
+        if not mask & bitset_nfa.final_mask:
+            self._check_for_input_rejection(to_states(mask))
+
+    def accepts_input(self, input_str: str) -> bool:
+        """
+        Return True if this NFA accepts the given input.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to check.
+
+        Returns
+        ------
+        bool
+            True if this NFA accepts the given input; False otherwise.
+        """
+        if len(self.states) > global_config.max_bitset_nfa_states:
+            return super().accepts_input(input_str)
+        return self.to_bitset().accepts_input(input_str)
 
     @staticmethod
     def _get_state_maps(
@@ -600,6 +695,7 @@ def _get_state_maps(
 
         return (state_map_a, state_map_b)
 
+    @cached_operation
     def union(self, other: NFA) -> Self:
         """
         Given two NFAs, M1 and M2, which accept the languages
@@ -649,7 +745,7 @@ def union(self, other: NFA) -> Self:
             )
         )
 
-        return self.__class__(
+        return self.__class__._from_derived(
             states=new_states,
             input_symbols=self.input_symbols | other.input_symbols,
             transitions=new_transitions,
@@ -657,6 +753,7 @@ def union(self, other: NFA) -> Self:
             final_states=new_final_states,
         )
 
+    @cached_operation
     def concatenate(self, other: NFA) -> Self:
         """
         Given two NFAs, M1 and M2, which accept the languages
@@ -701,7 +798,7 @@ def concatenate(self, other: NFA) -> Self:
         # Final states of other
         new_final_states = frozenset(state_map_b[state] for state in other.final_states)
 
-        return self.__class__(
+        return self.__class__._from_derived(
             states=new_states,
             input_symbols=self.input_symbols | other.input_symbols,
             transitions=new_transitions,
@@ -709,6 +806,7 @@ def concatenate(self, other: NFA) -> Self:
             final_states=new_final_states,
         )
 
+    @cached_operation
     def kleene_star(self) -> Self:
         """
         Given an NFA which accepts the language L, returns
@@ -737,7 +835,7 @@ def kleene_star(self) -> Self:
             transition[""] = set(transition.get("", set()))
             transition[""].add(self.initial_state)
 
-        return self.__class__(
+        return self.__class__._from_derived(
             states=new_states,
             input_symbols=self.input_symbols,
             transitions=new_transitions,
@@ -745,6 +843,7 @@ def kleene_star(self) -> Self:
             final_states=self.final_states | {new_initial_state},
         )
 
+    @cached_operation
     def option(self) -> Self:
         """
         Given an NFA which accepts the language L, returns
@@ -764,7 +863,7 @@ def option(self) -> Self:
         # to old initial state
         new_transitions[new_initial_state] = {"": {self.initial_state}}
 
-        return self.__class__(
+        return self.__class__._from_derived(
             states=new_states,
             input_symbols=self.input_symbols,
             transitions=new_transitions,
@@ -772,6 +871,7 @@ def option(self) -> Self:
             final_states=self.final_states | {new_initial_state},
         )
 
+    @cached_operation
     def reverse(self) -> Self:
         """
         Given an NFA which accepts the language L,
@@ -800,7 +900,7 @@ def reverse(self) -> Self:
         new_transitions[new_initial_state][""] = set(self.final_states)
         new_final_states = {self.initial_state}
 
-        return self.__class__(
+        return self.__class__._from_derived(
             states=new_states,
             input_symbols=self.input_symbols,
             transitions=new_transitions,
@@ -808,6 +908,7 @@ def reverse(self) -> Self:
             final_states=new_final_states,
         )
 
+    @cached_operation
     def intersection(self, other: NFA) -> Self:
         """
         Given two NFAs, M1 and M2, which accept the languages
@@ -834,6 +935,7 @@ def intersection(self, other: NFA) -> Self:
 
         queue.append(new_initial_state)
         new_states.add(new_initial_state)
+        limits = get_resource_limits()
 
         while queue:
             curr_state = queue.popleft()
@@ -882,13 +984,16 @@ def intersection(self, other: NFA) -> Self:
                     new_states.add(product_state)
                     queue.append(product_state)
 
+            if limits is not None:
+                limits.check("intersection", states=len(new_states))
+
         new_final_states = frozenset(
             (state_a, state_b)
             for (state_a, state_b) in new_states
             if state_a in self.final_states and state_b in other.final_states
         )
 
-        return self.__class__(
+        return self.__class__._from_derived(
             states=new_states,
             input_symbols=new_input_symbols,
             transitions=new_transitions,
@@ -896,16 +1001,95 @@ def intersection(self, other: NFA) -> Self:
             final_states=new_final_states,
         )
 
-    def shuffle_product(self, other: NFA) -> Self:
+    @classmethod
+    def _from_reachable_product(
+        cls,
+        initial_state: NFAStateT,
+        get_paths: Callable[[Any], Dict[str, Set[NFAStateT]]],
+        is_final: Callable[[Any], bool],
+        input_symbols: AbstractSet[str],
+        phase: str,
+        remove_dead_states: bool,
+    ) -> Self:
+        """
+        Build the part of a product construction reachable from its initial
+        state with a breadth-first search, where get_paths returns the
+        transitions of a product state and is_final its finality. If
+        remove_dead_states is True, the states from which no final state is
+        reachable are then removed, along with the transitions to them.
+        """
+        new_states = {initial_state}
+        new_transitions: Dict[NFAStateT, Dict[str, Set[NFAStateT]]] = {}
+        queue: Deque[NFAStateT] = deque(new_states)
+        limits = get_resource_limits()
+
+        while queue:
+            curr_state = queue.popleft()
+            state_dict = get_paths(curr_state)
+            new_transitions[curr_state] = state_dict
+
+            for end_states in state_dict.values():
+                for end_state in end_states:
+                    if end_state not in new_states:
+                        new_states.add(end_state)
+                        queue.append(end_state)
+
+            if limits is not None:
+                limits.check(phase, states=len(new_states))
+
+        new_final_states = {state for state in new_states if is_final(state)}
+
+        if remove_dead_states:
+            predecessors: Dict[NFAStateT, List[NFAStateT]] = {}
+            for start_state, state_dict in new_transitions.items():
+                for end_states in state_dict.values():
+                    for end_state in end_states:
+                        predecessors.setdefault(end_state, []).append(start_state)
+
+            live_states = set(new_final_states)
+            live_queue: Deque[NFAStateT] = deque(live_states)
+            while live_queue:
+                for start_state in predecessors.get(live_queue.popleft(), ()):
+                    if start_state not in live_states:
+                        live_states.add(start_state)
+                        live_queue.append(start_state)
+
+            live_states.add(initial_state)
+            new_states = live_states
+            new_transitions = {
+                state: {
+                    symbol: live_end_states
+                    for symbol, end_states in new_transitions[state].items()
+                    if (live_end_states := end_states & live_states)
+                }
+                for state in new_states
+            }
+
+        return cls._from_derived(
+            states=new_states,
+            input_symbols=input_symbols,
+            transitions=new_transitions,
+            initial_state=initial_state,
+            final_states=new_final_states,
+        )
+
+    @cached_operation
+    def shuffle_product(self, other: NFA, *, remove_dead_states: bool = False) -> Self:
         """
         Given two NFAs, M1 and M2, which accept the languages
         L1 and L2 respectively, returns an NFA which accepts
         the shuffle of L1 and L2.
 
+        Only the pairs of states reachable from the pair of initial states
+        are constructed.
+
         Parameters
         ----------
         other : NFA
             The NFA we want to take a shuffle product with.
+        remove_dead_states : bool, default: False
+            Whether to also remove the states from which no final state
+            is reachable.
 
         Returns
         ------
@@ -915,37 +1099,37 @@ def shuffle_product(self, other: NFA) -> Self:
         if not isinstance(other, NFA):
             raise TypeError(f"other must be an NFA, not {other.__class__.__name__}")
 
-        new_input_symbols = self.input_symbols | other.input_symbols
-        new_initial_state = (self.initial_state, other.initial_state)
-        new_states = frozenset(product(self.states, other.states))
-
-        new_transitions: Dict[NFAStateT, Dict[str, Set[NFAStateT]]] = {}
-
-        for curr_state in new_states:
-            state_dict = new_transitions.setdefault(curr_state, {})
+        def get_paths(curr_state: Tuple[NFAStateT, NFAStateT]) -> Dict[str, Set[Any]]:
             q_a, q_b = curr_state
+            state_dict: Dict[str, Set[Any]] = {}
 
-            transitions_a = self.transitions.get(q_a, {})
-            for symbol, end_states in transitions_a.items():
+            for symbol, end_states in self.transitions.get(q_a, {}).items():
                 state_dict.setdefault(symbol, set()).update(
                     zip(end_states, repeat(q_b))
                 )
 
-            transitions_b = other.transitions.get(q_b, {})
-            for symbol, end_states in transitions_b.items():
+            for symbol, end_states in other.transitions.get(q_b, {}).items():
                 state_dict.setdefault(symbol, set()).update(
                     zip(repeat(q_a), end_states)
                 )
 
-        return self.__class__(
-            states=new_states,
-            input_symbols=new_input_symbols,
-            transitions=new_transitions,
-            initial_state=new_initial_state,
-            final_states=frozenset(product(self.final_states, other.final_states)),
+            return state_dict
+
+        def is_final(curr_state: Tuple[NFAStateT, NFAStateT]) -> bool:
+            q_a, q_b = curr_state
+            return q_a in self.final_states and q_b in other.final_states
+
+        return self.__class__._from_reachable_product(
+            (self.initial_state, other.initial_state),
+            get_paths,
+            is_final,
+            self.input_symbols | other.input_symbols,
+            "shuffle_product",
+            remove_dead_states,
         )
 
-    def right_quotient(self, other: NFA) -> Self:
+    @cached_operation
+    def right_quotient(self, other: NFA, *, remove_dead_states: bool = False) -> Self:
         """
         Given two NFAs, M1 and M2, which accept the languages
         L1 and L2 respectively, returns an NFA which accepts
@@ -954,10 +1138,15 @@ def right_quotient(self, other: NFA) -> Self:
         Construction is based off of the one described here:
         https://cs.stackexchange.com/a/102043
 
+        Only the states reachable from the initial state are constructed.
+
         Parameters
         ----------
         other : NFA
             The NFA we want to take a right quotient with.
+        remove_dead_states : bool, default: False
+            Whether to also remove the states from which no final state
+            is reachable.
 
         Returns
         ------
@@ -969,73 +1158,58 @@ def right_quotient(self, other: NFA) -> Self:
             raise TypeError(f"other must be an NFA, not {other.__class__.__name__}")
 
         # First, eliminate lambdas because they cause problems with this algorithm
+        _, self_new_transitions, self_reachable_final_states = self._eliminate_lambda()
         (
-            self_reachable_states,
-            self_new_transitions,
-            self_reachable_final_states,
-        ) = self._eliminate_lambda()
-        (
-            other_reachable_states,
+            _,
             other_new_transitions,
             other_reachable_final_states,
         ) = other._eliminate_lambda()
 
-        new_input_symbols = self.input_symbols | other.input_symbols
-        new_initial_state = (self.initial_state, other.initial_state, False)
-        new_final_states = frozenset(
-            product(self_reachable_final_states, other_reachable_final_states, [True])
-        )
-        new_states = frozenset(
-            chain(
-                product(self_reachable_states, [other.initial_state], [False]),
-                product(self_reachable_states, other_reachable_states, [True]),
-            )
-        )
-
-        new_transitions: Dict[NFAStateT, Dict[str, Set[NFAStateT]]] = {}
-
-        # Populate transitions for before reading the suffix
-        for state in self_reachable_states:
-            new_state = (state, other.initial_state, False)
-            new_state_dict = new_transitions.setdefault(new_state, {})
-            old_transitions_dict = self_new_transitions.get(state)
-
-            if old_transitions_dict:
-                for symbol, end_states in old_transitions_dict.items():
-                    new_state_dict[symbol] = {
-                        (end_state, other.initial_state, False)
-                        for end_state in end_states
-                    }
-
-            new_state_dict[""] = {(state, other.initial_state, True)}
+        def get_paths(
+            curr_state: Tuple[NFAStateT, NFAStateT, bool],
+        ) -> Dict[str, Set[Any]]:
+            q_a, q_b, reading_suffix = curr_state
+            transitions_a = self_new_transitions.get(q_a, {})
 
-        # Start reading after the suffix
-        for q_a, q_b in product(self_reachable_states, other_reachable_states):
-            curr_state = (q_a, q_b, True)
+            # Before reading the suffix, follow self alone, or start reading it
+            if not reading_suffix:
+                state_dict: Dict[str, Set[Any]] = {
+                    symbol: set(zip(end_states, repeat(q_b), repeat(False)))
+                    for symbol, end_states in transitions_a.items()
+                }
+                state_dict[""] = {(q_a, q_b, True)}
+                return state_dict
 
-            transitions_a = self_new_transitions.get(q_a, {})
+            # Read the suffix without consuming input, moving over the same
+            # input symbols in both NFAs
             transitions_b = other_new_transitions.get(q_b, {})
-
-            # Add all transitions moving over same input symbols
-            for symbol in new_input_symbols:
-                end_states_a = transitions_a.get(symbol)
+            end_states: Set[Any] = set()
+            for symbol, end_states_a in transitions_a.items():
                 end_states_b = transitions_b.get(symbol)
+                if end_states_b is not None:
+                    end_states.update(product(end_states_a, end_states_b, [True]))
 
-                if end_states_a is not None and end_states_b is not None:
-                    state_dict = new_transitions.setdefault(curr_state, {})
-                    state_dict.setdefault("", set()).update(
-                        product(end_states_a, end_states_b, [True])
-                    )
+            return {"": end_states} if end_states else {}
 
-        return self.__class__(
-            states=new_states,
-            input_symbols=new_input_symbols,
-            transitions=new_transitions,
-            initial_state=new_initial_state,
-            final_states=new_final_states,
+        def is_final(curr_state: Tuple[NFAStateT, NFAStateT, bool]) -> bool:
+            q_a, q_b, reading_suffix = curr_state
+            return (
+                reading_suffix
+                and q_a in self_reachable_final_states
+                and q_b in other_reachable_final_states
+            )
+
+        return self.__class__._from_reachable_product(
+            (self.initial_state, other.initial_state, False),
+            get_paths,
+            is_final,
+            self.input_symbols | other.input_symbols,
+            "right_quotient",
+            remove_dead_states,
         )
 
-    def left_quotient(self, other: NFA) -> Self:
+    @cached_operation
+    def left_quotient(self, other: NFA, *, remove_dead_states: bool = False) -> Self:
         """
         Given two NFAs, M1 and M2, which accept the languages
         L1 and L2 respectively, returns an NFA which accepts
@@ -1044,10 +1218,15 @@ def left_quotient(self, other: NFA) -> Self:
         Construction is based off of the one described here:
         https://cs.stackexchange.com/a/102043
 
+        Only the states reachable from the initial state are constructed.
+
         Parameters
         ----------
         other : NFA
             The NFA we want to take a left quotient with.
+        remove_dead_states : bool, default: False
+            Whether to also remove the states from which no final state
+            is reachable.
 
         Returns
         ------
@@ -1059,74 +1238,56 @@ def left_quotient(self, other: NFA) -> Self:
             raise TypeError(f"other must be an NFA, not {other.__class__.__name__}")
 
         # First, eliminate lambdas because they cause problems with this algorithm
+        _, self_new_transitions, self_reachable_final_states = self._eliminate_lambda()
         (
-            self_reachable_states,
-            self_new_transitions,
-            self_reachable_final_states,
-        ) = self._eliminate_lambda()
-        (
-            other_reachable_states,
+            _,
             other_new_transitions,
             other_reachable_final_states,
         ) = other._eliminate_lambda()
 
-        new_input_symbols = self.input_symbols | other.input_symbols
-        new_initial_state = (self.initial_state, other.initial_state, False)
-        new_final_states = frozenset(
-            product(self_reachable_final_states, other_reachable_final_states, [True])
-        )
-        new_states = frozenset(
-            chain(
-                product(self_reachable_states, other_reachable_states, [False]),
-                product(self_reachable_states, other_reachable_final_states, [True]),
-            )
-        )
-
-        new_transitions: Dict[NFAStateT, Dict[str, Set[NFAStateT]]] = {}
+        def get_paths(
+            curr_state: Tuple[NFAStateT, NFAStateT, bool],
+        ) -> Dict[str, Set[Any]]:
+            q_a, q_b, read_prefix = curr_state
+            transitions_a = self_new_transitions.get(q_a, {})
 
-        # Start reading the prefix
-        for q_a, q_b in product(self_reachable_states, other_reachable_states):
-            curr_state = (q_a, q_b, False)
+            # After reading the prefix, follow self alone
+            if read_prefix:
+                return {
+                    symbol: set(zip(end_states, repeat(q_b), repeat(True)))
+                    for symbol, end_states in transitions_a.items()
+                }
 
-            transitions_a = self_new_transitions.get(q_a, {})
+            # Read the prefix without consuming input, moving over the same
+            # input symbols in both NFAs
             transitions_b = other_new_transitions.get(q_b, {})
-
-            # Add all transitions moving over same input symbols
-            for symbol in new_input_symbols:
-                end_states_a = transitions_a.get(symbol)
+            end_states: Set[Any] = set()
+            for symbol, end_states_a in transitions_a.items():
                 end_states_b = transitions_b.get(symbol)
-
-                if end_states_a is not None and end_states_b is not None:
-                    state_dict = new_transitions.setdefault(curr_state, {})
-                    state_dict.setdefault("", set()).update(
-                        product(end_states_a, end_states_b, [False])
-                    )
+                if end_states_b is not None:
+                    end_states.update(product(end_states_a, end_states_b, [False]))
 
             # Add lambda transition from final state, flipping third entry to true
             if q_b in other_reachable_final_states:
-                state_dict = new_transitions.setdefault(curr_state, {})
-                state_dict.setdefault("", set()).add((q_a, q_b, True))
+                end_states.add((q_a, q_b, True))
 
-        # Populate transitions for after reading the prefix
-        for state_a, state_b in product(
-            self_reachable_states, other_reachable_final_states
-        ):
-            new_state = (state_a, state_b, True)
-            new_state_dict = new_transitions.setdefault(new_state, {})
-            old_transitions_dict = self_new_transitions.get(state_a)
-
-            if old_transitions_dict:
-                for symbol, end_states in old_transitions_dict.items():
-                    new_state_dict[symbol] = set(
-                        zip(end_states, repeat(state_b), repeat(True))
-                    )
+            return {"": end_states} if end_states else {}
 
-        return self.__class__(
-            states=new_states,
-            input_symbols=new_input_symbols,
-            transitions=new_transitions,
-            initial_state=new_initial_state,
-            final_states=new_final_states,
+        def is_final(curr_state: Tuple[NFAStateT, NFAStateT, bool]) -> bool:
+            q_a, q_b, read_prefix = curr_state
+            return (
+                read_prefix
+                and q_a in self_reachable_final_states
+                and q_b in other_reachable_final_states
+            )
+
+        return self.__class__._from_reachable_product(
+            (self.initial_state, other.initial_state, False),
+            get_paths,
+            is_final,
+            self.input_symbols | other.input_symbols,
+            "left_quotient",
+            remove_dead_states,
         )
 
     @staticmethod
@@ -1188,11 +1349,18 @@ def transition(states_pair: NFAStatesPairT, symbol: str) -> NFAStatesPairT:
         state_sets.union(initial_state_a, initial_state_b)
         pair_stack.append((initial_state_a, initial_state_b))
 
+        stats = get_stats_collector()
+        start_time = perf_counter() if stats is not None else 0.0
+        pairs_processed = 0
+        is_equal = True
+
         while pair_stack:
             q_a, q_b = pair_stack.pop()
+            pairs_processed += 1
 
             if is_final_state(q_a) ^ is_final_state(q_b):
-                return False
+                is_equal = False
+                break
 
             for symbol in self.input_symbols:
                 r_1 = state_sets[transition(q_a, symbol)]
@@ -1202,7 +1370,97 @@ def transition(states_pair: NFAStatesPairT, symbol: str) -> NFAStatesPairT:
                     state_sets.union(r_1, r_2)
                     pair_stack.append((r_1, r_2))
 
-        return True
+        if stats is not None:
+            stats.increment("nfa_eq.pairs", pairs_processed)
+            stats.record_time("nfa_eq", start_time)
+
+        return is_equal
+
+    @classmethod
+    def random(
+        cls: Type[Self],
+        n_states: int,
+        input_symbols: AbstractSet[str],
+        *,
+        seed: Optional[int] = None,
+        density: float = 1.0,
+        lambda_density: float = 0.0,
+        accepting_ratio: float = 0.5,
+    ) -> Self:
+        """
+        Generates a random NFA whose states are all reachable from the
+        initial state. The states are the integers 0 to n_states - 1, with 0
+        as the initial state.
+
+        Parameters
+        ----------
+        n_states : int
+            The number of states, which must be positive.
+        input_symbols : AbstractSet[str]
+            The set of input symbols to construct the NFA over.
+        seed : Optional[int], default: None
+            The random seed to use, for reproducible NFAs.
+        density : float, default: 1.0
+            The average number of transitions on each input symbol leaving
+            each state, in addition to those of a random spanning tree which
+            makes every state reachable.
+        lambda_density : float, default: 0.0
+            The average number of lambda transitions leaving each state.
+        accepting_ratio : float, default: 0.5
+            The probability of each state being a final state.
+
+        Returns
+        ------
+        Self
+            A random NFA.
+        """
+        if n_states < 1:
+            raise ValueError("Number of states must be positive")
+        if n_states > 1 and not input_symbols:
+            raise ValueError("Input symbols must be nonempty if n_states > 1")
+        if density < 0 or lambda_density < 0:
+            raise ValueError("Densities must be non-negative")
+        if not 0 <= accepting_ratio <= 1:
+            raise ValueError("Accepting ratio must be between 0 and 1")
+
+        with generators.paused_gc():
+            rng = Random(seed)
+            symbols = sorted(input_symbols)
+            state_transitions = generators.random_nfa_transitions(
+                n_states,
+                len(symbols),
+                rng,
+                density=density,
+                lambda_density=lambda_density,
+            )
+            final_flags = generators.random_final_flags(n_states, accepting_ratio, rng)
+
+            # Build the frozen transitions directly, rather than freezing them
+            # transition by transition
+            return cls._from_trusted(
+                states=frozenset(range(n_states)),
+                input_symbols=frozenset(symbols),
+                transitions=frozendict(
+                    zip(
+                        range(n_states),
+                        (
+                            frozendict(
+                                {
+                                    symbols[symbol] if symbol >= 0 else "": frozenset(
+                                        targets
+                                    )
+                                    for symbol, targets in paths.items()
+                                }
+                            )
+                            for paths in state_transitions
+                        ),
+                    )
+                ),
+                initial_state=0,
+                final_states=frozenset(
+                    state for state, is_final in enumerate(final_flags) if is_final
+                ),
+            )
 
     @classmethod
     def edit_distance(
@@ -0,0 +1,298 @@
+"""Classes and methods for exploring products of finite automata lazily."""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import product
+from time import perf_counter
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+import automata.base.exceptions as exceptions
+import automata.fa.bitset as bitset
+import automata.fa.dfa as dfa
+import automata.fa.nfa as nfa
+from automata.base.instrumentation import get_stats_collector
+from automata.base.limits import get_resource_limits
+
+# A state of a product, as the index of a state of each operand
+ProductStateT = Tuple[int, ...]
+
+
+class _ProductOperand:
+    """
+    An operand of a product, whose states are numbered from 0 and whose sets
+    of states are bitsets. NFAs are represented by their `BitsetNFA`, whose
+    transitions are closed under lambda transitions, so that the product never
+    has to interleave them. The transitions of each state are computed when
+    first needed.
+    """
+
+    __slots__ = (
+        "initial_mask",
+        "final_mask",
+        "_bitset_nfa",
+        "_dfa",
+        "_states",
+        "_state_index",
+        "_paths",
+    )
+
+    initial_mask: int
+    final_mask: int
+    _bitset_nfa: Optional[bitset.BitsetNFA]
+    _dfa: Optional[dfa.DFA]
+    _states: List[dfa.DFAStateT]
+    _state_index: Dict[dfa.DFAStateT, int]
+    _paths: List[Optional[Dict[str, int]]]
+
+    def __init__(self, automaton: Union[nfa.NFA, dfa.DFA]) -> None:
+        if isinstance(automaton, nfa.NFA):
+            bitset_nfa = automaton.to_bitset()
+            self._bitset_nfa = bitset_nfa
+            self._dfa = None
+            self.initial_mask = bitset_nfa.initial_mask
+            self.final_mask = bitset_nfa.final_mask
+            state_count = len(bitset_nfa.states)
+        else:
+            self._bitset_nfa = None
+            self._dfa = automaton
+            self._states = [automaton.initial_state]
+            self._states.extend(
+                state for state in automaton.states if state != automaton.initial_state
+            )
+            self._state_index = {state: i for i, state in enumerate(self._states)}
+            self.initial_mask = 1
+            self.final_mask = sum(
+                1 << self._state_index[state] for state in automaton.final_states
+            )
+            state_count = len(self._states)
+        self._paths = [None] * state_count
+
+    def get_paths(self, state: int) -> Dict[str, int]:
+        """Return the bitset of next states on each symbol from a state."""
+        paths = self._paths[state]
+        if paths is None:
+            if self._bitset_nfa is not None:
+                paths = self._bitset_nfa.successor_masks(1 << state)
+            else:
+                assert self._dfa is not None
+                state_index = self._state_index
+                paths = {
+                    symbol: 1 << state_index[end_state]
+                    for symbol, end_state in self._dfa.transitions[
+                        self._states[state]
+                    ].items()
+                }
+            self._paths[state] = paths
+        return paths
+
+    def step(self, mask: int, symbol: str) -> int:
+        """Return the bitset of states reached from a bitset on a symbol."""
+        if self._bitset_nfa is not None:
+            return self._bitset_nfa.step(mask, symbol)
+        return self.get_paths(mask.bit_length() - 1).get(symbol, 0)
+
+
+class ProductView:
+    """
+    The `ProductView` class represents the intersection of the languages of
+    several NFAs and DFAs without constructing it. Unlike `NFA.intersection`,
+    which builds every reachable pair of states (including the pairs needed
+    to interleave lambda transitions) and validates the result, the product
+    is only explored as far as a query needs, and lambda transitions are
+    followed through the precomputed closures of each NFA.
+
+    Emptiness and shortest words are found by a breadth-first search over
+    tuples of states of the operands, which stops at the first tuple of final
+    states. Membership is checked by simulating the operands in lockstep,
+    which stops as soon as one of them rejects.
+
+    Parameters
+    ----------
+    *automata : Union[NFA, DFA]
+        The automata whose languages to intersect. NFAs are simulated with
+        bitsets of states, as built by `NFA.to_bitset`.
+    """
+
+    __slots__ = ("automata", "_operands", "_shortest_word")
+
+    automata: Tuple[Union[nfa.NFA, dfa.DFA], ...]
+    _operands: Tuple[_ProductOperand, ...]
+    _shortest_word: Optional[Tuple[Optional[str]]]
+
+    def __init__(self, *automata: Union[nfa.NFA, dfa.DFA]) -> None:
+        if not automata:
+            raise ValueError("a product needs at least one automaton")
+        for automaton in automata:
+            if not isinstance(automaton, (nfa.NFA, dfa.DFA)):
+                raise TypeError(
+                    f"automata must be NFAs or DFAs, not {automaton.__class__.__name__}"
+                )
+
+        self.automata = automata
+        self._operands = tuple(_ProductOperand(automaton) for automaton in automata)
+        self._shortest_word = None
+
+    def accepts_input(self, input_str: str) -> bool:
+        """
+        Return True if every automaton in the product accepts the given input.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to check.
+
+        Returns
+        ------
+        bool
+            Whether the input is in the intersection of the languages.
+        """
+        operands = self._operands
+        masks = [operand.initial_mask for operand in operands]
+        for symbol in input_str:
+            for i, operand in enumerate(operands):
+                mask = operand.step(masks[i], symbol)
+                if not mask:
+                    return False
+                masks[i] = mask
+        return all(mask & operand.final_mask for mask, operand in zip(masks, operands))
+
+    def __contains__(self, input_str: str) -> bool:
+        """Return True if every automaton in the product accepts the input."""
+        return self.accepts_input(input_str)
+
+    def isempty(self) -> bool:
+        """
+        Return True if no string is accepted by every automaton in the product.
+
+        Returns
+        ------
+        bool
+            Whether the intersection of the languages is empty.
+        """
+        return self._find_shortest_word() is None
+
+    def shortest_word(self) -> str:
+        """
+        Return the shortest string accepted by every automaton in the product.
+        Among strings of the same length, the first in lexicographic order
+        (by symbol) is returned.
+
+        Returns
+        ------
+        str
+            The shortest string in the intersection of the languages.
+
+        Raises
+        ------
+        EmptyLanguageException
+            Raised if the intersection of the languages is empty.
+        """
+        word = self._find_shortest_word()
+        if word is None:
+            raise exceptions.EmptyLanguageException(
+                "The intersection of the languages is empty"
+            )
+        return word
+
+    def _find_shortest_word(self) -> Optional[str]:
+        """
+        Search the product breadth first for a tuple of final states,
+        expanding symbols in sorted order so that the first tuple found is
+        reached by the shortest, then lexicographically first, string. The
+        result is cached.
+        """
+        if self._shortest_word is not None:
+            return self._shortest_word[0]
+
+        stats = get_stats_collector()
+        start_time = perf_counter() if stats is not None else 0.0
+        limits = get_resource_limits()
+        operands = self._operands
+
+        def is_final(state: ProductStateT) -> bool:
+            return all(
+                operand.final_mask >> i & 1 for i, operand in zip(state, operands)
+            )
+
+        # The state each state was first reached from, with the symbol read
+        parents: Dict[ProductStateT, Optional[Tuple[ProductStateT, str]]] = {}
+        final_state: Optional[ProductStateT] = None
+
+        initial_states = []
+        for state in product(
+            *(tuple(bitset.iter_bits(operand.initial_mask)) for operand in operands)
+        ):
+            parents[state] = None
+            initial_states.append(state)
+            if is_final(state):
+                final_state = state
+                break
+
+        # The states first reached by the same string are grouped together,
+        # and the groups are queued in the order of those strings. Expanding
+        # each group one symbol at a time, in sorted order, keeps the queue in
+        # that order.
+        queue: Deque[List[ProductStateT]] = deque([initial_states])
+
+        while queue and final_state is None:
+            group = queue.popleft()
+            group_paths = [
+                (state, [operand.get_paths(i) for i, operand in zip(state, operands)])
+                for state in group
+            ]
+            symbols = sorted(
+                {
+                    symbol
+                    for _, operand_paths in group_paths
+                    for symbol in min(operand_paths, key=len)
+                }
+            )
+
+            for symbol in symbols:
+                next_group = []
+                for state, operand_paths in group_paths:
+                    masks = []
+                    for paths in operand_paths:
+                        mask = paths.get(symbol)
+                        if mask is None:
+                            break
+                        masks.append(mask)
+                    else:
+                        for next_state in product(
+                            *(tuple(bitset.iter_bits(mask)) for mask in masks)
+                        ):
+                            if next_state in parents:
+                                continue
+                            parents[next_state] = (state, symbol)
+                            next_group.append(next_state)
+                            if is_final(next_state):
+                                final_state = next_state
+                                break
+                    if final_state is not None:
+                        break
+
+                if limits is not None:
+                    limits.check("product", states=len(parents))
+                if final_state is not None:
+                    break
+                if next_group:
+                    queue.append(next_group)
+
+        if stats is not None:
+            stats.increment("product.states", len(parents))
+            stats.record_time("product", start_time)
+
+        if final_state is None:
+            self._shortest_word = (None,)
+            return None
+
+        symbols = []
+        parent = parents[final_state]
+        while parent is not None:
+            state, symbol = parent
+            symbols.append(symbol)
+            parent = parents[state]
+        word = "".join(reversed(symbols))
+        self._shortest_word = (word,)
+        return word
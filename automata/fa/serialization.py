@@ -0,0 +1,476 @@
+"""
+Classes and methods for saving DFAs to, and loading DFAs from, a compact
+binary format.
+
+A file consists of a fixed-size header, a JSON metadata block, a dense table
+of 32-bit transition targets (one row per state and one column per input
+symbol, with -1 for missing transitions), a byte per state marking final
+states and, unless the states are exactly the integers 0 to n-1, a side table
+of JSON-encoded state names. All integers are little-endian, and the
+transition table is 8-byte aligned so it can be used directly from a memory
+map.
+"""
+
+from __future__ import annotations
+
+import array
+import json
+import mmap as mmap_module
+import os
+import struct
+import sys
+from collections.abc import Mapping, Set
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import automata.base.exceptions as exceptions
+
+if TYPE_CHECKING:
+    import automata.fa.dfa as dfa
+
+    DFAT = TypeVar("DFAT", bound=dfa.DFA)
+
+MAGIC = b"AUTMTDFA"
+FORMAT_VERSION = 1
+
+# Magic, version, flags, number of states, number of symbols, metadata length
+HEADER_FORMAT = struct.Struct("<8sHHQQQ")
+
+FLAG_ALLOW_PARTIAL = 1
+FLAG_INTEGER_STATES = 2
+
+
+def _encode_state(state: Any) -> Any:
+    """Encode a state name as a JSON-compatible value tagged with its type."""
+    if isinstance(state, bool) or state is None:
+        return ["c", state]
+    if isinstance(state, str):
+        return ["s", state]
+    if isinstance(state, int):
+        return ["i", state]
+    if isinstance(state, tuple):
+        return ["t", [_encode_state(element) for element in state]]
+    if isinstance(state, frozenset):
+        return [
+            "f",
+            sorted(
+                (_encode_state(element) for element in state),
+                key=lambda encoded: json.dumps(encoded, sort_keys=True),
+            ),
+        ]
+    raise exceptions.SerializationError(
+        f"state {state!r} of type {type(state).__name__} cannot be saved"
+    )
+
+
+def _decode_state(encoded: Any) -> Any:
+    """Decode a state name encoded by _encode_state."""
+    tag, value = encoded
+    if tag in ("c", "s", "i"):
+        return value
+    if tag == "t":
+        return tuple(_decode_state(element) for element in value)
+    if tag == "f":
+        return frozenset(_decode_state(element) for element in value)
+    raise exceptions.SerializationError(f"unknown state encoding {tag!r}")
+
+
+def _padding(offset: int) -> int:
+    """Return the number of bytes needed to align offset to 8 bytes."""
+    return -offset % 8
+
+
+class _DFATables:
+    """The tables of a loaded DFA, with state names decoded on demand."""
+
+    __slots__ = (
+        "buffer",
+        "table",
+        "final_flags",
+        "symbols",
+        "symbol_index",
+        "state_count",
+        "_name_offsets",
+        "_name_blob",
+        "_names",
+        "_name_index",
+    )
+
+    def __init__(
+        self,
+        buffer: Any,
+        table: Sequence[int],
+        final_flags: Sequence[int],
+        symbols: Tuple[str, ...],
+        state_count: int,
+        name_offsets: Optional[Sequence[int]],
+        name_blob: Optional[memoryview],
+    ) -> None:
+        self.buffer = buffer
+        self.table = table
+        self.final_flags = final_flags
+        self.symbols = symbols
+        self.symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+        self.state_count = state_count
+        self._name_offsets = name_offsets
+        self._name_blob = name_blob
+        self._names: Optional[List[Any]] = None
+        self._name_index: Optional[Dict[Any, int]] = None
+
+    def get_state(self, index: int) -> Any:
+        """Return the name of the state with the given index."""
+        if self._name_offsets is None or self._name_blob is None:
+            return index
+
+        if self._names is None:
+            self._names = [None] * self.state_count
+        name = self._names[index]
+        if name is None:
+            start, end = self._name_offsets[index], self._name_offsets[index + 1]
+            name = _decode_state(json.loads(bytes(self._name_blob[start:end])))
+            self._names[index] = name
+        return name
+
+    def get_index(self, state: Any) -> Optional[int]:
+        """Return the index of the given state, or None if it is not a state."""
+        if self._name_offsets is None:
+            if (
+                isinstance(state, int)
+                and not isinstance(state, bool)
+                and 0 <= state < self.state_count
+            ):
+                return state
+            return None
+
+        if self._name_index is None:
+            self._name_index = {
+                self.get_state(index): index for index in range(self.state_count)
+            }
+        try:
+            return self._name_index.get(state)
+        except TypeError:
+            return None
+
+
+class _StatesView(Set):
+    """A read-only set of the states of a loaded DFA."""
+
+    __slots__ = ("_tables", "_final")
+
+    def __init__(self, tables: _DFATables, final: bool) -> None:
+        self._tables = tables
+        self._final = final
+
+    @classmethod
+    def _from_iterable(cls, it: Any) -> frozenset:
+        return frozenset(it)
+
+    def __contains__(self, state: Any) -> bool:
+        index = self._tables.get_index(state)
+        if index is None:
+            return False
+        return not self._final or bool(self._tables.final_flags[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        tables = self._tables
+        for index in range(tables.state_count):
+            if not self._final or tables.final_flags[index]:
+                yield tables.get_state(index)
+
+    def __len__(self) -> int:
+        if not self._final:
+            return self._tables.state_count
+        return sum(1 for flag in self._tables.final_flags if flag)
+
+    def __reduce__(self) -> Tuple[Type[frozenset], Tuple[List[Any]]]:
+        return (frozenset, (list(self),))
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+class _PathsView(Mapping):
+    """A read-only mapping of the transitions leaving one state."""
+
+    __slots__ = ("_tables", "_row")
+
+    def __init__(self, tables: _DFATables, index: int) -> None:
+        self._tables = tables
+        self._row = index * len(tables.symbols)
+
+    def __getitem__(self, symbol: str) -> Any:
+        column = self._tables.symbol_index.get(symbol)
+        if column is not None:
+            end_index = self._tables.table[self._row + column]
+            if end_index >= self._tables.state_count:
+                raise exceptions.SerializationError(
+                    f"transition to nonexistent state index {end_index}"
+                )
+            if end_index >= 0:
+                return self._tables.get_state(end_index)
+        raise KeyError(symbol)
+
+    def __iter__(self) -> Iterator[str]:
+        table = self._tables.table
+        for column, symbol in enumerate(self._tables.symbols):
+            if table[self._row + column] >= 0:
+                yield symbol
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __reduce__(self) -> Tuple[Type[dict], Tuple[Dict[str, Any]]]:
+        return (dict, (dict(self),))
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class _TransitionsView(Mapping):
+    """A read-only mapping of the transitions of a loaded DFA."""
+
+    __slots__ = ("_tables",)
+
+    def __init__(self, tables: _DFATables) -> None:
+        self._tables = tables
+
+    def __getitem__(self, state: Any) -> _PathsView:
+        index = self._tables.get_index(state)
+        if index is None:
+            raise KeyError(state)
+        return _PathsView(self._tables, index)
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._tables.get_state, range(self._tables.state_count))
+
+    def __len__(self) -> int:
+        return self._tables.state_count
+
+    def __reduce__(self) -> Tuple[Type[dict], Tuple[Dict[Any, Dict[str, Any]]]]:
+        return (dict, ({state: dict(paths) for state, paths in self.items()},))
+
+    def __repr__(self) -> str:
+        return repr({state: dict(paths) for state, paths in self.items()})
+
+
+def save_dfa(target_dfa: dfa.DFA, path: Union[str, os.PathLike]) -> None:
+    """
+    Save the given DFA to a file in the binary DFA format.
+
+    Parameters
+    ----------
+    target_dfa : DFA
+        The DFA to save.
+    path : Union[str, os.PathLike]
+        The path of the file to write.
+
+    Raises
+    ------
+    SerializationError
+        If a state of the DFA cannot be encoded.
+    """
+    symbols = sorted(target_dfa.input_symbols)
+    state_count = len(target_dfa.states)
+
+    integer_states = all(
+        isinstance(state, int) and not isinstance(state, bool)
+        for state in target_dfa.states
+    ) and target_dfa.states == frozenset(range(state_count))
+
+    flags = FLAG_ALLOW_PARTIAL if target_dfa.allow_partial else 0
+    encoded_states: List[bytes] = []
+    if integer_states:
+        flags |= FLAG_INTEGER_STATES
+        states: List[Any] = list(range(state_count))
+    else:
+        encoded_state_pairs = sorted(
+            (
+                json.dumps(_encode_state(state), sort_keys=True).encode("utf-8"),
+                state,
+            )
+            for state in target_dfa.states
+        )
+        encoded_states = [encoded for encoded, _ in encoded_state_pairs]
+        states = [state for _, state in encoded_state_pairs]
+    state_index = {state: index for index, state in enumerate(states)}
+
+    table = array.array("i", [-1]) * (state_count * len(symbols))
+    for index, state in enumerate(states):
+        paths = target_dfa.transitions[state]
+        row = index * len(symbols)
+        for column, symbol in enumerate(symbols):
+            if symbol in paths:
+                table[row + column] = state_index[paths[symbol]]
+
+    final_flags = bytes(state in target_dfa.final_states for state in states)
+
+    metadata = json.dumps(
+        {
+            "input_symbols": symbols,
+            "initial_state": state_index[target_dfa.initial_state],
+        }
+    ).encode("utf-8")
+
+    name_offsets = array.array("Q", [0])
+    for encoded in encoded_states:
+        name_offsets.append(name_offsets[-1] + len(encoded))
+
+    if sys.byteorder != "little":
+        table.byteswap()
+        name_offsets.byteswap()
+
+    with open(path, "wb") as file:
+        file.write(
+            HEADER_FORMAT.pack(
+                MAGIC, FORMAT_VERSION, flags, state_count, len(symbols), len(metadata)
+            )
+        )
+        file.write(metadata)
+        file.write(bytes(_padding(HEADER_FORMAT.size + len(metadata))))
+        file.write(table.tobytes())
+        file.write(final_flags)
+        if not integer_states:
+            file.write(bytes(_padding(file.tell())))
+            file.write(name_offsets.tobytes())
+            file.writelines(encoded_states)
+
+
+def _get_int_table(buffer: memoryview, typecode: str) -> Sequence[int]:
+    """Interpret the buffer as little-endian integers, without copying if possible."""
+    if sys.byteorder == "little":
+        return buffer.cast(typecode)
+
+    # Big-endian platforms need a converted copy of the table
+    table = array.array(typecode)
+    table.frombytes(buffer)
+    table.byteswap()
+    return table
+
+
+def load_dfa(
+    cls: Type[DFAT],
+    path: Union[str, os.PathLike],
+    *,
+    mmap: bool = True,
+    trusted: bool = False,
+) -> DFAT:
+    """
+    Load a DFA saved with `save_dfa`. The transitions and states of the
+    loaded DFA are read-only views over the file contents, so loading takes
+    constant time and state names are only decoded when they are accessed.
+
+    Parameters
+    ----------
+    cls : Type[DFA]
+        The DFA class to create.
+    path : Union[str, os.PathLike]
+        The path of the file to read.
+    mmap : bool, default: True
+        Whether to memory-map the file instead of reading it into memory.
+        Memory-mapped tables are shared between processes loading the
+        same file.
+    trusted : bool, default: False
+        Whether to skip validating the loaded DFA. Only set this for files
+        written by `save_dfa` that have not been modified.
+
+    Returns
+    ------
+    DFA
+        The loaded DFA.
+
+    Raises
+    ------
+    SerializationError
+        If the file is not a valid DFA file.
+    """
+    with open(path, "rb") as file:
+        if mmap:
+            try:
+                buffer: Any = mmap_module.mmap(
+                    file.fileno(), 0, access=mmap_module.ACCESS_READ
+                )
+            except ValueError:
+                # Empty files cannot be memory-mapped
+                buffer = b""
+        else:
+            buffer = file.read()
+
+    view = memoryview(buffer)
+    if len(view) < HEADER_FORMAT.size:
+        raise exceptions.SerializationError(f"{path} is not a DFA file")
+
+    magic, version, flags, state_count, symbol_count, metadata_length = (
+        HEADER_FORMAT.unpack_from(view)
+    )
+    if magic != MAGIC:
+        raise exceptions.SerializationError(f"{path} is not a DFA file")
+    if version != FORMAT_VERSION:
+        raise exceptions.SerializationError(
+            f"{path} has unsupported format version {version}"
+        )
+
+    offset = HEADER_FORMAT.size
+    try:
+        metadata = json.loads(bytes(view[offset : offset + metadata_length]))
+    except ValueError:
+        raise exceptions.SerializationError(f"{path} has invalid metadata")
+    offset += metadata_length
+    offset += _padding(offset)
+
+    table_size = state_count * symbol_count * 4
+    integer_states = bool(flags & FLAG_INTEGER_STATES)
+    expected_size = offset + table_size + state_count
+    if not integer_states:
+        expected_size += _padding(expected_size) + (state_count + 1) * 8
+    if len(view) < expected_size or len(metadata["input_symbols"]) != symbol_count:
+        raise exceptions.SerializationError(f"{path} is truncated or corrupted")
+
+    table = _get_int_table(view[offset : offset + table_size], "i")
+    offset += table_size
+    final_flags = view[offset : offset + state_count]
+    offset += state_count
+
+    name_offsets = None
+    name_blob = None
+    if not integer_states:
+        offset += _padding(offset)
+        name_offsets = _get_int_table(
+            view[offset : offset + (state_count + 1) * 8], "Q"
+        )
+        offset += (state_count + 1) * 8
+        name_blob = view[offset:]
+        if len(name_blob) < name_offsets[-1]:
+            raise exceptions.SerializationError(f"{path} is truncated or corrupted")
+
+    tables = _DFATables(
+        buffer,
+        table,
+        final_flags,
+        tuple(metadata["input_symbols"]),
+        state_count,
+        name_offsets,
+        name_blob,
+    )
+
+    new_dfa = cls._from_trusted(
+        states=_StatesView(tables, final=False),
+        input_symbols=frozenset(tables.symbols),
+        transitions=_TransitionsView(tables),
+        initial_state=tables.get_state(metadata["initial_state"]),
+        final_states=_StatesView(tables, final=True),
+        allow_partial=bool(flags & FLAG_ALLOW_PARTIAL),
+    )
+    if not trusted:
+        new_dfa.validate()
+    return new_dfa
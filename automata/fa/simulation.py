@@ -0,0 +1,222 @@
+"""Classes and methods for reducing NFAs with simulation preorders."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from automata.fa.bitset import MaskImage, iter_bits
+
+# The successors of each state on each symbol, as bitsets of states
+SuccessorsT = List[Dict[str, int]]
+
+
+def reverse_successors(successors: SuccessorsT) -> SuccessorsT:
+    """Return the predecessors of each state on each symbol."""
+    predecessors: SuccessorsT = [{} for _ in successors]
+    for state, paths in enumerate(successors):
+        state_bit = 1 << state
+        for symbol, mask in paths.items():
+            for end_state in iter_bits(mask):
+                end_paths = predecessors[end_state]
+                end_paths[symbol] = end_paths.get(symbol, 0) | state_bit
+    return predecessors
+
+
+def get_forward_simulation(successors: SuccessorsT, final_mask: int) -> List[int]:
+    """
+    Return the greatest forward simulation preorder of a lambda-free NFA with
+    the given successors and final states. The result holds, for each state
+    p, the bitset of states q simulating p: q is final if p is, and every
+    transition of p on a symbol to some p' is matched by a transition of q on
+    the same symbol to some q' simulating p'. If q simulates p, q accepts
+    every string p accepts.
+
+    Applied to the reversed NFA with the initial states as final states, this
+    computes the backward simulation preorder instead.
+    """
+    state_count = len(successors)
+    predecessors = reverse_successors(successors)
+    images: Dict[str, MaskImage] = {}
+    for symbol in {symbol for paths in successors for symbol in paths}:
+        images[symbol] = MaskImage([paths.get(symbol, 0) for paths in predecessors])
+
+    all_mask = (1 << state_count) - 1
+    simulation = [
+        final_mask if final_mask >> state & 1 else all_mask
+        for state in range(state_count)
+    ]
+    # Every state with a predecessor depends on the simulation of the
+    # successors of that predecessor
+    any_predecessors = [0] * state_count
+    for state, paths in enumerate(predecessors):
+        for mask in paths.values():
+            any_predecessors[state] |= mask
+
+    # The states with a transition on each symbol to a state simulating each
+    # state, until the states simulating it change
+    simulating_predecessors: List[Dict[str, int]] = [{} for _ in range(state_count)]
+
+    queue: Deque[int] = deque(range(state_count))
+    queued = [True] * state_count
+    while queue:
+        state = queue.popleft()
+        queued[state] = False
+
+        mask = simulation[state]
+        for symbol, end_states in successors[state].items():
+            for end_state in iter_bits(end_states):
+                end_state_predecessors = simulating_predecessors[end_state]
+                predecessors_mask = end_state_predecessors.get(symbol)
+                if predecessors_mask is None:
+                    predecessors_mask = images[symbol](simulation[end_state])
+                    end_state_predecessors[symbol] = predecessors_mask
+                mask &= predecessors_mask
+
+        if mask != simulation[state]:
+            simulation[state] = mask
+            simulating_predecessors[state] = {}
+            for start_state in iter_bits(any_predecessors[state]):
+                if not queued[start_state]:
+                    queued[start_state] = True
+                    queue.append(start_state)
+
+    return simulation
+
+
+def _reduce_forward(
+    successors: SuccessorsT, initial_mask: int, final_mask: int
+) -> Tuple[SuccessorsT, int, int]:
+    """
+    Prune the transitions of a lambda-free NFA that lead to a state strictly
+    simulated by another target of the same transition, then merge the
+    states simulating each other into the state of the class with the
+    smallest index. Returns the new successors, initial and final states.
+    """
+    state_count = len(successors)
+    simulation = get_forward_simulation(successors, final_mask)
+    simulated = [0] * state_count
+    for state, mask in enumerate(simulation):
+        state_bit = 1 << state
+        for other_state in iter_bits(mask):
+            simulated[other_state] |= state_bit
+
+    strictly_simulating = []
+    representatives = []
+    for state, mask in enumerate(simulation):
+        strictly_simulating.append(mask & ~simulated[state])
+        equivalent_mask = mask & simulated[state]
+        representatives.append((equivalent_mask & -equivalent_mask).bit_length() - 1)
+
+    def merge_mask(mask: int) -> int:
+        merged_mask = 0
+        for state in iter_bits(mask):
+            merged_mask |= 1 << representatives[state]
+        return merged_mask
+
+    new_successors: SuccessorsT = [{} for _ in range(state_count)]
+    for state, paths in enumerate(successors):
+        new_paths = new_successors[representatives[state]]
+        for symbol, end_states in paths.items():
+            kept_mask = 0
+            for end_state in iter_bits(end_states):
+                if not strictly_simulating[end_state] & end_states:
+                    kept_mask |= 1 << end_state
+            new_paths[symbol] = new_paths.get(symbol, 0) | merge_mask(kept_mask)
+
+    return new_successors, merge_mask(initial_mask), merge_mask(final_mask)
+
+
+def _get_useful_states(
+    successors: SuccessorsT, initial_mask: int, final_mask: int
+) -> List[int]:
+    """
+    Return the states which are reachable from an initial state and from
+    which a final state is reachable, along with the initial states.
+    """
+    any_successors = [0] * len(successors)
+    any_predecessors = [0] * len(successors)
+    for state, paths in enumerate(successors):
+        state_bit = 1 << state
+        for mask in paths.values():
+            any_successors[state] |= mask
+            for end_state in iter_bits(mask):
+                any_predecessors[end_state] |= state_bit
+
+    def get_reachable_mask(start_mask: int, edges: List[int]) -> int:
+        reachable_mask = frontier = start_mask
+        while frontier:
+            next_frontier = 0
+            for state in iter_bits(frontier):
+                next_frontier |= edges[state]
+            frontier = next_frontier & ~reachable_mask
+            reachable_mask |= frontier
+        return reachable_mask
+
+    useful_mask = get_reachable_mask(initial_mask, any_successors)
+    useful_mask &= get_reachable_mask(final_mask, any_predecessors)
+    return list(iter_bits(useful_mask | initial_mask))
+
+
+def reduce_nfa(
+    successors: SuccessorsT, final_mask: int
+) -> Tuple[SuccessorsT, List[int], int]:
+    """
+    Reduce a lambda-free NFA whose initial state has index 0. Transitions to
+    states strictly simulated by another target of the same transition are
+    pruned and states simulating each other are merged, first with forward
+    and then with backward simulation, until the size of the NFA stops
+    decreasing. Useless states are removed after each pass. Every step
+    preserves the language of the NFA and takes polynomial time.
+
+    Returns the successors of the reduced NFA, the original index of each of
+    its states and its final states. The initial state keeps index 0.
+    """
+    original_states = list(range(len(successors)))
+    initial_mask = 1
+    size: Optional[Tuple[int, int]] = None
+
+    while True:
+        for backward in (False, True):
+            # Backward simulation is forward simulation on the reversed NFA
+            if backward:
+                successors, initial_mask, final_mask = _reduce_forward(
+                    reverse_successors(successors), final_mask, initial_mask
+                )
+                successors = reverse_successors(successors)
+                initial_mask, final_mask = final_mask, initial_mask
+            else:
+                successors, initial_mask, final_mask = _reduce_forward(
+                    successors, initial_mask, final_mask
+                )
+
+            kept_states = _get_useful_states(successors, initial_mask, final_mask)
+            index = {state: i for i, state in enumerate(kept_states)}
+
+            def select_mask(mask: int) -> int:
+                new_mask = 0
+                for state in iter_bits(mask):
+                    new_index = index.get(state)
+                    if new_index is not None:
+                        new_mask |= 1 << new_index
+                return new_mask
+
+            successors = [
+                {
+                    symbol: new_mask
+                    for symbol, mask in successors[state].items()
+                    if (new_mask := select_mask(mask))
+                }
+                for state in kept_states
+            ]
+            initial_mask = select_mask(initial_mask)
+            final_mask = select_mask(final_mask)
+            original_states = [original_states[state] for state in kept_states]
+
+        new_size = (
+            len(successors),
+            sum(mask.bit_count() for paths in successors for mask in paths.values()),
+        )
+        if size is not None and new_size >= size:
+            return successors, original_states, final_mask
+        size = new_size
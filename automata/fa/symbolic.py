@@ -0,0 +1,1373 @@
+"""
+Classes and methods for working with symbolic finite automata, whose
+transitions are labelled with sets of characters rather than single symbols.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import defaultdict, deque
+from itertools import count
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
+
+from cached_method import cached_method
+from typing_extensions import Self
+
+import automata.base.exceptions as exceptions
+import automata.fa.dfa as dfa
+import automata.fa.nfa as nfa
+from automata.base.automaton import Automaton, AutomatonStateT
+from automata.base.utils import get_renaming_function
+from automata.regex.syntax import (
+    CharSet,
+    Concat,
+    EmptyString,
+    Intersection,
+    RegexNode,
+    Repeat,
+    Shuffle,
+    Union,
+    parse_regex_ast,
+)
+
+SymbolicStateT = AutomatonStateT
+
+# The largest unicode code point
+MAX_CODE_POINT = 0x10FFFF
+
+
+class IntervalSet:
+    """
+    An immutable set of characters, stored as a sorted tuple of disjoint,
+    non-adjacent, inclusive ranges of code points. Set operations take time
+    proportional to the number of ranges rather than the number of characters.
+
+    Parameters
+    ----------
+    ranges : Iterable[Tuple[int, int]], default: ()
+        The inclusive (start, end) code point ranges in this set. The ranges
+        may overlap and need not be sorted.
+    """
+
+    __slots__ = ("ranges", "_starts")
+
+    ranges: Tuple[Tuple[int, int], ...]
+    _starts: Tuple[int, ...]
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = ()) -> None:
+        """Initialize the set, merging overlapping and adjacent ranges."""
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if not 0 <= start <= end <= MAX_CODE_POINT:
+                raise ValueError(f"invalid code point range ({start}, {end})")
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+
+        self.ranges = tuple(merged)
+        self._starts = tuple(start for start, _ in merged)
+
+    @classmethod
+    def from_chars(cls: Type[Self], chars: Iterable[str]) -> Self:
+        """Return the set containing exactly the given characters."""
+        return cls((code, code) for code in map(ord, chars))
+
+    @classmethod
+    def from_range(cls: Type[Self], start: str, end: str) -> Self:
+        """Return the set of characters between start and end, inclusive."""
+        return cls([(ord(start), ord(end))])
+
+    @classmethod
+    def universe(cls: Type[Self]) -> Self:
+        """Return the set of all unicode characters."""
+        return cls([(0, MAX_CODE_POINT)])
+
+    def __contains__(self, symbol: Any) -> bool:
+        """Return True if the given character is in this set."""
+        if not isinstance(symbol, str) or len(symbol) != 1:
+            return False
+
+        code = ord(symbol)
+        i = bisect_right(self._starts, code) - 1
+        return i >= 0 and code <= self.ranges[i][1]
+
+    def __bool__(self) -> bool:
+        """Return True if this set is non-empty."""
+        return bool(self.ranges)
+
+    def __len__(self) -> int:
+        """Return the number of characters in this set."""
+        return sum(end - start + 1 for start, end in self.ranges)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the characters in this set, in order."""
+        for start, end in self.ranges:
+            for code in range(start, end + 1):
+                yield chr(code)
+
+    def __eq__(self, other: Any) -> bool:
+        """Return True if both sets contain the same characters."""
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.ranges == other.ranges
+
+    def __hash__(self) -> int:
+        """Return a hash of the ranges in this set."""
+        return hash(self.ranges)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the set."""
+        return f"{self.__class__.__qualname__}({list(self.ranges)!r})"
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        """Return the union of this set and other."""
+        return IntervalSet(self.ranges + other.ranges)
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        """Return the intersection of this set and other."""
+        result = []
+        i = j = 0
+        while i < len(self.ranges) and j < len(other.ranges):
+            start_a, end_a = self.ranges[i]
+            start_b, end_b = other.ranges[j]
+            start, end = max(start_a, start_b), min(end_a, end_b)
+            if start <= end:
+                result.append((start, end))
+            if end_a < end_b:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet(result)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        """Return the characters in this set but not in other."""
+        return self & other.complement()
+
+    def complement(self) -> IntervalSet:
+        """Return the set of all characters not in this set."""
+        result = []
+        next_start = 0
+        for start, end in self.ranges:
+            if next_start < start:
+                result.append((next_start, start - 1))
+            next_start = end + 1
+        if next_start <= MAX_CODE_POINT:
+            result.append((next_start, MAX_CODE_POINT))
+        return IntervalSet(result)
+
+    def isdisjoint(self, other: IntervalSet) -> bool:
+        """Return True if this set has no characters in common with other."""
+        return not self & other
+
+    def min_symbol(self) -> str:
+        """Return the smallest character in this set."""
+        if not self.ranges:
+            raise ValueError("the interval set is empty")
+        return chr(self.ranges[0][0])
+
+
+SymbolicNFATransitionsT = Mapping[
+    SymbolicStateT, Mapping[IntervalSet, AbstractSet[SymbolicStateT]]
+]
+SymbolicDFATransitionsT = Mapping[SymbolicStateT, Mapping[IntervalSet, SymbolicStateT]]
+
+
+def get_minterms(
+    labels: Sequence[IntervalSet],
+) -> List[Tuple[IntervalSet, FrozenSet[int]]]:
+    """
+    Partition the characters covered by the given labels into minterms,
+    the largest sets of characters that no label distinguishes.
+
+    Parameters
+    ----------
+    labels : Sequence[IntervalSet]
+        The labels to compute the minterms of.
+
+    Returns
+    ------
+    List[Tuple[IntervalSet, FrozenSet[int]]]
+        A list of pairs (minterm, indices), where indices are the positions
+        of the labels containing the minterm. Characters contained in no
+        label are not part of any minterm.
+    """
+    events: DefaultDict[int, List[Tuple[int, bool]]] = defaultdict(list)
+    for i, label in enumerate(labels):
+        for start, end in label.ranges:
+            events[start].append((i, True))
+            events[end + 1].append((i, False))
+
+    minterm_ranges: DefaultDict[FrozenSet[int], List[Tuple[int, int]]] = defaultdict(
+        list
+    )
+    active: Set[int] = set()
+    points = sorted(events)
+    for point, next_point in zip(points, points[1:]):
+        for i, is_start in events[point]:
+            if is_start:
+                active.add(i)
+            else:
+                active.discard(i)
+        if active:
+            minterm_ranges[frozenset(active)].append((point, next_point - 1))
+
+    return [
+        (IntervalSet(ranges), indices) for indices, ranges in minterm_ranges.items()
+    ]
+
+
+_SymbolicPathsT = Dict[IntervalSet, Set[int]]
+_SymbolicEdgesT = Dict[int, List[Tuple[Optional[IntervalSet], int]]]
+
+
+class _SymbolicNFAData:
+    """The transitions of a lambda-free symbolic NFA over integer states."""
+
+    __slots__ = ("transitions", "initial_state", "final_states")
+
+    def __init__(
+        self,
+        transitions: Dict[int, _SymbolicPathsT],
+        initial_state: int,
+        final_states: Set[int],
+    ) -> None:
+        self.transitions = transitions
+        self.initial_state = initial_state
+        self.final_states = final_states
+
+
+def _add_lambda_free(
+    data: _SymbolicNFAData, edges: _SymbolicEdgesT, counter: count
+) -> Tuple[int, int]:
+    """Embed a lambda-free NFA as a single-exit fragment of the edge graph."""
+    get_state_name = get_renaming_function(counter)
+    exit_state = next(counter)
+    edges[exit_state] = []
+
+    for start_state, paths in data.transitions.items():
+        state_edges = edges.setdefault(get_state_name(start_state), [])
+        state_edges.extend(
+            (label, get_state_name(end_state))
+            for label, end_states in paths.items()
+            for end_state in end_states
+        )
+        if start_state in data.final_states:
+            state_edges.append((None, exit_state))
+
+    return get_state_name(data.initial_state), exit_state
+
+
+def _product(
+    data_a: _SymbolicNFAData, data_b: _SymbolicNFAData, *, shuffle: bool
+) -> _SymbolicNFAData:
+    """Return the reachable intersection or shuffle product of two NFAs."""
+    initial_state = (data_a.initial_state, data_b.initial_state)
+    get_state_name = get_renaming_function(count(0))
+    transitions: Dict[int, _SymbolicPathsT] = {}
+    final_states = set()
+
+    queue = deque([initial_state])
+    transitions[get_state_name(initial_state)] = {}
+    while queue:
+        q_a, q_b = curr_state = queue.popleft()
+        paths = transitions[get_state_name(curr_state)]
+        if q_a in data_a.final_states and q_b in data_b.final_states:
+            final_states.add(get_state_name(curr_state))
+
+        next_states: List[Tuple[IntervalSet, Tuple[int, int]]] = []
+        if shuffle:
+            next_states.extend(
+                (label, (end_state, q_b))
+                for label, end_states in data_a.transitions[q_a].items()
+                for end_state in end_states
+            )
+            next_states.extend(
+                (label, (q_a, end_state))
+                for label, end_states in data_b.transitions[q_b].items()
+                for end_state in end_states
+            )
+        else:
+            for label_a, end_states_a in data_a.transitions[q_a].items():
+                for label_b, end_states_b in data_b.transitions[q_b].items():
+                    label = label_a & label_b
+                    if label:
+                        next_states.extend(
+                            (label, (end_state_a, end_state_b))
+                            for end_state_a in end_states_a
+                            for end_state_b in end_states_b
+                        )
+
+        for label, next_state in next_states:
+            next_state_name = get_state_name(next_state)
+            paths.setdefault(label, set()).add(next_state_name)
+            if next_state_name not in transitions:
+                transitions[next_state_name] = {}
+                queue.append(next_state)
+
+    return _SymbolicNFAData(transitions, get_state_name(initial_state), final_states)
+
+
+def _add_fragment(
+    node: RegexNode, edges: _SymbolicEdgesT, counter: count
+) -> Tuple[int, int]:
+    """
+    Add a Thompson-style fragment matching the node to the edge graph, where
+    None labels lambda edges. Return the entry and exit states.
+    """
+
+    def new_state() -> int:
+        state = next(counter)
+        edges[state] = []
+        return state
+
+    if isinstance(node, EmptyString):
+        state = new_state()
+        return state, state
+
+    if isinstance(node, CharSet):
+        label = IntervalSet.from_chars(node.chars)
+        if node.negated:
+            label = label.complement()
+        entry_state, exit_state = new_state(), new_state()
+        if label:
+            edges[entry_state].append((label, exit_state))
+        return entry_state, exit_state
+
+    if isinstance(node, Concat):
+        entry_state, left_exit_state = _add_fragment(node.left, edges, counter)
+        right_entry_state, exit_state = _add_fragment(node.right, edges, counter)
+        edges[left_exit_state].append((None, right_entry_state))
+        return entry_state, exit_state
+
+    if isinstance(node, Union):
+        entry_state, exit_state = new_state(), new_state()
+        for child in (node.left, node.right):
+            child_entry_state, child_exit_state = _add_fragment(child, edges, counter)
+            edges[entry_state].append((None, child_entry_state))
+            edges[child_exit_state].append((None, exit_state))
+        return entry_state, exit_state
+
+    if isinstance(node, Repeat):
+        entry_state = curr_state = new_state()
+        for _ in range(node.lower_bound):
+            child_entry_state, child_exit_state = _add_fragment(
+                node.node, edges, counter
+            )
+            edges[curr_state].append((None, child_entry_state))
+            curr_state = child_exit_state
+
+        if node.upper_bound is None:
+            loop_state = new_state()
+            edges[curr_state].append((None, loop_state))
+            child_entry_state, child_exit_state = _add_fragment(
+                node.node, edges, counter
+            )
+            edges[loop_state].append((None, child_entry_state))
+            edges[child_exit_state].append((None, loop_state))
+            return entry_state, loop_state
+
+        exit_state = new_state()
+        for _ in range(node.upper_bound - node.lower_bound):
+            child_entry_state, child_exit_state = _add_fragment(
+                node.node, edges, counter
+            )
+            edges[curr_state].append((None, child_entry_state))
+            edges[curr_state].append((None, exit_state))
+            curr_state = child_exit_state
+        edges[curr_state].append((None, exit_state))
+        return entry_state, exit_state
+
+    if isinstance(node, (Intersection, Shuffle)):
+        product_data = _product(
+            _compile_node(node.left),
+            _compile_node(node.right),
+            shuffle=isinstance(node, Shuffle),
+        )
+        return _add_lambda_free(product_data, edges, counter)
+
+    raise exceptions.InvalidRegexError(f"Invalid regex node type {type(node)}")
+
+
+def _compile_node(node: RegexNode) -> _SymbolicNFAData:
+    """Compile the node into a lambda-free NFA with only reachable states."""
+    edges: _SymbolicEdgesT = {}
+    entry_state, exit_state = _add_fragment(node, edges, count(0))
+
+    lambda_closures: Dict[int, Set[int]] = {}
+
+    def get_lambda_closure(state: int) -> Set[int]:
+        closure = lambda_closures.get(state)
+        if closure is None:
+            closure = {state}
+            stack = [state]
+            while stack:
+                for label, end_state in edges[stack.pop()]:
+                    if label is None and end_state not in closure:
+                        closure.add(end_state)
+                        stack.append(end_state)
+            lambda_closures[state] = closure
+        return closure
+
+    transitions: Dict[int, _SymbolicPathsT] = {}
+    final_states = set()
+    queue = deque([entry_state])
+    transitions[entry_state] = {}
+    while queue:
+        curr_state = queue.popleft()
+        paths = transitions[curr_state]
+        closure = get_lambda_closure(curr_state)
+        if exit_state in closure:
+            final_states.add(curr_state)
+
+        for closure_state in closure:
+            for label, end_state in edges[closure_state]:
+                if label is None:
+                    continue
+                paths.setdefault(label, set()).add(end_state)
+                if end_state not in transitions:
+                    transitions[end_state] = {}
+                    queue.append(end_state)
+
+    return _SymbolicNFAData(transitions, entry_state, final_states)
+
+
+class SymbolicNFA(Automaton):
+    """
+    The `SymbolicNFA` class represents a lambda-free nondeterministic finite
+    automaton over the alphabet of all unicode characters, where each
+    transition is labelled with an `IntervalSet` of characters instead of a
+    single symbol. The labels leaving a state may overlap.
+
+    Parameters
+    ----------
+    states : AbstractSet[SymbolicStateT]
+        Set of the NFA's valid states.
+    transitions : SymbolicNFATransitionsT
+        Dict consisting of the transitions for each state. Each key is a
+        state name, and each value is another dict which maps a label
+        (the key) to a set of states (the value).
+    initial_state : SymbolicStateT
+        The initial state for this NFA.
+    final_states : AbstractSet[SymbolicStateT]
+        A set of final states for this NFA.
+    """
+
+    __slots__ = (
+        "states",
+        "transitions",
+        "initial_state",
+        "final_states",
+    )
+
+    transitions: SymbolicNFATransitionsT  # type: ignore
+
+    def __init__(
+        self,
+        *,
+        states: AbstractSet[SymbolicStateT],
+        transitions: SymbolicNFATransitionsT,
+        initial_state: SymbolicStateT,
+        final_states: AbstractSet[SymbolicStateT],
+    ) -> None:
+        """Initialize a complete symbolic NFA."""
+        super().__init__(
+            states=states,
+            transitions=transitions,
+            initial_state=initial_state,
+            final_states=final_states,
+        )
+
+    def validate(self) -> None:
+        """
+        Raises an exception if this automaton is not internally consistent.
+
+        Raises
+        ------
+        InvalidStateError
+            If this NFA has invalid states in the transition dictionary.
+        MissingStateError
+            If this NFA has states missing from the transition dictionary.
+        InvalidSymbolError
+            If this NFA has a transition labelled with a non-IntervalSet.
+        """
+        for state in self.states:
+            if state not in self.transitions:
+                raise exceptions.MissingStateError(
+                    f"state {state} is missing from transition function"
+                )
+        for start_state, paths in self.transitions.items():
+            if start_state not in self.states:
+                raise exceptions.InvalidStateError(
+                    f"transition start state {start_state} is not valid"
+                )
+            for label, end_states in paths.items():
+                if not isinstance(label, IntervalSet):
+                    raise exceptions.InvalidSymbolError(
+                        f"state {start_state} has invalid transition label {label}"
+                    )
+                for end_state in end_states:
+                    if end_state not in self.states:
+                        raise exceptions.InvalidStateError(
+                            f"end state {end_state} for transition on "
+                            f"{start_state} is not valid"
+                        )
+        self._validate_initial_state()
+        self._validate_final_states()
+
+    @classmethod
+    def from_regex(cls: Type[Self], regex: str) -> Self:
+        """
+        Initialize this NFA as one equivalent to the given regular expression,
+        over the alphabet of all unicode characters. Wildcards and negated
+        character classes match any character not excluded, so the size of
+        the NFA does not depend on the size of the alphabet.
+
+        Parameters
+        ----------
+        regex : str
+            The regex to construct an equivalent NFA for.
+
+        Returns
+        ------
+        Self
+            The symbolic NFA accepting the language of the input regex.
+        """
+        data = _compile_node(parse_regex_ast(regex))
+        return cls(
+            states=frozenset(data.transitions.keys()),
+            transitions=data.transitions,
+            initial_state=data.initial_state,
+            final_states=data.final_states,
+        )
+
+    @classmethod
+    def from_nfa(cls: Type[Self], target_nfa: nfa.NFA) -> Self:
+        """
+        Initialize this symbolic NFA as one equivalent to the given NFA.
+
+        Parameters
+        ----------
+        target_nfa : NFA
+            The NFA to construct an equivalent symbolic NFA for.
+
+        Returns
+        ------
+        Self
+            The symbolic NFA accepting the language of the input NFA.
+        """
+        lambda_free_nfa = target_nfa.eliminate_lambda()
+
+        transitions = {}
+        for start_state, paths in lambda_free_nfa.transitions.items():
+            edge_symbols: DefaultDict[SymbolicStateT, Set[str]] = defaultdict(set)
+            for symbol, end_states in paths.items():
+                for end_state in end_states:
+                    edge_symbols[end_state].add(symbol)
+
+            state_transitions: Dict[IntervalSet, Set[SymbolicStateT]] = {}
+            for end_state, symbols in edge_symbols.items():
+                label = IntervalSet.from_chars(symbols)
+                state_transitions.setdefault(label, set()).add(end_state)
+            transitions[start_state] = state_transitions
+
+        return cls(
+            states=lambda_free_nfa.states,
+            transitions=transitions,
+            initial_state=lambda_free_nfa.initial_state,
+            final_states=lambda_free_nfa.final_states,
+        )
+
+    def _get_next_current_states(
+        self, current_states: AbstractSet[SymbolicStateT], input_symbol: str
+    ) -> FrozenSet[SymbolicStateT]:
+        """Return the states reached by reading the symbol."""
+        return frozenset(
+            end_state
+            for current_state in current_states
+            for label, end_states in self.transitions[current_state].items()
+            if input_symbol in label
+            for end_state in end_states
+        )
+
+    def read_input_stepwise(
+        self, input_str: str
+    ) -> Generator[AbstractSet[SymbolicStateT], None, None]:
+        """
+        Return a generator that yields the configuration of this NFA at each
+        step while reading input.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to read.
+
+        Yields
+        ------
+        Generator[AbstractSet[SymbolicStateT], None, None]
+            A generator that yields the current configuration of
+            the NFA after each step of reading input.
+
+        Raises
+        ------
+        RejectionException
+            Raised if this NFA does not accept the input string.
+        """
+        current_states = frozenset({self.initial_state})
+
+        yield current_states
+        for input_symbol in input_str:
+            current_states = self._get_next_current_states(current_states, input_symbol)
+            yield current_states
+
+        if current_states.isdisjoint(self.final_states):
+            raise exceptions.RejectionException(
+                "the NFA stopped on all non-final states ({})".format(
+                    ", ".join(str(state) for state in current_states)
+                )
+            )
+
+
+class SymbolicDFA(Automaton):
+    """
+    The `SymbolicDFA` class represents a deterministic finite automaton over
+    the alphabet of all unicode characters, where each transition is
+    labelled with an `IntervalSet` of characters instead of a single symbol.
+    The labels leaving a state must be disjoint, and characters in no label
+    are rejected, so every symbolic DFA is partial.
+
+    Parameters
+    ----------
+    states : AbstractSet[SymbolicStateT]
+        Set of the DFA's valid states.
+    transitions : SymbolicDFATransitionsT
+        Dict consisting of the transitions for each state. Each key is a
+        state name, and each value is another dict which maps a label
+        (the key) to a state (the value).
+    initial_state : SymbolicStateT
+        The initial state for this DFA.
+    final_states : AbstractSet[SymbolicStateT]
+        A set of final states for this DFA.
+    """
+
+    __slots__ = (
+        "states",
+        "transitions",
+        "initial_state",
+        "final_states",
+        # These two entries are to allow for caching methods
+        "__dict__",
+        "__weakref__",
+    )
+
+    transitions: SymbolicDFATransitionsT  # type: ignore
+
+    def __init__(
+        self,
+        *,
+        states: AbstractSet[SymbolicStateT],
+        transitions: SymbolicDFATransitionsT,
+        initial_state: SymbolicStateT,
+        final_states: AbstractSet[SymbolicStateT],
+    ) -> None:
+        """Initialize a complete symbolic DFA."""
+        super().__init__(
+            states=states,
+            transitions=transitions,
+            initial_state=initial_state,
+            final_states=final_states,
+        )
+
+    def validate(self) -> None:
+        """
+        Raises an exception if this automaton is not internally consistent.
+
+        Raises
+        ------
+        InvalidStateError
+            If this DFA has invalid states in the transition dictionary.
+        MissingStateError
+            If this DFA has states missing from the transition dictionary.
+        InvalidSymbolError
+            If this DFA has overlapping or non-IntervalSet transition labels.
+        """
+        for state in self.states:
+            if state not in self.transitions:
+                raise exceptions.MissingStateError(
+                    f"state {state} is missing from transition function"
+                )
+        for start_state, paths in self.transitions.items():
+            if start_state not in self.states:
+                raise exceptions.InvalidStateError(
+                    f"transition start state {start_state} is not valid"
+                )
+            for label, end_state in paths.items():
+                if not isinstance(label, IntervalSet):
+                    raise exceptions.InvalidSymbolError(
+                        f"state {start_state} has invalid transition label {label}"
+                    )
+                if end_state not in self.states:
+                    raise exceptions.InvalidStateError(
+                        f"end state {end_state} for transition on "
+                        f"{start_state} is not valid"
+                    )
+            minterms = get_minterms(list(paths.keys()))
+            if any(len(indices) > 1 for _, indices in minterms):
+                raise exceptions.InvalidSymbolError(
+                    f"state {start_state} has overlapping transition labels"
+                )
+        self._validate_initial_state()
+        self._validate_final_states()
+
+    def __eq__(self, other: Any) -> bool:
+        """Return True if two symbolic DFAs accept the same language."""
+        if not isinstance(other, SymbolicDFA):
+            return NotImplemented
+        return self.symmetric_difference(other, minify=False).isempty()
+
+    def __le__(self, other: SymbolicDFA) -> bool:
+        """Return True if this DFA is a subset of (or equal to) another DFA."""
+        if isinstance(other, SymbolicDFA):
+            return self.issubset(other)
+        else:
+            return NotImplemented
+
+    def __ge__(self, other: SymbolicDFA) -> bool:
+        """Return True if this DFA is a superset of another DFA."""
+        if isinstance(other, SymbolicDFA):
+            return other.issubset(self)
+        else:
+            return NotImplemented
+
+    def __sub__(self, other: SymbolicDFA) -> Self:
+        """Return a DFA that is the difference of this DFA and another DFA."""
+        if isinstance(other, SymbolicDFA):
+            return self.difference(other)
+        else:
+            return NotImplemented
+
+    def __or__(self, other: SymbolicDFA) -> Self:
+        """Return the union of this DFA and another DFA."""
+        if isinstance(other, SymbolicDFA):
+            return self.union(other)
+        else:
+            return NotImplemented
+
+    def __and__(self, other: SymbolicDFA) -> Self:
+        """Return the intersection of this DFA and another DFA."""
+        if isinstance(other, SymbolicDFA):
+            return self.intersection(other)
+        else:
+            return NotImplemented
+
+    def __xor__(self, other: SymbolicDFA) -> Self:
+        """Return the symmetric difference of this DFA and another DFA."""
+        if isinstance(other, SymbolicDFA):
+            return self.symmetric_difference(other)
+        else:
+            return NotImplemented
+
+    def __invert__(self) -> Self:
+        """Return the complement of this DFA."""
+        return self.complement()
+
+    @classmethod
+    def universal_language(cls: Type[Self]) -> Self:
+        """
+        Returns a symbolic DFA accepting every string over unicode characters.
+
+        Returns
+        ------
+        Self
+            The universal symbolic DFA.
+        """
+        return cls(
+            states={0},
+            transitions={0: {IntervalSet.universe(): 0}},
+            initial_state=0,
+            final_states={0},
+        )
+
+    @classmethod
+    def empty_language(cls: Type[Self]) -> Self:
+        """
+        Returns a symbolic DFA accepting no strings.
+
+        Returns
+        ------
+        Self
+            The empty symbolic DFA.
+        """
+        return cls(
+            states={0},
+            transitions={0: {}},
+            initial_state=0,
+            final_states=set(),
+        )
+
+    @classmethod
+    def from_nfa(
+        cls: Type[Self],
+        target_nfa: SymbolicNFA,
+        *,
+        retain_names: bool = False,
+        minify: bool = True,
+    ) -> Self:
+        """
+        Initialize this DFA as one equivalent to the given symbolic NFA, using
+        the subset construction. The labels leaving each subset are split into
+        their minterms, so only as many transitions are created as there are
+        distinguishable sets of characters.
+
+        Parameters
+        ----------
+        target_nfa : SymbolicNFA
+            The symbolic NFA to construct an equivalent DFA for.
+        retain_names : bool, default: False
+            Whether or not to retain state names during processing.
+        minify : bool, default: True
+            Whether or not to minify the resulting DFA.
+
+        Returns
+        ------
+        Self
+            The symbolic DFA accepting the language of the input NFA.
+        """
+
+        def expand_state(
+            current_states: FrozenSet[SymbolicStateT],
+        ) -> Iterator[Tuple[IntervalSet, FrozenSet[SymbolicStateT]]]:
+            paths = [
+                (label, end_states)
+                for current_state in current_states
+                for label, end_states in target_nfa.transitions[current_state].items()
+            ]
+            minterms = get_minterms([label for label, _ in paths])
+
+            # Merge the minterms leading to the same subset
+            next_labels: Dict[FrozenSet[SymbolicStateT], IntervalSet] = {}
+            for minterm, indices in minterms:
+                next_states = frozenset().union(*(paths[i][1] for i in indices))
+                label = next_labels.get(next_states)
+                next_labels[next_states] = minterm if label is None else label | minterm
+            return ((label, states) for states, label in next_labels.items())
+
+        return cls._expand(
+            lambda current_states: not current_states.isdisjoint(
+                target_nfa.final_states
+            ),
+            frozenset({target_nfa.initial_state}),
+            expand_state,
+            retain_names=retain_names,
+            minify=minify,
+        )
+
+    @classmethod
+    def from_regex(cls: Type[Self], regex: str, *, minify: bool = True) -> Self:
+        """
+        Initialize this DFA as one equivalent to the given regular expression,
+        over the alphabet of all unicode characters.
+
+        Parameters
+        ----------
+        regex : str
+            The regex to construct an equivalent DFA for.
+        minify : bool, default: True
+            Whether or not to minify the resulting DFA.
+
+        Returns
+        ------
+        Self
+            The symbolic DFA accepting the language of the input regex.
+        """
+        return cls.from_nfa(SymbolicNFA.from_regex(regex), minify=minify)
+
+    @classmethod
+    def from_dfa(cls: Type[Self], target_dfa: dfa.DFA) -> Self:
+        """
+        Initialize this symbolic DFA as one equivalent to the given DFA.
+
+        Parameters
+        ----------
+        target_dfa : DFA
+            The DFA to construct an equivalent symbolic DFA for.
+
+        Returns
+        ------
+        Self
+            The symbolic DFA accepting the language of the input DFA.
+        """
+        transitions = {}
+        for start_state, paths in target_dfa.transitions.items():
+            edge_symbols: DefaultDict[SymbolicStateT, Set[str]] = defaultdict(set)
+            for symbol, end_state in paths.items():
+                edge_symbols[end_state].add(symbol)
+            transitions[start_state] = {
+                IntervalSet.from_chars(symbols): end_state
+                for end_state, symbols in edge_symbols.items()
+            }
+
+        return cls(
+            states=target_dfa.states,
+            transitions=transitions,
+            initial_state=target_dfa.initial_state,
+            final_states=target_dfa.final_states,
+        )
+
+    def to_dfa(self, input_symbols: AbstractSet[str]) -> dfa.DFA:
+        """
+        Create an explicit DFA equivalent to this DFA restricted to the given
+        input symbols.
+
+        Parameters
+        ----------
+        input_symbols : AbstractSet[str]
+            The input symbols of the new DFA.
+
+        Returns
+        ------
+        DFA
+            A partial DFA accepting the words of this DFA over the input symbols.
+        """
+        transitions = {
+            start_state: {
+                symbol: end_state
+                for label, end_state in paths.items()
+                for symbol in input_symbols
+                if symbol in label
+            }
+            for start_state, paths in self.transitions.items()
+        }
+
+        return dfa.DFA(
+            states=self.states,
+            input_symbols=input_symbols,
+            transitions=transitions,
+            initial_state=self.initial_state,
+            final_states=self.final_states,
+            allow_partial=True,
+        )
+
+    @cached_method
+    def _get_transition_lookup(
+        self,
+    ) -> Mapping[SymbolicStateT, Tuple[List[int], List[Tuple[int, SymbolicStateT]]]]:
+        """
+        Computes a dictionary mapping each state to a sorted table of the
+        ranges leaving it, for looking up transitions with binary search.
+        This dictionary is cached for the lifetime of the instance.
+        """
+        lookup = {}
+        for start_state, paths in self.transitions.items():
+            ranges = sorted(
+                (start, end, end_state)
+                for label, end_state in paths.items()
+                for start, end in label.ranges
+            )
+            lookup[start_state] = (
+                [start for start, _, _ in ranges],
+                [(end, end_state) for _, end, end_state in ranges],
+            )
+        return lookup
+
+    def _get_next_current_state(
+        self, current_state: SymbolicStateT, input_symbol: str
+    ) -> Optional[SymbolicStateT]:
+        """
+        Follow the transition for the given input symbol on the current state.
+
+        Return None if transition does not exist.
+        """
+        starts, ends = self._get_transition_lookup()[current_state]
+        i = bisect_right(starts, ord(input_symbol)) - 1
+        if i >= 0:
+            end, end_state = ends[i]
+            if ord(input_symbol) <= end:
+                return end_state
+        return None
+
+    def read_input_stepwise(
+        self, input_str: str, ignore_rejection: bool = False
+    ) -> Generator[SymbolicStateT, None, None]:
+        """
+        Return a generator that yields each step while reading input.
+
+        Parameters
+        ----------
+        input_str : str
+            The input string to read.
+        ignore_rejection : bool, default: False
+            Whether to throw an exception if the input string is rejected.
+
+        Yields
+        ------
+        Generator[SymbolicStateT, None, None]
+            A generator that yields the current configuration of the DFA
+            after each step of reading input.
+
+        Raises
+        ------
+        RejectionException
+            Raised if this DFA does not accept the input string.
+        """
+        current_state = self.initial_state
+
+        yield current_state
+        for input_symbol in input_str:
+            next_state = self._get_next_current_state(current_state, input_symbol)
+            if next_state is None:
+                if ignore_rejection:
+                    return
+                raise exceptions.RejectionException(
+                    f"{input_symbol} is not a valid input symbol for state "
+                    f"{current_state}"
+                )
+            current_state = next_state
+            yield current_state
+
+        if not ignore_rejection and current_state not in self.final_states:
+            raise exceptions.RejectionException(
+                f"the DFA stopped on a non-final state ({current_state})"
+            )
+
+    @classmethod
+    def _expand(
+        cls: Type[Self],
+        final_state_fn: Callable[[Any], bool],
+        initial_state: Any,
+        expand_state_fn: Callable[[Any], Iterable[Tuple[IntervalSet, Any]]],
+        *,
+        retain_names: bool,
+        minify: bool,
+    ) -> Self:
+        """
+        Build the DFA whose states are reachable from the initial state using
+        the given expansion function, optionally minifying it.
+        """
+        get_name: Callable[[Any], Any] = (
+            (lambda state: state) if retain_names else get_renaming_function(count(0))
+        )
+
+        transitions: Dict[Any, Dict[IntervalSet, Any]] = {}
+        final_states = set()
+        queue: Deque[Any] = deque([initial_state])
+        transitions[get_name(initial_state)] = {}
+        while queue:
+            curr_state = queue.popleft()
+            curr_state_name = get_name(curr_state)
+            if final_state_fn(curr_state):
+                final_states.add(curr_state_name)
+
+            paths = transitions[curr_state_name]
+            for label, next_state in expand_state_fn(curr_state):
+                next_state_name = get_name(next_state)
+                paths[label] = next_state_name
+                if next_state_name not in transitions:
+                    transitions[next_state_name] = {}
+                    queue.append(next_state)
+
+        new_dfa = cls(
+            states=frozenset(transitions.keys()),
+            transitions=transitions,
+            initial_state=get_name(initial_state),
+            final_states=final_states,
+        )
+        return new_dfa.minify() if minify else new_dfa
+
+    def _product(
+        self,
+        other: SymbolicDFA,
+        final_state_fn: Callable[[bool, bool], bool],
+        *,
+        require_both: bool,
+        minify: bool,
+    ) -> Self:
+        """
+        Compute the reachable product of this DFA and other, where a missing
+        transition is represented by None. If require_both is True, only pairs
+        where both DFAs have a transition are kept.
+        """
+
+        def expand_state(
+            state_pair: Tuple[Any, Any],
+        ) -> Iterator[Tuple[IntervalSet, Tuple[Any, Any]]]:
+            q_a, q_b = state_pair
+            paths_a = list(self.transitions[q_a].items()) if q_a is not None else []
+            paths_b = list(other.transitions[q_b].items()) if q_b is not None else []
+
+            next_labels: Dict[Tuple[Any, Any], IntervalSet] = {}
+            minterms = get_minterms(
+                [label for label, _ in paths_a] + [label for label, _ in paths_b]
+            )
+            for minterm, indices in minterms:
+                next_a = next_b = None
+                for i in indices:
+                    if i < len(paths_a):
+                        next_a = paths_a[i][1]
+                    else:
+                        next_b = paths_b[i - len(paths_a)][1]
+                if require_both and (next_a is None or next_b is None):
+                    continue
+
+                next_pair = (next_a, next_b)
+                label = next_labels.get(next_pair)
+                next_labels[next_pair] = minterm if label is None else label | minterm
+            return ((label, pair) for pair, label in next_labels.items())
+
+        return self.__class__._expand(
+            lambda state_pair: final_state_fn(
+                state_pair[0] in self.final_states,
+                state_pair[1] in other.final_states,
+            ),
+            (self.initial_state, other.initial_state),
+            expand_state,
+            retain_names=False,
+            minify=minify,
+        )
+
+    def union(self, other: SymbolicDFA, *, minify: bool = True) -> Self:
+        """
+        Takes as input two symbolic DFAs M1 and M2 which accept languages L1
+        and L2 respectively. Returns a DFA which accepts the union of L1 and L2.
+
+        Parameters
+        ----------
+        other : SymbolicDFA
+            The DFA we want to take a union with.
+        minify : bool, default: True
+            Whether to minify the DFA after taking the union.
+
+        Returns
+        ------
+        Self
+            A DFA which accepts the union of the two input DFAs.
+        """
+        return self._product(
+            other, lambda a, b: a or b, require_both=False, minify=minify
+        )
+
+    def intersection(self, other: SymbolicDFA, *, minify: bool = True) -> Self:
+        """
+        Takes as input two symbolic DFAs M1 and M2 which accept languages L1
+        and L2 respectively. Returns a DFA which accepts the intersection of
+        L1 and L2.
+
+        Parameters
+        ----------
+        other : SymbolicDFA
+            The DFA we want to take an intersection with.
+        minify : bool, default: True
+            Whether to minify the DFA after taking the intersection.
+
+        Returns
+        ------
+        Self
+            A DFA which accepts the intersection of the two input DFAs.
+        """
+        return self._product(
+            other, lambda a, b: a and b, require_both=True, minify=minify
+        )
+
+    def difference(self, other: SymbolicDFA, *, minify: bool = True) -> Self:
+        """
+        Takes as input two symbolic DFAs M1 and M2 which accept languages L1
+        and L2 respectively. Returns a DFA which accepts the difference of L1
+        and L2.
+
+        Parameters
+        ----------
+        other : SymbolicDFA
+            The DFA we want to take a difference with.
+        minify : bool, default: True
+            Whether to minify the DFA after taking the difference.
+
+        Returns
+        ------
+        Self
+            A DFA which accepts the difference of the two input DFAs.
+        """
+        return self._product(
+            other, lambda a, b: a and not b, require_both=False, minify=minify
+        )
+
+    def symmetric_difference(self, other: SymbolicDFA, *, minify: bool = True) -> Self:
+        """
+        Takes as input two symbolic DFAs M1 and M2 which accept languages L1
+        and L2 respectively. Returns a DFA which accepts the symmetric
+        difference of L1 and L2.
+
+        Parameters
+        ----------
+        other : SymbolicDFA
+            The DFA we want to take a symmetric difference with.
+        minify : bool, default: True
+            Whether to minify the DFA after taking the symmetric difference.
+
+        Returns
+        ------
+        Self
+            A DFA which accepts the symmetric difference of the two input DFAs.
+        """
+        return self._product(
+            other, lambda a, b: a != b, require_both=False, minify=minify
+        )
+
+    def complement(self, *, minify: bool = True) -> Self:
+        """
+        Return the complement of this DFA over all unicode characters.
+
+        Parameters
+        ----------
+        minify : bool, default: True
+            Whether to minify the DFA after taking the complement.
+
+        Returns
+        ------
+        Self
+            A DFA which accepts the complement of the input DFA.
+        """
+        return self.__class__.universal_language().difference(self, minify=minify)
+
+    def issubset(self, other: SymbolicDFA) -> bool:
+        """
+        Return True if this DFA is a subset of (or equal to) another DFA.
+
+        Parameters
+        ----------
+        other : SymbolicDFA
+            The other DFA.
+
+        Returns
+        ------
+        bool
+            True if this DFA is a subset of the other DFA, False otherwise.
+        """
+        return self.difference(other, minify=False).isempty()
+
+    def isempty(self) -> bool:
+        """
+        Returns True if the language accepted by self is empty.
+
+        Returns
+        ------
+        bool
+            True if self accepts the empty language, False otherwise.
+        """
+        return not dfa.DFA._find_state(
+            self.final_states.__contains__,
+            self.initial_state,
+            lambda state: iter(self.transitions[state].items()),  # type: ignore
+        )
+
+    def minify(self) -> Self:
+        """
+        Create a minimal DFA which accepts the same inputs as this DFA.
+
+        The labels of the DFA are split into global minterms, which are then
+        used as the input symbols for Hopcroft's algorithm. Unreachable states
+        and states that cannot reach a final state are removed.
+
+        Returns
+        ------
+        Self
+            A state-minimal equivalent symbolic DFA.
+        """
+        reachable_states = set(
+            dfa.DFA._bfs_states(
+                self.initial_state,
+                lambda state: iter(self.transitions[state].items()),  # type: ignore
+            )
+        )
+        graph: Dict[SymbolicStateT, Set[SymbolicStateT]] = {
+            state: set() for state in reachable_states
+        }
+        for start_state in reachable_states:
+            for end_state in self.transitions[start_state].values():
+                graph[end_state].add(start_state)
+
+        # Keep only states that can reach a final state
+        live_states = set(self.final_states & reachable_states)
+        stack = list(live_states)
+        while stack:
+            for start_state in graph[stack.pop()]:
+                if start_state not in live_states:
+                    live_states.add(start_state)
+                    stack.append(start_state)
+
+        if not live_states:
+            return self.__class__.empty_language()
+        live_states.add(self.initial_state)
+
+        labels = {
+            label
+            for state in live_states
+            for label, end_state in self.transitions[state].items()
+            if end_state in live_states
+        }
+        minterms = [minterm for minterm, _ in get_minterms(list(labels))]
+        input_symbols = [str(i) for i in range(len(minterms))]
+        minterm_lookup = {
+            label: [
+                symbol
+                for symbol, minterm in zip(input_symbols, minterms)
+                if not minterm.isdisjoint(label)
+            ]
+            for label in labels
+        }
+
+        explicit_transitions = {
+            state: {
+                symbol: end_state
+                for label, end_state in self.transitions[state].items()
+                if end_state in live_states
+                for symbol in minterm_lookup[label]
+            }
+            for state in live_states
+        }
+
+        minimal_dfa = dfa.DFA._minify(
+            reachable_states=live_states,
+            input_symbols=frozenset(input_symbols),
+            transitions=explicit_transitions,
+            initial_state=self.initial_state,
+            reachable_final_states=self.final_states & live_states,
+            retain_names=False,
+        )
+
+        transitions = {}
+        for start_state, paths in minimal_dfa.transitions.items():
+            end_state_ranges: DefaultDict[Any, List[Tuple[int, int]]] = defaultdict(
+                list
+            )
+            for symbol, end_state in paths.items():
+                end_state_ranges[end_state].extend(minterms[int(symbol)].ranges)
+            transitions[start_state] = {
+                IntervalSet(ranges): end_state
+                for end_state, ranges in end_state_ranges.items()
+            }
+
+        return self.__class__(
+            states=minimal_dfa.states,
+            transitions=transitions,
+            initial_state=minimal_dfa.initial_state,
+            final_states=minimal_dfa.final_states,
+        )
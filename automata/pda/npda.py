@@ -1,10 +1,26 @@
 """Classes and methods for working with nondeterministic pushdown automata."""
 
-from typing import AbstractSet, Generator, List, Mapping, Set, Tuple, Union
+from random import Random
+from typing import (
+    AbstractSet,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from typing_extensions import Self
 
 import automata.base.exceptions as exceptions
 import automata.pda.pda as pda
-from automata.base.utils import pairwise
+from automata.base.instrumentation import get_stats_collector
+from automata.base.limits import get_resource_limits
+from automata.base.utils import pairwise, sample_poisson
 from automata.pda.configuration import PDAConfiguration
 from automata.pda.stack import PDAStack
 
@@ -128,6 +144,104 @@ def __init__(
             acceptance_mode=acceptance_mode,
         )
 
+    @classmethod
+    def random(
+        cls: Type[Self],
+        n_states: int,
+        input_symbols: AbstractSet[str],
+        stack_symbols: AbstractSet[str],
+        *,
+        seed: Optional[int] = None,
+        density: float = 0.5,
+        lambda_density: float = 0.0,
+        max_push: int = 2,
+        accepting_ratio: float = 0.5,
+        initial_stack_symbol: str = "#",
+        acceptance_mode: pda.PDAAcceptanceModeT = "final_state",
+    ) -> Self:
+        """
+        Generates a random NPDA. The states are the integers 0 to
+        n_states - 1, with 0 as the initial state.
+
+        Parameters
+        ----------
+        n_states : int
+            The number of states, which must be positive.
+        input_symbols : AbstractSet[str]
+            The set of input symbols to construct the NPDA over.
+        stack_symbols : AbstractSet[str]
+            The set of stack symbols, to which initial_stack_symbol is added.
+        seed : Optional[int], default: None
+            The random seed to use, for reproducible NPDAs.
+        density : float, default: 0.5
+            The average number of transitions for each state, input symbol
+            and stack symbol.
+        lambda_density : float, default: 0.0
+            The average number of lambda transitions for each state and stack
+            symbol. Note that lambda transitions which push symbols can make
+            the NPDA loop forever.
+        max_push : int, default: 2
+            The maximum number of symbols pushed by a transition, which
+            replace the symbol popped from the top of the stack.
+        accepting_ratio : float, default: 0.5
+            The probability of each state being a final state.
+        initial_stack_symbol : str, default: "#"
+            The initial stack symbol.
+        acceptance_mode : pda.PDAAcceptanceModeT, default: "final_state"
+            The acceptance mode of the NPDA.
+
+        Returns
+        ------
+        Self
+            A random NPDA.
+        """
+        if n_states < 1:
+            raise ValueError("Number of states must be positive")
+        if density < 0 or lambda_density < 0:
+            raise ValueError("Densities must be non-negative")
+        if max_push < 0:
+            raise ValueError("max_push must be non-negative")
+        if not 0 <= accepting_ratio <= 1:
+            raise ValueError("Accepting ratio must be between 0 and 1")
+
+        rng = Random(seed)
+        all_stack_symbols = sorted(stack_symbols | {initial_stack_symbol})
+        transitions: Dict[
+            NPDAStateT,
+            Dict[str, Dict[str, Set[Tuple[NPDAStateT, Union[str, Tuple[str, ...]]]]]],
+        ] = {}
+
+        for state in range(n_states):
+            for input_symbol in ["", *sorted(input_symbols)]:
+                mean = lambda_density if input_symbol == "" else density
+                for stack_symbol in all_stack_symbols:
+                    for _ in range(sample_poisson(mean, rng)):
+                        pushed = tuple(
+                            rng.choice(all_stack_symbols)
+                            for _ in range(rng.randint(0, max_push))
+                        )
+                        transitions.setdefault(state, {}).setdefault(
+                            input_symbol, {}
+                        ).setdefault(stack_symbol, set()).add(
+                            (
+                                rng.randrange(n_states),
+                                pushed if len(pushed) > 1 else "".join(pushed),
+                            )
+                        )
+
+        return cls(
+            states=set(range(n_states)),
+            input_symbols=input_symbols,
+            stack_symbols=set(all_stack_symbols),
+            transitions=transitions,
+            initial_state=0,
+            initial_stack_symbol=initial_stack_symbol,
+            final_states={
+                state for state in range(n_states) if rng.random() < accepting_ratio
+            },
+            acceptance_mode=acceptance_mode,
+        )
+
     def iter_transitions(
         self,
     ) -> Generator[Tuple[NPDAStateT, NPDAStateT, Tuple[str, str, str]], None, None]:
@@ -261,6 +375,9 @@ def read_input_stepwise(
 
         yield current_configurations
 
+        stats = get_stats_collector()
+        limits = get_resource_limits()
+        steps = 0
         while current_configurations:
             new_configurations = set()
             for config in current_configurations:
@@ -272,6 +389,14 @@ def read_input_stepwise(
                 elif self._has_lambda_transition(config.state, config.stack.top()):
                     new_configurations.update(self._get_next_configurations(config))
             current_configurations = new_configurations
+            if stats is not None:
+                stats.increment("npda.steps")
+                stats.record_max("npda.frontier", len(current_configurations))
+            if limits is not None:
+                steps += 1
+                limits.check(
+                    "npda", steps=steps, configurations=len(current_configurations)
+                )
             yield current_configurations
 
         raise exceptions.RejectionException(
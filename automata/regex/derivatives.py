@@ -0,0 +1,628 @@
+"""Classes and methods for computing derivatives of regexes."""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import count
+from typing import (
+    AbstractSet,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import automata.base.exceptions as exceptions
+from automata.base.limits import get_resource_limits
+from automata.regex.parser import BuilderTransitionsT, NFARegexBuilder
+from automata.regex.syntax import (
+    CharSet,
+    Concat,
+    EmptyString,
+    Intersection,
+    RegexNode,
+    Repeat,
+    Shuffle,
+    Union,
+    parse_regex_ast,
+)
+
+# The kinds of regex terms
+EMPTY = 0
+EPSILON = 1
+CHARS = 2
+CONCAT = 3
+UNION = 4
+INTERSECTION = 5
+SHUFFLE = 6
+REPEAT = 7
+COMPLEMENT = 8
+
+# Maps each term reached by reading a symbol to the symbols leading to it
+LinearFormT = Dict["RegexTerm", FrozenSet[str]]
+
+
+class RegexTerm:
+    """
+    A regex term, as created by a `TermFactory`. The factory returns the
+    same object for structurally equal terms, so terms are compared and
+    hashed by identity.
+
+    Attributes
+    ----------
+    kind : int
+        The kind of the term, such as CONCAT or UNION.
+    args : tuple
+        The arguments of the term: its subterms, the characters matched by a
+        CHARS term, or the subterm and bounds of a REPEAT term. The subterms
+        of a UNION or INTERSECTION term are sorted by term_id.
+    nullable : bool
+        Whether the term matches the empty string.
+    term_id : int
+        The number of terms created by the factory before this one.
+    """
+
+    __slots__ = ("kind", "args", "nullable", "term_id")
+
+    def __init__(self, kind: int, args: tuple, nullable: bool, term_id: int) -> None:
+        self.kind = kind
+        self.args = args
+        self.nullable = nullable
+        self.term_id = term_id
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}({self.kind}, {self.args!r})"
+
+
+class TermFactory:
+    """
+    A factory of hash-consed regex terms over a fixed alphabet. Terms are
+    built with smart constructors, which simplify them with rules such as
+    r|r = r, r() = r and (r*)* = r*. Concatenations are kept associated to
+    the right, and unions and intersections are flattened, with their
+    subterms sorted and deduplicated, so that terms equal up to these rules
+    are the same object. The number of distinct derivatives of a term is
+    then finite.
+
+    Linear forms (partial derivatives) and derivatives of terms are memoized,
+    so each term is only derived once.
+
+    Parameters
+    ----------
+    input_symbols : AbstractSet[str]
+        The alphabet of the terms.
+    """
+
+    __slots__ = (
+        "input_symbols",
+        "empty",
+        "epsilon",
+        "universal",
+        "_terms",
+        "_linear_forms",
+        "_derivatives",
+        "_symbol_classes",
+    )
+
+    def __init__(self, input_symbols: AbstractSet[str]) -> None:
+        self.input_symbols = frozenset(input_symbols)
+        self._terms: Dict[Tuple[int, tuple], RegexTerm] = {}
+        self._linear_forms: Dict[RegexTerm, LinearFormT] = {}
+        self._derivatives: Dict[RegexTerm, Dict[str, RegexTerm]] = {}
+        self._symbol_classes: Dict[RegexTerm, Tuple[FrozenSet[str], ...]] = {}
+        self.empty = self._make(EMPTY, (), False)
+        self.epsilon = self._make(EPSILON, (), True)
+        self.universal = self._make(COMPLEMENT, (self.empty,), True)
+
+    def __len__(self) -> int:
+        """Return the number of distinct terms created so far."""
+        return len(self._terms)
+
+    def _make(self, kind: int, args: tuple, nullable: bool) -> RegexTerm:
+        """Return the unique term with the given kind and arguments."""
+        key = (kind, args)
+        term = self._terms.get(key)
+        if term is None:
+            term = self._terms[key] = RegexTerm(kind, args, nullable, len(self._terms))
+        return term
+
+    def chars(self, symbols: AbstractSet[str]) -> RegexTerm:
+        """Return the term matching any one of the given symbols."""
+        if not symbols:
+            return self.empty
+        return self._make(CHARS, (frozenset(symbols),), False)
+
+    def concat(self, left: RegexTerm, right: RegexTerm) -> RegexTerm:
+        """Return the term matching left followed by right."""
+        if left is self.empty or right is self.empty:
+            return self.empty
+        if left is self.epsilon:
+            return right
+        if right is self.epsilon:
+            return left
+
+        factors = []
+        while left.kind == CONCAT:
+            factors.append(left.args[0])
+            left = left.args[1]
+        factors.append(left)
+
+        result = right
+        for factor in reversed(factors):
+            result = self._make(
+                CONCAT, (factor, result), factor.nullable and result.nullable
+            )
+        return result
+
+    def union(self, terms: Iterable[RegexTerm]) -> RegexTerm:
+        """Return the term matching any of the given terms."""
+        args: Set[RegexTerm] = set()
+        symbols: Set[str] = set()
+        for term in terms:
+            if term.kind == UNION:
+                subterms: Iterable[RegexTerm] = term.args
+            else:
+                subterms = (term,)
+            for subterm in subterms:
+                if subterm.kind == CHARS:
+                    symbols.update(subterm.args[0])
+                elif subterm is not self.empty:
+                    args.add(subterm)
+
+        if self.universal in args:
+            return self.universal
+        if symbols:
+            args.add(self.chars(symbols))
+        if not args:
+            return self.empty
+        if len(args) == 1:
+            return args.pop()
+
+        sorted_args = tuple(sorted(args, key=lambda term: term.term_id))
+        return self._make(
+            UNION, sorted_args, any(term.nullable for term in sorted_args)
+        )
+
+    def intersection(self, terms: Iterable[RegexTerm]) -> RegexTerm:
+        """Return the term matching all of the given terms."""
+        args: Set[RegexTerm] = set()
+        symbols: Optional[FrozenSet[str]] = None
+        for term in terms:
+            if term.kind == INTERSECTION:
+                subterms: Iterable[RegexTerm] = term.args
+            else:
+                subterms = (term,)
+            for subterm in subterms:
+                if subterm is self.empty:
+                    return self.empty
+                if subterm.kind == CHARS:
+                    subterm_symbols = subterm.args[0]
+                    symbols = (
+                        subterm_symbols
+                        if symbols is None
+                        else symbols & subterm_symbols
+                    )
+                elif subterm is not self.universal:
+                    args.add(subterm)
+
+        if self.epsilon in args:
+            # The empty string is only matched if every term matches it
+            if symbols is None and all(term.nullable for term in args):
+                return self.epsilon
+            return self.empty
+        if symbols is not None:
+            chars = self.chars(symbols)
+            if chars is self.empty:
+                return self.empty
+            args.add(chars)
+        if not args:
+            return self.universal
+        if len(args) == 1:
+            return args.pop()
+
+        sorted_args = tuple(sorted(args, key=lambda term: term.term_id))
+        return self._make(
+            INTERSECTION, sorted_args, all(term.nullable for term in sorted_args)
+        )
+
+    def complement(self, term: RegexTerm) -> RegexTerm:
+        """Return the term matching the words over the alphabet not in term."""
+        if term.kind == COMPLEMENT:
+            return term.args[0]
+        return self._make(COMPLEMENT, (term,), not term.nullable)
+
+    def shuffle(self, left: RegexTerm, right: RegexTerm) -> RegexTerm:
+        """Return the term matching the interleavings of left and right."""
+        if left is self.empty or right is self.empty:
+            return self.empty
+        if left is self.epsilon:
+            return right
+        if right is self.epsilon:
+            return left
+        if right.term_id < left.term_id:
+            left, right = right, left
+        return self._make(SHUFFLE, (left, right), left.nullable and right.nullable)
+
+    def repeat(
+        self, term: RegexTerm, lower_bound: int, upper_bound: Optional[int]
+    ) -> RegexTerm:
+        """
+        Return the term matching between lower_bound and upper_bound
+        repetitions of term. If upper_bound is None, the number of repetitions
+        is unbounded.
+        """
+        if upper_bound == 0 or term is self.epsilon:
+            return self.epsilon
+        if term is self.empty:
+            return self.epsilon if lower_bound == 0 else self.empty
+        if lower_bound == 1 and upper_bound == 1:
+            return term
+        # Repeating a nullable term at least k times is the same as repeating
+        # it at least 0 times
+        if term.nullable:
+            if upper_bound == 1:
+                return term
+            lower_bound = 0
+        if term.kind == REPEAT and term.args[1] == 0 and term.args[2] is None:
+            return term
+        return self._make(
+            REPEAT, (term, lower_bound, upper_bound), lower_bound == 0 or term.nullable
+        )
+
+    def from_node(self, node: RegexNode) -> RegexTerm:
+        """
+        Return the term for the given regex syntax tree.
+
+        Parameters
+        ----------
+        node : RegexNode
+            The root of a regex syntax tree.
+
+        Returns
+        ------
+        RegexTerm
+            The term matching the same language over the alphabet.
+
+        Raises
+        ------
+        InvalidSymbolError
+            If the regex contains a symbol that is not in the alphabet.
+        """
+        if isinstance(node, EmptyString):
+            return self.epsilon
+
+        if isinstance(node, CharSet):
+            if not node.negated and not node.chars <= self.input_symbols:
+                raise exceptions.InvalidSymbolError(
+                    "regex symbols {} are not in the input symbols".format(
+                        ", ".join(sorted(node.chars - self.input_symbols))
+                    )
+                )
+            return self.chars(node.resolve(self.input_symbols))
+
+        if isinstance(node, (Concat, Union, Intersection)):
+            # Chains of the same operator are flattened without recursion,
+            # since long literals are parsed into deep chains of concatenations
+            node_type = type(node)
+            operands: List[RegexNode] = []
+            operand: RegexNode = node
+            while (
+                isinstance(operand, (Concat, Union, Intersection))
+                and type(operand) is node_type
+            ):
+                operands.append(operand.right)
+                operand = operand.left
+            operands.append(operand)
+            terms = [self.from_node(operand) for operand in reversed(operands)]
+
+            if node_type is Union:
+                return self.union(terms)
+            if node_type is Intersection:
+                return self.intersection(terms)
+            result = self.epsilon
+            for term in reversed(terms):
+                result = self.concat(term, result)
+            return result
+
+        if isinstance(node, Shuffle):
+            return self.shuffle(self.from_node(node.left), self.from_node(node.right))
+
+        if isinstance(node, Repeat):
+            return self.repeat(
+                self.from_node(node.node), node.lower_bound, node.upper_bound
+            )
+
+        raise exceptions.InvalidRegexError(f"Invalid regex node type {type(node)}")
+
+    def linear_form(self, term: RegexTerm) -> LinearFormT:
+        """
+        Return the partial derivatives of the term with respect to every
+        symbol, as defined by Antimirov. For each symbol a, the terms whose
+        symbol sets contain a match the words w such that aw matches the term.
+
+        Parameters
+        ----------
+        term : RegexTerm
+            The term to derive.
+
+        Returns
+        ------
+        Dict[RegexTerm, FrozenSet[str]]
+            A mapping from each partial derivative of the term to the symbols
+            it is a partial derivative for.
+        """
+        linear_form = self._linear_forms.get(term)
+        if linear_form is None:
+            linear_form = {
+                derivative: frozenset(symbols)
+                for derivative, symbols in self._compute_linear_form(term).items()
+                if derivative is not self.empty
+            }
+            self._linear_forms[term] = linear_form
+        return linear_form
+
+    def _compute_linear_form(self, term: RegexTerm) -> Dict[RegexTerm, Set[str]]:
+        """Compute the linear form of the term, without memoization."""
+        result: Dict[RegexTerm, Set[str]] = {}
+
+        def add(derivative: RegexTerm, symbols: AbstractSet[str]) -> None:
+            if symbols:
+                result.setdefault(derivative, set()).update(symbols)
+
+        kind = term.kind
+        if kind == CHARS:
+            add(self.epsilon, term.args[0])
+
+        elif kind == CONCAT:
+            head, tail = term.args
+            for derivative, symbols in self.linear_form(head).items():
+                add(self.concat(derivative, tail), symbols)
+            if head.nullable:
+                for derivative, symbols in self.linear_form(tail).items():
+                    add(derivative, symbols)
+
+        elif kind == UNION:
+            for subterm in term.args:
+                for derivative, symbols in self.linear_form(subterm).items():
+                    add(derivative, symbols)
+
+        elif kind == INTERSECTION:
+            pairs: List[Tuple[RegexTerm, FrozenSet[str]]] = list(
+                self.linear_form(term.args[0]).items()
+            )
+            for subterm in term.args[1:]:
+                pairs = [
+                    (self.intersection((derivative, other)), symbols & other_symbols)
+                    for derivative, symbols in pairs
+                    for other, other_symbols in self.linear_form(subterm).items()
+                    if not symbols.isdisjoint(other_symbols)
+                ]
+            for derivative, symbols in pairs:
+                add(derivative, symbols)
+
+        elif kind == SHUFFLE:
+            left, right = term.args
+            for derivative, symbols in self.linear_form(left).items():
+                add(self.shuffle(derivative, right), symbols)
+            for derivative, symbols in self.linear_form(right).items():
+                add(self.shuffle(left, derivative), symbols)
+
+        elif kind == REPEAT:
+            subterm, lower_bound, upper_bound = term.args
+            rest = self.repeat(
+                subterm,
+                max(lower_bound - 1, 0),
+                None if upper_bound is None else upper_bound - 1,
+            )
+            for derivative, symbols in self.linear_form(subterm).items():
+                add(self.concat(derivative, rest), symbols)
+
+        elif kind == COMPLEMENT:
+            raise ValueError("complements do not have partial derivatives")
+
+        return result
+
+    def derivative(self, term: RegexTerm, symbol: str) -> RegexTerm:
+        """
+        Return the derivative of the term with respect to a symbol, as defined
+        by Brzozowski: the term matching the words w such that symbol + w
+        matches the term.
+
+        Parameters
+        ----------
+        term : RegexTerm
+            The term to derive.
+        symbol : str
+            The symbol to derive the term with respect to.
+
+        Returns
+        ------
+        RegexTerm
+            The derivative of the term.
+        """
+        derivatives = self._derivatives.get(term)
+        if derivatives is None:
+            derivatives = self._derivatives[term] = {}
+        derivative = derivatives.get(symbol)
+        if derivative is None:
+            derivative = derivatives[symbol] = self._compute_derivative(term, symbol)
+        return derivative
+
+    def _compute_derivative(self, term: RegexTerm, symbol: str) -> RegexTerm:
+        """Compute the derivative of the term, without memoization."""
+        kind = term.kind
+        if kind == CHARS:
+            return self.epsilon if symbol in term.args[0] else self.empty
+
+        if kind == CONCAT:
+            head, tail = term.args
+            derivative = self.concat(self.derivative(head, symbol), tail)
+            if head.nullable:
+                return self.union((derivative, self.derivative(tail, symbol)))
+            return derivative
+
+        if kind == UNION:
+            return self.union(self.derivative(subterm, symbol) for subterm in term.args)
+
+        if kind == INTERSECTION:
+            return self.intersection(
+                self.derivative(subterm, symbol) for subterm in term.args
+            )
+
+        if kind == COMPLEMENT:
+            return self.complement(self.derivative(term.args[0], symbol))
+
+        if kind == SHUFFLE:
+            left, right = term.args
+            return self.union(
+                (
+                    self.shuffle(self.derivative(left, symbol), right),
+                    self.shuffle(left, self.derivative(right, symbol)),
+                )
+            )
+
+        if kind == REPEAT:
+            subterm, lower_bound, upper_bound = term.args
+            rest = self.repeat(
+                subterm,
+                max(lower_bound - 1, 0),
+                None if upper_bound is None else upper_bound - 1,
+            )
+            return self.concat(self.derivative(subterm, symbol), rest)
+
+        return self.empty
+
+    def symbol_classes(self, term: RegexTerm) -> Tuple[FrozenSet[str], ...]:
+        """
+        Return a partition of the alphabet into classes of symbols with
+        respect to which the term has the same derivative. The partition may
+        be finer than necessary.
+
+        Parameters
+        ----------
+        term : RegexTerm
+            The term to partition the alphabet for.
+
+        Returns
+        ------
+        Tuple[FrozenSet[str], ...]
+            The nonempty classes of symbols.
+        """
+        symbol_classes = self._symbol_classes.get(term)
+        if symbol_classes is None:
+            symbol_classes = self._symbol_classes[term] = self._compute_symbol_classes(
+                term
+            )
+        return symbol_classes
+
+    def _compute_symbol_classes(self, term: RegexTerm) -> Tuple[FrozenSet[str], ...]:
+        """Compute the symbol classes of the term, without memoization."""
+        kind = term.kind
+        if kind == CHARS:
+            symbols = term.args[0]
+            return tuple(
+                symbol_class
+                for symbol_class in (symbols, self.input_symbols - symbols)
+                if symbol_class
+            )
+
+        if kind == CONCAT:
+            head, tail = term.args
+            subterms: Tuple[RegexTerm, ...] = (head, tail) if head.nullable else (head,)
+        elif kind in (UNION, INTERSECTION, SHUFFLE):
+            subterms = term.args
+        elif kind in (COMPLEMENT, REPEAT):
+            subterms = (term.args[0],)
+        else:
+            subterms = ()
+
+        symbol_classes: Tuple[FrozenSet[str], ...] = (
+            (self.input_symbols,) if self.input_symbols else ()
+        )
+        for subterm in subterms:
+            subterm_classes = self.symbol_classes(subterm)
+            if len(subterm_classes) == 1:
+                continue
+            symbol_classes = tuple(
+                symbol_class & subterm_class
+                for symbol_class in symbol_classes
+                for subterm_class in subterm_classes
+                if not symbol_class.isdisjoint(subterm_class)
+            )
+        return symbol_classes
+
+    def iter_transitions(
+        self, term: RegexTerm
+    ) -> Generator[Tuple[str, RegexTerm], None, None]:
+        """
+        Iterate through the symbols with a nonempty derivative of the term,
+        along with the derivative. The derivative is only computed once for
+        each symbol class.
+
+        Parameters
+        ----------
+        term : RegexTerm
+            The term to derive.
+
+        Yields
+        ------
+        Generator[Tuple[str, RegexTerm], None, None]
+            Each symbol and the derivative of the term with respect to it.
+        """
+        for symbol_class in self.symbol_classes(term):
+            derivative = self.derivative(term, next(iter(symbol_class)))
+            if derivative is not self.empty:
+                for symbol in symbol_class:
+                    yield symbol, derivative
+
+
+def parse_regex_antimirov(
+    regexstr: str, input_symbols: AbstractSet[str]
+) -> NFARegexBuilder:
+    """
+    Return an NFARegexBuilder for the partial derivative automaton of
+    regexstr, as described by Antimirov. Each state is a term reachable from
+    the regex by taking partial derivatives, and the terms matching the
+    empty string are final. For regexes without intersections and shuffles,
+    the automaton has at most one more state than the regex has symbol
+    positions, and is often much smaller.
+    """
+    factory = TermFactory(input_symbols)
+    initial_term = factory.from_node(parse_regex_ast(regexstr))
+
+    counter = count(0)
+    state_names = {initial_term: next(counter)}
+    transitions: BuilderTransitionsT = {}
+    final_states = set()
+    queue: Deque[RegexTerm] = deque([initial_term])
+    limits = get_resource_limits()
+
+    while queue:
+        curr_term = queue.popleft()
+        curr_state_name = state_names[curr_term]
+        paths = transitions[curr_state_name] = {}
+        if curr_term.nullable:
+            final_states.add(curr_state_name)
+
+        for derivative, symbols in factory.linear_form(curr_term).items():
+            state_name = state_names.get(derivative)
+            if state_name is None:
+                state_name = state_names[derivative] = next(counter)
+                queue.append(derivative)
+            for symbol in symbols:
+                paths.setdefault(symbol, set()).add(state_name)
+
+        if limits is not None:
+            limits.check("regex_derivatives", states=len(state_names))
+
+    return NFARegexBuilder(
+        transitions=transitions,
+        initial_state=state_names[initial_term],
+        final_states=final_states,
+        counter=counter,
+    )
@@ -0,0 +1,264 @@
+"""Classes and methods for compiling regexes into Glushkov (position) NFAs."""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import count
+from typing import AbstractSet, Deque, Dict, Set, Tuple
+
+import automata.base.exceptions as exceptions
+from automata.base.limits import get_resource_limits
+from automata.regex.parser import BuilderTransitionsT, NFARegexBuilder
+from automata.regex.syntax import (
+    CharSet,
+    Concat,
+    EmptyString,
+    Intersection,
+    RegexNode,
+    Repeat,
+    Shuffle,
+    Union,
+    parse_regex_ast,
+)
+
+# The transitions from the initial state of a fragment, by symbol
+FirstT = Dict[str, Set[int]]
+# The initial state of the position automaton of an operand of a product
+_OPERAND_INITIAL_STATE = -1
+
+
+class _PositionFragment:
+    """
+    The part of a position automaton matching a subexpression: whether it
+    matches the empty string, the transitions from the initial state into its
+    first positions, and its last positions. The transitions between its
+    positions are stored in the transitions dict it was built in.
+    """
+
+    __slots__ = ("nullable", "first", "last")
+
+    def __init__(self, nullable: bool, first: FirstT, last: Set[int]) -> None:
+        self.nullable = nullable
+        self.first = first
+        self.last = last
+
+
+def _add_follow(
+    transitions: BuilderTransitionsT, last: Set[int], first: FirstT
+) -> None:
+    """Add transitions from each of the last positions along first."""
+    for position in last:
+        paths = transitions[position]
+        for symbol, end_states in first.items():
+            paths.setdefault(symbol, set()).update(end_states)
+
+
+def _concatenate(
+    left: _PositionFragment,
+    right: _PositionFragment,
+    transitions: BuilderTransitionsT,
+) -> _PositionFragment:
+    """Return the fragment matching left followed by right."""
+    _add_follow(transitions, left.last, right.first)
+
+    first = left.first
+    if left.nullable:
+        first = {symbol: set(end_states) for symbol, end_states in first.items()}
+        for symbol, end_states in right.first.items():
+            first.setdefault(symbol, set()).update(end_states)
+
+    last = right.last | left.last if right.nullable else right.last
+    return _PositionFragment(left.nullable and right.nullable, first, last)
+
+
+def _union(left: _PositionFragment, right: _PositionFragment) -> _PositionFragment:
+    """Return the fragment matching either left or right."""
+    first = {symbol: set(end_states) for symbol, end_states in left.first.items()}
+    for symbol, end_states in right.first.items():
+        first.setdefault(symbol, set()).update(end_states)
+    return _PositionFragment(
+        left.nullable or right.nullable, first, left.last | right.last
+    )
+
+
+def _product(
+    node: RegexNode,
+    transitions: BuilderTransitionsT,
+    input_symbols: AbstractSet[str],
+    counter: count,
+) -> _PositionFragment:
+    """
+    Return the fragment matching an intersection or shuffle node, whose
+    states are the reachable pairs of states of the position automata of its
+    operands. Since the initial states of those automata have no incoming
+    transitions, neither does the initial pair, so the product can be
+    embedded in the enclosing automaton like a single subexpression.
+    """
+    assert isinstance(node, (Intersection, Shuffle))
+    shuffle = isinstance(node, Shuffle)
+
+    operands = []
+    for operand in (node.left, node.right):
+        operand_transitions: BuilderTransitionsT = {}
+        fragment = _add_positions(operand, operand_transitions, input_symbols, counter)
+        operand_transitions[_OPERAND_INITIAL_STATE] = fragment.first
+        final_states = set(fragment.last)
+        if fragment.nullable:
+            final_states.add(_OPERAND_INITIAL_STATE)
+        operands.append((operand_transitions, final_states))
+
+    (left_paths, left_final_states), (right_paths, right_final_states) = operands
+
+    initial_state = (_OPERAND_INITIAL_STATE, _OPERAND_INITIAL_STATE)
+    state_names: Dict[Tuple[int, int], int] = {}
+    first: FirstT = {}
+    last = set()
+    queue: Deque[Tuple[int, int]] = deque([initial_state])
+    limits = get_resource_limits()
+
+    def get_state_name(product_state: Tuple[int, int]) -> int:
+        state_name = state_names.get(product_state)
+        if state_name is None:
+            state_name = state_names[product_state] = next(counter)
+            transitions[state_name] = {}
+            queue.append(product_state)
+        return state_name
+
+    while queue:
+        curr_state = queue.popleft()
+        q_a, q_b = curr_state
+        paths_a, paths_b = left_paths[q_a], right_paths[q_b]
+
+        if curr_state == initial_state:
+            paths = first
+        else:
+            curr_state_name = state_names[curr_state]
+            paths = transitions[curr_state_name]
+            if q_a in left_final_states and q_b in right_final_states:
+                last.add(curr_state_name)
+
+        if shuffle:
+            for symbol, end_states in paths_a.items():
+                paths.setdefault(symbol, set()).update(
+                    get_state_name((end_state, q_b)) for end_state in end_states
+                )
+            for symbol, end_states in paths_b.items():
+                paths.setdefault(symbol, set()).update(
+                    get_state_name((q_a, end_state)) for end_state in end_states
+                )
+        else:
+            for symbol, end_states_a in paths_a.items():
+                end_states_b = paths_b.get(symbol)
+                if end_states_b is None:
+                    continue
+                paths.setdefault(symbol, set()).update(
+                    get_state_name((end_state_a, end_state_b))
+                    for end_state_a in end_states_a
+                    for end_state_b in end_states_b
+                )
+
+        if limits is not None:
+            limits.check(
+                "regex_shuffle" if shuffle else "regex_intersection",
+                states=len(state_names),
+            )
+
+    nullable = (
+        _OPERAND_INITIAL_STATE in left_final_states
+        and _OPERAND_INITIAL_STATE in right_final_states
+    )
+    return _PositionFragment(nullable, first, last)
+
+
+def _add_positions(
+    node: RegexNode,
+    transitions: BuilderTransitionsT,
+    input_symbols: AbstractSet[str],
+    counter: count,
+) -> _PositionFragment:
+    """
+    Add a state for each symbol position of the node to transitions, along
+    with the transitions between them, and return the resulting fragment.
+    """
+    if isinstance(node, EmptyString):
+        return _PositionFragment(True, {}, set())
+
+    if isinstance(node, CharSet):
+        position = next(counter)
+        transitions[position] = {}
+        return _PositionFragment(
+            False,
+            {symbol: {position} for symbol in node.resolve(input_symbols)},
+            {position},
+        )
+
+    if isinstance(node, Concat):
+        return _concatenate(
+            _add_positions(node.left, transitions, input_symbols, counter),
+            _add_positions(node.right, transitions, input_symbols, counter),
+            transitions,
+        )
+
+    if isinstance(node, Union):
+        return _union(
+            _add_positions(node.left, transitions, input_symbols, counter),
+            _add_positions(node.right, transitions, input_symbols, counter),
+        )
+
+    if isinstance(node, Repeat):
+        # Bounded repetitions are expanded into copies of the subexpression,
+        # and x{m,} becomes m - 1 copies of x followed by x+
+        lower_bound, upper_bound = node.lower_bound, node.upper_bound
+        copy_count = max(lower_bound, 1) if upper_bound is None else upper_bound
+        limits = get_resource_limits()
+        fragment = _PositionFragment(True, {}, set())
+        for i in range(copy_count):
+            if limits is not None:
+                limits.check("regex_repeat", states=len(transitions))
+            child = _add_positions(node.node, transitions, input_symbols, counter)
+            if upper_bound is None and i == copy_count - 1:
+                _add_follow(transitions, child.last, child.first)
+            if i >= lower_bound:
+                child.nullable = True
+            fragment = _concatenate(fragment, child, transitions)
+        return fragment
+
+    if isinstance(node, (Intersection, Shuffle)):
+        return _product(node, transitions, input_symbols, counter)
+
+    raise exceptions.InvalidRegexError(f"Invalid regex node type {type(node)}")
+
+
+def parse_regex_glushkov(
+    regexstr: str, input_symbols: AbstractSet[str]
+) -> NFARegexBuilder:
+    """
+    Return an NFARegexBuilder for the position automaton of regexstr, as
+    described by Glushkov. The automaton has an initial state and one state
+    per occurrence of a symbol, wildcard or character class in the regex
+    (after expanding quantifiers), and no lambda transitions: the initial
+    state has a transition to each position that can match first, and each
+    position has a transition to each position that can follow it. Each
+    transition on a symbol leads to a position matching that symbol.
+
+    Intersections and shuffles are compiled to the product of the position
+    automata of their operands, which is also free of lambda transitions.
+    """
+    counter = count(0)
+    initial_state = next(counter)
+    transitions: BuilderTransitionsT = {}
+    fragment = _add_positions(
+        parse_regex_ast(regexstr), transitions, input_symbols, counter
+    )
+
+    transitions[initial_state] = fragment.first
+    final_states = set(fragment.last)
+    if fragment.nullable:
+        final_states.add(initial_state)
+
+    return NFARegexBuilder(
+        transitions=transitions,
+        initial_state=initial_state,
+        final_states=final_states,
+        counter=counter,
+    )
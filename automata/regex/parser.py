@@ -7,11 +7,23 @@
 import string
 from collections import deque
 from itertools import chain, count, product, repeat
-from typing import AbstractSet, Deque, Dict, Iterable, List, Optional, Set, Tuple, Type
+from typing import (
+    AbstractSet,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from typing_extensions import NoReturn, Self
 
 import automata.base.exceptions as exceptions
+from automata.base.limits import get_resource_limits
 from automata.base.utils import get_renaming_function, pairwise
 from automata.regex.lexer import Lexer, Token
 from automata.regex.postfix import (
@@ -170,6 +182,7 @@ def intersection(self, other: NFARegexBuilder) -> None:
 
         queue.append(new_initial_state)
         new_transitions[new_initial_state_name] = {}
+        limits = get_resource_limits()
 
         while queue:
             curr_state = queue.popleft()
@@ -223,6 +236,9 @@ def intersection(self, other: NFARegexBuilder) -> None:
                     new_transitions[product_state_name] = {}
                     queue.append(product_state)
 
+            if limits is not None:
+                limits.check("regex_intersection", states=len(new_transitions))
+
         self._final_states = new_final_states
         self._transitions = new_transitions
         self._initial_state = new_initial_state_name
@@ -264,8 +280,14 @@ def repeat(self, lower_bound: int, upper_bound: Optional[int]) -> None:
             new_final_states.add(self._initial_state)
 
         prev_initial_state = self._initial_state
+        limits = get_resource_limits()
 
         for i in range(2, number_of_repetitions + 1):
+            if limits is not None:
+                limits.check(
+                    "regex_repeat", states=len(new_transitions) + len(self._transitions)
+                )
+
             # Reset the state renaming function each time
             get_state_name = get_renaming_function(self._state_name_counter)
 
@@ -304,36 +326,56 @@ def repeat(self, lower_bound: int, upper_bound: Optional[int]) -> None:
     def shuffle_product(self, other: NFARegexBuilder) -> None:
         """
         Apply the shuffle operation to the NFA represented by this builder and other.
-        No need for BFS since all states are accessible.
+        Use BFS to only traverse reachable part (keeps number of states down).
         """
 
         get_state_name = get_renaming_function(self._state_name_counter)
 
-        self._initial_state = get_state_name(
-            (self._initial_state, other._initial_state)
-        )
-
+        new_final_states = set()
         new_transitions: BuilderTransitionsT = {}
+        new_initial_state = (self._initial_state, other._initial_state)
 
-        transition_product = product(
-            self._transitions.items(), other._transitions.items()
-        )
-        for (q_a, transitions_a), (q_b, transitions_b) in transition_product:
-            state_dict = new_transitions.setdefault(get_state_name((q_a, q_b)), {})
+        queue: Deque[Tuple[int, int]] = deque()
+
+        queue.append(new_initial_state)
+        new_transitions[get_state_name(new_initial_state)] = {}
+        limits = get_resource_limits()
 
-            for symbol, end_states in transitions_a.items():
+        while queue:
+            curr_state = queue.popleft()
+            state_dict = new_transitions[get_state_name(curr_state)]
+            q_a, q_b = curr_state
+
+            if q_a in self._final_states and q_b in other._final_states:
+                new_final_states.add(get_state_name(curr_state))
+
+            # States we will consider adding to the queue
+            next_states_iterables: List[Iterable[Tuple[int, int]]] = []
+
+            for symbol, end_states in self._transitions.get(q_a, {}).items():
                 state_dict.setdefault(symbol, set()).update(
                     map(get_state_name, zip(end_states, repeat(q_b)))
                 )
+                next_states_iterables.append(zip(end_states, repeat(q_b)))
 
-            for symbol, end_states in transitions_b.items():
+            for symbol, end_states in other._transitions.get(q_b, {}).items():
                 state_dict.setdefault(symbol, set()).update(
                     map(get_state_name, zip(repeat(q_a), end_states))
                 )
+                next_states_iterables.append(zip(repeat(q_a), end_states))
 
-        self._final_states = set(
-            map(get_state_name, product(self._final_states, other._final_states))
-        )
+            # Finally, try visiting every state we found.
+            for product_state in chain.from_iterable(next_states_iterables):
+                product_state_name = get_state_name(product_state)
+                if product_state_name not in new_transitions:
+                    new_transitions[product_state_name] = {}
+                    queue.append(product_state)
+
+            if limits is not None:
+                limits.check("regex_shuffle", states=len(new_transitions))
+
+        self._initial_state = get_state_name(new_initial_state)
+        self._final_states = new_final_states
         self._transitions = new_transitions
 
 
@@ -768,6 +810,144 @@ def _handle_escape_sequences(char: str) -> str:
     return escape_map.get(char, char)
 
 
+def get_regex_input_symbols(
+    regex: str, input_symbols: Optional[AbstractSet[str]]
+) -> FrozenSet[str]:
+    """
+    Return the alphabet of the automata built from regexstr: the given input
+    symbols (or, if None, the non-reserved characters of the regex), along
+    with the characters of its character classes, escape sequences and
+    shorthand classes.
+    """
+    # Dictionary mapping shorthand character class markers to their character sets
+    shorthand_classes = {
+        "\\s": WHITESPACE_CHARS,
+        "\\S": NON_WHITESPACE_CHARS,
+        "\\d": DIGIT_CHARS,
+        "\\D": NON_DIGIT_CHARS,
+        "\\w": WORD_CHARS,
+        "\\W": NON_WORD_CHARS,
+    }
+
+    # Create a set for additional symbols from shorthand classes
+    additional_symbols: Set[str] = set()
+
+    # Check for shorthand classes in the regex
+    for marker, char_set in shorthand_classes.items():
+        if marker in regex:
+            additional_symbols.update(char_set)
+
+    # Extract escaped sequences from the regex
+    escape_chars = set()
+    i = 0
+    while i < len(regex):
+        if regex[i] == "\\" and i + 1 < len(regex):
+            # Skip shorthand classes
+            if regex[i + 1] in "sSwWdD":
+                i += 2
+                continue
+
+            escaped_char = _handle_escape_sequences(regex[i + 1])
+            escape_chars.add(escaped_char)
+            i += 2
+        else:
+            i += 1
+
+    class_symbols = set()
+    range_pattern = re.compile(r"\[([^\]]*)\]")
+    for match in range_pattern.finditer(regex):
+        class_content = match.group(1)
+        pos = 0
+        # Dictionary for shorthand class handling in character classes
+        shorthand_map = {
+            "s": WHITESPACE_CHARS,
+            "S": NON_WHITESPACE_CHARS,
+            "d": DIGIT_CHARS,
+            "D": NON_DIGIT_CHARS,
+            "w": WORD_CHARS,
+            "W": NON_WORD_CHARS,
+        }
+
+        while pos < len(class_content):
+            if class_content[pos] == "\\" and pos + 1 < len(class_content):
+                # Check for shorthand classes in character classes
+                if class_content[pos + 1] in shorthand_map:
+                    additional_symbols.update(shorthand_map[class_content[pos + 1]])
+                    pos += 2
+                    continue
+
+                # Handle escape sequence in character class
+                escaped_char = _handle_escape_sequences(class_content[pos + 1])
+                class_symbols.add(escaped_char)
+
+                # Check if this is part of a range
+                if (
+                    pos + 2 < len(class_content)
+                    and class_content[pos + 2] == "-"
+                    and pos + 3 < len(class_content)
+                ):
+                    # Handle range with escaped start character
+                    start_char = escaped_char
+
+                    # Check if end character is also escaped
+                    if class_content[pos + 3] == "\\" and pos + 4 < len(class_content):
+                        end_char = _handle_escape_sequences(class_content[pos + 4])
+                        pos += 5
+                    else:
+                        end_char = class_content[pos + 3]
+                        pos += 4
+
+                    # Add all characters in the range to input symbols
+                    for i in range(ord(start_char), ord(end_char) + 1):
+                        class_symbols.add(chr(i))
+                    continue
+
+                pos += 2
+            elif pos + 2 < len(class_content) and class_content[pos + 1] == "-":
+                # Handle normal range
+                start_char = class_content[pos]
+
+                if class_content[pos + 2] == "\\" and pos + 3 < len(class_content):
+                    end_char = _handle_escape_sequences(class_content[pos + 3])
+                    pos += 4
+                else:
+                    end_char = class_content[pos + 2]
+                    pos += 3
+
+                for i in range(ord(start_char), ord(end_char) + 1):
+                    class_symbols.add(chr(i))
+            else:
+                if class_content[pos] != "^":  # Skip negation symbol
+                    class_symbols.add(class_content[pos])
+                pos += 1
+
+    # Set up the final input symbols
+    if input_symbols is None:
+        # If no input_symbols provided, collect all non-reserved chars from regex
+        input_symbols_set = set()
+        for char in regex:
+            if char not in RESERVED_CHARACTERS:
+                input_symbols_set.add(char)
+
+        # Include all character class symbols and escape sequences
+        input_symbols_set.update(class_symbols)
+        input_symbols_set.update(escape_chars)
+
+        # Add the shorthand characters
+        input_symbols_set.update(additional_symbols)
+
+        return frozenset(input_symbols_set)
+    else:
+        # For user-provided input_symbols, we need to update
+        # with character class symbols and escape sequences
+        return (
+            frozenset(input_symbols)
+            .union(class_symbols)
+            .union(escape_chars)
+            .union(additional_symbols)
+        )
+
+
 def parse_regex(regexstr: str, input_symbols: AbstractSet[str]) -> NFARegexBuilder:
     """Return an NFARegexBuilder corresponding to regexstr."""
 
@@ -23,14 +23,31 @@
 This is similar to the Python `re` module, but this library does not support any special
 characters other than those given above. All regular languages can be written with
 these.
+
+Regular expressions that are used repeatedly can be compiled with `compile`, which
+keeps the most recently compiled regular expressions in a process-wide cache, so that
+their automata are only built once.
 """
 
 from itertools import count
-from typing import AbstractSet, Optional
+from random import Random
+from threading import Lock
+from typing import AbstractSet, Any, NoReturn, Optional, Set, Tuple
 
 import automata.base.exceptions as exceptions
+from automata.base.cache import CacheInfo, OperationCache
+from automata.fa.dfa import DFA
 from automata.fa.nfa import NFA
 from automata.regex.parser import RESERVED_CHARACTERS, get_regex_lexer, validate_tokens
+from automata.regex.syntax import RegexNode, parse_regex_ast
+
+# The maximum number of compiled regular expressions to keep
+_MAX_COMPILE_CACHE_SIZE = 4096
+
+_compile_cache = OperationCache(_MAX_COMPILE_CACHE_SIZE)
+# The regular expressions found valid by validate, most recently used last
+_validate_cache = OperationCache(_MAX_COMPILE_CACHE_SIZE)
+_compile_cache_lock = Lock()
 
 
 def _validate(regex: str) -> bool:
@@ -46,16 +63,24 @@ def _validate(regex: str) -> bool:
 
 def validate(regex: str) -> None:
     """
-    Raises an exception if the input regular expression is invalid.
+    Raises an exception if the input regular expression is invalid. Valid
+    regular expressions are cached alongside those compiled by `compile`,
+    so validating them again does not lex them again.
 
     Raises
     ------
     InvalidRegexError
         Raised if the regex given as input is not well defined.
     """
+    with _compile_cache_lock:
+        if _validate_cache.get(regex) is not None:
+            return
+
     input_symbols = set(regex) - RESERVED_CHARACTERS
 
     validate_tokens(get_regex_lexer(input_symbols, count(0)).lex(regex))
+    with _compile_cache_lock:
+        _validate_cache.setdefault(regex, True)
 
 
 def isequal(
@@ -80,8 +105,8 @@ def isequal(
         Whether the regular expressions are equivalent.
     """
 
-    nfa1 = NFA.from_regex(re1, input_symbols=input_symbols)
-    nfa2 = NFA.from_regex(re2, input_symbols=input_symbols)
+    nfa1 = compile(re1, input_symbols=input_symbols).nfa
+    nfa2 = compile(re2, input_symbols=input_symbols).nfa
 
     return nfa1 == nfa2
 
@@ -108,8 +133,8 @@ def issubset(
         True if re1 is a subset of re2.
     """
 
-    nfa1 = NFA.from_regex(re1, input_symbols=input_symbols)
-    nfa2 = NFA.from_regex(re2, input_symbols=input_symbols)
+    nfa1 = compile(re1, input_symbols=input_symbols).nfa
+    nfa2 = compile(re2, input_symbols=input_symbols).nfa
 
     return nfa1.union(nfa2) == nfa2
 
@@ -136,7 +161,295 @@ def issuperset(
         True if re1 is a superset of re2.
     """
 
-    nfa1 = NFA.from_regex(re1, input_symbols=input_symbols)
-    nfa2 = NFA.from_regex(re2, input_symbols=input_symbols)
+    nfa1 = compile(re1, input_symbols=input_symbols).nfa
+    nfa2 = compile(re2, input_symbols=input_symbols).nfa
 
     return nfa1.union(nfa2) == nfa1
+
+
+def random_regex(
+    n_symbols: int,
+    input_symbols: AbstractSet[str],
+    *,
+    seed: Optional[int] = None,
+    operators: str = "|*+?",
+    unary_probability: float = 0.3,
+) -> str:
+    """
+    Generates a random regular expression, for use in tests and benchmarks.
+
+    Parameters
+    ----------
+    n_symbols : int
+        The number of occurrences of input symbols in the regular expression,
+        which must be positive.
+    input_symbols : AbstractSet[str]
+        The set of input symbols to draw from.
+    seed : Optional[int], default: None
+        The random seed to use, for reproducible regular expressions.
+    operators : str, default: "|*+?"
+        The operators to use besides concatenation, among `|`, `&`, `^`, `*`,
+        `+` and `?`. Intersection and shuffle are excluded by default, since
+        their NFAs can be much larger than the regular expression.
+    unary_probability : float, default: 0.3
+        The probability of applying a unary operator to each subexpression,
+        if any unary operators are allowed.
+
+    Returns
+    ------
+    str
+        A random regular expression.
+
+    Raises
+    ------
+    ValueError
+        If an argument is invalid.
+    """
+    if n_symbols < 1:
+        raise ValueError("Number of symbols must be positive")
+    if not input_symbols or any(
+        len(symbol) != 1 or symbol in RESERVED_CHARACTERS for symbol in input_symbols
+    ):
+        raise ValueError("Input symbols must be unreserved single characters")
+    if set(operators) - set("|&^*+?"):
+        raise ValueError(f"Invalid operators {operators!r}")
+    if not 0 <= unary_probability <= 1:
+        raise ValueError("Unary probability must be between 0 and 1")
+
+    rng = Random(seed)
+    symbols = sorted(input_symbols)
+    binary_operators = ["", *(op for op in "|&^" if op in operators)]
+    unary_operators = [op for op in "*+?" if op in operators]
+
+    def generate(size: int) -> Tuple[str, str]:
+        """
+        Return a random regular expression with size symbols, along with its
+        top-level operator ("" for concatenation, or "a" for an atom).
+        """
+        if size == 1:
+            expression, operator = rng.choice(symbols), "a"
+        else:
+            operator = rng.choice(binary_operators)
+            left_size = rng.randint(1, size - 1)
+            operands = []
+            for operand, operand_operator in (
+                generate(left_size),
+                generate(size - left_size),
+            ):
+                # Concatenation binds tighter than the other binary operators,
+                # which all have the same precedence
+                if operand_operator not in ("a", operator) and (
+                    operator == "" or operand_operator != ""
+                ):
+                    operand = f"({operand})"
+                operands.append(operand)
+            expression = operator.join(operands)
+
+        if unary_operators and rng.random() < unary_probability:
+            if operator != "a":
+                expression = f"({expression})"
+            expression, operator = expression + rng.choice(unary_operators), "a"
+        return expression, operator
+
+    return generate(n_symbols)[0]
+
+
+class CompiledRegex:
+    """
+    A regular expression compiled to automata, as returned by `compile`. The
+    NFA is built when the regular expression is compiled, while the syntax
+    tree and the minimal DFA are only built when first needed. Compiled
+    regular expressions are immutable and can be shared freely.
+
+    Unlike the Python `re` module, matching methods return whether the input
+    matches rather than a match object.
+
+    Parameters
+    ----------
+    pattern : str
+        The regular expression as a string.
+    input_symbols : Optional[AbstractSet[str]], default: None
+        The set of input symbols of the automata, as in `NFA.from_regex`.
+    """
+
+    __slots__ = ("_pattern", "_nfa", "_ast", "_dfa")
+
+    _pattern: str
+    _nfa: NFA
+    _ast: Optional[RegexNode]
+    _dfa: Optional[DFA]
+
+    def __init__(
+        self, pattern: str, *, input_symbols: Optional[AbstractSet[str]] = None
+    ) -> None:
+        object.__setattr__(self, "_pattern", pattern)
+        object.__setattr__(
+            self, "_nfa", NFA.from_regex(pattern, input_symbols=input_symbols)
+        )
+        object.__setattr__(self, "_ast", None)
+        object.__setattr__(self, "_dfa", None)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        """Set custom setattr to make class immutable."""
+        raise AttributeError(f"This {type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Set custom delattr to make class immutable."""
+        raise AttributeError(f"This {type(self).__name__} is immutable")
+
+    @property
+    def pattern(self) -> str:
+        """The regular expression as a string."""
+        return self._pattern
+
+    @property
+    def nfa(self) -> NFA:
+        """The NFA accepting the language of the regular expression."""
+        return self._nfa
+
+    @property
+    def input_symbols(self) -> AbstractSet[str]:
+        """The input symbols of the automata of the regular expression."""
+        return self._nfa.input_symbols
+
+    @property
+    def ast(self) -> RegexNode:
+        """The syntax tree of the regular expression."""
+        ast = self._ast
+        if ast is None:
+            ast = parse_regex_ast(self._pattern)
+            object.__setattr__(self, "_ast", ast)
+        return ast
+
+    @property
+    def dfa(self) -> DFA:
+        """The minimal DFA accepting the language of the regular expression."""
+        dfa = self._dfa
+        if dfa is None:
+            dfa = DFA.from_nfa(self._nfa, minify=True)
+            object.__setattr__(self, "_dfa", dfa)
+        return dfa
+
+    def fullmatch(self, string: str) -> bool:
+        """
+        Return True if the whole string matches the regular expression.
+
+        Parameters
+        ----------
+        string : str
+            The string to match. Symbols outside of the input symbols never
+            match.
+
+        Returns
+        ------
+        bool
+            Whether the string is in the language of the regular expression.
+        """
+        dfa = self.dfa
+        transitions = dfa.transitions
+        state = dfa.initial_state
+        for symbol in string:
+            state = transitions[state].get(symbol)
+            if state is None:
+                return False
+        return state in dfa.final_states
+
+    def search(self, string: str) -> bool:
+        """
+        Return True if some substring of the string matches the regular
+        expression. The DFA is run from every position of the string at
+        once, so the string is read a single time.
+
+        Parameters
+        ----------
+        string : str
+            The string to search. Symbols outside of the input symbols may
+            occur outside of the matching substring.
+
+        Returns
+        ------
+        bool
+            Whether a substring is in the language of the regular expression.
+        """
+        dfa = self.dfa
+        transitions = dfa.transitions
+        initial_state = dfa.initial_state
+        final_states = dfa.final_states
+        if initial_state in final_states:
+            return True
+
+        states: Set = {initial_state}
+        for symbol in string:
+            next_states = {initial_state}
+            for state in states:
+                next_state = transitions[state].get(symbol)
+                if next_state is not None:
+                    if next_state in final_states:
+                        return True
+                    next_states.add(next_state)
+            states = next_states
+        return False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.pattern!r})"
+
+
+def compile(
+    pattern: str, *, input_symbols: Optional[AbstractSet[str]] = None
+) -> CompiledRegex:
+    """
+    Compile a regular expression, or return it from the cache if it was
+    compiled recently. The cache is shared by the whole process and keeps the
+    most recently used compiled regular expressions, keyed by the pattern
+    and the input symbols.
+
+    Parameters
+    ----------
+    pattern : str
+        The regular expression as a string.
+    input_symbols : Optional[AbstractSet[str]], default: None
+        The set of input symbols of the automata, as in `NFA.from_regex`.
+
+    Returns
+    ------
+    CompiledRegex
+        The compiled regular expression.
+
+    Raises
+    ------
+    InvalidRegexError
+        Raised if the regex given as input is not well defined.
+    """
+    key = (pattern, None if input_symbols is None else frozenset(input_symbols))
+    with _compile_cache_lock:
+        compiled = _compile_cache.get(key)
+    if compiled is not None:
+        return compiled
+
+    # Compile without holding the lock, so that other threads are not blocked
+    # by a slow miss. If another thread compiled the same key meanwhile, its
+    # result is kept.
+    compiled = CompiledRegex(pattern, input_symbols=input_symbols)
+    with _compile_cache_lock:
+        return _compile_cache.setdefault(key, compiled)
+
+
+def compile_cache_info() -> CacheInfo:
+    """
+    Return statistics describing the use of the cache of `compile`.
+
+    Returns
+    ------
+    CacheInfo
+        The hits, misses, evictions, maximum size and current size of the
+        cache.
+    """
+    with _compile_cache_lock:
+        return _compile_cache.cache_info()
+
+
+def purge() -> None:
+    """Clear the caches of compiled and validated regular expressions."""
+    with _compile_cache_lock:
+        _compile_cache.clear()
+        _validate_cache.clear()
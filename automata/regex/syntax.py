@@ -0,0 +1,192 @@
+"""Classes and methods for parsing regexes into abstract syntax trees."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import count
+from typing import AbstractSet, FrozenSet, List, Optional, Tuple
+
+import automata.base.exceptions as exceptions
+from automata.regex.lexer import Token
+from automata.regex.parser import (
+    DIGIT_CHARS,
+    WHITESPACE_CHARS,
+    WORD_CHARS,
+    CharacterClassToken,
+    ConcatToken,
+    IntersectionToken,
+    KleenePlusToken,
+    KleeneStarToken,
+    OptionToken,
+    QuantifierToken,
+    ShuffleToken,
+    StringToken,
+    UnionToken,
+    WildcardToken,
+    add_concat_and_empty_string_tokens,
+    get_regex_lexer,
+)
+from automata.regex.postfix import tokens_to_postfix, validate_tokens
+
+# The character sets matched by each wildcard token, as (chars, negated) pairs
+WILDCARD_CHAR_SETS = {
+    ".": (frozenset(), True),
+    "\\s": (WHITESPACE_CHARS, False),
+    "\\S": (WHITESPACE_CHARS, True),
+    "\\d": (DIGIT_CHARS, False),
+    "\\D": (DIGIT_CHARS, True),
+    "\\w": (WORD_CHARS, False),
+    "\\W": (WORD_CHARS, True),
+}
+
+
+class RegexNode:
+    """Base class for the nodes of a regex syntax tree."""
+
+    __slots__: Tuple[str, ...] = tuple()
+
+
+@dataclass(frozen=True)
+class EmptyString(RegexNode):
+    """A node matching only the empty string."""
+
+    __slots__ = ()
+
+
+@dataclass(frozen=True)
+class CharSet(RegexNode):
+    """
+    A node matching any single character in chars, or any single character
+    not in chars if negated is True. Literals, wildcards, shorthand classes and
+    bracketed character classes are all represented this way, independently
+    of the alphabet.
+    """
+
+    __slots__ = ("chars", "negated")
+
+    chars: FrozenSet[str]
+    negated: bool
+
+    def resolve(self, input_symbols: AbstractSet[str]) -> FrozenSet[str]:
+        """Return the characters matched by this node within the alphabet."""
+        if self.negated:
+            return frozenset(input_symbols) - self.chars
+        return self.chars
+
+
+@dataclass(frozen=True)
+class Concat(RegexNode):
+    """A node matching the concatenation of two expressions."""
+
+    __slots__ = ("left", "right")
+
+    left: RegexNode
+    right: RegexNode
+
+
+@dataclass(frozen=True)
+class Union(RegexNode):
+    """A node matching either of two expressions."""
+
+    __slots__ = ("left", "right")
+
+    left: RegexNode
+    right: RegexNode
+
+
+@dataclass(frozen=True)
+class Intersection(RegexNode):
+    """A node matching both of two expressions."""
+
+    __slots__ = ("left", "right")
+
+    left: RegexNode
+    right: RegexNode
+
+
+@dataclass(frozen=True)
+class Shuffle(RegexNode):
+    """A node matching the shuffle (interleaving) of two expressions."""
+
+    __slots__ = ("left", "right")
+
+    left: RegexNode
+    right: RegexNode
+
+
+@dataclass(frozen=True)
+class Repeat(RegexNode):
+    """
+    A node matching between lower_bound and upper_bound repetitions of an
+    expression. If upper_bound is None, the number of repetitions is unbounded.
+    """
+
+    __slots__ = ("node", "lower_bound", "upper_bound")
+
+    node: RegexNode
+    lower_bound: int
+    upper_bound: Optional[int]
+
+
+def _string_to_node(text: str) -> RegexNode:
+    """Return the node matching exactly the given string literal."""
+    if not text:
+        return EmptyString()
+
+    node: RegexNode = CharSet(frozenset(text[0]), False)
+    for symbol in text[1:]:
+        node = Concat(node, CharSet(frozenset(symbol), False))
+    return node
+
+
+def parse_regex_ast(regexstr: str) -> RegexNode:
+    """
+    Return the syntax tree corresponding to regexstr. Unlike `parse_regex`,
+    the tree does not depend on an alphabet, so wildcards and negated classes
+    are kept symbolic.
+    """
+    if len(regexstr) == 0:
+        return EmptyString()
+
+    state_name_counter = count(0)
+
+    lexer = get_regex_lexer(frozenset(), state_name_counter)
+    lexed_tokens = lexer.lex(regexstr)
+    validate_tokens(lexed_tokens)
+    tokens_with_concats = add_concat_and_empty_string_tokens(
+        lexed_tokens, state_name_counter
+    )
+    postfix: List[Token] = tokens_to_postfix(tokens_with_concats)
+
+    stack: List[RegexNode] = []
+    for token in postfix:
+        if isinstance(token, StringToken):
+            stack.append(_string_to_node(token.text))
+        elif isinstance(token, CharacterClassToken):
+            stack.append(CharSet(frozenset(token.class_chars), token.negated))
+        elif isinstance(token, WildcardToken):
+            chars, negated = WILDCARD_CHAR_SETS[token.text]
+            stack.append(CharSet(chars, negated))
+        elif isinstance(token, KleeneStarToken):
+            stack.append(Repeat(stack.pop(), 0, None))
+        elif isinstance(token, KleenePlusToken):
+            stack.append(Repeat(stack.pop(), 1, None))
+        elif isinstance(token, OptionToken):
+            stack.append(Repeat(stack.pop(), 0, 1))
+        elif isinstance(token, QuantifierToken):
+            stack.append(Repeat(stack.pop(), token.lower_bound, token.upper_bound))
+        else:
+            right = stack.pop()
+            left = stack.pop()
+            if isinstance(token, ConcatToken):
+                stack.append(Concat(left, right))
+            elif isinstance(token, UnionToken):
+                stack.append(Union(left, right))
+            elif isinstance(token, IntersectionToken):
+                stack.append(Intersection(left, right))
+            elif isinstance(token, ShuffleToken):
+                stack.append(Shuffle(left, right))
+            else:
+                raise exceptions.InvalidRegexError(f"Invalid token type {type(token)}")
+
+    return stack[0]
@@ -1,6 +1,18 @@
 """Classes and methods for working with deterministic Turing machines."""
 
-from typing import AbstractSet, Generator, Mapping, Optional, Tuple
+from random import Random
+from typing import (
+    AbstractSet,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from typing_extensions import Self
 
 import automata.base.exceptions as exceptions
 import automata.tm.exceptions as tm_exceptions
@@ -109,6 +121,89 @@ def __init__(
             final_states=final_states,
         )
 
+    @classmethod
+    def random(
+        cls: Type[Self],
+        n_states: int,
+        input_symbols: AbstractSet[str],
+        *,
+        seed: Optional[int] = None,
+        density: float = 0.8,
+        blank_symbol: str = ".",
+    ) -> Self:
+        """
+        Generates a random DTM whose states are all reachable from the
+        initial state. The states are the integers 0 to n_states - 1, with 0
+        as the initial state and n_states - 1 as the only final state. The
+        tape symbols are the input symbols and the blank symbol.
+
+        Parameters
+        ----------
+        n_states : int
+            The number of states, which must be at least 2.
+        input_symbols : AbstractSet[str]
+            The set of input symbols to construct the DTM over.
+        seed : Optional[int], default: None
+            The random seed to use, for reproducible DTMs.
+        density : float, default: 0.8
+            The probability of a transition being defined for each nonfinal
+            state and tape symbol, in addition to those of a random spanning
+            tree which makes every state reachable.
+        blank_symbol : str, default: "."
+            The blank symbol, which must not be an input symbol.
+
+        Returns
+        ------
+        Self
+            A random DTM.
+        """
+        if n_states < 2:
+            raise ValueError("Number of states must be at least 2")
+        if blank_symbol in input_symbols:
+            raise ValueError("Blank symbol must not be an input symbol")
+        if not 0 <= density <= 1:
+            raise ValueError("Density must be between 0 and 1")
+
+        rng = Random(seed)
+        tape_symbols = sorted(input_symbols | {blank_symbol})
+        directions: Tuple[tm.TMDirectionT, ...] = ("L", "R", "N")
+        transitions: Dict[DTMStateT, Dict[str, DTMPathResultT]] = {
+            state: {} for state in range(n_states - 1)
+        }
+
+        def random_result(state: DTMStateT) -> DTMPathResultT:
+            return (state, rng.choice(tape_symbols), rng.choice(directions))
+
+        # Connect each state to a random transition of a previous state. Every
+        # nonfinal state has at least two tape symbols, so a free transition
+        # always remains.
+        free_transitions: List[Tuple[DTMStateT, str]] = []
+        for state in range(n_states):
+            if state > 0:
+                index = rng.randrange(len(free_transitions))
+                free_transitions[index], free_transitions[-1] = (
+                    free_transitions[-1],
+                    free_transitions[index],
+                )
+                parent, symbol = free_transitions.pop()
+                transitions[parent][symbol] = random_result(state)
+            if state < n_states - 1:
+                free_transitions.extend((state, symbol) for symbol in tape_symbols)
+
+        for state, symbol in free_transitions:
+            if rng.random() < density:
+                transitions[state][symbol] = random_result(rng.randrange(n_states))
+
+        return cls(
+            states=set(range(n_states)),
+            input_symbols=input_symbols,
+            tape_symbols=set(tape_symbols),
+            transitions=transitions,
+            initial_state=0,
+            blank_symbol=blank_symbol,
+            final_states={n_states - 1},
+        )
+
     def _validate_transition_state(self, transition_state: DTMStateT) -> None:
         if transition_state not in self.states:
             raise exceptions.InvalidStateError(
@@ -5,6 +5,8 @@
 import automata.base.exceptions as exceptions
 import automata.tm.exceptions as tm_exceptions
 import automata.tm.tm as tm
+from automata.base.instrumentation import get_stats_collector
+from automata.base.limits import get_resource_limits
 from automata.tm.configuration import TMConfiguration
 from automata.tm.tape import TMTape
 
@@ -253,6 +255,9 @@ def read_input_stepwise(
 
         # The initial state cannot be a final state for a NTM, so the first
         # iteration is always guaranteed to run (as it should)
+        stats = get_stats_collector()
+        limits = get_resource_limits()
+        steps = 0
         while current_configurations:
             new_configurations = set()
             for config in current_configurations:
@@ -261,6 +266,14 @@ def read_input_stepwise(
                     return
                 new_configurations.update(self._get_next_configurations(config))
             current_configurations = new_configurations
+            if stats is not None:
+                stats.increment("ntm.steps")
+                stats.record_max("ntm.frontier", len(current_configurations))
+            if limits is not None:
+                steps += 1
+                limits.check(
+                    "ntm", steps=steps, configurations=len(current_configurations)
+                )
             yield current_configurations
 
         raise exceptions.RejectionException(
@@ -0,0 +1,86 @@
+"""
+Run the benchmark suite.
+
+Usage examples:
+
+    python -m benchmarks                      # run all benchmarks
+    python -m benchmarks --quick fa. regex.   # run a subset on small inputs
+    python -m benchmarks --save .benchmarks/main.json
+    python -m benchmarks --compare .benchmarks/main.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Import the benchmark modules so that their benchmarks are registered
+import benchmarks.bench_enumeration  # noqa: F401
+import benchmarks.bench_fa  # noqa: F401
+import benchmarks.bench_machines  # noqa: F401
+import benchmarks.bench_regex  # noqa: F401
+from benchmarks.harness import (
+    format_report,
+    get_benchmarks,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run the automata benchmarks."
+    )
+    parser.add_argument(
+        "patterns",
+        nargs="*",
+        help="only run benchmarks whose names contain one of these patterns",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="only run the smallest input sizes"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of measurements per size"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="minimum duration of each measurement, in seconds",
+    )
+    parser.add_argument("--save", type=Path, help="save the results to a JSON file")
+    parser.add_argument(
+        "--compare", type=Path, help="compare against results saved with --save"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list the benchmarks and exit"
+    )
+    args = parser.parse_args(argv)
+
+    selected = get_benchmarks(args.patterns)
+    if args.list:
+        for bench in selected:
+            print(f"{bench.name:<40} sizes={list(bench.sizes)}")
+        return 0
+    if not selected:
+        print("No benchmarks match the given patterns", file=sys.stderr)
+        return 1
+
+    baseline = load_results(args.compare) if args.compare else None
+    results = run_benchmarks(
+        selected, quick=args.quick, repeat=args.repeat, min_time=args.min_time
+    )
+    print()
+    print("\n".join(format_report(results, baseline)))
+
+    if args.save:
+        save_results(args.save, results)
+        print(f"\nSaved results to {args.save}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
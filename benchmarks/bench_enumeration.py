@@ -0,0 +1,57 @@
+"""Benchmarks for enumerating and counting the words accepted by DFAs."""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import Callable
+
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+from benchmarks import workloads
+from benchmarks.harness import benchmark
+
+
+@benchmark("enumeration.count_words_of_length", sizes=(10, 100, 1_000))
+def count_words_of_length(n: int) -> Callable[[], object]:
+    dfa = workloads.random_dfa(200)
+
+    def count() -> int:
+        # Clear cached counts so that each call does the full computation
+        dfa.clear_cache()
+        return dfa.count_words_of_length(n)
+
+    return count
+
+
+@benchmark("enumeration.words_of_length", sizes=(10, 100, 1_000))
+def words_of_length(n: int) -> Callable[[], object]:
+    # Accepts exactly n + 1 words of length n
+    dfa = DFA.from_nfa(NFA.from_regex("0*1*"))
+
+    def enumerate_words() -> object:
+        dfa.clear_cache()
+        return list(dfa.words_of_length(n))
+
+    return enumerate_words
+
+
+@benchmark("enumeration.iterate", sizes=(10, 100, 1_000, 10_000))
+def iterate(n: int) -> Callable[[], object]:
+    dfa = workloads.random_dfa(100)
+
+    def iterate_words() -> object:
+        dfa.clear_cache()
+        return list(islice(dfa, n))
+
+    return iterate_words
+
+
+@benchmark("enumeration.finite_language", sizes=(10, 100, 1_000, 10_000))
+def finite_language(n: int) -> Callable[[], object]:
+    language = set(workloads.random_words(workloads.BINARY, 16, n))
+
+    def build_and_count() -> int:
+        dfa = DFA.from_finite_language(workloads.BINARY, language)
+        return dfa.cardinality()
+
+    return build_and_count
@@ -0,0 +1,125 @@
+"""Benchmarks for DFA/NFA membership, minimization and constructions."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+from benchmarks import workloads
+from benchmarks.harness import benchmark
+
+
+@benchmark("fa.dfa_accepts_input", sizes=(100, 1_000, 10_000, 100_000))
+def dfa_accepts_input(n: int) -> Callable[[], object]:
+    dfa = workloads.random_dfa(1_000)
+    (word,) = workloads.random_words(dfa.input_symbols, n, 1)
+    return lambda: dfa.accepts_input(word)
+
+
+@benchmark("fa.dfa_accepts_batch", sizes=(10, 100, 1_000, 10_000))
+def dfa_accepts_batch(n: int) -> Callable[[], object]:
+    dfa = workloads.random_dfa(1_000)
+    words = workloads.random_words(dfa.input_symbols, 32, n)
+    return lambda: [dfa.accepts_input(word) for word in words]
+
+
+@benchmark("fa.nfa_accepts_input", sizes=(10, 100, 1_000, 3_000))
+def nfa_accepts_input(n: int) -> Callable[[], object]:
+    nfa = workloads.random_nfa(200, density=1.5)
+    (word,) = workloads.random_words(nfa.input_symbols, n, 1)
+    return lambda: nfa.accepts_input(word)
+
+
+@benchmark("fa.nfa_accepts_batch", sizes=(10, 30, 100, 300))
+def nfa_accepts_batch(n: int) -> Callable[[], object]:
+    nfa = workloads.random_nfa(200, density=1.5)
+    words = workloads.random_words(nfa.input_symbols, 32, n)
+    return lambda: [nfa.accepts_input(word) for word in words]
+
+
+@benchmark("fa.random_dfa_uniform", sizes=(1_000, 3_000, 10_000, 30_000))
+def random_dfa_uniform(n: int) -> Callable[[], object]:
+    return lambda: DFA.random(n, workloads.BINARY, seed=0)
+
+
+@benchmark("fa.random_dfa_fast", sizes=(10_000, 100_000, 1_000_000))
+def random_dfa_fast(n: int) -> Callable[[], object]:
+    return lambda: DFA.random(n, workloads.BINARY, seed=0, uniform=False)
+
+
+@benchmark("fa.random_nfa", sizes=(10_000, 100_000, 1_000_000))
+def random_nfa(n: int) -> Callable[[], object]:
+    return lambda: NFA.random(n, workloads.BINARY, seed=0)
+
+
+@benchmark("fa.minify_random", sizes=(100, 1_000, 10_000, 50_000))
+def minify_random(n: int) -> Callable[[], object]:
+    dfa = workloads.random_dfa(n)
+    return lambda: dfa.minify()
+
+
+@benchmark("fa.minify_structured", sizes=(64, 256, 1_024, 4_096))
+def minify_structured(n: int) -> Callable[[], object]:
+    # The product of two nth_from_end DFAs, which has redundant states
+    dfa = DFA.nth_from_end(workloads.BINARY, "1", n.bit_length() - 1)
+    product_dfa = dfa.union(DFA.nth_from_end(workloads.BINARY, "1", 2), minify=False)
+    return lambda: product_dfa.minify()
+
+
+@benchmark("fa.union", sizes=(10, 30, 100, 300))
+def union(n: int) -> Callable[[], object]:
+    dfa = workloads.random_dfa(n, seed=1)
+    other_dfa = workloads.random_dfa(n, seed=2)
+    return lambda: dfa.union(other_dfa, minify=False)
+
+
+@benchmark("fa.intersection", sizes=(10, 30, 100, 300))
+def intersection(n: int) -> Callable[[], object]:
+    dfa = workloads.random_dfa(n, seed=1)
+    other_dfa = workloads.random_dfa(n, seed=2)
+    return lambda: dfa.intersection(other_dfa, minify=False)
+
+
+@benchmark("fa.difference_minify", sizes=(10, 30, 100))
+def difference_minify(n: int) -> Callable[[], object]:
+    dfa = workloads.random_dfa(n, seed=1)
+    other_dfa = workloads.random_dfa(n, seed=2)
+    return lambda: dfa.difference(other_dfa)
+
+
+@benchmark("fa.issubset", sizes=(10, 30, 100, 300))
+def issubset(n: int) -> Callable[[], object]:
+    # A subset check that succeeds, so the whole product is explored
+    dfa = workloads.random_dfa(n, seed=1)
+    superset_dfa = dfa.union(workloads.random_dfa(n, seed=2))
+    return lambda: dfa.issubset(superset_dfa)
+
+
+@benchmark("fa.from_nfa_random", sizes=(10, 30, 100))
+def from_nfa_random(n: int) -> Callable[[], object]:
+    nfa = workloads.random_nfa(n, density=1.5)
+    return lambda: DFA.from_nfa(nfa, minify=False)
+
+
+@benchmark("fa.from_nfa_nth_from_end", sizes=(64, 256, 1_024, 4_096))
+def from_nfa_nth_from_end(n: int) -> Callable[[], object]:
+    # The minimal DFA has n states
+    nfa = workloads.nth_from_end_nfa(n.bit_length() - 1)
+    return lambda: DFA.from_nfa(nfa)
+
+
+@benchmark("fa.nfa_right_quotient", sizes=(10, 30, 100))
+def nfa_right_quotient(n: int) -> Callable[[], object]:
+    # Only the states of the loop of nfa read a suffix in other_nfa
+    nfa = NFA.from_regex(f"(01){{{n}}}(2|3)*")
+    other_nfa = NFA.from_regex(f"(23){{{n}}}")
+    return lambda: nfa.right_quotient(other_nfa)
+
+
+@benchmark("fa.nfa_left_quotient", sizes=(10, 30, 100))
+def nfa_left_quotient(n: int) -> Callable[[], object]:
+    # Only the states of the loop of nfa read a prefix in other_nfa
+    nfa = NFA.from_regex(f"(2|3)*(01){{{n}}}")
+    other_nfa = NFA.from_regex(f"(23){{{n}}}")
+    return lambda: nfa.left_quotient(other_nfa)
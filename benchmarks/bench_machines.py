@@ -0,0 +1,44 @@
+"""Benchmarks for simulating pushdown automata and Turing machines."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from benchmarks import workloads
+from benchmarks.harness import benchmark
+
+
+@benchmark("machines.dpda", sizes=(10, 100, 1_000, 10_000))
+def dpda(n: int) -> Callable[[], object]:
+    automaton = workloads.balanced_dpda()
+    word = "a" * n + "b" * n
+    return lambda: automaton.accepts_input(word)
+
+
+@benchmark("machines.npda", sizes=(10, 30, 100, 300))
+def npda(n: int) -> Callable[[], object]:
+    automaton = workloads.palindrome_npda()
+    (half,) = workloads.random_words({"a", "b"}, n, 1)
+    word = half + half[::-1]
+    return lambda: automaton.accepts_input(word)
+
+
+@benchmark("machines.dtm", sizes=(10, 30, 100, 200))
+def dtm(n: int) -> Callable[[], object]:
+    automaton = workloads.balanced_dtm()
+    word = "0" * n + "1" * n
+    return lambda: automaton.accepts_input(word)
+
+
+@benchmark("machines.ntm", sizes=(10, 100, 1_000))
+def ntm(n: int) -> Callable[[], object]:
+    automaton = workloads.guessing_ntm()
+    word = "10" * n + "11"
+    return lambda: automaton.accepts_input(word)
+
+
+@benchmark("machines.mntm", sizes=(10, 100, 1_000))
+def mntm(n: int) -> Callable[[], object]:
+    automaton = workloads.copying_mntm()
+    (word,) = workloads.random_words(workloads.BINARY, n, 1)
+    return lambda: automaton.accepts_input(word)
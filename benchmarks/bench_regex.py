@@ -0,0 +1,205 @@
+"""Benchmarks for converting between regular expressions and automata."""
+
+from __future__ import annotations
+
+from itertools import cycle, islice
+from typing import Callable
+
+from automata.fa.dfa import DFA
+from automata.fa.gnfa import GNFA
+from automata.fa.lazy import LazyDerivativeDFA
+from automata.fa.nfa import NFA
+from automata.fa.product import ProductView
+from automata.regex import regex
+from benchmarks import workloads
+from benchmarks.harness import benchmark
+
+
+@benchmark("regex.from_regex_real_world", sizes=(1, 4, 16, 64))
+def from_regex_real_world(n: int) -> Callable[[], object]:
+    # The union of n real-world patterns
+    patterns = islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n)
+    regex = "|".join(f"({pattern})" for pattern in patterns)
+    return lambda: NFA.from_regex(regex)
+
+
+@benchmark("regex.from_regex_repeated", sizes=(1, 4, 16, 64))
+def from_regex_repeated(n: int) -> Callable[[], object]:
+    # Matching n real-world patterns, rebuilding their automata every time
+    patterns = list(islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n))
+    return lambda: [NFA.from_regex(pattern).accepts_input("") for pattern in patterns]
+
+
+@benchmark("regex.compile_repeated", sizes=(1, 4, 16, 64))
+def compile_repeated(n: int) -> Callable[[], object]:
+    # Matching n real-world patterns compiled in an earlier call
+    patterns = list(islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n))
+    for pattern in patterns:
+        regex.compile(pattern).fullmatch("")
+    return lambda: [regex.compile(pattern).fullmatch("") for pattern in patterns]
+
+
+@benchmark("regex.from_regex_glushkov_real_world", sizes=(1, 4, 16, 64))
+def from_regex_glushkov_real_world(n: int) -> Callable[[], object]:
+    patterns = islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n)
+    regex = "|".join(f"({pattern})" for pattern in patterns)
+    return lambda: NFA.from_regex(regex, construction="glushkov")
+
+
+@benchmark("regex.from_regex_antimirov_real_world", sizes=(1, 4, 16, 64))
+def from_regex_antimirov_real_world(n: int) -> Callable[[], object]:
+    patterns = islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n)
+    regex = "|".join(f"({pattern})" for pattern in patterns)
+    return lambda: NFA.from_regex(regex, construction="antimirov")
+
+
+@benchmark("regex.thompson_to_dfa", sizes=(4, 8, 12))
+def thompson_to_dfa(n: int) -> Callable[[], object]:
+    regex = f"(a|b)*a(a|b){{{n}}}"
+    return lambda: DFA.from_nfa(NFA.from_regex(regex))
+
+
+@benchmark("regex.lambda_closures_real_world", sizes=(1, 4, 16, 64))
+def lambda_closures_real_world(n: int) -> Callable[[], object]:
+    # The Thompson NFA of the union of n real-world patterns, copied without
+    # its cached closures
+    patterns = islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n)
+    nfa = NFA.from_regex("|".join(f"({pattern})" for pattern in patterns))
+
+    def get_lambda_closures() -> object:
+        nfa_copy = NFA._from_trusted(**nfa.input_parameters)
+        return nfa_copy._get_lambda_closures()
+
+    return get_lambda_closures
+
+
+@benchmark("regex.eliminate_lambda_real_world", sizes=(1, 4, 16, 64))
+def eliminate_lambda_real_world(n: int) -> Callable[[], object]:
+    # The Thompson NFA of the union of n real-world patterns
+    patterns = islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n)
+    nfa = NFA.from_regex("|".join(f"({pattern})" for pattern in patterns))
+    return nfa.eliminate_lambda
+
+
+@benchmark("regex.reduce_real_world", sizes=(1, 4, 16, 64))
+def reduce_real_world(n: int) -> Callable[[], object]:
+    # The Thompson NFA of the union of n real-world patterns
+    patterns = islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n)
+    nfa = NFA.from_regex("|".join(f"({pattern})" for pattern in patterns))
+    return nfa.reduce
+
+
+@benchmark("regex.subset_construction_real_world", sizes=(1, 4, 16, 64))
+def subset_construction_real_world(n: int) -> Callable[[], object]:
+    # The Thompson NFA of the union of n real-world patterns
+    patterns = islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n)
+    nfa = NFA.from_regex("|".join(f"({pattern})" for pattern in patterns))
+    return lambda: DFA.from_nfa(nfa, minify=False)
+
+
+@benchmark("regex.glushkov_to_dfa", sizes=(4, 8, 12))
+def glushkov_to_dfa(n: int) -> Callable[[], object]:
+    regex = f"(a|b)*a(a|b){{{n}}}"
+    return lambda: DFA.from_nfa(NFA.from_regex(regex, construction="glushkov"))
+
+
+@benchmark("regex.antimirov_to_dfa", sizes=(4, 8, 12))
+def antimirov_to_dfa(n: int) -> Callable[[], object]:
+    regex = f"(a|b)*a(a|b){{{n}}}"
+    return lambda: DFA.from_nfa(NFA.from_regex(regex, construction="antimirov"))
+
+
+@benchmark("regex.from_regex_quantifier", sizes=(10, 100, 1_000))
+def from_regex_quantifier(n: int) -> Callable[[], object]:
+    regex = f"(a|b)*a(a|b){{{n}}}"
+    return lambda: NFA.from_regex(regex)
+
+
+@benchmark("regex.from_regex_intersection", sizes=(2, 4, 8, 16))
+def from_regex_intersection(n: int) -> Callable[[], object]:
+    regex = f"(a|b)*a(a|b){{{n}}}&(a|b)*b(a|b){{{n}}}"
+    return lambda: NFA.from_regex(regex)
+
+
+@benchmark("regex.from_regex_intersection_antimirov", sizes=(2, 4, 8, 16))
+def from_regex_intersection_antimirov(n: int) -> Callable[[], object]:
+    regex = f"(a|b)*a(a|b){{{n}}}&(a|b)*b(a|b){{{n}}}"
+    return lambda: NFA.from_regex(regex, construction="antimirov")
+
+
+@benchmark("regex.nfa_to_dfa_intersection", sizes=(2, 4, 6, 8))
+def nfa_to_dfa_intersection(n: int) -> Callable[[], object]:
+    regex = f"(a|b)*a(a|b){{{n}}}&(a|b)*b(a|b){{{n}}}"
+    return lambda: DFA.from_nfa(NFA.from_regex(regex))
+
+
+@benchmark("regex.dfa_from_regex_intersection", sizes=(2, 4, 6, 8))
+def dfa_from_regex_intersection(n: int) -> Callable[[], object]:
+    regex = f"(a|b)*a(a|b){{{n}}}&(a|b)*b(a|b){{{n}}}"
+    return lambda: DFA.from_regex(regex)
+
+
+@benchmark("regex.intersection_isempty", sizes=(1, 4, 16, 64))
+def intersection_isempty(n: int) -> Callable[[], object]:
+    # Whether the union of n real-world patterns overlaps with a date pattern,
+    # by building the product NFA and determinizing it
+    patterns = islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n)
+    nfa = NFA.from_regex("|".join(f"({pattern})" for pattern in patterns))
+    other_nfa = NFA.from_regex(
+        "[0-9]{4}-[0-9]{2}-[0-9]{2}", input_symbols=nfa.input_symbols
+    )
+
+    def isempty() -> object:
+        product_dfa = DFA.from_nfa(nfa.intersection(other_nfa))
+        return product_dfa.isempty()
+
+    return isempty
+
+
+@benchmark("regex.product_view_isempty", sizes=(1, 4, 16, 64))
+def product_view_isempty(n: int) -> Callable[[], object]:
+    # The same check, exploring the product lazily
+    patterns = islice(cycle(workloads.REAL_WORLD_REGEXES.values()), n)
+    nfa = NFA.from_regex("|".join(f"({pattern})" for pattern in patterns))
+    other_nfa = NFA.from_regex(
+        "[0-9]{4}-[0-9]{2}-[0-9]{2}", input_symbols=nfa.input_symbols
+    )
+    return lambda: ProductView(nfa, other_nfa).isempty()
+
+
+@benchmark("regex.to_regex", sizes=(4, 8, 16, 32))
+def to_regex(n: int) -> Callable[[], object]:
+    gnfa = GNFA.from_dfa(workloads.random_dfa(n))
+    return lambda: gnfa.to_regex()
+
+
+@benchmark("regex.lazy_dfa_match", sizes=(10, 100, 1_000, 10_000))
+def lazy_dfa_match(n: int) -> Callable[[], object]:
+    # Matching n words against the union of the real-world patterns, whose
+    # DFA is built lazily by the first words
+    regex = "|".join(
+        f"({pattern})" for pattern in workloads.REAL_WORLD_REGEXES.values()
+    )
+    nfa = NFA.from_regex(regex)
+    words = workloads.random_words(nfa.input_symbols, 16, n)
+
+    def match() -> object:
+        lazy_dfa = nfa.to_lazy_dfa()
+        return [lazy_dfa.accepts_input(word) for word in words]
+
+    return match
+
+
+@benchmark("regex.lazy_derivative_dfa_match", sizes=(10, 100, 1_000, 10_000))
+def lazy_derivative_dfa_match(n: int) -> Callable[[], object]:
+    regex = "|".join(
+        f"({pattern})" for pattern in workloads.REAL_WORLD_REGEXES.values()
+    )
+    input_symbols = NFA.from_regex(regex).input_symbols
+    words = workloads.random_words(input_symbols, 16, n)
+
+    def match() -> object:
+        lazy_dfa = LazyDerivativeDFA(regex)
+        return [lazy_dfa.accepts_input(word) for word in words]
+
+    return match
@@ -0,0 +1,212 @@
+"""
+A small, dependency-free benchmark harness. Benchmarks are registered with the
+`benchmark` decorator and run over a range of input sizes, so that each one
+produces a scaling curve rather than a single number. Results can be saved as
+JSON and compared against the results of another commit.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# A benchmark receives an input size, performs any setup, and returns the
+# zero-argument function to time
+BenchmarkFnT = Callable[[int], Callable[[], object]]
+
+# Maps benchmark names to a mapping from input sizes (as strings, for JSON) to
+# timing statistics
+ResultsT = Dict[str, Dict[str, Dict[str, float]]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A registered benchmark, timed once for each of its input sizes."""
+
+    name: str
+    sizes: Tuple[int, ...]
+    quick_sizes: Tuple[int, ...]
+    function: BenchmarkFnT
+
+
+_REGISTRY: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, sizes: Sequence[int], quick_sizes: Optional[Sequence[int]] = None
+) -> Callable[[BenchmarkFnT], BenchmarkFnT]:
+    """
+    Register a benchmark under the given name.
+
+    Parameters
+    ----------
+    name : str
+        The name of the benchmark, conventionally "<area>.<operation>".
+    sizes : Sequence[int]
+        The input sizes to run the benchmark with.
+    quick_sizes : Optional[Sequence[int]], default: None
+        The input sizes to run in quick mode. Defaults to the two smallest
+        sizes.
+    """
+
+    def decorator(function: BenchmarkFnT) -> BenchmarkFnT:
+        if name in _REGISTRY:
+            raise ValueError(f"benchmark {name!r} is already registered")
+        sorted_sizes = tuple(sorted(sizes))
+        _REGISTRY[name] = Benchmark(
+            name,
+            sorted_sizes,
+            tuple(sorted(quick_sizes)) if quick_sizes else sorted_sizes[:2],
+            function,
+        )
+        return function
+
+    return decorator
+
+
+def get_benchmarks(patterns: Sequence[str] = ()) -> List[Benchmark]:
+    """Return the registered benchmarks whose names contain any pattern."""
+    return [
+        bench
+        for name, bench in sorted(_REGISTRY.items())
+        if not patterns or any(pattern in name for pattern in patterns)
+    ]
+
+
+def time_function(
+    function: Callable[[], object], repeat: int, min_time: float
+) -> Dict[str, float]:
+    """
+    Time a function, calling it enough times per measurement to take at least
+    min_time seconds, and return per-call statistics in seconds.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 2 if elapsed == 0 else max(2, math.ceil(min_time / elapsed))
+
+    times = [elapsed / number] + [
+        timer.timeit(number) / number for _ in range(repeat - 1)
+    ]
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def scaling_exponent(sizes: Sequence[int], times: Sequence[float]) -> Optional[float]:
+    """
+    Return the slope of the least-squares fit of log(time) against
+    log(size), which estimates k for a running time of O(n^k).
+    """
+    points = [
+        (math.log(size), math.log(time))
+        for size, time in zip(sizes, times)
+        if size > 0 and time > 0
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return covariance / variance
+
+
+def run_benchmarks(
+    benchmarks: Sequence[Benchmark],
+    *,
+    quick: bool = False,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    log: Callable[[str], None] = print,
+) -> ResultsT:
+    """Run the given benchmarks over their input sizes and return the results."""
+    results: ResultsT = {}
+    for bench in benchmarks:
+        results[bench.name] = {}
+        for size in bench.quick_sizes if quick else bench.sizes:
+            function = bench.function(size)
+            timing = time_function(function, repeat, min_time)
+            results[bench.name][str(size)] = timing
+            log(f"{bench.name:<40} n={size:<10} {format_time(timing['min'])}")
+    return results
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with an appropriate unit."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f} {unit}"
+    return f"{seconds / 1e-9:8.3f} ns"
+
+
+def format_report(results: ResultsT, baseline: Optional[ResultsT] = None) -> List[str]:
+    """
+    Return a report of the scaling behavior of each benchmark, with the
+    speedup over a baseline where one is given.
+    """
+    lines = []
+    for name, timings in results.items():
+        sizes = [int(size) for size in timings]
+        exponent = scaling_exponent(
+            sizes, [timing["min"] for timing in timings.values()]
+        )
+        lines.append(
+            f"{name}: ~O(n^{exponent:.2f})" if exponent is not None else f"{name}:"
+        )
+        for size, timing in timings.items():
+            line = f"  n={size:<10} {format_time(timing['min'])}"
+            baseline_timing = (baseline or {}).get(name, {}).get(size)
+            if baseline_timing is not None:
+                speedup = baseline_timing["min"] / timing["min"]
+                line += f"  {speedup:6.2f}x vs baseline"
+            lines.append(line)
+    return lines
+
+
+def get_commit() -> Optional[str]:
+    """Return the current git commit, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(path: Path, results: ResultsT) -> None:
+    """Save results, along with the commit and environment, as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document: Dict[str, Any] = {
+        "commit": get_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def load_results(path: Path) -> ResultsT:
+    """Load the results saved in the given file."""
+    return json.loads(path.read_text())["results"]
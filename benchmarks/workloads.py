@@ -0,0 +1,214 @@
+"""
+Synthetic workloads for the benchmarks. All generators are deterministic
+for a given seed, so results are comparable between runs and commits.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import AbstractSet, List
+
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+from automata.pda.dpda import DPDA
+from automata.pda.npda import NPDA
+from automata.tm.dtm import DTM
+from automata.tm.mntm import MNTM
+from automata.tm.ntm import NTM
+
+BINARY = frozenset("01")
+
+# Regexes in the style of real-world validation patterns, written in the
+# syntax supported by automata.regex
+REAL_WORLD_REGEXES = {
+    "identifier": "[a-zA-Z_][a-zA-Z0-9_]*",
+    "integer": "(-|())(0|[1-9][0-9]*)",
+    "decimal": r"(-|())[0-9]+(\.[0-9]+|())",
+    "hex_color": "#([0-9a-f]{3}|[0-9a-f]{6})",
+    "iso_date": "[0-9]{4}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])",
+    "time": "([01][0-9]|2[0-3]):[0-5][0-9](:[0-5][0-9]|())",
+    "ipv4": r"(([0-9]|[1-9][0-9]|1[0-9][0-9]|2[0-4][0-9]|25[0-5])\.){3}"
+    "([0-9]|[1-9][0-9]|1[0-9][0-9]|2[0-4][0-9]|25[0-5])",
+    "email": r"[a-z0-9]+(\.[a-z0-9]+)*@[a-z0-9]+(\.[a-z0-9]+)+",
+}
+
+
+def random_dfa(
+    n_states: int,
+    input_symbols: AbstractSet[str] = BINARY,
+    *,
+    seed: int = 0,
+    accepting_ratio: float = 0.5,
+    uniform: bool = True,
+) -> DFA:
+    """
+    Return a complete accessible DFA with n_states states, sampled uniformly
+    unless uniform is False.
+    """
+    return DFA.random(
+        n_states,
+        input_symbols,
+        seed=seed,
+        accepting_ratio=accepting_ratio,
+        uniform=uniform,
+    )
+
+
+def random_nfa(
+    n_states: int,
+    input_symbols: AbstractSet[str] = BINARY,
+    *,
+    seed: int = 0,
+    density: float = 2.0,
+    lambda_density: float = 0.1,
+    accepting_ratio: float = 0.2,
+) -> NFA:
+    """
+    Return an NFA with n_states states, where each state has on average
+    density transitions on each symbol and lambda_density lambda transitions,
+    plus a random spanning tree making every state reachable.
+    """
+    return NFA.random(
+        n_states,
+        input_symbols,
+        seed=seed,
+        density=density,
+        lambda_density=lambda_density,
+        accepting_ratio=accepting_ratio,
+    )
+
+
+def random_words(
+    input_symbols: AbstractSet[str], length: int, count: int, *, seed: int = 0
+) -> List[str]:
+    """Return count words of the given length over input_symbols."""
+    rng = random.Random(seed)
+    symbols = sorted(input_symbols)
+    return ["".join(rng.choices(symbols, k=length)) for _ in range(count)]
+
+
+def nth_from_end_nfa(n: int) -> NFA:
+    """
+    Return the (n + 1)-state NFA accepting binary words whose nth symbol from
+    the end is 1, whose minimal DFA has 2^n states.
+    """
+    return NFA.from_regex(f"(0|1)*1(0|1){{{n - 1}}}", input_symbols=BINARY)
+
+
+def balanced_dpda() -> DPDA:
+    """Return a DPDA accepting a^n b^n by final state."""
+    return DPDA(
+        states={"q0", "q1", "q2", "q3"},
+        input_symbols={"a", "b"},
+        stack_symbols={"0", "1"},
+        transitions={
+            "q0": {"a": {"0": ("q1", ("1", "0"))}},
+            "q1": {"a": {"1": ("q1", ("1", "1"))}, "b": {"1": ("q2", "")}},
+            "q2": {"b": {"1": ("q2", "")}, "": {"0": ("q3", ("0",))}},
+        },
+        initial_state="q0",
+        initial_stack_symbol="0",
+        final_states={"q3"},
+        acceptance_mode="final_state",
+    )
+
+
+def palindrome_npda() -> NPDA:
+    """Return an NPDA accepting even-length palindromes over {a, b}."""
+    return NPDA(
+        states={"q0", "q1", "q2"},
+        input_symbols={"a", "b"},
+        stack_symbols={"A", "B", "#"},
+        transitions={
+            "q0": {
+                "": {"#": {("q2", "#")}},
+                "a": {
+                    "#": {("q0", ("A", "#"))},
+                    "A": {("q0", ("A", "A")), ("q1", "")},
+                    "B": {("q0", ("A", "B"))},
+                },
+                "b": {
+                    "#": {("q0", ("B", "#"))},
+                    "A": {("q0", ("B", "A"))},
+                    "B": {("q0", ("B", "B")), ("q1", "")},
+                },
+            },
+            "q1": {
+                "": {"#": {("q2", "#")}},
+                "a": {"A": {("q1", "")}},
+                "b": {"B": {("q1", "")}},
+            },
+        },
+        initial_state="q0",
+        initial_stack_symbol="#",
+        final_states={"q2"},
+        acceptance_mode="final_state",
+    )
+
+
+def balanced_dtm() -> DTM:
+    """Return a DTM accepting 0^n 1^n in O(n^2) steps."""
+    return DTM(
+        states={"q0", "q1", "q2", "q3", "q4"},
+        input_symbols={"0", "1"},
+        tape_symbols={"0", "1", "x", "y", "."},
+        transitions={
+            "q0": {"0": ("q1", "x", "R"), "y": ("q3", "y", "R")},
+            "q1": {
+                "0": ("q1", "0", "R"),
+                "1": ("q2", "y", "L"),
+                "y": ("q1", "y", "R"),
+            },
+            "q2": {
+                "0": ("q2", "0", "L"),
+                "x": ("q0", "x", "R"),
+                "y": ("q2", "y", "L"),
+            },
+            "q3": {"y": ("q3", "y", "R"), ".": ("q4", ".", "R")},
+        },
+        initial_state="q0",
+        blank_symbol=".",
+        final_states={"q4"},
+    )
+
+
+def guessing_ntm() -> NTM:
+    """
+    Return an NTM accepting binary words containing "11", which guesses at
+    every 1 whether the match starts there.
+    """
+    return NTM(
+        states={"q0", "q1", "q2"},
+        input_symbols={"0", "1"},
+        tape_symbols={"0", "1", "."},
+        transitions={
+            "q0": {
+                "0": {("q0", "0", "R")},
+                "1": {("q0", "1", "R"), ("q1", "1", "R")},
+            },
+            "q1": {"1": {("q2", "1", "N")}},
+        },
+        initial_state="q0",
+        blank_symbol=".",
+        final_states={"q2"},
+    )
+
+
+def copying_mntm() -> MNTM:
+    """Return a two-tape MNTM copying the 1s of its input to the second tape."""
+    return MNTM(
+        states={"q0", "q1"},
+        input_symbols={"0", "1"},
+        tape_symbols={"0", "1", "#"},
+        n_tapes=2,
+        transitions={
+            "q0": {
+                ("1", "#"): [("q0", (("1", "R"), ("1", "R")))],
+                ("0", "#"): [("q0", (("0", "R"), ("#", "N")))],
+                ("#", "#"): [("q1", (("#", "N"), ("#", "N")))],
+            }
+        },
+        initial_state="q0",
+        blank_symbol="#",
+        final_states={"q1"},
+    )
@@ -0,0 +1,155 @@
+"""Classes and functions for testing the behavior of automaton builders"""
+
+import unittest
+
+from frozendict import frozendict
+
+import automata.base.config as global_config
+import automata.base.exceptions as exceptions
+from automata.fa.builders import DFABuilder, NFABuilder
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+
+
+class TestDFABuilder(unittest.TestCase):
+    """A test class for testing DFA builders"""
+
+    def test_build(self) -> None:
+        """Should build the same DFA as the constructor"""
+        builder = DFABuilder()
+        builder.add_state("q0", initial=True)
+        builder.add_transition("q0", "0", "q0")
+        builder.add_transition("q0", "1", "q1")
+        builder.add_transition("q1", "0", "q0")
+        builder.add_transition("q1", "1", "q2")
+        builder.add_transition("q2", "0", "q2")
+        builder.add_transition("q2", "1", "q1")
+        builder.set_final("q1")
+
+        dfa = builder.build()
+        self.assertEqual(
+            dfa.input_parameters,
+            DFA(
+                states={"q0", "q1", "q2"},
+                input_symbols={"0", "1"},
+                transitions={
+                    "q0": {"0": "q0", "1": "q1"},
+                    "q1": {"0": "q0", "1": "q2"},
+                    "q2": {"0": "q2", "1": "q1"},
+                },
+                initial_state="q0",
+                final_states={"q1"},
+            ).input_parameters,
+        )
+        self.assertIsInstance(dfa.transitions, frozendict)
+        self.assertIsInstance(dfa.transitions["q0"], frozendict)
+        self.assertIsInstance(dfa.states, frozenset)
+        self.assertTrue(dfa.accepts_input("0111"))
+
+    def test_build_is_independent_of_builder(self) -> None:
+        """Should not change a built DFA when the builder is modified"""
+        builder = DFABuilder(allow_partial=True)
+        builder.set_initial(0)
+        builder.add_transition(0, "a", 1)
+        builder.set_final(1)
+        dfa = builder.build()
+
+        builder.add_transition(1, "a", 0)
+        builder.set_final(1, final=False)
+        builder.add_input_symbol("b")
+        self.assertEqual(dfa.transitions, {0: {"a": 1}, 1: {}})
+        self.assertEqual(dfa.final_states, {1})
+        self.assertEqual(dfa.input_symbols, {"a"})
+
+        new_dfa = builder.build()
+        self.assertEqual(new_dfa.transitions, {0: {"a": 1}, 1: {"a": 0}})
+        self.assertEqual(new_dfa.final_states, set())
+        self.assertEqual(new_dfa.input_symbols, {"a", "b"})
+        self.assertTrue(new_dfa.allow_partial)
+
+    def test_build_validate(self) -> None:
+        """Should validate the built DFA unless told not to"""
+        builder = DFABuilder(input_symbols={"a", "b"})
+        builder.set_initial(0)
+        builder.add_transition(0, "a", 0)
+
+        with self.assertRaises(exceptions.MissingSymbolError):
+            builder.build()
+        with self.assertRaises(exceptions.MissingSymbolError):
+            builder.build(validate=True)
+        self.assertEqual(builder.build(validate=False).transitions, {0: {"a": 0}})
+
+        global_config.should_validate_automata = False
+        try:
+            self.assertEqual(builder.build().transitions, {0: {"a": 0}})
+        finally:
+            global_config.should_validate_automata = True
+
+    def test_build_missing_initial_state(self) -> None:
+        """Should raise an error if no initial state has been set"""
+        builder = DFABuilder()
+        builder.add_transition(0, "a", 0)
+        with self.assertRaises(exceptions.MissingStateError):
+            builder.build()
+
+        builder.set_initial(None)
+        builder.add_transition(None, "a", 0)
+        self.assertIsNone(builder.build().initial_state)
+
+
+class TestNFABuilder(unittest.TestCase):
+    """A test class for testing NFA builders"""
+
+    def test_build(self) -> None:
+        """Should build the same NFA as the constructor"""
+        builder = NFABuilder()
+        builder.add_state("q0", initial=True)
+        builder.add_transition("q0", "a", "q1")
+        builder.add_transition("q1", "a", "q1")
+        builder.add_transition("q1", "", "q2")
+        builder.add_transition("q2", "b", "q0")
+        builder.add_state("q2", final=True)
+
+        nfa = builder.build()
+        self.assertEqual(
+            nfa,
+            NFA(
+                states={"q0", "q1", "q2"},
+                input_symbols={"a", "b"},
+                transitions={
+                    "q0": {"a": {"q1"}},
+                    "q1": {"a": {"q1"}, "": {"q2"}},
+                    "q2": {"b": {"q0"}},
+                },
+                initial_state="q0",
+                final_states={"q2"},
+            ),
+        )
+        self.assertIsInstance(nfa.transitions["q1"]["a"], frozenset)
+        self.assertEqual(nfa.input_symbols, {"a", "b"})
+        self.assertTrue(nfa.accepts_input("aaba"))
+
+    def test_build_nondeterministic(self) -> None:
+        """Should accumulate several transitions on the same symbol"""
+        builder = NFABuilder(input_symbols={"c"})
+        builder.set_initial(0)
+        builder.add_transition(0, "a", 1)
+        builder.add_transition(0, "a", 2)
+        builder.add_state(3)
+        builder.set_final(2)
+
+        nfa = builder.build()
+        self.assertEqual(nfa.transitions, {0: {"a": {1, 2}}, 1: {}, 2: {}, 3: {}})
+        self.assertEqual(nfa.states, {0, 1, 2, 3})
+        self.assertEqual(nfa.input_symbols, {"a", "c"})
+        self.assertEqual(builder.states, {0, 1, 2, 3})
+        self.assertTrue(nfa.accepts_input("a"))
+
+    def test_build_missing_initial_state(self) -> None:
+        """Should raise an error if no initial state has been set"""
+        builder = NFABuilder()
+        builder.add_transition(0, "", 1)
+        with self.assertRaises(exceptions.MissingStateError):
+            builder.build()
+        with self.assertRaises(exceptions.MissingStateError):
+            builder.build(validate=False)
@@ -0,0 +1,139 @@
+"""Functions for testing the caching of automaton operations."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from automata.base.cache import OperationCache, get_active_cache, operation_cache
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+
+
+class TestOperationCache(unittest.TestCase):
+    """A test class for testing the operation cache"""
+
+    def setUp(self) -> None:
+        self.input_symbols = {"a", "b"}
+        self.dfa = DFA.from_nfa(NFA.from_regex("a*b", input_symbols=self.input_symbols))
+        self.other_dfa = DFA.from_nfa(
+            NFA.from_regex("(a|b)*a", input_symbols=self.input_symbols)
+        )
+
+    def test_disabled_by_default(self) -> None:
+        """Should not cache results unless a cache is active"""
+        self.assertIsNone(get_active_cache())
+        self.assertIsNot(self.dfa | self.other_dfa, self.dfa | self.other_dfa)
+
+    def test_cached_operations(self) -> None:
+        """Should return cached results for repeated operations"""
+        nfa = NFA.from_regex("ab*")
+        with operation_cache() as cache:
+            self.assertIs(get_active_cache(), cache)
+            self.assertIs(self.dfa | self.other_dfa, self.dfa.union(self.other_dfa))
+            self.assertIs(self.dfa & self.other_dfa, self.dfa & self.other_dfa)
+            self.assertIs(self.dfa - self.other_dfa, self.dfa - self.other_dfa)
+            self.assertIs(~self.dfa, self.dfa.complement())
+            self.assertIs(self.dfa.minify(), self.dfa.minify(retain_names=False))
+            self.assertIs(DFA.from_nfa(nfa), DFA.from_nfa(nfa, minify=True))
+
+            self.assertIsNot(
+                self.dfa.union(self.other_dfa),
+                self.dfa.union(self.other_dfa, retain_names=True),
+            )
+            self.assertIsNot(self.dfa | self.other_dfa, self.other_dfa | self.dfa)
+
+        self.assertIsNone(get_active_cache())
+        self.assertEqual(self.dfa | self.other_dfa, self.dfa.union(self.other_dfa))
+
+    def test_cached_nfa_operations(self) -> None:
+        """Should cache NFA operations, matching NFA operands by identity"""
+        nfa = NFA.from_regex("ab*", input_symbols=self.input_symbols)
+        other_nfa = NFA.from_regex("a*b", input_symbols=self.input_symbols)
+        same_nfa = NFA.from_regex("a*b", input_symbols=self.input_symbols)
+        with operation_cache(key="language"):
+            self.assertIs(nfa | other_nfa, nfa.union(other_nfa))
+            self.assertIs(nfa & other_nfa, nfa.intersection(other_nfa))
+            self.assertIs(nfa + other_nfa, nfa.concatenate(other_nfa))
+            self.assertIs(nfa.kleene_star(), nfa.kleene_star())
+            self.assertIs(nfa.reverse(), nfa.reverse())
+            self.assertIs(nfa.reduce(), nfa.reduce())
+            self.assertIs(nfa.right_quotient(other_nfa), nfa.right_quotient(other_nfa))
+            self.assertIsNot(nfa | same_nfa, nfa | other_nfa)
+            self.assertIsNot(
+                nfa.shuffle_product(other_nfa),
+                nfa.shuffle_product(other_nfa, remove_dead_states=True),
+            )
+
+    def test_cache_info(self) -> None:
+        """Should count hits, misses and evictions"""
+        with operation_cache(maxsize=2) as cache:
+            self.dfa.complement()
+            self.dfa.complement()
+            self.other_dfa.complement()
+            self.dfa.minify()
+            self.other_dfa.complement()
+            self.dfa.complement()
+
+        info = cache.cache_info()
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 4)
+        self.assertEqual(info.evictions, 2)
+        self.assertEqual(info.maxsize, 2)
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 0, 2, 0))
+
+    def test_language_keys(self) -> None:
+        """Should reuse results for operands accepting the same language"""
+        equivalent_dfa = DFA.from_nfa(
+            NFA.from_regex("a*b|a*ab&a*b", input_symbols=self.input_symbols),
+            minify=False,
+        )
+        with operation_cache(key="language") as cache:
+            union_dfa = self.dfa | self.other_dfa
+            self.assertIs(equivalent_dfa | self.other_dfa, union_dfa)
+            self.assertIsNot(self.other_dfa | self.dfa, union_dfa)
+        self.assertEqual(cache.hits, 1)
+
+        with operation_cache(key="identity"):
+            self.assertIsNot(equivalent_dfa | self.other_dfa, self.dfa | self.other_dfa)
+
+    def test_shared_cache(self) -> None:
+        """Should share a cache between blocks and support nesting"""
+        cache = OperationCache(maxsize=None)
+        with operation_cache(cache=cache):
+            result = self.dfa.complement()
+            with operation_cache() as inner_cache:
+                self.assertIsNot(self.dfa.complement(), result)
+                self.assertIs(get_active_cache(), inner_cache)
+            self.assertIs(get_active_cache(), cache)
+        with operation_cache(cache=cache):
+            self.assertIs(self.dfa.complement(), result)
+
+    @patch("automata.fa.dfa.DFA._expand_dfa")
+    def test_zero_maxsize(self, expand_dfa: MagicMock) -> None:
+        """Should not store results if maxsize is zero"""
+        with operation_cache(maxsize=0) as cache:
+            self.dfa | self.other_dfa
+            self.dfa | self.other_dfa
+        self.assertEqual(expand_dfa.call_count, 2)
+        self.assertEqual(cache.cache_info().currsize, 0)
+
+    def test_get_and_setdefault(self) -> None:
+        """Should keep the first result stored for a key"""
+        cache = OperationCache(maxsize=1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.setdefault("a", 1), 1)
+        self.assertEqual(cache.setdefault("a", 2), 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.setdefault("b", 3), 3)
+        self.assertEqual(cache.get("a", 0), 0)
+        self.assertEqual(cache.cache_info(), (1, 2, 1, 1, 1))
+
+    def test_invalid_arguments(self) -> None:
+        """Should reject invalid cache parameters"""
+        with self.assertRaises(ValueError):
+            OperationCache(maxsize=-1)
+        with self.assertRaises(ValueError):
+            OperationCache(key="name")  # type: ignore
@@ -7,6 +7,7 @@
 
 import automata.base.config as global_config
 from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
 
 
 class TestConfig(unittest.TestCase):
@@ -50,3 +51,59 @@ def test_disable_ensure_values_are_frozen(self, freeze_value: MagicMock) -> None
             final_states={"s1"},
         )
         freeze_value.assert_not_called()
+
+    def test_derived_automata_skip_validation(self) -> None:
+        """Should not validate automata produced by operations on valid automata"""
+        dfa = DFA.from_nfa(NFA.from_regex("a*b", input_symbols={"a", "b"}))
+        nfa = NFA.from_regex("ab*")
+        with (
+            patch("automata.fa.dfa.DFA.validate") as validate_dfa,
+            patch("automata.fa.nfa.NFA.validate") as validate_nfa,
+        ):
+            result_dfa = (dfa | dfa.complement()).minify(retain_names=True)
+            result_nfa = nfa.union(nfa.kleene_star()).reverse().eliminate_lambda()
+            validate_dfa.assert_not_called()
+            validate_nfa.assert_not_called()
+
+        self.assertIsInstance(result_dfa.transitions, frozendict)
+        self.assertIsInstance(next(iter(result_dfa.transitions.values())), frozendict)
+        self.assertIsInstance(result_dfa.states, frozenset)
+        self.assertIsInstance(result_nfa.transitions, frozendict)
+        for paths in result_nfa.transitions.values():
+            self.assertIsInstance(paths, frozendict)
+            for end_states in paths.values():
+                self.assertIsInstance(end_states, frozenset)
+
+    def test_derived_automata_mutable(self) -> None:
+        """Should not freeze derived automata if mutability is enabled"""
+        global_config.allow_mutable_automata = True
+        nfa = NFA.from_regex("ab*")
+        self.assertIsInstance(nfa.transitions, dict)
+        self.assertNotIsInstance(nfa.transitions, frozendict)
+        self.assertTrue(DFA.from_nfa(nfa).accepts_input("abb"))
+
+    def test_mutable_automata_equality(self) -> None:
+        """Should not compare mutable DFAs using stale canonical forms"""
+        global_config.allow_mutable_automata = True
+        dfa = DFA(
+            states={0, 1},
+            input_symbols={"a"},
+            transitions={0: {"a": 1}, 1: {}},
+            initial_state=0,
+            final_states={1},
+            allow_partial=True,
+        )
+        other_dfa = DFA(
+            states={0, 1},
+            input_symbols={"a"},
+            transitions={0: {"a": 1}, 1: {}},
+            initial_state=0,
+            final_states={1},
+            allow_partial=True,
+        )
+        hash(dfa)
+        hash(other_dfa)
+        other_dfa.final_states.clear()
+        self.assertFalse(other_dfa.accepts_input("a"))
+        self.assertNotEqual(dfa, other_dfa)
+        self.assertNotEqual(hash(dfa), hash(other_dfa))
@@ -0,0 +1,140 @@
+"""Tests of the regex terms used to compute derivatives."""
+
+import unittest
+
+import automata.regex.derivatives as derivatives
+from automata.regex.syntax import parse_regex_ast
+
+
+class TestTermFactory(unittest.TestCase):
+    """A test class for testing the construction of regex terms"""
+
+    def setUp(self) -> None:
+        self.factory = derivatives.TermFactory({"a", "b", "c"})
+
+    def term(self, regex: str) -> derivatives.RegexTerm:
+        return self.factory.from_node(parse_regex_ast(regex))
+
+    def test_hash_consing(self) -> None:
+        """Should return the same object for equal terms"""
+        self.assertIs(self.term("ab*"), self.term("a(b*)"))
+        self.assertIs(self.term("(ab)c"), self.term("a(bc)"))
+        self.assertIs(self.term("a|b|c"), self.term("[abc]"))
+        self.assertIs(self.term("(a|b)|a"), self.term("b|a"))
+        self.assertIs(self.term("ab|ba|ab"), self.term("ba|ab"))
+        self.assertIs(self.term("a*&b*&a*"), self.term("b*&a*"))
+        self.assertIs(self.term("a^b"), self.term("b^a"))
+        self.assertIsNot(self.term("ab"), self.term("ba"))
+
+    def test_simplification(self) -> None:
+        """Should simplify terms with the smart constructor rules"""
+        factory = self.factory
+        self.assertIs(self.term("()a()"), self.term("a"))
+        self.assertIs(self.term("(a*)*"), self.term("a*"))
+        self.assertIs(self.term("(a*){2,5}"), self.term("a*"))
+        self.assertIs(self.term("(a?)?"), self.term("a?"))
+        self.assertIs(self.term("a{1}"), self.term("a"))
+        self.assertIs(self.term("a{0}"), factory.epsilon)
+        self.assertIs(self.term("()^a"), self.term("a"))
+        self.assertIs(self.term("a&b"), factory.empty)
+        self.assertIs(self.term("a&()"), factory.empty)
+        self.assertIs(self.term("a*&()"), factory.epsilon)
+        self.assertIs(self.term("[ab]&[bc]"), self.term("b"))
+        self.assertIs(self.term("(a&b)c|b"), self.term("b"))
+        self.assertIs(self.term("(a&b)*"), factory.epsilon)
+
+    def test_nullable(self) -> None:
+        """Should determine whether terms match the empty string"""
+        self.assertTrue(self.term("a*b?").nullable)
+        self.assertTrue(self.term("(ab)*&a*").nullable)
+        self.assertTrue(self.term("(a?b?){2,3}").nullable)
+        self.assertFalse(self.term("a*b").nullable)
+        self.assertFalse(self.term("a*^b").nullable)
+        self.assertFalse(self.term("a{2,}").nullable)
+
+    def test_linear_form(self) -> None:
+        """Should compute the partial derivatives with respect to each symbol"""
+        factory = self.factory
+        self.assertEqual(factory.linear_form(factory.empty), {})
+        self.assertEqual(factory.linear_form(factory.epsilon), {})
+        self.assertEqual(
+            factory.linear_form(self.term("(a|b)*ab")),
+            {self.term("(a|b)*ab"): {"a", "b"}, self.term("b"): {"a"}},
+        )
+        self.assertEqual(
+            factory.linear_form(self.term("a{2,3}")), {self.term("a{1,2}"): {"a"}}
+        )
+        self.assertEqual(
+            factory.linear_form(self.term("(ab|ac)&a.")),
+            {self.term("b"): {"a"}, self.term("c"): {"a"}},
+        )
+        self.assertEqual(
+            factory.linear_form(self.term("ab^c")),
+            {self.term("b^c"): {"a"}, self.term("ab"): {"c"}},
+        )
+
+    def test_linear_form_memoized(self) -> None:
+        """Should only derive each term once"""
+        term = self.term("(a|b)*a(a|b)")
+        self.assertIs(self.factory.linear_form(term), self.factory.linear_form(term))
+
+    def test_long_literal(self) -> None:
+        """Should build terms for long literals without deep recursion"""
+        term = self.term("ab" * 2000)
+        for _ in range(3999):
+            (term,) = self.factory.linear_form(term)
+        self.assertIs(term, self.term("b"))
+
+    def test_complement(self) -> None:
+        """Should build and simplify complemented terms"""
+        factory = self.factory
+        term = self.term("ab*")
+        self.assertIs(factory.complement(factory.complement(term)), term)
+        self.assertIs(factory.complement(factory.empty), factory.universal)
+        self.assertTrue(factory.complement(term).nullable)
+        self.assertIs(factory.union((term, factory.universal)), factory.universal)
+        self.assertIs(factory.intersection((term, factory.universal)), term)
+        with self.assertRaises(ValueError):
+            factory.linear_form(factory.complement(term))
+
+    def test_derivative(self) -> None:
+        """Should compute the derivatives with respect to symbols"""
+        factory = self.factory
+        self.assertIs(factory.derivative(self.term("ab*"), "a"), self.term("b*"))
+        self.assertIs(factory.derivative(self.term("ab*"), "b"), factory.empty)
+        self.assertIs(factory.derivative(self.term("a*b"), "a"), self.term("a*b"))
+        self.assertIs(
+            factory.derivative(self.term("(a|b)*ab"), "a"), self.term("(a|b)*ab|b")
+        )
+        self.assertIs(
+            factory.derivative(self.term("(ab|ac)&a."), "a"), self.term("b|c")
+        )
+        self.assertIs(factory.derivative(self.term("ab^c"), "c"), self.term("ab"))
+        self.assertIs(
+            factory.derivative(factory.complement(self.term("ab")), "a"),
+            factory.complement(self.term("b")),
+        )
+        self.assertIs(
+            factory.derivative(factory.complement(self.term("ab")), "b"),
+            factory.universal,
+        )
+
+    def test_symbol_classes(self) -> None:
+        """Should partition the alphabet by the derivatives of terms"""
+        factory = self.factory
+        self.assertEqual(
+            set(factory.symbol_classes(self.term("[ab]*c"))),
+            {frozenset("ab"), frozenset("c")},
+        )
+        self.assertEqual(
+            set(factory.symbol_classes(self.term("a*b"))),
+            {frozenset("a"), frozenset("b"), frozenset("c")},
+        )
+        self.assertEqual(
+            set(factory.symbol_classes(self.term("ab*"))),
+            {frozenset("a"), frozenset("bc")},
+        )
+        self.assertEqual(
+            dict(factory.iter_transitions(self.term(".b"))),
+            dict.fromkeys("abc", self.term("b")),
+        )
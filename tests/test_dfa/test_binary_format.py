@@ -0,0 +1,181 @@
+"""Tests covering saving and loading DFAs in the binary format."""
+
+import os
+import pickle
+import struct
+import tempfile
+
+import automata.base.exceptions as exceptions
+import automata.fa.serialization as serialization
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+from tests.test_dfa.base import DFATestCase
+
+
+class TestDFABinaryFormat(DFATestCase):
+    """Validate DFA.save and DFA.load."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "automaton.dfa")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def assert_round_trip(self, dfa: DFA) -> None:
+        """Assert that the DFA is unchanged after saving and loading it."""
+        dfa.save(self.path)
+        for mmap in (True, False):
+            for trusted in (True, False):
+                loaded_dfa = DFA.load(self.path, mmap=mmap, trusted=trusted)
+                self.assertEqual(loaded_dfa.states, dfa.states)
+                self.assertEqual(loaded_dfa.final_states, dfa.final_states)
+                self.assertEqual(loaded_dfa.initial_state, dfa.initial_state)
+                self.assertEqual(loaded_dfa.input_symbols, dfa.input_symbols)
+                self.assertEqual(loaded_dfa.allow_partial, dfa.allow_partial)
+                self.assertEqual(
+                    {
+                        state: dict(paths)
+                        for state, paths in loaded_dfa.transitions.items()
+                    },
+                    {state: dict(paths) for state, paths in dfa.transitions.items()},
+                )
+                self.assertEqual(loaded_dfa, dfa)
+
+    def test_round_trip_string_states(self) -> None:
+        """Should save and load a DFA with string states"""
+        self.assert_round_trip(self.dfa)
+        self.assert_round_trip(self.no_consecutive_11_dfa)
+
+    def test_round_trip_integer_states(self) -> None:
+        """Should save and load a DFA whose states are 0 to n-1 without names"""
+        self.assert_round_trip(self.partial_dfa)
+
+        with open(self.path, "rb") as file:
+            flags = serialization.HEADER_FORMAT.unpack(
+                file.read(serialization.HEADER_FORMAT.size)
+            )[2]
+        self.assertTrue(flags & serialization.FLAG_INTEGER_STATES)
+
+        loaded_dfa = DFA.load(self.path)
+        self.assertNotIn("object at", repr(loaded_dfa))
+        rebuilt_dfa = DFA(
+            states=set(loaded_dfa.states),
+            input_symbols=set(loaded_dfa.input_symbols),
+            transitions={
+                state: dict(paths) for state, paths in loaded_dfa.transitions.items()
+            },
+            initial_state=loaded_dfa.initial_state,
+            final_states=set(loaded_dfa.final_states),
+            allow_partial=True,
+        )
+        self.assertEqual(rebuilt_dfa.states, self.partial_dfa.states)
+        self.assertEqual(rebuilt_dfa.transitions, self.partial_dfa.transitions)
+        self.assertEqual(rebuilt_dfa.final_states, self.partial_dfa.final_states)
+
+    def test_round_trip_compound_states(self) -> None:
+        """Should save and load a DFA with frozenset and tuple states"""
+        nfa = NFA.from_regex("(a|b)*ab", input_symbols={"a", "b"})
+        subset_dfa = DFA.from_nfa(nfa, retain_names=True, minify=False)
+        self.assert_round_trip(subset_dfa)
+        self.assert_round_trip(
+            self.no_consecutive_11_dfa.union(self.zero_or_one_1_dfa, retain_names=True)
+        )
+        self.assert_round_trip(
+            DFA(
+                states={None, True, 2, ("x", (2, False))},
+                input_symbols={"0"},
+                transitions={
+                    None: {"0": True},
+                    True: {"0": 2},
+                    2: {"0": ("x", (2, False))},
+                    ("x", (2, False)): {"0": None},
+                },
+                initial_state=None,
+                final_states={2},
+            )
+        )
+
+    def test_round_trip_partial(self) -> None:
+        """Should save and load a partial DFA"""
+        self.partial_dfa.save(self.path)
+        loaded_dfa = DFA.load(self.path)
+        self.assertEqual(dict(loaded_dfa.transitions[3]), {})
+        self.assertTrue(loaded_dfa.accepts_input("111"))
+        self.assertFalse(loaded_dfa.accepts_input("110"))
+
+    def test_loaded_dfa_operations(self) -> None:
+        """Should support regular DFA operations on a loaded DFA"""
+        self.no_consecutive_11_dfa.save(self.path)
+        loaded_dfa = DFA.load(self.path)
+
+        self.assertTrue(loaded_dfa.accepts_input("0101"))
+        self.assertFalse(loaded_dfa.accepts_input("0110"))
+        self.assertEqual(loaded_dfa.minify(), self.no_consecutive_11_dfa.minify())
+        self.assertEqual(
+            loaded_dfa.complement(), self.no_consecutive_11_dfa.complement()
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(loaded_dfa)), loaded_dfa)
+        self.assertEqual(loaded_dfa.copy(), self.no_consecutive_11_dfa)
+        self.assertNotIn("p3", loaded_dfa.states)
+        self.assertNotIn(["p0"], loaded_dfa.states)
+
+        self.assertNotIn("object at", repr(loaded_dfa))
+
+        with self.assertRaises(AttributeError):
+            loaded_dfa.initial_state = "p1"  # type: ignore
+
+    def test_save_invalid_state_type(self) -> None:
+        """Should not save a DFA with states that cannot be encoded"""
+        dfa = DFA(
+            states={1.5},
+            input_symbols={"0"},
+            transitions={1.5: {"0": 1.5}},
+            initial_state=1.5,
+            final_states=set(),
+        )
+        with self.assertRaises(exceptions.SerializationError):
+            dfa.save(self.path)
+
+    def test_load_invalid_file(self) -> None:
+        """Should not load files that are not DFA files"""
+        for contents in (b"", b"not a DFA file at all, sorry about that"):
+            with open(self.path, "wb") as file:
+                file.write(contents)
+            for mmap in (True, False):
+                with self.assertRaises(exceptions.SerializationError):
+                    DFA.load(self.path, mmap=mmap)
+
+    def test_load_unsupported_version(self) -> None:
+        """Should not load files with an unknown format version"""
+        self.dfa.save(self.path)
+        with open(self.path, "r+b") as file:
+            file.seek(len(serialization.MAGIC))
+            file.write(struct.pack("<H", serialization.FORMAT_VERSION + 1))
+        with self.assertRaises(exceptions.SerializationError):
+            DFA.load(self.path)
+
+    def test_load_truncated_file(self) -> None:
+        """Should not load files that have been truncated"""
+        self.dfa.save(self.path)
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 5)
+        with self.assertRaises(exceptions.SerializationError):
+            DFA.load(self.path)
+
+    def test_load_corrupted_transition(self) -> None:
+        """Should reject out-of-range transitions unless the file is trusted"""
+        dfa = DFA.from_nfa(NFA.from_regex("ab*"))
+        dfa.save(self.path)
+        with open(self.path, "rb") as file:
+            contents = bytearray(file.read())
+        table_offset = serialization.HEADER_FORMAT.size
+        table_offset += serialization.HEADER_FORMAT.unpack_from(contents)[5]
+        table_offset += -table_offset % 8
+        struct.pack_into("<i", contents, table_offset, len(dfa.states) + 10)
+        with open(self.path, "wb") as file:
+            file.write(contents)
+
+        with self.assertRaises(exceptions.AutomatonException):
+            DFA.load(self.path)
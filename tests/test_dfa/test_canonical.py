@@ -0,0 +1,98 @@
+"""Tests covering canonical forms and language hashing of DFAs."""
+
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+from tests.test_dfa.base import DFATestCase
+
+
+class TestDFACanonical(DFATestCase):
+    """Validate DFA.canonical, DFA.language_hash and DFA.__hash__."""
+
+    def test_canonical(self) -> None:
+        """Should number the states of the minimal DFA in BFS order"""
+        dfa = DFA.from_nfa(
+            NFA.from_regex("(a|b)*ab", input_symbols={"a", "b"}),
+            retain_names=True,
+            minify=False,
+        )
+        canonical_dfa = dfa.canonical()
+
+        self.assertEqual(canonical_dfa.states, {0, 1, 2})
+        self.assertEqual(canonical_dfa.initial_state, 0)
+        self.assertEqual(canonical_dfa.final_states, {2})
+        self.assertEqual(
+            canonical_dfa.transitions,
+            {
+                0: {"a": 1, "b": 0},
+                1: {"a": 1, "b": 2},
+                2: {"a": 1, "b": 0},
+            },
+        )
+        self.assertFalse(canonical_dfa.allow_partial)
+        self.assertEqual(canonical_dfa, dfa)
+
+    def test_canonical_removes_dead_states(self) -> None:
+        """Should produce the same partial canonical form for complete DFAs"""
+        canonical_dfa = self.no_consecutive_11_dfa.complement().canonical()
+        self.assertEqual(
+            canonical_dfa.transitions,
+            {0: {"0": 0, "1": 1}, 1: {"0": 0, "1": 2}, 2: {"0": 2, "1": 2}},
+        )
+
+        canonical_partial_dfa = self.partial_dfa.canonical()
+        self.assertEqual(
+            canonical_partial_dfa.transitions,
+            {0: {"1": 1}, 1: {"1": 2}, 2: {"1": 3}, 3: {}},
+        )
+        self.assertTrue(canonical_partial_dfa.allow_partial)
+        self.assertEqual(
+            self.partial_dfa.to_complete().canonical().transitions,
+            canonical_partial_dfa.transitions,
+        )
+
+        empty_dfa = DFA.empty_language({"0", "1"})
+        self.assertEqual(empty_dfa.canonical().transitions, {0: {}})
+        self.assertEqual(empty_dfa.canonical().final_states, set())
+
+    def test_language_hash(self) -> None:
+        """Should give DFAs accepting the same language the same hash"""
+        input_symbols = {"0", "1"}
+        dfa = self.no_consecutive_11_dfa
+        equivalent_dfa = DFA.from_nfa(
+            NFA.from_regex("(0|10)*(1|())", input_symbols=input_symbols),
+            retain_names=True,
+            minify=False,
+        )
+        self.assertEqual(dfa.language_hash(), equivalent_dfa.language_hash())
+        self.assertEqual(hash(dfa), hash(equivalent_dfa))
+        self.assertEqual(hash(dfa), hash(dfa.canonical()))
+        self.assertEqual(
+            hash(DFA.empty_language(input_symbols)),
+            hash(dfa - equivalent_dfa),
+        )
+        self.assertNotEqual(hash(dfa), hash(dfa.complement()))
+
+    def test_hash_deduplication(self) -> None:
+        """Should allow DFAs to be deduplicated by language in sets and dicts"""
+        input_symbols = {"0", "1"}
+        dfas = [
+            self.no_consecutive_11_dfa,
+            self.no_consecutive_11_dfa.minify(),
+            self.zero_or_one_1_dfa,
+            self.zero_or_one_1_dfa.union(self.zero_or_one_1_dfa),
+            DFA.universal_language(input_symbols),
+            self.zero_or_one_1_dfa | self.zero_or_one_1_dfa.complement(),
+        ]
+        self.assertEqual(len(set(dfas)), 3)
+        self.assertEqual(
+            {dfa: dfa for dfa in dfas}[DFA.universal_language({"0", "1"})], dfas[5]
+        )
+
+    def test_eq_canonical_fast_path(self) -> None:
+        """Should compare DFAs with cached canonical forms correctly"""
+        dfa = self.no_consecutive_11_dfa
+        other_dfa = dfa.union(self.zero_or_one_1_dfa, retain_names=True)
+        dfa.language_hash()
+        other_dfa.language_hash()
+        self.assertEqual(dfa, other_dfa)
+        self.assertNotEqual(dfa, self.zero_or_one_1_dfa.canonical())
@@ -0,0 +1,107 @@
+"""Tests covering DFA alphabet compression."""
+
+import string
+from itertools import product
+
+import automata.base.exceptions as exceptions
+from automata.fa.alphabet import SymbolClasses
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+from tests.test_dfa.base import DFATestCase
+
+
+class TestDFACompression(DFATestCase):
+    """Validate symbol classes and compressed DFAs."""
+
+    def test_symbol_classes(self) -> None:
+        """Should group symbols that every state treats identically"""
+        input_symbols = set(string.ascii_lowercase + string.digits)
+        dfa = DFA.from_nfa(NFA.from_regex(r"\d+x", input_symbols=input_symbols))
+
+        symbol_classes = dfa.symbol_classes()
+        self.assertEqual(
+            symbol_classes.classes,
+            (
+                frozenset(string.digits),
+                frozenset(string.ascii_lowercase) - {"x"},
+                frozenset("x"),
+            ),
+        )
+        self.assertEqual(symbol_classes.class_of["7"], 0)
+        self.assertEqual(symbol_classes.class_of["x"], 2)
+        self.assertEqual(symbol_classes.representatives(), ("0", "a", "x"))
+        self.assertIs(dfa.symbol_classes(), symbol_classes)
+
+    def test_symbol_classes_partial(self) -> None:
+        """Should group symbols with missing transitions together"""
+        self.assertEqual(
+            self.partial_dfa.symbol_classes().classes,
+            (frozenset("0"), frozenset("1")),
+        )
+
+    def test_symbol_classes_nfa(self) -> None:
+        """Should compute symbol classes of an NFA, ignoring lambda transitions"""
+        nfa = NFA(
+            states={0, 1, 2},
+            input_symbols={"a", "b", "c", "d"},
+            transitions={
+                0: {"a": {1, 2}, "b": {1, 2}, "c": {1}, "": {2}},
+                1: {"a": {0}, "b": {0}, "c": {0}},
+                2: {},
+            },
+            initial_state=0,
+            final_states={2},
+        )
+        self.assertEqual(
+            nfa.symbol_classes().classes,
+            (frozenset("ab"), frozenset("c"), frozenset("d")),
+        )
+
+    def test_classify(self) -> None:
+        """Should translate strings into class indices"""
+        symbol_classes = SymbolClasses([{"b", "c"}, {"a"}])
+        self.assertEqual(len(symbol_classes), 2)
+        self.assertEqual(list(symbol_classes.classify("abca")), [0, 1, 1, 0])
+        self.assertIsNone(symbol_classes.classify("abz"))
+
+        with self.assertRaises(ValueError):
+            SymbolClasses([{"a", "b"}, {"b"}])
+
+    def test_compress(self) -> None:
+        """Should accept exactly the words the original DFA accepts"""
+        for dfa in (
+            self.no_consecutive_11_dfa,
+            self.partial_dfa,
+            DFA.from_nfa(NFA.from_regex("(0|1)*0(0|1)(0|1)")),
+        ):
+            compressed_dfa = dfa.compress()
+            for length in range(7):
+                for word in product("01", repeat=length):
+                    input_str = "".join(word)
+                    self.assertEqual(
+                        compressed_dfa.accepts_input(input_str),
+                        dfa.accepts_input(input_str),
+                    )
+            self.assertFalse(compressed_dfa.accepts_input("012"))
+
+    def test_compress_table_size(self) -> None:
+        """Should store one transition per state and symbol class"""
+        input_symbols = set(string.printable)
+        dfa = DFA.from_nfa(NFA.from_regex(r"\w+@\w+", input_symbols=input_symbols))
+        compressed_dfa = dfa.compress()
+
+        self.assertEqual(len(dfa.symbol_classes()), 3)
+        self.assertEqual(len(compressed_dfa.table), len(dfa.states) * 3)
+        self.assertTrue(compressed_dfa.accepts_input("user@example"))
+        self.assertFalse(compressed_dfa.accepts_input("user@"))
+
+    def test_compress_read_input(self) -> None:
+        """Should return the final state or raise a RejectionException"""
+        compressed_dfa = self.partial_dfa.compress()
+        self.assertEqual(compressed_dfa.read_input("111"), 3)
+
+        with self.assertRaises(exceptions.RejectionException):
+            compressed_dfa.read_input("11")
+
+        with self.assertRaises(exceptions.RejectionException):
+            compressed_dfa.read_input("0")
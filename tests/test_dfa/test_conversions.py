@@ -1,5 +1,6 @@
 """Tests covering DFA conversions from other automata representations."""
 
+import automata.base.exceptions as exceptions
 from automata.fa.dfa import DFA
 from automata.fa.nfa import NFA
 from tests.test_dfa.base import DFATestCase
@@ -152,3 +153,44 @@ def test_partial_dfa(self) -> None:
             allow_partial=True,
         )
         self.assertEqual(dfa.read_input("aa"), "aa")
+
+    def test_from_regex(self) -> None:
+        """Should build the minimal DFA of a regex from its derivatives"""
+        dfa = DFA.from_regex("(a|b)*a(a|b)", input_symbols={"a", "b"})
+        self.assertEqual(len(dfa.states), 4)
+        self.assertEqual(dfa, DFA.from_nfa(NFA.from_regex("(a|b)*a(a|b)")))
+        self.assertTrue(dfa.accepts_input("bbab"))
+        self.assertFalse(dfa.accepts_input("abba"))
+
+    def test_from_regex_equivalence(self) -> None:
+        """Should match the minimal DFA built from the NFA of the regex"""
+        input_symbols = {"a", "b", "c"}
+        for regex in (
+            "",
+            "()",
+            "ab(ca*|bc)|a?",
+            "a{2,}b{0,3}",
+            "[^a].b+",
+            "((a|())b*)*",
+            "(a|b)*&(.a){2,4}",
+            "(a*b*)*&(ab|ba)*",
+            "a&b",
+            "(ab)^c",
+            "(a^b^c)*",
+        ):
+            with self.subTest(regex=regex):
+                dfa = DFA.from_regex(regex, input_symbols=input_symbols)
+                expected_dfa = DFA.from_nfa(
+                    NFA.from_regex(regex, input_symbols=input_symbols)
+                )
+                self.assertEqual(dfa, expected_dfa)
+                self.assertEqual(len(dfa.states), len(expected_dfa.states))
+                self.assertEqual(
+                    DFA.from_regex(regex, input_symbols=input_symbols, minify=False),
+                    expected_dfa,
+                )
+
+    def test_from_regex_invalid_symbol(self) -> None:
+        """Should reject regexes with symbols outside of the input symbols"""
+        with self.assertRaises(exceptions.InvalidSymbolError):
+            DFA.from_regex("abc", input_symbols={"a", "b"})
@@ -1,8 +1,11 @@
 """Enumeration and ordering behaviors for DFAs."""
 
+from unittest.mock import MagicMock, patch
+
 from parameterized import parameterized  # type: ignore
 
 import automata.base.exceptions as exceptions
+from automata.base.utils import get_reachable_nodes
 from automata.fa.dfa import DFA
 from automata.fa.nfa import NFA
 from tests.test_dfa.base import DFATestCase
@@ -267,3 +270,66 @@ def test_successor_partial(self) -> None:
         self.assertEqual(dfa.successor("01"), "011")
         self.assertEqual(dfa.successor("01000"), "011")
         self.assertIsNone(dfa.successor("1"))
+
+    @parameterized.expand((True, False))
+    def test_fuzzy_lookup(self, as_partial: bool) -> None:
+        """Should generate the words of the DFA close to the query in order"""
+        input_symbols = {"a", "c", "e", "h", "i", "o", "s", "t"}
+        language = {"those", "these", "this", "hose", "hoses", "the", "cat", "thos"}
+        dfa = DFA.from_finite_language(input_symbols, language, as_partial=as_partial)
+
+        for max_edit_distance in range(4):
+            edit_distance_dfa = DFA.from_nfa(
+                NFA.edit_distance(input_symbols, "those", max_edit_distance)
+            )
+            expected = sorted(dfa & edit_distance_dfa)
+            actual = list(dfa.fuzzy_lookup("those", max_edit_distance))
+            self.assertListEqual(actual, expected)
+
+    def test_fuzzy_lookup_error_types(self) -> None:
+        """Should respect the enabled error types when generating words"""
+        dfa = DFA.from_finite_language({"a", "b"}, {"ab", "ba", "aab", "b"})
+
+        self.assertListEqual(
+            list(dfa.fuzzy_lookup("ab", 1, insertion=False, deletion=False)),
+            ["ab"],
+        )
+        self.assertListEqual(
+            list(dfa.fuzzy_lookup("ab", 1, substitution=False, deletion=False)),
+            ["aab", "ab"],
+        )
+        self.assertListEqual(
+            list(dfa.fuzzy_lookup("ab", 1, insertion=False, substitution=False)),
+            ["ab", "b"],
+        )
+
+    def test_fuzzy_lookup_infinite(self) -> None:
+        """Should terminate on DFAs accepting infinite languages"""
+        dfa = DFA.from_substring({"0", "1"}, "11")
+
+        self.assertListEqual(list(dfa.fuzzy_lookup("11", 0)), ["11"])
+        self.assertListEqual(
+            list(dfa.fuzzy_lookup("011", 1)),
+            ["0011", "011", "0110", "0111", "1011", "11", "111"],
+        )
+
+    def test_fuzzy_lookup_no_matches(self) -> None:
+        """Should generate nothing if no word is close enough to the query"""
+        dfa = DFA.from_finite_language({"a", "b"}, {"aaaa"})
+        self.assertListEqual(list(dfa.fuzzy_lookup("bbbb", 3)), [])
+        self.assertListEqual(list(DFA.empty_language({"a"}).fuzzy_lookup("a", 1)), [])
+
+    @patch("automata.fa.dfa.get_reachable_nodes", wraps=get_reachable_nodes)
+    def test_fuzzy_lookup_reuses_coaccessible_states(
+        self, reachable_nodes: MagicMock
+    ) -> None:
+        """Should only search for coaccessible states once per DFA"""
+        dfa = DFA.from_finite_language({"a", "b"}, {"aaaa", "abab"})
+        self.assertListEqual(list(dfa.fuzzy_lookup("bbbb", 1)), [])
+        self.assertListEqual(list(dfa.fuzzy_lookup("abab", 0)), ["abab"])
+        reachable_nodes.assert_called_once()
+
+    def test_fuzzy_lookup_query_symbols(self) -> None:
+        """Should allow query symbols outside of the DFA's input symbols"""
+        dfa = DFA.from_finite_language({"a", "b"}, {"ab", "bb"})
+        self.assertListEqual(list(dfa.fuzzy_lookup("zb", 1)), ["ab", "bb"])
@@ -0,0 +1,70 @@
+"""Tests for the lazy derivative DFA matcher."""
+
+from itertools import product
+
+import automata.base.exceptions as exceptions
+from automata.base.instrumentation import collect_stats
+from automata.fa.dfa import DFA
+from automata.fa.lazy import LazyDerivativeDFA
+from tests.test_dfa.base import DFATestCase
+
+
+class TestLazyDerivativeDFA(DFATestCase):
+    """Check that lazy derivative DFAs match the same language as regexes."""
+
+    def test_accepts_input(self) -> None:
+        """Should accept the same words as the DFA of the regex"""
+        for regex in ("(a|b)*a(a|b){2}", "(a*b*)*&(ab|ba)*", "(ab)^b*", "[^a]b?"):
+            with self.subTest(regex=regex):
+                lazy_dfa = LazyDerivativeDFA(regex, input_symbols={"a", "b"})
+                dfa = DFA.from_regex(regex, input_symbols={"a", "b"})
+                for length in range(7):
+                    for input_str in map("".join, product("ab", repeat=length)):
+                        self.assertEqual(
+                            lazy_dfa.accepts_input(input_str),
+                            dfa.accepts_input(input_str),
+                        )
+
+    def test_unknown_symbols(self) -> None:
+        """Should reject input with symbols outside of the input symbols"""
+        lazy_dfa = LazyDerivativeDFA(".*")
+        self.assertEqual(lazy_dfa.input_symbols, frozenset())
+        self.assertTrue(lazy_dfa.accepts_input(""))
+        self.assertFalse(lazy_dfa.accepts_input("a"))
+        with self.assertRaises(exceptions.InvalidSymbolError):
+            LazyDerivativeDFA("ab", input_symbols={"a"})
+
+    def test_cache(self) -> None:
+        """Should only compute each transition once"""
+        lazy_dfa = LazyDerivativeDFA("(ab)*")
+        self.assertTrue(lazy_dfa.accepts_input("abab"))
+        self.assertEqual(tuple(lazy_dfa.cache_info()), (2, 2, 0, 10000, 2))
+        self.assertFalse(lazy_dfa.accepts_input("abb"))
+        self.assertEqual(tuple(lazy_dfa.cache_info()), (4, 3, 0, 10000, 2))
+
+        lazy_dfa.clear()
+        self.assertEqual(tuple(lazy_dfa.cache_info()), (0, 0, 0, 10000, 0))
+
+    def test_flush(self) -> None:
+        """Should flush the cache between inputs once it is full"""
+        lazy_dfa = LazyDerivativeDFA("(a|b)*a(a|b){5}", max_states=4)
+        self.assertTrue(lazy_dfa.accepts_input("abbbbb"))
+        self.assertGreater(len(lazy_dfa), 4)
+        self.assertTrue(lazy_dfa.accepts_input("babbbbb"))
+        self.assertEqual(lazy_dfa.flushes, 1)
+        self.assertEqual(lazy_dfa.evictions, 6)
+        self.assertLessEqual(len(lazy_dfa), 8)
+
+    def test_stats(self) -> None:
+        """Should report cache statistics to the active stats collector"""
+        lazy_dfa = LazyDerivativeDFA("a*b")
+        with collect_stats() as stats:
+            self.assertTrue(lazy_dfa.accepts_input("aaab"))
+        self.assertEqual(stats.counters["lazy_dfa.hits"], 2)
+        self.assertEqual(stats.counters["lazy_dfa.misses"], 2)
+        self.assertEqual(stats.maxima["lazy_dfa.states"], 1)
+
+    def test_invalid_max_states(self) -> None:
+        """Should reject a non-positive cache size"""
+        with self.assertRaises(ValueError):
+            LazyDerivativeDFA("a", max_states=0)
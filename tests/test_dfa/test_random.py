@@ -0,0 +1,104 @@
+"""Tests covering the generation of random DFAs."""
+
+from collections import Counter
+from random import Random
+
+from automata.fa.dfa import DFA
+from automata.fa.generators import random_dfa_table
+from tests.test_dfa.base import DFATestCase
+
+
+class TestDFARandom(DFATestCase):
+    """Validate DFA.random and the underlying table sampler."""
+
+    def assert_accessible(self, dfa: DFA) -> None:
+        """Assert that every state of the given DFA is reachable"""
+        reachable_states = {dfa.initial_state}
+        queue = [dfa.initial_state]
+        while queue:
+            for next_state in dfa.transitions[queue.pop()].values():
+                if next_state not in reachable_states:
+                    reachable_states.add(next_state)
+                    queue.append(next_state)
+        self.assertEqual(reachable_states, dfa.states)
+
+    def test_random(self) -> None:
+        """Should generate a valid, complete, accessible DFA"""
+        dfa = DFA.random(50, {"a", "b", "c"}, seed=1)
+        dfa.validate()
+        self.assertEqual(dfa.states, set(range(50)))
+        self.assertEqual(dfa.input_symbols, {"a", "b", "c"})
+        self.assertEqual(dfa.initial_state, 0)
+        self.assertFalse(dfa.allow_partial)
+        self.assert_accessible(dfa)
+
+    def test_random_reproducible(self) -> None:
+        """Should generate the same DFA for the same seed"""
+        for uniform in (True, False):
+            self.assertEqual(
+                DFA.random(30, {"0", "1"}, seed=7, uniform=uniform).transitions,
+                DFA.random(30, {"0", "1"}, seed=7, uniform=uniform).transitions,
+            )
+        self.assertNotEqual(
+            DFA.random(30, {"0", "1"}, seed=7).transitions,
+            DFA.random(30, {"0", "1"}, seed=8).transitions,
+        )
+
+    def test_random_partial(self) -> None:
+        """Should generate a valid partial DFA with missing transitions"""
+        dfa = DFA.random(100, {"a", "b"}, seed=2, partial=True)
+        dfa.validate()
+        self.assertTrue(dfa.allow_partial)
+        self.assertLess(sum(map(len, dfa.transitions.values())), 200)
+        self.assert_accessible(dfa)
+
+    def test_random_fast(self) -> None:
+        """Should generate valid DFAs with the linear-time sampler"""
+        for partial in (False, True):
+            dfa = DFA.random(500, {"a", "b"}, seed=3, partial=partial, uniform=False)
+            dfa.validate()
+            self.assert_accessible(dfa)
+
+    def test_random_accepting_ratio(self) -> None:
+        """Should choose final states according to the accepting ratio"""
+        self.assertEqual(
+            DFA.random(20, {"a"}, seed=4, accepting_ratio=0).final_states, set()
+        )
+        self.assertEqual(
+            DFA.random(20, {"a"}, seed=4, accepting_ratio=1).final_states,
+            set(range(20)),
+        )
+
+    def test_random_edge_cases(self) -> None:
+        """Should generate DFAs with a single state or symbol"""
+        self.assertEqual(DFA.random(1, set(), seed=5).transitions, {0: {}})
+        # With a single symbol, the states must form a path
+        dfa = DFA.random(3, {"a"}, seed=5)
+        self.assertEqual(dfa.transitions[0], {"a": 1})
+        self.assertEqual(dfa.transitions[1], {"a": 2})
+
+    def test_random_invalid(self) -> None:
+        """Should reject invalid arguments"""
+        with self.assertRaises(ValueError):
+            DFA.random(0, {"a"})
+        with self.assertRaises(ValueError):
+            DFA.random(2, set())
+        with self.assertRaises(ValueError):
+            DFA.random(2, {"a"}, accepting_ratio=1.5)
+
+    def test_uniform_table(self) -> None:
+        """Should sample all accessible DFAs with equal probability"""
+        rng = Random(0)
+        sample_count = 4320
+        counts = Counter(
+            tuple(random_dfa_table(3, 2, rng)) for _ in range(sample_count)
+        )
+
+        # There are 216 accessible DFAs with 3 states over 2 symbols, up to
+        # renaming of the states
+        self.assertEqual(len(counts), 216)
+        expected = sample_count / 216
+        chi_squared = sum(
+            (count - expected) ** 2 / expected for count in counts.values()
+        )
+        self.assertLess(chi_squared, 300)
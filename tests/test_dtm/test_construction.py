@@ -50,3 +50,33 @@ def test_dtm_immutable_attr_del(self) -> None:
     def test_dtm_immutable_dict(self) -> None:
         """Should create a DTM whose contents are fully immutable/hashable"""
         self.assertIsInstance(hash(frozendict(self.dtm1.input_parameters)), int)
+
+    def test_random(self) -> None:
+        """Should generate a valid, reproducible DTM"""
+        dtm = DTM.random(20, {"0", "1"}, seed=1)
+        dtm.validate()
+        self.assertEqual(dtm.states, set(range(20)))
+        self.assertEqual(dtm.tape_symbols, {"0", "1", "."})
+        self.assertEqual(dtm.initial_state, 0)
+        self.assertEqual(dtm.final_states, {19})
+        self.assertEqual(
+            dtm.transitions, DTM.random(20, {"0", "1"}, seed=1).transitions
+        )
+
+        reachable_states = {0}
+        queue = [0]
+        while queue:
+            for next_state, _, _ in dtm.transitions.get(queue.pop(), {}).values():
+                if next_state not in reachable_states:
+                    reachable_states.add(next_state)
+                    queue.append(next_state)
+        self.assertEqual(reachable_states, dtm.states)
+
+    def test_random_invalid(self) -> None:
+        """Should reject invalid arguments for random DTMs"""
+        with self.assertRaises(ValueError):
+            DTM.random(1, {"0"})
+        with self.assertRaises(ValueError):
+            DTM.random(2, {"0", "."})
+        with self.assertRaises(ValueError):
+            DTM.random(2, {"0"}, density=2)
@@ -0,0 +1,119 @@
+"""Functions for testing the instrumentation of automaton algorithms."""
+
+import unittest
+from typing import List, Tuple
+
+import tests.test_pda as test_pda
+import tests.test_tm as test_tm
+from automata.base.instrumentation import (
+    StatsCollector,
+    collect_stats,
+    get_stats_collector,
+)
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+
+
+class TestStatsCollector(unittest.TestCase):
+    """A test class for testing stats collectors"""
+
+    def test_collector(self) -> None:
+        """Should record counters, maxima and timings"""
+        collector = StatsCollector()
+        collector.increment("a")
+        collector.increment("a", 4)
+        collector.record_max("b", 3)
+        collector.record_max("b", 1)
+        collector.record_max("c", -2)
+        with collector.phase("phase"):
+            pass
+        with collector.phase("phase"):
+            pass
+
+        self.assertEqual(collector.counters, {"a": 5})
+        self.assertEqual(collector.maxima, {"b": 3, "c": -2})
+        self.assertEqual(list(collector.timings), ["phase"])
+        self.assertGreaterEqual(collector.timings["phase"], 0)
+
+        collector.clear()
+        self.assertEqual(collector.counters, {})
+        self.assertEqual(collector.maxima, {})
+        self.assertEqual(collector.timings, {})
+
+    def test_collect_stats_context(self) -> None:
+        """Should only activate a collector within the block"""
+        self.assertIsNone(get_stats_collector())
+        collector = StatsCollector()
+        with collect_stats(collector) as active_collector:
+            self.assertIs(active_collector, collector)
+            self.assertIs(get_stats_collector(), collector)
+            with collect_stats() as inner_collector:
+                self.assertIs(get_stats_collector(), inner_collector)
+            self.assertIs(get_stats_collector(), collector)
+        self.assertIsNone(get_stats_collector())
+
+    def test_invalid_progress_interval(self) -> None:
+        """Should reject a non-positive progress interval"""
+        with self.assertRaises(ValueError):
+            StatsCollector(progress_interval=0)
+
+
+class TestFAInstrumentation(unittest.TestCase):
+    """A test class for testing the instrumentation of FA algorithms"""
+
+    def test_from_nfa_and_minify(self) -> None:
+        """Should record subset construction and minification statistics"""
+        nfa = NFA.from_regex("(a|b)*a(a|b)(a|b)", input_symbols={"a", "b"})
+        progress: List[Tuple[str, int]] = []
+        with collect_stats(
+            progress_callback=lambda phase, count: progress.append((phase, count)),
+            progress_interval=4,
+        ) as stats:
+            dfa = DFA.from_nfa(nfa)
+
+        self.assertEqual(stats.counters["from_nfa.nfa_states"], len(nfa.states))
+        self.assertEqual(stats.counters["from_nfa.dfa_states"], len(dfa.states))
+        self.assertEqual(stats.counters["expand_dfa.states"], 9)
+        self.assertEqual(stats.counters["expand_dfa.edges"], 18)
+        self.assertEqual(stats.counters["minify.states"], 9)
+        self.assertGreater(stats.counters["minify.refinement_rounds"], 0)
+        self.assertGreater(stats.maxima["minify.splitter_queue"], 0)
+        self.assertEqual(set(stats.timings), {"from_nfa", "expand_dfa", "minify"})
+        self.assertEqual(progress, [("expand_dfa", 4), ("expand_dfa", 8)])
+
+    def test_disabled(self) -> None:
+        """Should not record anything without an active collector"""
+        collector = StatsCollector()
+        DFA.from_nfa(NFA.from_regex("ab*"))
+        self.assertEqual(collector.counters, {})
+
+    def test_nfa_eq(self) -> None:
+        """Should record the number of state pairs processed by NFA equality"""
+        nfa = NFA.from_regex("(ab)*", input_symbols={"a", "b"})
+        with collect_stats() as stats:
+            self.assertEqual(nfa, nfa.reverse().reverse())
+            self.assertNotEqual(nfa, nfa.concatenate(NFA.from_regex("a")))
+        self.assertGreater(stats.counters["nfa_eq.pairs"], 0)
+        self.assertIn("nfa_eq", stats.timings)
+
+
+class TestNPDAInstrumentation(test_pda.TestPDA):
+    """A test class for testing the instrumentation of NPDA simulation"""
+
+    def test_npda_frontier(self) -> None:
+        """Should record the steps and frontier size of NPDA simulation"""
+        with collect_stats() as stats:
+            self.assertTrue(self.npda.accepts_input("abba"))
+        self.assertEqual(stats.counters["npda.steps"], 5)
+        self.assertEqual(stats.maxima["npda.frontier"], 2)
+
+
+class TestNTMInstrumentation(test_tm.TestTM):
+    """A test class for testing the instrumentation of NTM simulation"""
+
+    def test_ntm_frontier(self) -> None:
+        """Should record the steps and frontier size of NTM simulation"""
+        with collect_stats() as stats:
+            self.assertTrue(self.ntm1.accepts_input("0012001"))
+        self.assertEqual(stats.counters["ntm.steps"], 8)
+        self.assertEqual(stats.maxima["ntm.frontier"], 2)
@@ -0,0 +1,162 @@
+"""Functions for testing resource limits on automaton algorithms."""
+
+import unittest
+
+import automata.base.exceptions as exceptions
+import tests.test_pda as test_pda
+import tests.test_tm as test_tm
+from automata.base.limits import (
+    CancellationToken,
+    ResourceLimits,
+    get_resource_limits,
+    resource_limits,
+)
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+
+
+class TestResourceLimits(unittest.TestCase):
+    """A test class for testing resource limits"""
+
+    def test_resource_limits_context(self) -> None:
+        """Should only activate limits within the block"""
+        self.assertIsNone(get_resource_limits())
+        limits = ResourceLimits(max_states=10)
+        with resource_limits(limits) as active_limits:
+            self.assertIs(active_limits, limits)
+            self.assertIs(get_resource_limits(), limits)
+            with resource_limits(max_steps=5) as inner_limits:
+                self.assertIs(get_resource_limits(), inner_limits)
+            self.assertIs(get_resource_limits(), limits)
+        self.assertIsNone(get_resource_limits())
+
+    def test_invalid_limits(self) -> None:
+        """Should reject negative limits"""
+        with self.assertRaises(ValueError):
+            ResourceLimits(max_states=-1)
+        with self.assertRaises(ValueError):
+            ResourceLimits(timeout=-0.5)
+
+    def test_check(self) -> None:
+        """Should raise an error carrying the progress of the operation"""
+        limits = ResourceLimits(max_states=10, max_steps=5, max_configurations=2)
+        limits.check("phase", states=10, steps=5, configurations=2)
+
+        with self.assertRaises(exceptions.ResourceLimitError) as context:
+            limits.check("phase", states=11, steps=3)
+        error = context.exception
+        self.assertEqual(error.limit, "max_states")
+        self.assertEqual(error.phase, "phase")
+        self.assertEqual(error.stats["states"], 11)
+        self.assertEqual(error.stats["steps"], 3)
+        self.assertNotIn("configurations", error.stats)
+        self.assertGreaterEqual(error.stats["elapsed"], 0)
+
+        with self.assertRaises(exceptions.ResourceLimitError) as context:
+            limits.check("phase", configurations=3)
+        self.assertEqual(context.exception.limit, "max_configurations")
+
+
+class TestFALimits(unittest.TestCase):
+    """A test class for testing resource limits on FA algorithms"""
+
+    def setUp(self) -> None:
+        self.nfa = NFA.from_regex("(a|b)*a(a|b){10}", input_symbols={"a", "b"})
+
+    def test_unlimited(self) -> None:
+        """Should not limit operations without active limits"""
+        self.assertEqual(len(DFA.from_nfa(self.nfa).states), 2048)
+
+    def test_from_nfa_max_states(self) -> None:
+        """Should interrupt the subset construction after max_states states"""
+        with resource_limits(max_states=100):
+            self.assertEqual(len(DFA.from_nfa(NFA.from_regex("a(a|b){3}")).states), 5)
+            with self.assertRaises(exceptions.ResourceLimitError) as context:
+                DFA.from_nfa(self.nfa)
+
+        error = context.exception
+        self.assertEqual(error.limit, "max_states")
+        self.assertEqual(error.phase, "expand_dfa")
+        self.assertEqual(error.stats["states"], 101)
+
+    def test_nth_from_end_max_states(self) -> None:
+        """Should refuse to build nth_from_end DFAs with too many states"""
+        with resource_limits(max_states=1000):
+            with self.assertRaises(exceptions.ResourceLimitError) as context:
+                DFA.nth_from_end({"0", "1"}, "1", 10)
+        self.assertEqual(context.exception.stats["states"], 1024)
+
+    def test_nfa_products_max_states(self) -> None:
+        """Should interrupt NFA intersections and shuffle products"""
+        other_nfa = NFA.from_regex("(a|b)*b(a|b){10}", input_symbols={"a", "b"})
+        with resource_limits(max_states=50):
+            with self.assertRaises(exceptions.ResourceLimitError) as context:
+                self.nfa.intersection(other_nfa)
+            self.assertEqual(context.exception.phase, "intersection")
+
+            with self.assertRaises(exceptions.ResourceLimitError) as context:
+                self.nfa.shuffle_product(other_nfa)
+            self.assertEqual(context.exception.phase, "shuffle_product")
+
+    def test_regex_max_states(self) -> None:
+        """Should interrupt the compilation of regex operators"""
+        with resource_limits(max_states=50):
+            for regex, phase in (
+                ("(a|b)*a(a|b)(a|b)&(a|b)*b(a|b)(a|b)", "regex_intersection"),
+                ("(abcdef)^(ghijkl)", "regex_shuffle"),
+                ("(a|b){30}", "regex_repeat"),
+            ):
+                with self.subTest(regex=regex):
+                    with self.assertRaises(exceptions.ResourceLimitError) as context:
+                        NFA.from_regex(regex)
+                    self.assertEqual(context.exception.phase, phase)
+
+    def test_timeout(self) -> None:
+        """Should interrupt operations running past the deadline"""
+        with resource_limits(timeout=0):
+            with self.assertRaises(exceptions.ResourceLimitError) as context:
+                DFA.from_nfa(self.nfa)
+        self.assertEqual(context.exception.limit, "timeout")
+
+    def test_cancellation(self) -> None:
+        """Should interrupt operations once the token is cancelled"""
+        token = CancellationToken()
+        with resource_limits(cancellation_token=token):
+            DFA.from_nfa(NFA.from_regex("ab"))
+            token.cancel()
+            with self.assertRaises(exceptions.ResourceLimitError) as context:
+                DFA.from_nfa(self.nfa)
+        self.assertEqual(context.exception.limit, "cancelled")
+
+
+class TestNPDALimits(test_pda.TestPDA):
+    """A test class for testing resource limits on NPDA simulation"""
+
+    def test_npda_max_steps(self) -> None:
+        """Should interrupt NPDA simulation after max_steps steps"""
+        with resource_limits(max_steps=5):
+            self.assertTrue(self.npda.accepts_input("abba"))
+            with self.assertRaises(exceptions.ResourceLimitError) as context:
+                self.npda.accepts_input("abbaab")
+        self.assertEqual(context.exception.limit, "max_steps")
+        self.assertEqual(context.exception.stats["steps"], 6)
+
+    def test_npda_max_configurations(self) -> None:
+        """Should interrupt NPDA simulation tracking too many configurations"""
+        with resource_limits(max_configurations=1):
+            with self.assertRaises(exceptions.ResourceLimitError) as context:
+                self.npda.accepts_input("abba")
+        self.assertEqual(context.exception.limit, "max_configurations")
+        self.assertEqual(context.exception.phase, "npda")
+
+
+class TestNTMLimits(test_tm.TestTM):
+    """A test class for testing resource limits on NTM simulation"""
+
+    def test_ntm_max_steps(self) -> None:
+        """Should interrupt NTM simulation after max_steps steps"""
+        with resource_limits(max_steps=4):
+            with self.assertRaises(exceptions.ResourceLimitError) as context:
+                self.ntm1.accepts_input("0012001")
+        self.assertEqual(context.exception.limit, "max_steps")
+        self.assertEqual(context.exception.phase, "ntm")
@@ -0,0 +1,134 @@
+"""Tests for the bit-parallel approximate matcher."""
+
+from itertools import product
+
+from parameterized import parameterized  # type: ignore
+
+import automata.base.exceptions as exceptions
+from automata.fa.approx import ApproximateMatcher
+from automata.fa.nfa import NFA
+from tests.test_nfa.base import NFATestCase
+
+
+def substring_distances(pattern: str, text: str):
+    """Compute the best edit distance of a substring ending at each index."""
+    row = list(range(len(pattern) + 1))
+    distances = [row[-1]]
+    for symbol in text:
+        next_row = [0]
+        for i, pattern_symbol in enumerate(pattern, start=1):
+            next_row.append(
+                min(
+                    row[i] + 1,
+                    next_row[i - 1] + 1,
+                    row[i - 1] + (pattern_symbol != symbol),
+                )
+            )
+        row = next_row
+        distances.append(row[-1])
+    return distances
+
+
+class TestApproximateMatcher(NFATestCase):
+    """A test class for testing the approximate matcher."""
+
+    @parameterized.expand(
+        [
+            (insertion, deletion, substitution, restricted)
+            for insertion, deletion, substitution, restricted in product(
+                (True, False), repeat=4
+            )
+            if insertion or deletion or substitution
+        ]
+    )
+    def test_fullmatch_agrees_with_nfa(
+        self, insertion: bool, deletion: bool, substitution: bool, restricted: bool
+    ) -> None:
+        """Should accept exactly the words accepted by NFA.edit_distance"""
+        input_symbols = {"a", "b", "c"}
+        for pattern, max_edit_distance in [("", 1), ("abca", 0), ("abca", 2)]:
+            nfa = NFA.edit_distance(
+                input_symbols,
+                pattern,
+                max_edit_distance,
+                insertion=insertion,
+                deletion=deletion,
+                substitution=substitution,
+            )
+            matcher = ApproximateMatcher(
+                pattern,
+                max_edit_distance,
+                input_symbols={"a", "b", "c"} if restricted else None,
+                insertion=insertion,
+                deletion=deletion,
+                substitution=substitution,
+            )
+            for length in range(7):
+                for word in product("abc", repeat=length):
+                    text = "".join(word)
+                    self.assertEqual(
+                        matcher.fullmatch(text), nfa.accepts_input(text), text
+                    )
+
+    def test_distance(self) -> None:
+        """Should return the edit distance when it is small enough"""
+        matcher = ApproximateMatcher("kitten", 3)
+        self.assertEqual(matcher.distance("kitten"), 0)
+        self.assertEqual(matcher.distance("sitting"), 3)
+        self.assertEqual(matcher.distance("sittings"), None)
+        self.assertEqual(matcher.distance(""), None)
+
+        matcher = ApproximateMatcher("kitten", 3, substitution=False)
+        self.assertEqual(matcher.distance("sitten"), 2)
+        self.assertEqual(matcher.distance("sitting"), None)
+
+    def test_search(self) -> None:
+        """Should find the end of every approximate occurrence of the pattern"""
+        text = "the quick brown fox jumps over the lazy dog, the quack"
+        for pattern, max_edit_distance in [("quick", 1), ("the", 0), ("dgo", 2)]:
+            expected = [
+                (end, distance)
+                for end, distance in enumerate(substring_distances(pattern, text))
+                if distance <= max_edit_distance
+            ]
+            for restricted in (True, False):
+                matcher = ApproximateMatcher(
+                    pattern,
+                    max_edit_distance,
+                    input_symbols=set(text) if restricted else None,
+                )
+                self.assertEqual(list(matcher.search(text)), expected)
+
+    def test_search_without_deletion(self) -> None:
+        """Should only report matches reachable with the enabled edits"""
+        matcher = ApproximateMatcher("abc", 1, deletion=False)
+        self.assertEqual(list(matcher.search("xacx")), [])
+        self.assertEqual(list(matcher.search("abxc")), [(3, 1), (4, 1)])
+        self.assertEqual(list(matcher.search("abd")), [(3, 1)])
+
+    def test_search_empty_pattern(self) -> None:
+        """Should match the empty pattern at every position"""
+        matcher = ApproximateMatcher("", 0)
+        self.assertEqual(list(matcher.search("ab")), [(0, 0), (1, 0), (2, 0)])
+
+    def test_symbols_outside_alphabet(self) -> None:
+        """Should not insert or substitute symbols outside the alphabet"""
+        matcher = ApproximateMatcher("ab", 1, input_symbols={"a", "b"})
+        self.assertFalse(matcher.fullmatch("abz"))
+        self.assertFalse(matcher.fullmatch("zb"))
+        self.assertTrue(matcher.fullmatch("abb"))
+
+        self.assertTrue(ApproximateMatcher("ab", 1).fullmatch("abz"))
+
+    def test_matcher_error_types(self) -> None:
+        """Should raise the same errors as NFA.edit_distance"""
+        with self.assertRaises(ValueError):
+            ApproximateMatcher("abc", -1)
+
+        with self.assertRaises(ValueError):
+            ApproximateMatcher(
+                "abc", 1, insertion=False, deletion=False, substitution=False
+            )
+
+        with self.assertRaises(exceptions.InvalidSymbolError):
+            ApproximateMatcher("abc", 1, input_symbols={"a", "b"})
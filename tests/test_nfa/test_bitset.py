@@ -0,0 +1,148 @@
+"""Tests for the bitset simulation of NFAs."""
+
+from itertools import product
+from unittest.mock import patch
+
+import automata.base.config as global_config
+import automata.base.exceptions as exceptions
+import automata.fa.bitset as bitset
+from automata.fa.nfa import NFA
+from tests.test_nfa.base import NFATestCase
+
+
+def read_with_sets(nfa: NFA, input_str: str):
+    """Simulate the NFA with sets of states, without the bitset engine."""
+    current_states = nfa._get_lambda_closures()[nfa.initial_state]
+    configurations = [current_states]
+    for symbol in input_str:
+        current_states = nfa._get_next_current_states(current_states, symbol)
+        configurations.append(current_states)
+    return configurations
+
+
+class TestBitsetNFA(NFATestCase):
+    """Check that the bitset engine simulates NFAs exactly."""
+
+    def assert_same_simulation(self, nfa: NFA, input_str: str) -> None:
+        """Assert that both engines agree on the given input"""
+        expected_configurations = read_with_sets(nfa, input_str)
+        configurations = []
+        try:
+            configurations.extend(nfa.read_input_stepwise(input_str))
+        except exceptions.RejectionException:
+            self.assertTrue(expected_configurations[-1].isdisjoint(nfa.final_states))
+        else:
+            self.assertFalse(expected_configurations[-1].isdisjoint(nfa.final_states))
+        self.assertEqual(configurations, expected_configurations)
+        self.assertEqual(
+            nfa.accepts_input(input_str),
+            not expected_configurations[-1].isdisjoint(nfa.final_states),
+        )
+
+    def test_fixture_nfa(self) -> None:
+        """Should simulate an NFA with lambda transitions"""
+        for length in range(5):
+            for input_str in map("".join, product("ab", repeat=length)):
+                self.assert_same_simulation(self.nfa, input_str)
+
+    def test_random_nfas(self) -> None:
+        """Should simulate sparse and dense sets of states"""
+        for seed, state_count in enumerate((5, 40, 300)):
+            nfa = NFA.random(
+                state_count, {"a", "b", "c"}, seed=seed, lambda_density=0.2
+            )
+            for input_length in (0, 1, 7, 30):
+                self.assert_same_simulation(nfa, ("abcab" * 6)[:input_length])
+
+    def test_sparse_sets(self) -> None:
+        """Should simulate NFAs whose sets of states stay small"""
+        nfa = NFA.from_regex("a{50}b", input_symbols={"a", "b"})
+        self.assert_same_simulation(nfa, "a" * 50 + "b")
+        self.assert_same_simulation(nfa, "a" * 30 + "b")
+
+    def test_invalid_symbols(self) -> None:
+        """Should reject input containing symbols without transitions"""
+        nfa = NFA.from_regex("ab*", input_symbols={"a", "b", "c"})
+        self.assertFalse(nfa.accepts_input("abc"))
+        self.assertFalse(nfa.accepts_input("ab!"))
+        self.assertEqual(list(nfa.read_input_stepwise("ab"))[-1], nfa.read_input("ab"))
+        with self.assertRaises(exceptions.RejectionException):
+            nfa.read_input("ac")
+
+    def test_masks(self) -> None:
+        """Should convert between sets of states and bitsets"""
+        bitset_nfa = self.nfa.to_bitset()
+        self.assertIs(bitset_nfa, self.nfa.to_bitset())
+        self.assertEqual(bitset_nfa.states[0], self.nfa.initial_state)
+        self.assertEqual(
+            bitset_nfa.to_states(bitset_nfa.initial_mask),
+            self.nfa._get_lambda_closures()[self.nfa.initial_state],
+        )
+        for state in self.nfa.states:
+            mask = bitset_nfa.to_mask({state})
+            self.assertEqual(mask.bit_count(), 1)
+            self.assertEqual(bitset_nfa.to_states(mask), {state})
+        self.assertEqual(bitset_nfa.to_states(0), set())
+
+    def test_read_input(self) -> None:
+        """Should read input without raising exceptions for rejection"""
+        bitset_nfa = self.nfa.to_bitset()
+        self.assertEqual(bitset_nfa.read_input("aba"), self.nfa.read_input("aba"))
+        self.assertEqual(
+            [
+                bitset_nfa.to_states(mask)
+                for mask in bitset_nfa.read_input_stepwise("b")
+            ],
+            read_with_sets(self.nfa, "b"),
+        )
+        with self.assertRaises(exceptions.RejectionException):
+            bitset_nfa.read_input("abb")
+
+    def test_shared_tables(self) -> None:
+        """Should share tables between symbols with the same successors"""
+        nfa = NFA.from_regex("[a-c]x[a-c]", input_symbols={"a", "b", "c", "x"})
+        bitset_nfa = nfa.to_bitset()
+        self.assertIs(bitset_nfa.successors["a"], bitset_nfa.successors["c"])
+        self.assertIsNot(bitset_nfa.successors["a"], bitset_nfa.successors["x"])
+        self.assertIs(bitset_nfa._images["a"], bitset_nfa._images["b"])
+
+    def test_mask_image(self) -> None:
+        """Should compute images of sparse and dense bitsets"""
+        rows = [1 << (i * 7 % 40) for i in range(40)]
+        image = bitset.MaskImage(rows)
+        for mask in (0, 1 << 39, 0b1011, (1 << 40) - 1, 0x5555555555):
+            expected = 0
+            for state in bitset.iter_bits(mask):
+                expected |= rows[state]
+            self.assertEqual(image(mask), expected)
+            self.assertEqual(image(mask), expected)
+        self.assertEqual(list(bitset.iter_bits(0b100101)), [0, 2, 5])
+
+    def test_successor_masks(self) -> None:
+        """Should compute the successors of sets of states on every symbol"""
+        for seed, state_count in enumerate((5, 40, 300)):
+            nfa = NFA.random(
+                state_count, {"a", "b", "c"}, seed=seed, lambda_density=0.2
+            )
+            bitset_nfa = nfa.to_bitset()
+            current_states = nfa._get_lambda_closures()[nfa.initial_state]
+            for symbol in "abcab" * 4:
+                mask = bitset_nfa.to_mask(current_states)
+                self.assertEqual(
+                    {
+                        symbol: bitset_nfa.to_states(next_mask)
+                        for symbol, next_mask in bitset_nfa.successor_masks(
+                            mask
+                        ).items()
+                    },
+                    dict(nfa._iterate_through_symbol_path_pairs(current_states)),
+                )
+                current_states = nfa._get_next_current_states(current_states, symbol)
+
+    def test_large_nfa_fallback(self) -> None:
+        """Should simulate large NFAs with sets of states"""
+        nfa = NFA.random(30, {"a", "b"}, seed=0)
+        with patch.object(global_config, "max_bitset_nfa_states", 10):
+            with patch.object(NFA, "to_bitset") as to_bitset:
+                self.assert_same_simulation(nfa, "abba")
+                to_bitset.assert_not_called()
@@ -246,6 +246,63 @@ def test_cyclic_lambda_transitions(self) -> None:
         self.assertEqual(nfa.read_input(""), {"q0", "q1", "q3"})
         self.assertEqual(nfa.read_input("a"), {"q0", "q1", "q2", "q3"})
 
+    def test_lambda_closures(self) -> None:
+        """Should compute lambda closures shared by cycles of lambda transitions"""
+        nfa = NFA(
+            states={"q0", "q1", "q2", "q3", "q4"},
+            input_symbols={"a"},
+            transitions={
+                "q0": {"": {"q1"}, "a": {"q4"}},
+                "q1": {"": {"q2"}},
+                "q2": {"": {"q1", "q3"}},
+                "q3": {"a": {"q0"}},
+            },
+            initial_state="q0",
+            final_states={"q3"},
+        )
+        lambda_closures = nfa._get_lambda_closures()
+        self.assertEqual(
+            lambda_closures,
+            {
+                "q0": {"q0", "q1", "q2", "q3"},
+                "q1": {"q1", "q2", "q3"},
+                "q2": {"q1", "q2", "q3"},
+                "q3": {"q3"},
+                "q4": {"q4"},
+            },
+        )
+        self.assertIs(lambda_closures["q1"], lambda_closures["q2"])
+
+    def test_lambda_closures_random(self) -> None:
+        """Should compute the same lambda closures as a search from each state"""
+        for seed in range(3):
+            nfa = NFA.random(60, {"a"}, seed=seed, density=0.2, lambda_density=1.5)
+            for state, closure in nfa._get_lambda_closures().items():
+                reachable_states = {state}
+                queue = [state]
+                while queue:
+                    for end_state in nfa.transitions[queue.pop()].get("", ()):
+                        if end_state not in reachable_states:
+                            reachable_states.add(end_state)
+                            queue.append(end_state)
+                self.assertEqual(closure, reachable_states)
+
+    def test_lambda_closures_long_chain(self) -> None:
+        """Should compute lambda closures of long chains without recursion"""
+        state_count = 2000
+        nfa = NFA(
+            states=set(range(state_count)),
+            input_symbols={"a"},
+            transitions={
+                state: {"": {state + 1}} if state < state_count - 1 else {}
+                for state in range(state_count)
+            },
+            initial_state=0,
+            final_states={state_count - 1},
+        )
+        self.assertEqual(len(nfa._get_lambda_closures()[0]), state_count)
+        self.assertTrue(nfa.accepts_input(""))
+
     def test_non_str_states(self) -> None:
         """Should handle non-string state names"""
         nfa = NFA(
@@ -256,3 +313,49 @@ def test_non_str_states(self) -> None:
             final_states=set(),
         )
         self.assertIsNotNone(nfa.accepts_input(""))
+
+    def test_random(self) -> None:
+        """Should generate a valid, reproducible, accessible NFA"""
+        nfa = NFA.random(40, {"a", "b"}, seed=1, density=0.5, lambda_density=0.2)
+        nfa.validate()
+        self.assertEqual(nfa.states, set(range(40)))
+        self.assertEqual(nfa.initial_state, 0)
+        self.assertTrue(any("" in paths for paths in nfa.transitions.values()))
+        self.assertEqual(
+            nfa.transitions,
+            NFA.random(
+                40, {"a", "b"}, seed=1, density=0.5, lambda_density=0.2
+            ).transitions,
+        )
+
+        reachable_states = {0}
+        queue = [0]
+        while queue:
+            for targets in nfa.transitions[queue.pop()].values():
+                for next_state in targets - reachable_states:
+                    reachable_states.add(next_state)
+                    queue.append(next_state)
+        self.assertEqual(reachable_states, nfa.states)
+
+    def test_random_density(self) -> None:
+        """Should only add spanning tree transitions with zero density"""
+        nfa = NFA.random(30, {"a", "b"}, seed=2, density=0)
+        self.assertEqual(
+            sum(
+                len(targets)
+                for paths in nfa.transitions.values()
+                for targets in paths.values()
+            ),
+            29,
+        )
+
+    def test_random_invalid(self) -> None:
+        """Should reject invalid arguments for random NFAs"""
+        with self.assertRaises(ValueError):
+            NFA.random(0, {"a"})
+        with self.assertRaises(ValueError):
+            NFA.random(2, set())
+        with self.assertRaises(ValueError):
+            NFA.random(2, {"a"}, density=-1)
+        with self.assertRaises(ValueError):
+            NFA.random(2, {"a"}, accepting_ratio=-0.5)
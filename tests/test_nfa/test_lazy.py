@@ -0,0 +1,97 @@
+"""Tests for the lazy DFA matcher."""
+
+from itertools import product
+from random import Random
+
+import automata.base.exceptions as exceptions
+from automata.base.instrumentation import collect_stats
+from automata.fa.nfa import NFA
+from tests.test_nfa.base import NFATestCase
+
+
+class TestLazyDFA(NFATestCase):
+    """Check that lazy DFAs match the same language as their NFAs."""
+
+    def test_accepts_input(self) -> None:
+        """Should accept the same words as the NFA"""
+        lazy_dfa = self.nfa.to_lazy_dfa()
+        for length in range(6):
+            for input_str in map("".join, product("ab", repeat=length)):
+                self.assertEqual(
+                    lazy_dfa.accepts_input(input_str),
+                    self.nfa.accepts_input(input_str),
+                )
+
+    def test_random_nfas(self) -> None:
+        """Should accept the same words as random NFAs, with any cache size"""
+        rng = Random(0)
+        for seed in range(5):
+            nfa = NFA.random(30, {"a", "b", "c"}, seed=seed, lambda_density=0.2)
+            words = [
+                "".join(rng.choices("abc", k=rng.randrange(20))) for _ in range(50)
+            ]
+            for max_states in (1, 3, 10000):
+                lazy_dfa = nfa.to_lazy_dfa(max_states=max_states)
+                for word in words:
+                    self.assertEqual(
+                        lazy_dfa.accepts_input(word), nfa.accepts_input(word)
+                    )
+                    self.assertLessEqual(len(lazy_dfa), max(max_states, 3))
+
+    def test_cache_info(self) -> None:
+        """Should count cache hits and misses"""
+        nfa = NFA.from_regex("(ab)*", input_symbols={"a", "b"})
+        lazy_dfa = nfa.to_lazy_dfa()
+        self.assertTrue(lazy_dfa.accepts_input("abab"))
+        self.assertEqual(lazy_dfa.cache_info(), (1, 3, 0, 10000, 3))
+        self.assertFalse(lazy_dfa.accepts_input("abb"))
+        self.assertEqual(lazy_dfa.cache_info(), (3, 4, 0, 10000, 3))
+
+        lazy_dfa.clear()
+        self.assertEqual(lazy_dfa.cache_info(), (0, 0, 0, 10000, 1))
+        self.assertEqual(len(lazy_dfa), 1)
+
+    def test_flush(self) -> None:
+        """Should flush the cache when it is full"""
+        nfa = NFA.from_regex("(a|b)*a(a|b){5}", input_symbols={"a", "b"})
+        lazy_dfa = nfa.to_lazy_dfa(max_states=8)
+        word = "".join(Random(1).choices("ab", k=500))
+        self.assertEqual(lazy_dfa.accepts_input(word), nfa.accepts_input(word))
+        self.assertGreater(lazy_dfa.flushes, 0)
+        self.assertGreater(lazy_dfa.evictions, 0)
+        self.assertLessEqual(len(lazy_dfa), 8)
+
+    def test_fallback(self) -> None:
+        """Should simulate the NFA directly if the cache is flushed too often"""
+        nfa = NFA.from_regex("(a|b)*a(a|b){10}", input_symbols={"a", "b"})
+        lazy_dfa = nfa.to_lazy_dfa(max_states=4)
+        rng = Random(2)
+        for _ in range(10):
+            word = "".join(rng.choices("ab", k=200))
+            self.assertEqual(lazy_dfa.accepts_input(word), nfa.accepts_input(word))
+        self.assertGreater(lazy_dfa.fallbacks, 0)
+
+    def test_read_input(self) -> None:
+        """Should return the NFA states reached on accepted input"""
+        lazy_dfa = self.nfa.to_lazy_dfa()
+        self.assertEqual(lazy_dfa.read_input("aba"), self.nfa.read_input("aba"))
+        with self.assertRaises(exceptions.RejectionException):
+            lazy_dfa.read_input("abb")
+        with self.assertRaises(exceptions.RejectionException):
+            lazy_dfa.read_input("c")
+
+    def test_stats(self) -> None:
+        """Should report cache statistics to an active stats collector"""
+        lazy_dfa = self.nfa.to_lazy_dfa()
+        with collect_stats() as stats:
+            lazy_dfa.accepts_input("aba")
+            lazy_dfa.accepts_input("aba")
+        self.assertEqual(stats.counters["lazy_dfa.misses"], 2)
+        self.assertEqual(stats.counters["lazy_dfa.hits"], 4)
+        self.assertEqual(stats.counters["lazy_dfa.flushes"], 0)
+        self.assertEqual(stats.maxima["lazy_dfa.states"], len(lazy_dfa))
+
+    def test_invalid_max_states(self) -> None:
+        """Should reject a non-positive cache size"""
+        with self.assertRaises(ValueError):
+            self.nfa.to_lazy_dfa(max_states=0)
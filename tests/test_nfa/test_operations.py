@@ -361,6 +361,35 @@ def test_left_quotient(self) -> None:
         with self.assertRaises(TypeError):
             self.nfa.left_quotient(self.dfa)  # type: ignore
 
+    def test_products_reachable_states(self) -> None:
+        """Should only construct the reachable states of products"""
+        nfa1 = NFA.from_regex("a{30}", input_symbols={"a", "b"})
+        nfa2 = NFA.from_regex("b{30}", input_symbols={"a", "b"})
+        # State 2 is dead
+        nfa3 = NFA(
+            states={0, 1, 2},
+            input_symbols={"a", "b"},
+            transitions={0: {"a": {1, 2}}, 1: {}, 2: {"b": {2}}},
+            initial_state=0,
+            final_states={1},
+        )
+        nfa4 = NFA.from_regex("ab*a|b", input_symbols={"a", "b"})
+
+        for quotient_nfa in (nfa1.right_quotient(nfa2), nfa1.left_quotient(nfa2)):
+            self.assertLess(len(quotient_nfa.states), 2 * len(nfa1.states))
+            quotient_nfa.validate()
+            quotient_dfa = DFA.from_nfa(quotient_nfa)
+            self.assertTrue(quotient_dfa.isempty())
+
+        for operation in ("right_quotient", "left_quotient", "shuffle_product"):
+            with self.subTest(operation=operation):
+                result_nfa = getattr(nfa4, operation)(nfa3)
+                trimmed_nfa = getattr(nfa4, operation)(nfa3, remove_dead_states=True)
+                trimmed_nfa.validate()
+                self.assertEqual(trimmed_nfa, result_nfa)
+                self.assertLess(len(trimmed_nfa.states), len(result_nfa.states))
+                self.assertIn(trimmed_nfa.initial_state, trimmed_nfa.states)
+
     def test_quotient_properties(self) -> None:
         """Test some properties of quotients, based on
         https://planetmath.org/quotientoflanguages"""
@@ -0,0 +1,98 @@
+"""Tests for exploring products of finite automata lazily."""
+
+from itertools import product
+
+import automata.base.exceptions as exceptions
+from automata.base.instrumentation import collect_stats
+from automata.base.limits import resource_limits
+from automata.fa.dfa import DFA
+from automata.fa.gnfa import GNFA
+from automata.fa.nfa import NFA
+from automata.fa.product import ProductView
+from tests.test_nfa.base import NFATestCase
+
+
+class TestProductView(NFATestCase):
+    """Check that product views answer queries about intersections."""
+
+    def test_accepts_input(self) -> None:
+        """Should accept the strings accepted by every automaton"""
+        view = ProductView(
+            NFA.from_regex("(a|b)*b", input_symbols={"a", "b", "c"}),
+            DFA.from_nfa(NFA.from_regex("a*b|ba|c")),
+        )
+        self.assertTrue(view.accepts_input("aab"))
+        self.assertIn("b", view)
+        self.assertNotIn("ba", view)
+        self.assertNotIn("c", view)
+        self.assertNotIn("", view)
+        self.assertNotIn("abd", view)
+
+    def test_shortest_word(self) -> None:
+        """Should find the shortest, then lexicographically first, string"""
+        view = ProductView(
+            NFA.from_regex("ba|bb|ab|a*c"), NFA.from_regex("(a|b)(a|b)|aac")
+        )
+        self.assertFalse(view.isempty())
+        self.assertEqual(view.shortest_word(), "ab")
+        self.assertEqual(ProductView(NFA.from_regex("a*")).shortest_word(), "")
+
+    def test_empty(self) -> None:
+        """Should detect empty intersections"""
+        view = ProductView(
+            NFA.from_regex("(ab)*a"),
+            NFA.from_regex("(ab)*"),
+            DFA.from_nfa(NFA.from_regex("a*")),
+        )
+        self.assertTrue(view.isempty())
+        with self.assertRaises(exceptions.EmptyLanguageException):
+            view.shortest_word()
+
+    def test_random(self) -> None:
+        """Should agree with the intersection of random NFAs"""
+        input_symbols = {"a", "b"}
+        for seed in range(20):
+            nfa = NFA.random(
+                6, input_symbols, seed=seed, density=0.4, lambda_density=0.3
+            )
+            other_nfa = NFA.random(
+                6, input_symbols, seed=seed + 100, density=0.4, lambda_density=0.3
+            )
+            intersection = DFA.from_nfa(nfa.intersection(other_nfa))
+            words = [
+                "".join(word)
+                for length in range(6)
+                for word in product(sorted(input_symbols), repeat=length)
+            ]
+            accepted_words = [word for word in words if word in intersection]
+
+            for view in (
+                ProductView(nfa, other_nfa),
+                ProductView(nfa, DFA.from_nfa(other_nfa)),
+            ):
+                self.assertEqual(view.isempty(), intersection.isempty())
+                if accepted_words:
+                    self.assertEqual(view.shortest_word(), accepted_words[0])
+                for word in words:
+                    self.assertEqual(view.accepts_input(word), word in intersection)
+
+    def test_stats_and_limits(self) -> None:
+        """Should report the product states explored and respect limits"""
+        nfa = NFA.from_regex("(a|b)*a(a|b){6}", input_symbols={"a", "b"})
+        other_nfa = NFA.from_regex("b*", input_symbols={"a", "b"})
+        with collect_stats() as stats:
+            self.assertTrue(ProductView(nfa, other_nfa).isempty())
+        self.assertGreater(stats.counters["product.states"], 0)
+        self.assertIn("product", stats.timings)
+
+        with resource_limits(max_states=1):
+            with self.assertRaises(exceptions.ResourceLimitError) as context:
+                ProductView(nfa, nfa).isempty()
+        self.assertEqual(context.exception.phase, "product")
+
+    def test_invalid_automata(self) -> None:
+        """Should only accept NFAs and DFAs"""
+        with self.assertRaises(ValueError):
+            ProductView()
+        with self.assertRaises(TypeError):
+            ProductView(self.nfa, GNFA.from_nfa(self.nfa))  # type: ignore
@@ -37,6 +37,119 @@ def test_from_regex(self) -> None:
     def test_from_regex_empty_string(self) -> None:
         NFA.from_regex("")
 
+    def test_from_regex_glushkov(self) -> None:
+        """Should build the position automaton of the regex"""
+        nfa = NFA.from_regex(
+            "ab(cd*|dc)|a?",
+            input_symbols={"a", "b", "c", "d"},
+            construction="glushkov",
+        )
+        self.assertEqual(
+            nfa.transitions,
+            {
+                0: {"a": {1, 7}},
+                1: {"b": {2}},
+                2: {"c": {3}, "d": {5}},
+                3: {"d": {4}},
+                4: {"d": {4}},
+                5: {"c": {6}},
+                6: {},
+                7: {},
+            },
+        )
+        self.assertEqual(nfa.final_states, {0, 3, 4, 6, 7})
+
+    def test_from_regex_glushkov_positions(self) -> None:
+        """Should have one state per position and no lambda transitions"""
+        input_symbols = {"a", "b", "c"}
+        for regex, position_count in (
+            ("", 0),
+            ("()", 0),
+            ("(a|b)*a(a|b)(a|b)", 7),
+            ("a{2,}b{1,3}c?", 6),
+            ("(ab)+|[^a].", 4),
+            ("((a|())b*)*", 2),
+        ):
+            with self.subTest(regex=regex):
+                thompson_nfa = NFA.from_regex(regex, input_symbols=input_symbols)
+                glushkov_nfa = NFA.from_regex(
+                    regex, input_symbols=input_symbols, construction="glushkov"
+                )
+                self.assertEqual(len(glushkov_nfa.states), position_count + 1)
+                self.assertFalse(
+                    any("" in paths for paths in glushkov_nfa.transitions.values())
+                )
+                self.assertEqual(glushkov_nfa, thompson_nfa)
+
+    def test_from_regex_glushkov_products(self) -> None:
+        """Should compile intersections and shuffles without lambdas"""
+        input_symbols = {"a", "b", "c"}
+        for regex in ("a*&(aa)*", "(a|b){1,3}&a*b", "(ab)^c", "(a^b)*c"):
+            with self.subTest(regex=regex):
+                thompson_nfa = NFA.from_regex(regex, input_symbols=input_symbols)
+                glushkov_nfa = NFA.from_regex(
+                    regex, input_symbols=input_symbols, construction="glushkov"
+                )
+                self.assertFalse(
+                    any("" in paths for paths in glushkov_nfa.transitions.values())
+                )
+                self.assertEqual(glushkov_nfa, thompson_nfa)
+
+    def test_from_regex_antimirov(self) -> None:
+        """Should build the partial derivative automaton of the regex"""
+        nfa = NFA.from_regex(
+            "(a|b)*a(a|b)(a|b)", input_symbols={"a", "b"}, construction="antimirov"
+        )
+        self.assertEqual(
+            nfa.transitions,
+            {
+                0: {"a": {0, 1}, "b": {0}},
+                1: {"a": {2}, "b": {2}},
+                2: {"a": {3}, "b": {3}},
+                3: {},
+            },
+        )
+        self.assertEqual(nfa.final_states, {3})
+
+    def test_from_regex_antimirov_equivalence(self) -> None:
+        """Should match the languages of the other constructions"""
+        input_symbols = {"a", "b", "c"}
+        for regex in (
+            "",
+            "()",
+            "ab(ca*|bc)|a?",
+            "a{2,}b{0,3}",
+            "((a|())b*)*",
+            "(a?){3}b",
+            "[^a].b+",
+            "a*&(aa)*",
+            "(a*b*)*&(ab|ba)*",
+            "a*&()",
+            "(ab)^c",
+            "(a^b)*c",
+            "((ab)*&(a|b)*b)^c*",
+        ):
+            with self.subTest(regex=regex):
+                thompson_nfa = NFA.from_regex(regex, input_symbols=input_symbols)
+                glushkov_nfa = NFA.from_regex(
+                    regex, input_symbols=input_symbols, construction="glushkov"
+                )
+                antimirov_nfa = NFA.from_regex(
+                    regex, input_symbols=input_symbols, construction="antimirov"
+                )
+                self.assertFalse(
+                    any("" in paths for paths in antimirov_nfa.transitions.values())
+                )
+                self.assertLessEqual(
+                    len(antimirov_nfa.states), len(glushkov_nfa.states)
+                )
+                self.assertEqual(antimirov_nfa, thompson_nfa)
+
+    def test_from_regex_invalid_construction(self) -> None:
+        """Should reject unknown regex constructions"""
+        with self.assertRaises(ValueError):
+            NFA.from_regex("ab", construction="brzozowski")  # type: ignore
+
     def test_eliminate_lambda(self) -> None:
         original_nfa = NFA(
             states={0, 1, 2, 3, 4, 5, 6},
@@ -101,6 +214,38 @@ def test_eliminate_lambda_other(self) -> None:
             nfa1._get_lambda_closures(), original_nfa._get_lambda_closures()
         )
 
+    def test_eliminate_lambda_shared_closures(self) -> None:
+        """Should share the transitions of states in a cycle of lambdas"""
+        original_nfa = NFA(
+            states={0, 1, 2, 3},
+            initial_state=0,
+            input_symbols={"a", "b"},
+            transitions={
+                0: {"a": {1}, "b": {2}},
+                1: {"": {2}, "a": {3}},
+                2: {"": {1}, "b": {3}},
+                3: {"": {3}},
+            },
+            final_states={3},
+        )
+        nfa = original_nfa.eliminate_lambda()
+        self.assertEqual(nfa, original_nfa)
+        self.assertEqual(nfa.transitions[1], {"a": {3}, "b": {3}})
+        self.assertIs(nfa.transitions[1], nfa.transitions[2])
+        self.assertEqual(nfa.transitions[3], {})
+        self.assertEqual(nfa.final_states, {3})
+
+    def test_eliminate_lambda_random(self) -> None:
+        """Should eliminate lambdas from random NFAs"""
+        for seed in range(3):
+            original_nfa = NFA.random(
+                40, {"a", "b"}, seed=seed, density=0.3, lambda_density=1.0
+            )
+            nfa = original_nfa.eliminate_lambda()
+            nfa.validate()
+            self.assertEqual(nfa, original_nfa)
+            self.assertFalse(any("" in paths for paths in nfa.transitions.values()))
+
     def test_eliminate_lambda_regex(self) -> None:
         nfa = NFA.from_regex(
             "a(aaa*bbcd|abbcd)d*|aa*bb(dcc*|(d|c)b|a?bb(dcc*|(d|c)))ab(c|d)*(ccd)?"
@@ -0,0 +1,84 @@
+"""Tests for reducing NFAs with simulation preorders."""
+
+import automata.fa.simulation as simulation
+from automata.base.instrumentation import collect_stats
+from automata.fa.nfa import NFA
+from tests.test_nfa.base import NFATestCase
+
+
+class TestNFASimulation(NFATestCase):
+    """Check that NFAs are reduced without changing their language."""
+
+    def assert_reduced(self, nfa: NFA) -> NFA:
+        """Assert that the reduced NFA is a valid equivalent lambda-free NFA"""
+        reduced_nfa = nfa.reduce()
+        reduced_nfa.validate()
+        self.assertEqual(reduced_nfa, nfa)
+        self.assertLessEqual(reduced_nfa.states, nfa.states)
+        self.assertEqual(reduced_nfa.initial_state, nfa.initial_state)
+        self.assertFalse(any("" in paths for paths in reduced_nfa.transitions.values()))
+        return reduced_nfa
+
+    def test_forward_simulation(self) -> None:
+        """Should compute the states simulating each state"""
+        # 0 -a-> 1 -b-> 3, 0 -a-> 2 -b-> 3, 2 -c-> 3, with 3 final
+        successors = [{"a": 0b0110}, {"b": 0b1000}, {"b": 0b1000, "c": 0b1000}, {}]
+        self.assertEqual(
+            simulation.get_forward_simulation(successors, 0b1000),
+            [0b0001, 0b0110, 0b0100, 0b1000],
+        )
+
+    def test_reduce_regex(self) -> None:
+        """Should merge and prune the states of regex NFAs"""
+        input_symbols = {"a", "b", "c"}
+        for regex, state_count in (
+            ("a*b|a*c", 2),
+            ("(ab|ac)*", 2),
+            ("((a|b)*|(b|a)*)c", 2),
+            ("a|a|a|aa*", 2),
+            ("(a|b)*a(a|b){3}", 5),
+        ):
+            nfa = NFA.from_regex(regex, input_symbols=input_symbols)
+            self.assertEqual(len(self.assert_reduced(nfa).states), state_count)
+
+    def test_reduce_pruning(self) -> None:
+        """Should remove transitions to states simulated by a sibling target"""
+        nfa = NFA(
+            states={0, 1, 2, 3},
+            input_symbols={"a", "b", "c"},
+            transitions={
+                0: {"a": {1, 2}},
+                1: {"b": {3}},
+                2: {"b": {3}, "c": {3}},
+                3: {},
+            },
+            initial_state=0,
+            final_states={3},
+        )
+        reduced_nfa = self.assert_reduced(nfa)
+        self.assertEqual(reduced_nfa.states, {0, 2, 3})
+        self.assertEqual(reduced_nfa.transitions[0], {"a": {2}})
+
+    def test_reduce_random(self) -> None:
+        """Should preserve the language of random NFAs"""
+        for seed in range(30):
+            nfa = NFA.random(12, {"a", "b"}, seed=seed, density=0.4, lambda_density=0.3)
+            self.assert_reduced(nfa)
+
+    def test_reduce_empty_language(self) -> None:
+        """Should reduce NFAs accepting nothing to their initial state"""
+        nfa = NFA.from_regex("ab", input_symbols={"a", "b"}).intersection(
+            NFA.from_regex("ba", input_symbols={"a", "b"})
+        )
+        reduced_nfa = self.assert_reduced(nfa)
+        self.assertEqual(reduced_nfa.states, {nfa.initial_state})
+        self.assertEqual(reduced_nfa.final_states, set())
+
+    def test_reduce_stats(self) -> None:
+        """Should record the number of states before and after reduction"""
+        nfa = NFA.from_regex("a*b|a*c")
+        with collect_stats() as stats:
+            nfa.reduce()
+        self.assertEqual(stats.counters["reduce.nfa_states"], len(nfa.states))
+        self.assertEqual(stats.counters["reduce.reduced_states"], 2)
+        self.assertIn("reduce", stats.timings)
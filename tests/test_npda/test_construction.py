@@ -67,3 +67,28 @@ def test_npda_immutable_attr_del(self) -> None:
     def test_npda_immutable_dict(self) -> None:
         """Should create an NPDA whose contents are fully immutable/hashable"""
         self.assertIsInstance(hash(frozendict(self.npda.input_parameters)), int)
+
+    def test_random(self) -> None:
+        """Should generate a valid, reproducible NPDA"""
+        npda = NPDA.random(5, {"a", "b"}, {"A", "B"}, seed=1, max_push=3)
+        npda.validate()
+        self.assertEqual(npda.states, set(range(5)))
+        self.assertEqual(npda.stack_symbols, {"A", "B", "#"})
+        self.assertEqual(npda.initial_stack_symbol, "#")
+        self.assertEqual(
+            npda.transitions,
+            NPDA.random(5, {"a", "b"}, {"A", "B"}, seed=1, max_push=3).transitions,
+        )
+        self.assertNotIn("", npda.transitions[0])
+        npda.accepts_input("abba")
+
+    def test_random_invalid(self) -> None:
+        """Should reject invalid arguments for random NPDAs"""
+        with self.assertRaises(ValueError):
+            NPDA.random(0, {"a"}, {"A"})
+        with self.assertRaises(ValueError):
+            NPDA.random(1, {"a"}, {"A"}, lambda_density=-1)
+        with self.assertRaises(ValueError):
+            NPDA.random(1, {"a"}, {"A"}, max_push=-1)
+        with self.assertRaises(ValueError):
+            NPDA.random(1, {"a"}, {"A"}, accepting_ratio=2)
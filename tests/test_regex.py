@@ -2,7 +2,9 @@
 
 import re as regex
 import string
+import threading
 import unittest
+from unittest.mock import patch
 
 import automata.base.exceptions as exceptions
 import automata.regex.regex as re
@@ -871,3 +873,150 @@ def test_space_in_patterns(self) -> None:
         minimal = NFA.from_regex(r"(a; )+", input_symbols=input_symbols)
         self.assertTrue(minimal.accepts_input("a; "))
         self.assertTrue(minimal.accepts_input("a; a; "))
+
+    def test_random_regex(self) -> None:
+        """Should generate valid, reproducible random regular expressions"""
+        for seed in range(50):
+            regex_str = re.random_regex(15, {"a", "b"}, seed=seed, operators="|&^*+?")
+            re.validate(regex_str)
+            self.assertEqual(
+                regex_str.count("a") + regex_str.count("b"),
+                15,
+            )
+            self.assertEqual(
+                regex_str,
+                re.random_regex(15, {"a", "b"}, seed=seed, operators="|&^*+?"),
+            )
+
+        self.assertEqual(re.random_regex(3, {"a"}, seed=0, operators=""), "aaa")
+        self.assertTrue(
+            set(re.random_regex(100, {"a", "b"}, seed=0)) <= set("ab|*+?()")
+        )
+
+        nfa = NFA.from_regex(re.random_regex(40, {"a", "b"}, seed=1))
+        nfa.validate()
+
+    def test_random_regex_invalid(self) -> None:
+        """Should reject invalid arguments for random regular expressions"""
+        with self.assertRaises(ValueError):
+            re.random_regex(0, {"a"})
+        with self.assertRaises(ValueError):
+            re.random_regex(1, {"*"})
+        with self.assertRaises(ValueError):
+            re.random_regex(1, {"ab"})
+        with self.assertRaises(ValueError):
+            re.random_regex(1, {"a"}, operators="-")
+        with self.assertRaises(ValueError):
+            re.random_regex(1, {"a"}, unary_probability=2)
+
+    def test_compile(self) -> None:
+        """Should compile regular expressions once per pattern and alphabet"""
+        re.purge()
+        compiled = re.compile("a(b|c)*d", input_symbols={"a", "b", "c", "d"})
+        self.assertIs(
+            re.compile("a(b|c)*d", input_symbols={"d", "c", "b", "a"}), compiled
+        )
+        self.assertIsNot(re.compile("a(b|c)*d"), compiled)
+        self.assertEqual(re.compile_cache_info().hits, 1)
+        self.assertEqual(re.compile_cache_info().currsize, 2)
+
+        self.assertEqual(compiled.pattern, "a(b|c)*d")
+        self.assertEqual(compiled.input_symbols, {"a", "b", "c", "d"})
+        self.assertEqual(compiled.nfa, NFA.from_regex("a(b|c)*d"))
+        self.assertEqual(compiled.dfa, compiled.dfa.minify())
+        self.assertIs(compiled.ast, compiled.ast)
+        self.assertEqual(repr(compiled), "CompiledRegex('a(b|c)*d')")
+
+        re.purge()
+        self.assertEqual(re.compile_cache_info().currsize, 0)
+        self.assertIsNot(
+            re.compile("a(b|c)*d", input_symbols={"a", "b", "c", "d"}), compiled
+        )
+
+        with self.assertRaises(exceptions.InvalidRegexError):
+            re.compile("a(b")
+
+    def test_compiled_immutable(self) -> None:
+        """Should not allow cached compiled regexes to be modified"""
+        compiled = re.compile("a*b")
+        with self.assertRaises(AttributeError):
+            compiled.pattern = "c"  # type: ignore
+        with self.assertRaises(AttributeError):
+            compiled.nfa = NFA.from_regex("c")  # type: ignore
+        with self.assertRaises(AttributeError):
+            compiled._dfa = None  # type: ignore
+        with self.assertRaises(AttributeError):
+            del compiled._nfa
+        self.assertTrue(compiled.fullmatch("aab"))
+        self.assertIs(re.compile("a*b").pattern, "a*b")
+
+    def test_validate_cache(self) -> None:
+        """Should only lex regular expressions validated once"""
+        re.purge()
+        with patch("automata.regex.regex.get_regex_lexer") as get_regex_lexer:
+            re.validate("a*b")
+            re.validate("a*b")
+            self.assertEqual(get_regex_lexer.call_count, 1)
+        with self.assertRaises(exceptions.InvalidRegexError):
+            re.validate("a(")
+        with self.assertRaises(exceptions.InvalidRegexError):
+            re.validate("a(")
+
+    def test_compile_concurrent(self) -> None:
+        """Should return cached regexes while another thread compiles"""
+        re.purge()
+        compiled = re.compile("ab")
+        started = threading.Event()
+        release = threading.Event()
+        from_regex = NFA.from_regex
+
+        def slow_from_regex(pattern: str, **kwargs: object) -> NFA:
+            if pattern == "slow":
+                started.set()
+                release.wait(10)
+            return from_regex(pattern, **kwargs)  # type: ignore
+
+        results = []
+        with patch.object(NFA, "from_regex", side_effect=slow_from_regex):
+            compile_thread = threading.Thread(target=re.compile, args=("slow",))
+            compile_thread.start()
+            self.assertTrue(started.wait(10))
+
+            hit_thread = threading.Thread(
+                target=lambda: results.append(re.compile("ab"))
+            )
+            hit_thread.start()
+            hit_thread.join(5)
+            self.assertFalse(hit_thread.is_alive())
+            self.assertTrue(compile_thread.is_alive())
+
+            release.set()
+            compile_thread.join(10)
+
+        self.assertEqual(results, [compiled])
+        self.assertIs(results[0], compiled)
+        self.assertEqual(re.compile("slow").pattern, "slow")
+        self.assertEqual(re.compile_cache_info().currsize, 2)
+
+    def test_compiled_fullmatch_and_search(self) -> None:
+        """Should match like the re module, returning booleans"""
+        words = ["", "a", "d", "ad", "abd", "xabcdx", "acbx", "xxd", "abxd", "aad"]
+        for pattern in ("a(b|c)*d", "a*", "(ab)+|d", "a?c"):
+            compiled = re.compile(pattern, input_symbols={"a", "b", "c", "d"})
+            for word in words:
+                with self.subTest(pattern=pattern, word=word):
+                    self.assertEqual(
+                        compiled.fullmatch(word),
+                        regex.fullmatch(pattern, word) is not None,
+                    )
+                    self.assertEqual(
+                        compiled.search(word), regex.search(pattern, word) is not None
+                    )
+
+    def test_comparisons_use_compile_cache(self) -> None:
+        """Should reuse compiled regular expressions when comparing them"""
+        re.purge()
+        self.assertTrue(re.isequal("(a|b)*", "(a*b*)*"))
+        self.assertTrue(re.issubset("ab", "(a|b)*"))
+        self.assertTrue(re.issuperset("(a|b)*", "ab"))
+        self.assertEqual(re.compile_cache_info().hits, 3)
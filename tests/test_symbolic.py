@@ -0,0 +1,230 @@
+"""Classes and functions for testing the behavior of symbolic automata"""
+
+import unittest
+from itertools import product
+
+from parameterized import parameterized  # type: ignore
+
+import automata.base.exceptions as exceptions
+from automata.fa.dfa import DFA
+from automata.fa.nfa import NFA
+from automata.fa.symbolic import (
+    MAX_CODE_POINT,
+    IntervalSet,
+    SymbolicDFA,
+    SymbolicNFA,
+    get_minterms,
+)
+from automata.regex.syntax import (
+    CharSet,
+    Concat,
+    EmptyString,
+    Repeat,
+    Union,
+    parse_regex_ast,
+)
+
+REGEXES = [
+    "",
+    "a*b",
+    "(a|b)*c(a|b)",
+    "[^a]b*",
+    ".a{2,3}",
+    "(ab|c)+&.*c.*",
+    "ab^c",
+    "(a|bc)?a?()",
+    "[a-b]*&(a|c)*",
+]
+
+
+class TestIntervalSet(unittest.TestCase):
+    """A test class for testing interval sets"""
+
+    def test_normalize(self) -> None:
+        """Should merge overlapping and adjacent ranges"""
+        interval_set = IntervalSet([(5, 8), (0, 2), (3, 3), (7, 10)])
+        self.assertEqual(interval_set.ranges, ((0, 3), (5, 10)))
+        self.assertEqual(len(interval_set), 10)
+        self.assertEqual(interval_set, IntervalSet.from_chars(interval_set))
+
+        with self.assertRaises(ValueError):
+            IntervalSet([(3, 2)])
+
+    def test_contains(self) -> None:
+        """Should check membership of characters"""
+        interval_set = IntervalSet.from_range("a", "f") | IntervalSet.from_chars("x")
+        self.assertIn("a", interval_set)
+        self.assertIn("x", interval_set)
+        self.assertNotIn("g", interval_set)
+        self.assertNotIn("ab", interval_set)
+
+    def test_set_operations(self) -> None:
+        """Should compute unions, intersections, differences and complements"""
+        set_a = IntervalSet([(0, 10), (20, 30)])
+        set_b = IntervalSet([(5, 25)])
+        self.assertEqual((set_a | set_b).ranges, ((0, 30),))
+        self.assertEqual((set_a & set_b).ranges, ((5, 10), (20, 25)))
+        self.assertEqual((set_a - set_b).ranges, ((0, 4), (26, 30)))
+        self.assertEqual(set_a.complement().ranges, ((11, 19), (31, MAX_CODE_POINT)))
+        self.assertEqual(IntervalSet().complement(), IntervalSet.universe())
+        self.assertTrue(set_a.isdisjoint(IntervalSet([(11, 19)])))
+        self.assertEqual(set_b.min_symbol(), chr(5))
+
+    def test_minterms(self) -> None:
+        """Should split labels into the sets of characters they don't distinguish"""
+        label_a = IntervalSet.from_range("a", "m")
+        label_b = IntervalSet.from_range("h", "z")
+        minterms = dict(get_minterms([label_a, label_b]))
+        self.assertEqual(
+            minterms,
+            {
+                IntervalSet.from_range("a", "g"): frozenset({0}),
+                IntervalSet.from_range("h", "m"): frozenset({0, 1}),
+                IntervalSet.from_range("n", "z"): frozenset({1}),
+            },
+        )
+
+
+class TestRegexSyntax(unittest.TestCase):
+    """A test class for testing regex syntax trees"""
+
+    def test_parse_regex_ast(self) -> None:
+        """Should parse a regex into a syntax tree"""
+        self.assertEqual(
+            parse_regex_ast("a(b|.)*"),
+            Concat(
+                CharSet(frozenset("a"), False),
+                Repeat(
+                    Union(CharSet(frozenset("b"), False), CharSet(frozenset(), True)),
+                    0,
+                    None,
+                ),
+            ),
+        )
+        self.assertEqual(parse_regex_ast(""), EmptyString())
+        self.assertEqual(parse_regex_ast("[^ab]"), CharSet(frozenset("ab"), True))
+
+    def test_parse_regex_ast_invalid(self) -> None:
+        """Should raise an error for invalid regexes"""
+        with self.assertRaises(exceptions.InvalidRegexError):
+            parse_regex_ast("a|")
+
+
+class TestSymbolicAutomata(unittest.TestCase):
+    """A test class for testing symbolic automata"""
+
+    @parameterized.expand([(regex,) for regex in REGEXES])
+    def test_from_regex(self, regex: str) -> None:
+        """Should agree with the explicit construction over a small alphabet"""
+        input_symbols = frozenset("abc")
+        symbolic_nfa = SymbolicNFA.from_regex(regex)
+        symbolic_dfa = SymbolicDFA.from_regex(regex)
+        explicit_dfa = DFA.from_nfa(NFA.from_regex(regex, input_symbols=input_symbols))
+
+        self.assertEqual(symbolic_dfa.to_dfa(input_symbols), explicit_dfa)
+        for length in range(6):
+            for word in product("abc", repeat=length):
+                input_str = "".join(word)
+                self.assertEqual(
+                    symbolic_nfa.accepts_input(input_str),
+                    explicit_dfa.accepts_input(input_str),
+                )
+
+    def test_large_alphabet(self) -> None:
+        """Should build small automata for wildcards over all of unicode"""
+        symbolic_dfa = SymbolicDFA.from_regex(r"[^a]*b.\S+")
+        self.assertLess(len(symbolic_dfa.states), 10)
+        self.assertTrue(symbolic_dfa.accepts_input("中béx"))
+        self.assertTrue(symbolic_dfa.accepts_input("b x"))
+        self.assertFalse(symbolic_dfa.accepts_input("ab x"))
+        self.assertFalse(symbolic_dfa.accepts_input("bx "))
+
+    def test_from_dfa_and_nfa(self) -> None:
+        """Should convert explicit automata to symbolic automata"""
+        nfa = NFA.from_regex("(a|b)*b(a|c)", input_symbols={"a", "b", "c"})
+        dfa = DFA.from_nfa(nfa)
+        symbolic_nfa = SymbolicNFA.from_nfa(nfa)
+        symbolic_dfa = SymbolicDFA.from_dfa(dfa)
+
+        self.assertEqual(SymbolicDFA.from_nfa(symbolic_nfa), symbolic_dfa)
+        self.assertEqual(symbolic_dfa.to_dfa({"a", "b", "c"}), dfa)
+
+    def test_minify(self) -> None:
+        """Should compute minimal symbolic DFAs"""
+        self.assertEqual(len(SymbolicDFA.from_regex("(a|b)*&(ab)*").states), 2)
+        self.assertEqual(len(SymbolicDFA.from_regex("(.|a)*").states), 1)
+        self.assertEqual(len(SymbolicDFA.from_regex("a&b").states), 1)
+        self.assertEqual(
+            SymbolicDFA.from_regex("[a-z]x|[a-m]x|[n-z]y").minify().transitions,
+            SymbolicDFA.from_regex("[a-m]x|[n-z](x|y)").transitions,
+        )
+
+    def test_set_operations(self) -> None:
+        """Should compute products of symbolic DFAs"""
+        dfa_a = SymbolicDFA.from_regex(".*a")
+        dfa_b = SymbolicDFA.from_regex("[^b]*")
+        input_symbols = frozenset("abc")
+        explicit_a = dfa_a.to_dfa(input_symbols).to_complete()
+        explicit_b = dfa_b.to_dfa(input_symbols).to_complete()
+
+        self.assertEqual((dfa_a | dfa_b).to_dfa(input_symbols), explicit_a | explicit_b)
+        self.assertEqual((dfa_a & dfa_b).to_dfa(input_symbols), explicit_a & explicit_b)
+        self.assertEqual((dfa_a - dfa_b).to_dfa(input_symbols), explicit_a - explicit_b)
+        self.assertEqual((dfa_a ^ dfa_b).to_dfa(input_symbols), explicit_a ^ explicit_b)
+        self.assertEqual((~dfa_a).to_dfa(input_symbols), ~explicit_a)
+
+        self.assertTrue((~dfa_a).accepts_input("中"))
+        self.assertTrue(SymbolicDFA.from_regex("[^b]a") <= dfa_a)
+        self.assertFalse(dfa_a <= dfa_b)
+        self.assertTrue(dfa_a >= SymbolicDFA.from_regex("ca"))
+        self.assertNotEqual(dfa_a, dfa_b)
+        self.assertEqual(~~dfa_a, dfa_a)
+        self.assertTrue((dfa_a & ~dfa_a).isempty())
+
+    def test_read_input(self) -> None:
+        """Should read input or raise a RejectionException"""
+        symbolic_dfa = SymbolicDFA.from_regex("ab", minify=False)
+        self.assertEqual(len(list(symbolic_dfa.read_input_stepwise("ab"))), 3)
+        self.assertEqual(
+            list(symbolic_dfa.read_input_stepwise("b", ignore_rejection=True)),
+            [symbolic_dfa.initial_state],
+        )
+
+        with self.assertRaises(exceptions.RejectionException):
+            symbolic_dfa.read_input("b")
+        with self.assertRaises(exceptions.RejectionException):
+            symbolic_dfa.read_input("a")
+        with self.assertRaises(exceptions.RejectionException):
+            SymbolicNFA.from_regex("ab").read_input("a")
+
+    def test_validate(self) -> None:
+        """Should reject malformed symbolic automata"""
+        label = IntervalSet.from_range("a", "c")
+        with self.assertRaises(exceptions.InvalidSymbolError):
+            SymbolicDFA(
+                states={0, 1},
+                transitions={0: {label: 0, IntervalSet.from_chars("c"): 1}, 1: {}},
+                initial_state=0,
+                final_states={1},
+            )
+        with self.assertRaises(exceptions.InvalidSymbolError):
+            SymbolicNFA(
+                states={0},
+                transitions={0: {"a": {0}}},  # type: ignore
+                initial_state=0,
+                final_states={0},
+            )
+        with self.assertRaises(exceptions.InvalidStateError):
+            SymbolicDFA(
+                states={0},
+                transitions={0: {label: 1}},
+                initial_state=0,
+                final_states={0},
+            )
+        with self.assertRaises(exceptions.MissingStateError):
+            SymbolicNFA(
+                states={0, 1},
+                transitions={0: {label: {1}}},
+                initial_state=0,
+                final_states={1},
+            )